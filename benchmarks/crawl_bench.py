@@ -0,0 +1,195 @@
+"""
+오프라인 크롤링 벤치마크와 회귀 검사.
+
+기록된 목록 페이지 픽스처를 네트워크 없이 재생하면서 크롤러와 백엔드별로 초당 페이지 수,
+초당 행 수, 페이지별 지연 백분위수, 최대 RSS를 측정합니다. 케이스마다 새 프로세스에서
+실행하므로 최대 RSS가 다른 케이스의 영향을 받지 않습니다.
+
+다음 경우 종료 코드 1로 끝나므로 CI에서 선택자 깨짐과 성능 저하를 잡을 수 있습니다.
+  - 딜이 하나도 나오지 않은 페이지가 있거나, idx/제목/URL이 빠진 딜이 있는 경우
+  - --baseline의 딜 수와 다르거나 초당 페이지 수가 --tolerance 넘게 떨어진 경우
+
+    python benchmarks/crawl_bench.py --repeat 50 --baseline benchmarks/baseline.json
+
+benchmarks/baseline.json은 저장소의 픽스처로 만든 기준 결과입니다. record_fixtures.py로 픽스처를
+다시 기록하면 --save-baseline benchmarks/baseline.json으로 함께 갱신합니다.
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hotdeal_crawler.models import CrawlTarget  # noqa: E402
+from hotdeal_crawler.plugins import get_site_registry  # noqa: E402
+from hotdeal_crawler.replay import AsyncReplayFetcher, ReplayFetcher  # noqa: E402
+from make_fixtures import DEFAULT_FIXTURES  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # resource 모듈이 없는 플랫폼(Windows)에서는 최대 RSS를 측정하지 않음
+    resource = None
+
+# selenium 백엔드는 Chrome이 필요하므로 직접 지정한 경우에만 실행
+DEFAULT_BACKENDS = ("http", "async")
+
+
+def percentile(values, fraction: float) -> float:
+    """정렬된 값 목록의 백분위수를 반환합니다."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def peak_rss_kb():
+    """현재 프로세스의 최대 RSS(KB)를 반환합니다."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def crawl_page(crawler, backend: str, replay: ReplayFetcher, url: str, page: int, loop):
+    """백엔드로 기록된 페이지 하나를 크롤링하여 딜 목록을 반환합니다."""
+    if backend == "async":
+        target = CrawlTarget(crawler.site_name, crawler.boards[0], page)
+        return loop.run_until_complete(crawler.crawl_target_async(target, None, AsyncReplayFetcher(replay)))
+    if backend == "selenium":
+        crawler.get_page(replay.file_url(url))
+    else:
+        crawler.get_page(url)
+    return list(crawler._parse_rows())
+
+
+def run_case(site: str, backend: str, fixtures: str, repeat: int) -> dict:
+    """
+    크롤러 하나를 백엔드 하나로 측정합니다. 새 프로세스에서 실행됩니다.
+
+    Args:
+        site: 사이트 이름
+        backend: "http", "async", "selenium"
+        fixtures: 픽스처 디렉토리
+        repeat: 페이지 목록 반복 횟수
+
+    Returns:
+        dict: 측정 결과
+    """
+    replay = ReplayFetcher(fixtures)
+    crawler = get_site_registry().create(site, fetch_backend="selenium" if backend == "selenium" else "http")
+    crawler.http_fetcher = replay
+    crawler.latency_budget = float("inf")
+
+    # 게시판의 페이지 URL 중 기록된 것만 사용
+    pages = []
+    while replay.has(crawler.page_url(len(pages) + 1, crawler.boards[0])):
+        pages.append((crawler.page_url(len(pages) + 1, crawler.boards[0]), len(pages) + 1))
+    if not pages:
+        return {"site": site, "backend": backend, "errors": ["기록된 페이지가 없습니다"]}
+
+    loop = asyncio.new_event_loop()
+    errors = []
+    deal_count = 0
+    try:
+        # 첫 실행에서 결과를 검사하고, 파일 읽기와 지연 import가 측정에 들어가지 않도록 함
+        for url, page in pages:
+            deals = crawl_page(crawler, backend, replay, url, page, loop)
+            if not deals:
+                errors.append(f"{url}: 딜이 없습니다")
+            for deal in deals:
+                if not (deal.idx and deal.title and deal.url):
+                    errors.append(f"{url}: 필드가 빠진 딜 {deal.to_dict()}")
+            deal_count += len(deals)
+
+        latencies = []
+        rows = 0
+        start_time = time.perf_counter()
+        for _ in range(repeat):
+            for url, page in pages:
+                page_start = time.perf_counter()
+                rows += len(crawl_page(crawler, backend, replay, url, page, loop))
+                latencies.append(time.perf_counter() - page_start)
+        elapsed = time.perf_counter() - start_time
+    finally:
+        loop.close()
+        crawler._close_driver()
+
+    latencies.sort()
+    return {
+        "site": site,
+        "backend": backend,
+        "pages": len(latencies),
+        "deals": deal_count,
+        "pages_per_sec": len(latencies) / elapsed,
+        "rows_per_sec": rows / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_rss_kb": peak_rss_kb(),
+        "errors": errors,
+    }
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list:
+    """기준 결과와 비교하여 회귀 목록을 반환합니다."""
+    expected = baseline.get(f"{result['site']}/{result['backend']}")
+    if expected is None:
+        return []
+    regressions = []
+    if result["deals"] != expected["deals"]:
+        regressions.append(f"딜 수가 {expected['deals']}개에서 {result['deals']}개로 바뀌었습니다")
+    if result["pages_per_sec"] < expected["pages_per_sec"] * (1 - tolerance):
+        regressions.append(f"초당 페이지 수가 {expected['pages_per_sec']:.0f}에서 "
+                           f"{result['pages_per_sec']:.0f}로 떨어졌습니다")
+    return regressions
+
+
+def main():
+    """벤치마크를 실행하고 결과를 출력합니다."""
+    parser = argparse.ArgumentParser(description="오프라인 크롤링 벤치마크와 회귀 검사")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES, help="픽스처 디렉토리")
+    parser.add_argument("--sites", nargs="+", choices=get_site_registry().names(), help="측정할 사이트 목록")
+    parser.add_argument("--backends", nargs="+", choices=["http", "async", "selenium"],
+                        default=list(DEFAULT_BACKENDS), help="측정할 백엔드 목록")
+    parser.add_argument("--repeat", type=int, default=20, help="페이지 목록 반복 횟수")
+    parser.add_argument("--baseline", metavar="PATH", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--save-baseline", metavar="PATH", help="결과를 기준 결과 JSON 파일로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용할 초당 페이지 수 감소 비율")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    cases = [(site, backend) for site in args.sites or get_site_registry().names() for backend in args.backends]
+    results = []
+    failed = False
+    print(f"{'크롤러/백엔드':<20} {'페이지/초':>9} {'행/초':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'최대 RSS':>10}")
+    for site, backend in cases:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(run_case, site, backend, args.fixtures, args.repeat).result()
+        name = f"{site}/{backend}"
+        problems = result["errors"] + (compare(result, baseline, args.tolerance) if "pages" in result else [])
+        if "pages" in result:
+            results.append(result)
+            rss = f"{result['peak_rss_kb'] / 1024:.1f}MB" if result["peak_rss_kb"] is not None else "-"
+            print(f"{name:<20} {result['pages_per_sec']:>9.0f} {result['rows_per_sec']:>9.0f} "
+                  f"{result['p50_ms']:>6.2f}ms {result['p95_ms']:>6.2f}ms {result['p99_ms']:>6.2f}ms {rss:>10}")
+        for problem in problems:
+            failed = True
+            print(f"  실패: {name}: {problem}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({f"{r['site']}/{r['backend']}": r for r in results}, f, ensure_ascii=False, indent=2)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+합성 목록 페이지 픽스처 생성 스크립트.
+
+사이트별 목록 페이지와 같은 마크업에 titles.txt의 제목을 채워 benchmarks/fixtures에 기록합니다.
+실제 페이지를 기록하려면 record_fixtures.py를 사용합니다.
+
+    python benchmarks/make_fixtures.py --pages 2 --rows 20
+"""
+
+import argparse
+import html
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hotdeal_crawler import CoolenjoyCrawler, PPomppuCrawler, RuliwebCrawler  # noqa: E402
+from hotdeal_crawler.price_parser import extract_price_info  # noqa: E402
+from hotdeal_crawler.replay import FixtureRecorder  # noqa: E402
+from price_parser_bench import DEFAULT_CORPUS, load_titles  # noqa: E402
+
+# 기본 픽스처 디렉토리
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+CATEGORIES = ["PC/가전", "식품", "생활", "의류", "게임"]
+
+
+def views(offset: int) -> str:
+    """행의 조회 수를 만듭니다. 위쪽(최근) 행일수록 적습니다."""
+    return f"{(offset + 1) * 137:,}"
+
+
+def sold_out_title(title: str, offset: int) -> str:
+    """일곱 행마다 하나씩 제목 앞에 품절 표시를 붙입니다."""
+    return f"[품절] {title}" if offset % 7 == 6 else title
+
+
+def ppomppu_page(titles, first_idx: int) -> str:
+    """뽐뿌 목록 페이지를 만듭니다. 첫 행은 상단 고정 게시글입니다."""
+    rows = ['<tr class="baseList bbs_new1 hotpop_bg_color"><td class="baseList-space">인기</td>'
+            '<td class="baseList-space title"><a class="baseList-title" '
+            'href="view.php?id=ppomppu&amp;no=1">[공지] 뽐뿌게시판 이용 안내</a></td></tr>']
+    for offset, title in enumerate(titles):
+        idx = first_idx - offset
+        title = sold_out_title(title, offset)
+        rows.append(f'<tr class="baseList bbs_new1"><td class="baseList-space">{idx}</td>'
+                    f'<td class="baseList-space title"><a class="baseList-title" '
+                    f'href="view.php?id=ppomppu&amp;no={idx}">{html.escape(title)}</a>'
+                    f'<span class="baseList-c">{offset % 7}</span></td>'
+                    f'<td class="baseList-space"><time>12:{offset:02d}</time></td>'
+                    f'<td class="baseList-space baseList-rec">{offset % 5} - 0</td>'
+                    f'<td class="baseList-space baseList-views">{views(offset)}</td></tr>')
+    return ('<html><head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr">'
+            '<title>뽐뿌게시판</title></head><body><table id="revolution_main_table"><tbody>'
+            + "".join(rows) + '</tbody></table></body></html>')
+
+
+def ruliweb_page(titles, first_idx: int) -> str:
+    """루리웹 목록 페이지를 만듭니다. 공지와 BEST 행이 섞여 있습니다."""
+    rows = ['<tr class="table_body notice"><td class="id"></td><td class="divsn">공지</td>'
+            '<td class="subject"><a class="deco" href="/market/board/1020/read/1">핫딜 게시판 규칙</a></td></tr>',
+            '<tr class="table_body best"><td class="id">90001</td><td class="divsn">BEST</td>'
+            '<td class="subject"><a class="deco" href="/market/board/1020/read/90001">지난주 인기 딜</a></td></tr>']
+    for offset, title in enumerate(titles):
+        idx = first_idx - offset
+        title = sold_out_title(title, offset)
+        comments = f" ({offset % 30})" if offset % 3 else ""
+        rows.append(f'<tr class="table_body blocktarget"><td class="id">{idx}</td>'
+                    f'<td class="divsn">{CATEGORIES[offset % len(CATEGORIES)]}</td>'
+                    f'<td class="subject"><a class="deco" href="/market/board/1020/read/{idx}">'
+                    f'{html.escape(title)}{comments}</a></td><td class="writer">작성자</td>'
+                    f'<td class="recomd">{offset % 9}</td><td class="hit">{views(offset)}</td></tr>')
+    return ('<html><head><meta charset="utf-8"><title>루리웹 핫딜</title></head><body>'
+            '<table class="board_list_table"><tbody>' + "".join(rows) + '</tbody></table></body></html>')
+
+
+def coolenjoy_page(titles, first_idx: int) -> str:
+    """쿨엔조이 목록 페이지를 만듭니다. 첫 행은 상단 고정 게시글이고, 일부 행은 가격 열이 비어 있습니다."""
+    rows = ['<li class="d-md-table-row px-3 py-2 p-md-0 text-md-center bg-light">'
+            '<div class="d-none d-md-table-cell">공지</div>'
+            '<div class="d-md-table-cell text-left"><div class="na-title"><div class="na-item">'
+            '<a href="https://coolenjoy.net/bbs/jirum/1" class="na-subject">지름 게시판 안내</a>'
+            '</div></div></div><div class="d-md-table-cell"></div></li>']
+    for offset, title in enumerate(titles):
+        idx = first_idx - offset
+        amount = extract_price_info(title).price
+        price = f'<font color="#f89a00">{amount:,}원</font>' if amount and offset % 4 else ""
+        title = sold_out_title(title, offset)
+        rows.append(f'<li class="d-md-table-row px-3 py-2 p-md-0 text-md-center">'
+                    f'<div class="d-none d-md-table-cell">{CATEGORIES[offset % len(CATEGORIES)]}</div>'
+                    f'<div class="d-md-table-cell text-left"><div class="na-title"><div class="na-item">'
+                    f'<a href="https://coolenjoy.net/bbs/jirum/{idx}" class="na-subject">{html.escape(title)}</a>'
+                    f'<span class="count-plus">{offset % 11}</span>'
+                    f'</div></div></div><div class="d-md-table-cell">{price}</div>'
+                    f'<div class="d-md-table-cell">작성자</div><div class="d-md-table-cell">12:{offset:02d}</div>'
+                    f'<div class="d-md-table-cell">{views(offset)}</div>'
+                    f'<div class="d-md-table-cell">{offset % 6}</div></li>')
+    return ('<html><head><meta charset="utf-8"><title>쿨엔조이 지름</title></head><body>'
+            '<section id="bo_list"><ul class="na-table d-md-table w-100">' + "".join(rows)
+            + '</ul></section></body></html>')
+
+
+# 크롤러 클래스, 페이지 생성 함수, 첫 idx
+SITES = [
+    (PPomppuCrawler, ppomppu_page, 612000),
+    (RuliwebCrawler, ruliweb_page, 100500),
+    (CoolenjoyCrawler, coolenjoy_page, 3300000),
+]
+
+
+def main():
+    """픽스처를 만들어 기록합니다."""
+    parser = argparse.ArgumentParser(description="합성 목록 페이지 픽스처 생성")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES, help="픽스처 디렉토리")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="제목 말뭉치 파일 경로")
+    parser.add_argument("--pages", type=int, default=2, help="사이트별 페이지 수")
+    parser.add_argument("--rows", type=int, default=20, help="페이지별 딜 행 수")
+    args = parser.parse_args()
+
+    titles = load_titles(args.corpus)
+    recorder = FixtureRecorder(args.fixtures)
+    for site_number, (crawler_class, make_page, first_idx) in enumerate(SITES):
+        crawler = crawler_class(fetch_backend="http")
+        encoding = crawler.encoding or "utf-8"
+        for page in range(1, args.pages + 1):
+            start = (page - 1) * args.rows
+            # 사이트마다 다른 제목을 써서 사이트 간 중복 제거에 걸리지 않게 함
+            offset = start + site_number * args.pages * args.rows
+            page_titles = [titles[(offset + i) % len(titles)] for i in range(args.rows)]
+            document = make_page(page_titles, first_idx - start)
+            url = crawler.page_url(page, crawler.boards[0])
+            path = recorder.record(url, document.encode(encoding, errors="xmlcharrefreplace"), crawler.encoding)
+            print(f"{url} -> {path}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""
+키워드 구독 매칭 벤치마크.
+
+titles.txt의 제목에서 뽑은 단어로 구독을 무작위로 만들고, 구독 수를 늘려 가며
+모든 구독을 하나씩 확인하는 선형 탐색과 DealMatcher의 제목당 매칭 시간을 비교합니다.
+
+    python benchmarks/matcher_bench.py --sizes 100 1000 10000 30000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hotdeal_crawler.matcher import DealMatcher, Subscription, normalize_text  # noqa: E402
+from hotdeal_crawler.models import HotDealItem  # noqa: E402
+from price_parser_bench import DEFAULT_CORPUS, load_titles  # noqa: E402
+
+# 구독 키워드로 쓸 제목 단어 (한글, 영문, 숫자 두 글자 이상)
+_WORD_RE = re.compile(r'[0-9A-Za-z가-힣]{2,}')
+
+
+def make_subscriptions(titles, count: int, seed: int = 0):
+    """
+    제목 단어와 만들어 낸 단어를 섞어 구독 목록을 만듭니다.
+
+    Args:
+        titles: 제목 목록
+        count: 만들 구독 수
+        seed: 난수 시드
+
+    Returns:
+        List[Subscription]: 구독 목록
+    """
+    rng = random.Random(seed)
+    words = sorted({word for title in titles for word in _WORD_RE.findall(title)})
+    subscriptions = []
+    for i in range(count):
+        # 실제 구독처럼 대부분은 제목에 나오지 않는 키워드를 포함
+        keywords = [rng.choice(words) if rng.random() < 0.3 else f"{rng.choice(words)}{i}"
+                    for _ in range(rng.randint(1, 3))]
+        max_price = rng.choice([None, 50000, 300000])
+        subscriptions.append(Subscription(str(i), keywords, max_price=max_price))
+    return subscriptions
+
+
+def linear_match(subscriptions, deal: HotDealItem):
+    """모든 구독의 모든 키워드를 제목에서 찾는 선형 탐색."""
+    title = normalize_text(deal.title)
+    return [subscription for subscription in subscriptions
+            if all(keyword in title for keyword in subscription.keywords)
+            and not any(keyword in title for keyword in subscription.exclude)
+            and subscription.accepts(deal)]
+
+
+def measure(match, deals, repeat: int) -> float:
+    """제목 하나를 매칭하는 평균 시간(µs)을 측정합니다."""
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for deal in deals:
+            match(deal)
+    return (time.perf_counter() - start_time) / (repeat * len(deals)) * 1e6
+
+
+def main():
+    """벤치마크를 실행하고 결과를 출력합니다."""
+    parser = argparse.ArgumentParser(description="키워드 구독 매칭 벤치마크")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="제목 말뭉치 파일 경로")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="구독 수 목록")
+    parser.add_argument("--repeat", type=int, default=20, help="말뭉치 반복 횟수")
+    args = parser.parse_args()
+
+    titles = load_titles(args.corpus)
+    deals = [HotDealItem(idx=str(i), title=title, url=f"https://example.com/{i}", site="bench")
+             for i, title in enumerate(titles)]
+
+    print(f"{'구독 수':>8} {'선형 탐색':>12} {'DealMatcher':>12} {'매칭 수':>8}")
+    for size in args.sizes:
+        subscriptions = make_subscriptions(titles, size)
+
+        start_time = time.perf_counter()
+        matcher = DealMatcher(subscriptions)
+        matcher.match(deals[0])
+        build_time = time.perf_counter() - start_time
+
+        # 두 방식의 결과가 같은지 확인
+        matched = 0
+        for deal in deals:
+            expected = {subscription.id for subscription in linear_match(subscriptions, deal)}
+            actual = {subscription.id for subscription in matcher.match(deal)}
+            assert expected == actual, (deal.title, expected ^ actual)
+            matched += len(actual)
+
+        linear_repeat = max(1, args.repeat * 100 // size)
+        linear_time = measure(lambda deal: linear_match(subscriptions, deal), deals, linear_repeat)
+        matcher_time = measure(matcher.match, deals, args.repeat)
+        print(f"{size:>8} {linear_time:>10.1f}µs {matcher_time:>10.1f}µs {matched:>8}"
+              f"  (오토마톤 생성 {build_time * 1000:.0f}ms)")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,184 @@
+"""
+목록 페이지 행 추출 벤치마크.
+
+기록된 픽스처 페이지의 응답 바이트에서 행 명세의 모든 행과 필드를 꺼내는 데 걸리는 시간을
+추출 방식별로 비교합니다. Selenium을 뺀 모든 방식은 파싱을 포함해 측정하며, 모든 방식의
+결과가 컴파일한 lxml 방식과 같은지도 확인합니다 (다르면 종료 코드 1).
+
+  - cssselect: 이전 방식 (문자열로 디코딩한 뒤 파싱하고, 호출마다 CSS 선택자를 XPath로 변환)
+  - bs4: BeautifulSoup + soupsieve (설치되어 있으면)
+  - lxml: 미리 컴파일한 XPath로 바이트를 직접 파싱한 lxml 트리에서 추출
+  - selectolax: 바이트에서 lexbor로 바로 추출 (설치되어 있으면)
+  - selenium: 렌더링된 file:// 페이지에서 한 번의 스크립트로 추출 (--selenium, 파싱/이동 제외)
+
+    python benchmarks/parse_bench.py --repeat 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lxml.html  # noqa: E402
+
+from hotdeal_crawler.fetchers import HtmlNode, parse_document  # noqa: E402
+from hotdeal_crawler.plugins import get_site_registry  # noqa: E402
+from hotdeal_crawler.replay import ReplayFetcher  # noqa: E402
+from hotdeal_crawler.row_spec import (  # noqa: E402
+    LexborHTMLParser,
+    extract_rows_from_bytes,
+    extract_rows_from_driver,
+    extract_rows_from_lxml
+)
+from make_fixtures import DEFAULT_FIXTURES  # noqa: E402
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:  # BeautifulSoup이 없으면 bs4 방식은 측정하지 않음
+    BeautifulSoup = None
+
+
+def extract_cssselect(content: bytes, base_url: str, encoding, spec):
+    """이전 방식: 디코딩한 문자열을 파싱하고 행과 필드마다 cssselect를 호출합니다."""
+    if encoding:
+        root = HtmlNode(lxml.html.document_fromstring(content.decode(encoding, errors="replace")), base_url)
+    else:
+        root = HtmlNode(lxml.html.document_fromstring(content), base_url)
+    rows = []
+    for row in root.element.cssselect(spec.row_selector):
+        values = {}
+        for name, field in spec.fields.items():
+            if field.selector:
+                matches = row.cssselect(field.selector)
+                element = matches[0] if matches else None
+            else:
+                element = row
+            if element is None:
+                values[name] = None
+            elif field.attribute is None:
+                values[name] = HtmlNode(element, base_url).text
+            else:
+                values[name] = HtmlNode(element, base_url).get_attribute(field.attribute)
+        rows.append(values)
+    return rows
+
+
+def extract_bs4(content: bytes, base_url: str, encoding, spec):
+    """BeautifulSoup과 soupsieve로 추출합니다."""
+    from urllib.parse import urljoin
+    soup = BeautifulSoup(content, "lxml", from_encoding=encoding)
+    rows = []
+    for row in soup.select(spec.row_selector):
+        values = {}
+        for name, field in spec.fields.items():
+            element = row.select_one(field.selector) if field.selector else row
+            if element is None:
+                values[name] = None
+            elif field.attribute is None:
+                values[name] = " ".join(element.get_text().split())
+            else:
+                value = element.get(field.attribute)
+                if isinstance(value, list):
+                    value = " ".join(value)
+                if value is not None and field.attribute in ("href", "src"):
+                    value = urljoin(base_url, value)
+                values[name] = value
+        rows.append(values)
+    return rows
+
+
+def extract_lxml(content: bytes, base_url: str, encoding, spec):
+    """바이트를 직접 파싱하고 컴파일한 XPath로 추출합니다."""
+    return extract_rows_from_lxml(parse_document(content, base_url, encoding), spec)
+
+
+def extract_selectolax(content: bytes, base_url: str, encoding, spec):
+    """selectolax로 바이트에서 바로 추출합니다."""
+    return extract_rows_from_bytes(content, base_url, encoding, spec)
+
+
+def pages_of(replay: ReplayFetcher, crawler):
+    """크롤러의 첫 게시판에서 기록된 페이지의 (본문, URL, 인코딩) 목록을 반환합니다."""
+    pages = []
+    while True:
+        url = crawler.page_url(len(pages) + 1, crawler.boards[0])
+        if not replay.has(url):
+            return pages
+        entry = replay._index[url]
+        pages.append((url, replay.content(url), entry["final_url"], crawler.encoding or entry["encoding"]))
+
+
+def measure(function, pages, spec, repeat: int):
+    """모든 페이지를 repeat번 추출하여 (초당 행 수, 페이지당 ms)를 반환합니다."""
+    rows = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _, content, base_url, encoding in pages:
+            rows += len(function(content, base_url, encoding, spec))
+    elapsed = time.perf_counter() - start
+    return rows / elapsed, elapsed / (repeat * len(pages)) * 1000
+
+
+def main():
+    """벤치마크를 실행하고 결과를 출력합니다."""
+    parser = argparse.ArgumentParser(description="목록 페이지 행 추출 벤치마크")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES, help="픽스처 디렉토리")
+    parser.add_argument("--repeat", type=int, default=100, help="페이지 목록 반복 횟수")
+    parser.add_argument("--selenium", action="store_true", help="Selenium 추출도 측정 (Chrome 필요)")
+    args = parser.parse_args()
+
+    methods = [("cssselect", extract_cssselect)]
+    if BeautifulSoup is not None:
+        methods.append(("bs4", extract_bs4))
+    methods.append(("lxml", extract_lxml))
+    if LexborHTMLParser is not None:
+        methods.append(("selectolax", extract_selectolax))
+
+    driver = None
+    if args.selenium:
+        from hotdeal_crawler.driver_pool import create_chrome_driver
+        driver = create_chrome_driver(block_resources=False)
+
+    replay = ReplayFetcher(args.fixtures)
+    failed = False
+    print(f"{'사이트':<12} {'방식':<12} {'행/초':>10} {'페이지당':>10} {'배율':>7}")
+    try:
+        for site in get_site_registry().names():
+            crawler = get_site_registry().create(site, fetch_backend="http")
+            spec = crawler.row_spec
+            pages = pages_of(replay, crawler)
+            if not pages:
+                continue
+            expected = [extract_lxml(content, base_url, encoding, spec) for _, content, base_url, encoding in pages]
+
+            baseline = None
+            for name, function in methods:
+                results = [function(content, base_url, encoding, spec) for _, content, base_url, encoding in pages]
+                if results != expected:
+                    failed = True
+                    print(f"  실패: {site}/{name}: lxml 방식과 결과가 다릅니다")
+                rows_per_sec, page_ms = measure(function, pages, spec, args.repeat)
+                baseline = baseline or rows_per_sec
+                print(f"{site:<12} {name:<12} {rows_per_sec:>10.0f} {page_ms:>8.3f}ms {rows_per_sec / baseline:>6.1f}x")
+
+            if driver is not None:
+                rows = 0
+                elapsed = 0.0
+                for url, _, _, _ in pages:
+                    driver.get(replay.file_url(url))
+                    start = time.perf_counter()
+                    for _ in range(args.repeat):
+                        rows += len(extract_rows_from_driver(driver, spec))
+                    elapsed += time.perf_counter() - start
+                print(f"{site:<12} {'selenium':<12} {rows / elapsed:>10.0f} "
+                      f"{elapsed / (args.repeat * len(pages)) * 1000:>8.3f}ms {rows / elapsed / baseline:>6.1f}x")
+    finally:
+        if driver is not None:
+            driver.quit()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
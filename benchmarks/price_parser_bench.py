@@ -0,0 +1,65 @@
+"""
+가격 정보 추출 벤치마크.
+
+titles.txt의 딜 제목 말뭉치로 extract_price_info의 처리량과 항목별 추출률을 측정합니다.
+
+    python benchmarks/price_parser_bench.py --repeat 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hotdeal_crawler.price_parser import extract_price_info  # noqa: E402
+
+# 기본 제목 말뭉치 경로
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "titles.txt")
+
+
+def load_titles(path: str):
+    """
+    말뭉치 파일에서 빈 줄을 제외한 제목 목록을 읽습니다.
+
+    Args:
+        path: 한 줄에 제목 하나가 있는 UTF-8 텍스트 파일
+
+    Returns:
+        List[str]: 제목 목록
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main():
+    """벤치마크를 실행하고 결과를 출력합니다."""
+    parser = argparse.ArgumentParser(description="가격 정보 추출 벤치마크")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="제목 말뭉치 파일 경로")
+    parser.add_argument("--repeat", type=int, default=1000, help="말뭉치 반복 횟수")
+    parser.add_argument("--show", action="store_true", help="제목별 추출 결과 출력")
+    args = parser.parse_args()
+
+    titles = load_titles(args.corpus)
+    results = [extract_price_info(title) for title in titles]
+    if args.show:
+        for title, info in zip(titles, results):
+            print(f"{title}\n    {info}")
+
+    for field in ("store", "price", "shipping", "discount"):
+        found = sum(1 for info in results if getattr(info, field) is not None)
+        print(f"{field:>8}: {found}/{len(titles)} ({found / len(titles):.0%})")
+
+    start_time = time.perf_counter()
+    for _ in range(args.repeat):
+        for title in titles:
+            extract_price_info(title)
+    elapsed = time.perf_counter() - start_time
+    total = args.repeat * len(titles)
+    print(f"{total}개 제목을 {elapsed:.2f}초에 처리 ({total / elapsed:,.0f}개/초, "
+          f"제목당 {elapsed / total * 1e6:.1f}µs)")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+실제 목록 페이지 픽스처 기록 스크립트.
+
+사이트별 크롤러가 요청하는 목록 페이지를 그대로 기록하여 crawl_bench.py와
+crawler.py --replay에서 네트워크 없이 재생할 수 있게 합니다.
+
+    python benchmarks/record_fixtures.py --sites ppomppu ruliweb --pages 2
+    python benchmarks/crawl_bench.py --repeat 50 --save-baseline benchmarks/baseline.json
+
+기록한 뒤에는 기준 결과를 다시 저장해야 tests/test_fixture_replay.py의 사이트별 딜 수와 맞습니다.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hotdeal_crawler.plugins import get_site_registry  # noqa: E402
+from hotdeal_crawler.replay import FixtureRecorder  # noqa: E402
+from make_fixtures import DEFAULT_FIXTURES  # noqa: E402
+
+
+def main():
+    """실제 목록 페이지를 기록합니다."""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="실제 목록 페이지 픽스처 기록")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES, help="픽스처 디렉토리")
+    parser.add_argument("--sites", nargs="+", choices=get_site_registry().names(), help="기록할 사이트 목록")
+    parser.add_argument("--backend", choices=["http", "selenium"], help="페이지 가져오기 백엔드")
+    parser.add_argument("--pages", type=int, default=2, help="게시판마다 기록할 페이지 수")
+    args = parser.parse_args()
+
+    recorder = FixtureRecorder(args.fixtures)
+    for site in args.sites or get_site_registry().names():
+        crawler = get_site_registry().create(site, fetch_backend=args.backend)
+        count = recorder.record_crawler(crawler, pages=args.pages)
+        print(f"{site}: {count}개 페이지 기록")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -5,19 +5,32 @@
 """
 
 import argparse
-import json
+import asyncio
 import logging
 import os
-from datetime import datetime
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
+# requests, lxml 등을 가져오는 모듈(관리자, 엔진, fetcher, 재생, 싱크)은 --help가 빠르도록
+# 쓰는 함수 안에서 import
 from hotdeal_crawler import (
-    HotDealCrawlerManager,
-    PPomppuCrawler,
-    RuliwebCrawler,
-    CoolenjoyCrawler,
-    HotDealItem
+    AdaptiveScheduler,
+    HotDealItem,
+    CrawlStateStore,
+    PriceHistoryStore,
+    ResultStore
 )
+from hotdeal_crawler.db import MySqlDialect, SqliteDialect, mysql_pool_from_env, sqlite_pool
+from hotdeal_crawler.health import HealthTracker
+from hotdeal_crawler.http_cache import ResponseCache
+from hotdeal_crawler.lifecycle import LifecycleStore
+from hotdeal_crawler.matcher import DealMatcher, load_subscriptions
+from hotdeal_crawler.metrics import MetricsServer, Tracer, get_registry
+from hotdeal_crawler.plugins import get_site_registry
+from hotdeal_crawler.ratelimit import HostThrottle
+
+if TYPE_CHECKING:
+    from hotdeal_crawler import HotDealCrawlerManager
+    from hotdeal_crawler.sinks import BaseSink, SinkPipeline
 
 # 로깅 설정
 logging.basicConfig(
@@ -26,54 +39,126 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 사이트 이름과 크롤러 클래스의 매핑
-SITE_CRAWLERS = {
-    "ppomppu": PPomppuCrawler,
-    "ruliweb": RuliwebCrawler,
-    "coolenjoy": CoolenjoyCrawler
-}
-
 # 결과 저장 디렉토리
 RESULT_DIR = "result"
+# 사이트별 마지막으로 본 idx를 저장하는 파일
+STATE_FILE = os.path.join(RESULT_DIR, "state.json")
+# 딜을 JSON Lines 세그먼트로 이어 쓰는 결과 저장소 디렉토리
+STORE_DIR = os.path.join(RESULT_DIR, "store")
+# 목록 페이지의 ETag, Last-Modified와 본문 해시를 저장하는 파일
+HTTP_CACHE_FILE = os.path.join(RESULT_DIR, "http_cache.json")
+# 상품별 가격 이력 디렉토리
+PRICE_HISTORY_DIR = os.path.join(RESULT_DIR, "price_history")
+# 분산 크롤링 작업 큐 파일
+QUEUE_FILE = os.path.join(RESULT_DIR, "queue.sqlite3")
+# 딜별 내용 지문과 인기 지표를 저장하는 파일
+LIFECYCLE_FILE = os.path.join(RESULT_DIR, "lifecycle.json")
 
 
-def save_to_json(deals: List[HotDealItem], site_name: str = None):
+def parse_boards(values: List[str]) -> Dict[str, List[str]]:
     """
-    크롤링한 핫딜 정보를 JSON 파일로 저장합니다.
+    "사이트:게시판" 형식의 인자를 사이트별 게시판 목록으로 변환합니다.
     
     Args:
-        deals: 저장할 핫딜 목록
-        site_name: 사이트 이름 (None인 경우 모든 사이트를 하나의 파일로 저장)
+        values: --board 인자 목록
+    
+    Returns:
+        Dict[str, List[str]]: 사이트 이름과 게시판 목록의 매핑
+    """
+    boards = {}
+    for value in values or []:
+        site, sep, board = value.partition(":")
+        if not sep or site not in get_site_registry() or not board:
+            raise argparse.ArgumentTypeError(f"--board는 사이트:게시판 형식이어야 합니다: {value}")
+        boards.setdefault(site, []).append(board)
+    return boards
+
+
+def create_sinks(args) -> List["BaseSink"]:
     """
-    # 결과 디렉토리가 없으면 생성
-    if not os.path.exists(RESULT_DIR):
-        os.makedirs(RESULT_DIR)
-        logger.info(f"결과 디렉토리 생성: {RESULT_DIR}")
+    명령행 인자에 맞는 결과 싱크 목록을 만듭니다.
     
-    # 파일명 생성 (사이트명_날짜시간.json 또는 all_날짜시간.json)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{site_name or 'all'}_{timestamp}.json"
-    filepath = os.path.join(RESULT_DIR, filename)
+    Args:
+        args: 명령행 인자
     
-    # HotDealItem 객체를 딕셔너리로 변환
-    deals_dict = []
-    for deal in deals:
-        deal_dict = {
-            "idx": deal.idx,
-            "title": deal.title,
-            "url": deal.url,
-            "price": deal.price,
-            "timestamp": deal.timestamp.isoformat(),
-            "site": deal.site,
-            "category": deal.category
-        }
-        deals_dict.append(deal_dict)
+    Returns:
+        List[BaseSink]: 결과 싱크 목록
+    """
+    from hotdeal_crawler.sinks import (
+        AlertSink,
+        DatabaseSink,
+        ElasticsearchSink,
+        JsonLinesSink,
+        ResultStoreSink,
+        StdoutSink
+    )
+
+    store = ResultStore(STORE_DIR, compression=args.compression)
+    sinks = [StdoutSink(), ResultStoreSink(store)]
+    if args.jsonl:
+        sinks.append(JsonLinesSink(args.jsonl))
+    if args.sqlite:
+        sinks.append(DatabaseSink(sqlite_pool(args.sqlite), SqliteDialect()))
+    else:
+        # DB_HOST 등 환경 변수가 설정되어 있으면 MySQL에 저장
+        pool = mysql_pool_from_env()
+        if pool is not None:
+            sinks.append(DatabaseSink(pool, MySqlDialect()))
+    # ELASTICSEARCH_HOST 환경 변수가 설정되어 있으면 색인
+    es_sink = ElasticsearchSink.from_env()
+    if es_sink is not None:
+        sinks.append(es_sink)
+    if args.subscriptions:
+        matcher = DealMatcher(load_subscriptions(args.subscriptions))
+        logger.info(f"키워드 구독 {len(matcher)}개를 불러왔습니다")
+        sinks.append(AlertSink(matcher))
+    return sinks
+
+
+def close_http_cache(http_cache: Optional[ResponseCache]):
+    """
+    응답 캐시를 저장하고 적중 통계를 기록합니다.
     
-    # JSON 파일로 저장
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(deals_dict, f, ensure_ascii=False, indent=2)
+    Args:
+        http_cache: 응답 캐시 (None이면 아무것도 하지 않음)
+    """
+    if http_cache is None:
+        return
+    http_cache.flush()
+    stats = http_cache.stats()
+    logger.info(f"HTTP 캐시: 304 응답 {stats['not_modified']}개, 본문 동일 {stats['unchanged']}개, "
+                f"변경 {stats['misses']}개 (적중률 {stats['hit_ratio']:.0%})")
+
+
+def run_daemon(manager: "HotDealCrawlerManager", pipeline: "SinkPipeline", args,
+               price_history: Optional[PriceHistoryStore] = None):
+    """
+    데몬 모드로 사이트별 적응형 간격에 따라 계속 크롤링합니다.
     
-    logger.info(f"{len(deals)}개의 핫딜 정보를 {filepath}에 저장했습니다.")
+    Args:
+        manager: 크롤러가 추가된 크롤러 매니저
+        pipeline: 새 딜을 전달할 싱크 파이프라인
+        args: 명령행 인자
+        price_history: 새 딜에 가격 이력을 붙일 저장소 (None이면 붙이지 않음)
+    """
+    scheduler = AdaptiveScheduler(
+        initial_interval=args.interval,
+        min_interval=args.min_interval,
+        max_interval=args.max_interval
+    )
+
+    def on_deals(site_name: str, deals: List[HotDealItem]):
+        logger.info(f"{site_name}에서 {len(deals)}개의 새 핫딜을 찾았습니다")
+        for deal in deals:
+            if price_history is not None:
+                price_history.annotate(deal)
+            pipeline.put(deal)
+
+    try:
+        manager.run_daemon(scheduler, on_deals)
+    except KeyboardInterrupt:
+        logger.info("종료 요청을 받았습니다. 실행 중인 크롤링이 끝나길 기다립니다")
+        manager.stop()
 
 
 def main():
@@ -83,51 +168,292 @@ def main():
     parser.add_argument(
         "--sites", 
         nargs="+", 
-        choices=SITE_CRAWLERS.keys(),
-        help="크롤링할 사이트 목록 (지정하지 않으면 모든 사이트 크롤링)"
+        choices=get_site_registry().names(),
+        help="크롤링할 사이트 목록 (지정하지 않으면 모든 사이트 크롤링, "
+             "hotdeal_crawler.sites 엔트리 포인트로 등록된 사이트 포함)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["http", "selenium"],
+        help="페이지 가져오기 백엔드 (지정하지 않으면 사이트별 기본값 사용)"
+    )
+    parser.add_argument(
+        "--board",
+        action="append",
+        metavar="SITE:BOARD",
+        help="크롤링할 게시판 (예: ppomppu:ppomppu4, 여러 번 지정 가능, 지정하지 않으면 사이트별 기본 게시판)"
+    )
+    parser.add_argument(
+        "--pages",
+        type=int,
+        default=1,
+        help="게시판마다 마지막으로 본 글과 관계없이 읽을 페이지 수 (중단되었던 기간을 채울 때 사용)"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["thread", "async", "distributed"],
+        default="thread",
+        help="한 번 실행할 때의 크롤링 엔진 (async는 하나의 이벤트 루프에서 모든 대상을 동시에 크롤링, "
+             "distributed는 작업 큐로 여러 프로세스나 노드에 나눠 크롤링)"
+    )
+    parser.add_argument(
+        "--queue",
+        metavar="PATH",
+        default=QUEUE_FILE,
+        help="distributed 엔진과 작업자가 공유하는 작업 큐 SQLite 파일"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help="distributed 엔진이 이 머신에서 띄울 작업자 프로세스 수 "
+             "(지정하지 않으면 CPU 수, 0이면 --worker로 띄운 작업자에게만 맡김)"
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="크롤링을 시작하지 않고 --queue의 대상을 처리하는 작업자로 실행 (다른 노드에서 사용)"
+    )
+    parser.add_argument(
+        "--target-timeout",
+        type=float,
+        default=30,
+        help="async 엔진에서 대상(게시판 페이지) 하나를 크롤링할 최대 시간(초)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="작업자 스레드 수 (지정하지 않으면 호스트 수 x 호스트별 동시 요청 수)"
+    )
+    parser.add_argument(
+        "--host-concurrency",
+        type=int,
+        default=2,
+        help="호스트 하나에 동시에 보낼 최대 요청 수"
+    )
+    parser.add_argument(
+        "--host-rate",
+        type=float,
+        default=1.0,
+        help="호스트 하나에 보낼 초당 요청 수"
+    )
+    parser.add_argument(
+        "--latency-budget",
+        type=float,
+        help="페이지 하나에 허용할 시간(초), 넘은 페이지는 경고로 보고 (지정하지 않으면 사이트별 기본값)"
+    )
+    parser.add_argument(
+        "--retry-budget",
+        type=int,
+        default=3,
+        help="사이트마다 실행 한 번에 허용할 목록 페이지 재시도 횟수"
+    )
+    parser.add_argument(
+        "--breaker-threshold",
+        type=int,
+        default=3,
+        help="사이트의 회로 차단기를 열 연속 실패 페이지 수"
+    )
+    parser.add_argument(
+        "--breaker-cooldown",
+        type=float,
+        default=60,
+        help="회로 차단기가 열린 사이트에 다시 요청하기까지의 처음 냉각 시간(초, 실패가 이어지면 두 배씩 늘어남)"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="네트워크 대신 기록된 목록 페이지 픽스처 디렉토리에서 읽기 (HTTP 백엔드 사용)"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="마지막으로 본 글 기록을 사용하지 않고 첫 페이지 전체를 크롤링"
+    )
+    parser.add_argument(
+        "--jsonl",
+        metavar="PATH",
+        help="찾는 대로 딜을 JSON Lines 파일에 이어 쓰기"
+    )
+    parser.add_argument(
+        "--sqlite",
+        metavar="PATH",
+        help="DB_* 환경 변수 대신 로컬 SQLite 데이터베이스에 딜 저장"
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["gzip", "zstd"],
+        help="결과 저장소 세그먼트 압축 방식 (지정하지 않으면 압축하지 않음)"
+    )
+    parser.add_argument(
+        "--no-price-history",
+        action="store_true",
+        help="상품별 가격 이력을 기록하지 않고 딜에 역대 최저가, 중앙값도 붙이지 않음"
+    )
+    parser.add_argument(
+        "--no-lifecycle",
+        action="store_true",
+        help="이미 본 딜을 다시 읽어 제목/가격 수정, 품절, 추천/댓글/조회 수 변화를 찾지 않음"
+    )
+    parser.add_argument(
+        "--subscriptions",
+        metavar="PATH",
+        help="키워드 구독 JSON 파일 (매칭되는 딜을 알림으로 기록)"
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="한 번 실행하고 끝내지 않고 사이트별 적응형 간격으로 계속 크롤링"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=60,
+        help="데몬 모드의 사이트별 시작 폴링 간격(초)"
+    )
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=15,
+        help="데몬 모드의 최소 폴링 간격(초)"
+    )
+    parser.add_argument(
+        "--max-interval",
+        type=float,
+        default=600,
+        help="데몬 모드의 최대 폴링 간격(초)"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="데몬 모드에서 Prometheus 형식 메트릭을 http://127.0.0.1:PORT/metrics 로 내보내기"
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="크롤링 단계별 스팬을 JSON Lines 파일에 기록"
     )
     args = parser.parse_args()
+    try:
+        boards = parse_boards(args.board)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
     
+    if args.worker:
+        from hotdeal_crawler.distributed import run_worker
+        try:
+            health = HealthTracker(failure_threshold=args.breaker_threshold, cooldown=args.breaker_cooldown,
+                                   retries_per_cycle=args.retry_budget)
+            run_worker(args.queue, max_per_host=args.host_concurrency, host_rate=args.host_rate,
+                       replay_dir=args.replay, health_options=health.options())
+        except KeyboardInterrupt:
+            logger.info("작업자를 종료합니다")
+        return
+    
+    from hotdeal_crawler import HotDealCrawlerManager
+    from hotdeal_crawler.async_engine import AsyncCrawlEngine
+    from hotdeal_crawler.distributed import DistributedCrawlEngine
+    from hotdeal_crawler.fetchers import AsyncHttpFetcher, get_http_fetcher
+    from hotdeal_crawler.replay import AsyncReplayFetcher, ReplayFetcher
+    from hotdeal_crawler.sinks import SinkPipeline
+
     logger.info("핫딜 크롤러 시작")
     
     # 크롤러 매니저 생성
-    manager = HotDealCrawlerManager()
+    state_store = None if args.full else CrawlStateStore(STATE_FILE)
+    # 바뀌지 않은 목록 페이지는 파싱하지 않음 (전체 크롤링에서는 항상 파싱)
+    http_cache = None if args.full else ResponseCache(HTTP_CACHE_FILE)
+    get_http_fetcher().cache = http_cache
+    throttle = HostThrottle(max_concurrency=args.host_concurrency, rate=args.host_rate)
+    health = HealthTracker(failure_threshold=args.breaker_threshold, cooldown=args.breaker_cooldown,
+                           retries_per_cycle=args.retry_budget)
+    # 이미 본 딜의 변경 추적 (전체 크롤링에서는 모든 딜을 새 딜로 내보냄)
+    lifecycle = None if args.full or args.no_lifecycle else LifecycleStore(LIFECYCLE_FILE)
+    manager = HotDealCrawlerManager(state_store=state_store, throttle=throttle, health=health,
+                                    lifecycle=lifecycle)
+    replay = ReplayFetcher(args.replay) if args.replay else None
+    price_history = None if args.no_price_history else PriceHistoryStore(PRICE_HISTORY_DIR)
+    tracer = Tracer(args.trace) if args.trace else None
+    get_registry().tracer = tracer
     
-    # 사이트별 크롤러 추가
-    if args.sites:
-        # 지정된 사이트만 크롤링
-        for site in args.sites:
-            crawler_class = SITE_CRAWLERS[site]
-            manager.add_crawler(crawler_class())
-            logger.info(f"{site} 크롤러 추가")
-    else:
-        # 모든 사이트 크롤링
-        for site, crawler_class in SITE_CRAWLERS.items():
-            manager.add_crawler(crawler_class())
-            logger.info(f"{site} 크롤러 추가")
+    # 사이트별 크롤러 추가 (지정하지 않으면 모든 사이트 크롤링)
+    # 선택한 사이트의 크롤러 모듈만 import
+    registry = get_site_registry()
+    for site in args.sites or registry.names():
+        crawler = registry.create(site, fetch_backend="http" if replay else args.backend, boards=boards.get(site),
+                                  pages=args.pages)
+        crawler.http_fetcher = replay
+        if args.latency_budget is not None:
+            crawler.latency_budget = args.latency_budget
+        manager.add_crawler(crawler)
+        logger.info(f"{site} 크롤러 추가")
     
-    # 사이트를 병렬로 크롤링
-    deals = manager.crawl_all()
+    if args.daemon:
+        metrics_server = None
+        if args.metrics_port is not None:
+            metrics_server = MetricsServer(port=args.metrics_port)
+            metrics_server.start()
+        try:
+            with SinkPipeline(create_sinks(args)) as pipeline:
+                manager.dedup_index.on_update = pipeline.put_update
+                if lifecycle is not None:
+                    lifecycle.on_update = pipeline.put_update
+                run_daemon(manager, pipeline, args, price_history)
+        finally:
+            manager.close()
+            close_http_cache(http_cache)
+            if lifecycle is not None:
+                lifecycle.close()
+            if price_history is not None:
+                price_history.close()
+            if metrics_server is not None:
+                metrics_server.close()
+            if tracer is not None:
+                tracer.close()
+        logger.info("핫딜 크롤러 완료")
+        return
     
-    # 결과 출력
-    print(f"\n{len(deals)}개의 핫딜을 찾았습니다:")
-    for i, deal in enumerate(deals, 1):
-        print(f"{i}. {deal}")
+    # 사이트를 병렬로 크롤링하면서 찾는 대로 가격 이력을 붙여 싱크에 전달
+    try:
+        with SinkPipeline(create_sinks(args)) as pipeline:
+            manager.dedup_index.on_update = pipeline.put_update
+            if lifecycle is not None:
+                lifecycle.on_update = pipeline.put_update
+            if args.engine == "async":
+                fetcher = AsyncReplayFetcher(replay) if replay else AsyncHttpFetcher(cache=http_cache)
+                engine = AsyncCrawlEngine(manager, fetcher=fetcher, target_timeout=args.target_timeout)
+                deals = engine.iter_crawl()
+                if price_history is not None:
+                    deals = price_history.annotate_async(deals)
+                count = asyncio.run(pipeline.consume_async(deals))
+            elif args.engine == "distributed":
+                engine = DistributedCrawlEngine(manager, args.queue, processes=args.processes,
+                                                replay_dir=args.replay)
+                try:
+                    deals = engine.iter_crawl()
+                    if price_history is not None:
+                        deals = price_history.annotate_all(deals)
+                    count = pipeline.consume(deals)
+                finally:
+                    engine.close()
+            else:
+                deals = manager.iter_crawl(max_workers=args.workers)
+                if price_history is not None:
+                    deals = price_history.annotate_all(deals)
+                count = pipeline.consume(deals)
+    finally:
+        manager.close()
+        close_http_cache(http_cache)
+        if lifecycle is not None:
+            lifecycle.close()
+        if price_history is not None:
+            price_history.close()
+        if tracer is not None:
+            tracer.close()
     
-    # 결과를 JSON 파일로 저장
-    save_to_json(deals)
-    
-    # 사이트별로 결과 저장
-    if len(manager.crawlers) > 1:
-        site_deals = {}
-        for deal in deals:
-            site = deal.site.lower()
-            if site not in site_deals:
-                site_deals[site] = []
-            site_deals[site].append(deal)
-        
-        for site, site_deal_list in site_deals.items():
-            save_to_json(site_deal_list, site)
+    print(f"\n{count}개의 핫딜을 찾았습니다")
+    if pipeline.updates:
+        print(f"이미 본 딜 {pipeline.updates}개가 바뀌었습니다")
     
     logger.info("핫딜 크롤러 완료")
 
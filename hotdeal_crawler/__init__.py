@@ -2,21 +2,71 @@
 핫딜 크롤러 패키지.
 
 이 패키지는 다양한 한국 커뮤니티 웹사이트에서 핫딜을 크롤링하는 기능을 제공합니다.
+패키지를 import할 때 무거운 모듈을 읽지 않도록 아래 이름들은 처음 접근할 때 import합니다.
+사이트 크롤러는 plugins 모듈의 레지스트리에서 이름으로 찾을 수 있습니다.
 """
 
-from .models import HotDealItem
-from .base_crawler import BaseCrawler
-from .manager import HotDealCrawlerManager
+import importlib
+from typing import TYPE_CHECKING
+
+# 공개 이름과 그 이름을 정의한 모듈 (처음 접근할 때 import)
+_LAZY_ATTRIBUTES = {
+    'HotDealItem': '.models',
+    'BaseCrawler': '.base_crawler',
+    'HotDealCrawlerManager': '.manager',
+    'AdaptiveScheduler': '.scheduler',
+    'CrawlStateStore': '.state',
+    'ResultStore': '.result_store',
+    'PriceHistoryStore': '.price_history',
+    'LifecycleStore': '.lifecycle',
+    'SiteRegistry': '.plugins',
+    'get_site_registry': '.plugins',
+    # 사이트별 크롤러
+    'RuliwebCrawler': '.site_crawlers.ruliweb_crawler',
+    'CoolenjoyCrawler': '.site_crawlers.coolenjoy_crawler',
+    'PPomppuCrawler': '.site_crawlers.ppomppu_crawler',
+}
+
+if TYPE_CHECKING:
+    from .models import HotDealItem
+    from .base_crawler import BaseCrawler
+    from .manager import HotDealCrawlerManager
+    from .scheduler import AdaptiveScheduler
+    from .state import CrawlStateStore
+    from .result_store import ResultStore
+    from .price_history import PriceHistoryStore
+    from .lifecycle import LifecycleStore
+    from .plugins import SiteRegistry, get_site_registry
+    from .site_crawlers.ruliweb_crawler import RuliwebCrawler
+    from .site_crawlers.coolenjoy_crawler import CoolenjoyCrawler
+    from .site_crawlers.ppomppu_crawler import PPomppuCrawler
+
+
+def __getattr__(name: str):
+    """공개 이름에 처음 접근할 때 모듈을 import합니다 (PEP 562)."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# 사이트별 크롤러 가져오기
-from .site_crawlers.ruliweb_crawler import RuliwebCrawler
-from .site_crawlers.coolenjoy_crawler import CoolenjoyCrawler
-from .site_crawlers.ppomppu_crawler import PPomppuCrawler
 
 __all__ = [
     'HotDealItem',
     'BaseCrawler',
     'HotDealCrawlerManager',
+    'AdaptiveScheduler',
+    'CrawlStateStore',
+    'ResultStore',
+    'PriceHistoryStore',
+    'LifecycleStore',
+    'SiteRegistry',
+    'get_site_registry',
     'RuliwebCrawler',
     'CoolenjoyCrawler',
     'PPomppuCrawler',
@@ -0,0 +1,160 @@
+"""
+핫딜 크롤러를 위한 asyncio 크롤링 엔진 모듈.
+
+이 모듈은 대상마다 스레드를 쓰지 않고 하나의 이벤트 루프에서 많은 (게시판, 페이지) 대상을
+동시에 크롤링하는 엔진을 제공합니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+from .fetchers import AsyncHttpFetcher
+from .manager import BoardRun, HotDealCrawlerManager
+from .models import CrawlTarget, HotDealItem
+from .ratelimit import host_of
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCrawlEngine:
+    """관리자의 크롤러들을 asyncio로 크롤링하는 엔진."""
+
+    def __init__(self, manager: HotDealCrawlerManager, fetcher: Optional[AsyncHttpFetcher] = None,
+                 target_timeout: float = 30.0, max_concurrency: int = 100):
+        """
+        asyncio 크롤링 엔진을 초기화합니다.
+
+        크롤러 목록, 호스트별 제한, 중복 제거 인덱스, 상태 저장소는 관리자의 것을 그대로 사용합니다.
+
+        Args:
+            manager: 크롤러가 추가된 크롤러 관리자
+            fetcher: 비동기 HTTP 백엔드 (기본값: 새 AsyncHttpFetcher).
+                     세션은 이벤트 루프에 묶이므로 크롤링을 마칠 때마다 닫음
+            target_timeout: 대상 하나를 크롤링할 최대 시간(초)
+            max_concurrency: 전체 동시 크롤링 대상 수
+        """
+        self.manager = manager
+        self.fetcher = fetcher or AsyncHttpFetcher()
+        self.target_timeout = target_timeout
+        self.max_concurrency = max_concurrency
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """호스트별 동시 요청 수를 제한하는 세마포어를 반환합니다."""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.manager.throttle.max_concurrency)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def _crawl_target(self, run: BoardRun, target: CrawlTarget) -> List[HotDealItem]:
+        """
+        호스트별, 전체 동시 실행 한도 안에서 대상 하나를 크롤링합니다.
+
+        Args:
+            run: 대상이 속한 게시판 실행
+            target: 크롤링할 대상
+
+        Returns:
+            List[HotDealItem]: 핫딜 아이템 목록, 실패하거나 시간이 초과되면 빈 목록
+        """
+        crawler = run.crawler
+        host = host_of(crawler.page_url(target.page, target.board))
+        async with self._semaphore, self._host_semaphore(host):
+            try:
+                with self.manager.metrics.span("crawl_target", site=crawler.site_name, board=target.board,
+                                               page=target.page):
+                    return await asyncio.wait_for(
+                        crawler.crawl_target_async(target, run.last_idx, self.fetcher),
+                        self.target_timeout)
+            except asyncio.TimeoutError:
+                # 스레드 풀에서 실행 중인 Selenium 크롤링은 멈출 수 없고 결과만 버려짐
+                logger.warning(f"{target} 크롤링이 {self.target_timeout:.0f}초 안에 끝나지 않았습니다")
+                # 취소된 크롤링은 결과를 기록하지 못하므로 시간 초과를 실패로 기록
+                if crawler.health is not None:
+                    crawler.health.record_failure(f"{self.target_timeout:.0f}초 안에 끝나지 않았습니다")
+            except asyncio.CancelledError:
+                # 반열림 상태의 시험 요청이 취소되면 차단기가 계속 요청을 막지 않도록 풀어 줌
+                if crawler.health is not None:
+                    crawler.health.release_probe()
+                raise
+            except Exception as e:
+                logger.error(f"크롤러 {crawler.site_name}에서 오류 발생 ({target}): {e}")
+        # 읽지 못한 페이지의 딜을 놓치지 않도록 게시판의 마지막으로 본 idx를 갱신하지 않게 함
+        target.failed = True
+        return []
+
+    async def iter_crawl(self) -> AsyncIterator[HotDealItem]:
+        """
+        모든 사이트의 게시판과 페이지를 동시에 크롤링하면서 딜을 찾는 대로 반환합니다.
+
+        반복을 중간에 멈추거나 취소하면 진행 중인 대상을 모두 취소합니다.
+
+        Returns:
+            AsyncIterator[HotDealItem]: 중복이 제거된 핫딜 아이템
+        """
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.manager.health.begin_cycle()
+        tasks: Dict[asyncio.Task, tuple] = {}
+
+        def submit(run: BoardRun, target: CrawlTarget):
+            run.pending += 1
+            tasks[asyncio.create_task(self._crawl_target(run, target))] = (run, target)
+
+        for crawler in self.manager.crawlers:
+            runs = {board: BoardRun(crawler, board) for board in crawler.boards}
+            for target in crawler.targets():
+                submit(runs[target.board], target)
+
+        start_time = time.time()
+        count = 0
+        logger.info(f"{len(tasks)}개의 대상으로 asyncio 크롤링을 시작합니다")
+
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    run, target = tasks.pop(task)
+                    crawler = run.crawler
+                    run.record(target)
+                    run.pending -= 1
+                    # 처음에 넣은 pages 페이지 다음부터는 경계에 도달할 때까지 한 페이지씩 추가
+                    if target.page >= crawler.pages:
+                        next_target = crawler.next_target(target, run.last_idx)
+                        if next_target is not None:
+                            submit(run, next_target)
+
+                    for deal in self.manager.dedup_index.dedupe(task.result()):
+                        count += 1
+                        self.manager.metrics.deals.inc(site=deal.site)
+                        yield deal
+                    # 시간이 초과된 대상은 스레드 풀에서 계속 실행되더라도 반영하지 않음
+                    if not target.failed:
+                        crawler.commit_lifecycle(target)
+                    if not run.pending:
+                        run.finish()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.fetcher.close()
+
+        for crawler in self.manager.crawlers:
+            self.manager.report_slow_pages(crawler)
+        self.manager.report_health()
+        elapsed_time = time.time() - start_time
+        self.manager.metrics.cycle_seconds.observe(elapsed_time, site="all")
+        logger.info(f"크롤링이 {elapsed_time:.2f}초 만에 완료되었습니다")
+        logger.info(f"총 {count}개의 딜을 찾았습니다")
+
+    async def crawl(self) -> List[HotDealItem]:
+        """
+        모든 사이트의 게시판과 페이지를 동시에 크롤링합니다.
+
+        Returns:
+            List[HotDealItem]: 중복이 제거된 모든 핫딜 아이템 목록
+        """
+        return [deal async for deal in self.iter_crawl()]
\ No newline at end of file
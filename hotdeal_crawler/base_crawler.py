@@ -5,53 +5,134 @@
 """
 
 import abc
+import asyncio
+import collections
 import logging
+import threading
 import time
-from typing import List, Optional
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import WebDriverException, TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
+from .driver_pool import WebDriverPool, create_chrome_driver
+from .fetchers import BY_CSS_SELECTOR, AsyncHttpFetcher, HtmlNode, HttpFetcher, get_http_fetcher
+from .health import SiteHealth
+from .http_cache import PageUnchanged
+from .lifecycle import LifecycleStore
+from .metrics import MetricsRegistry, get_registry
+from .models import CrawlTarget, HotDealItem
+from .price_parser import apply_price_info
+from .ratelimit import HostThrottle
+from .row_spec import RowSpec, extract_rows_from_driver, extract_rows_from_node
+from .state import CrawlStateStore, idx_to_int
 
-from .models import HotDealItem
+# 사용할 수 있는 페이지 가져오기 백엔드
+BACKEND_SELENIUM = "selenium"
+BACKEND_HTTP = "http"
+FETCH_BACKENDS = (BACKEND_SELENIUM, BACKEND_HTTP)
 
 
 class BaseCrawler(abc.ABC):
     """모든 사이트별 크롤러를 위한 추상 기본 클래스."""
+
+    # 브라우저 없이(서버 렌더링된 HTML만으로) 크롤링할 수 없는 사이트면 True
+    requires_browser = True
+    # HTTP 백엔드에서 사용할 문서 인코딩 (None이면 자동 감지)
+    encoding = None
+    # 목록 페이지에서 추출할 행과 필드의 선언적 명세
+    row_spec: Optional[RowSpec] = None
+    # 마지막으로 본 idx까지의 간격이 한 페이지보다 클 때 최대로 읽을 페이지 수
+    max_pages = 5
+    # Selenium 백엔드에서 페이지가 준비되었다고 판단할 CSS 선택자 (None이면 row_spec의 행 선택자)
+    ready_selector: Optional[str] = None
+    # 준비 선택자를 기다릴 최대 시간(초)
+    ready_timeout = 10
+    # 페이지 하나를 가져오는 데 허용할 시간(초). 넘으면 느린 페이지로 기록
+    latency_budget = 5.0
+    # 기본으로 크롤링할 게시판 목록 (첫 번째 게시판의 상태는 사이트 이름으로 저장)
+    default_boards: Tuple[str, ...] = ()
     
-    def __init__(self, site_name: str, base_url: str):
+    def __init__(self, site_name: str, base_url: str, fetch_backend: Optional[str] = None,
+                 http_fetcher: Optional[HttpFetcher] = None, boards: Optional[Sequence[str]] = None,
+                 pages: int = 1):
         """
         기본 크롤러를 초기화합니다.
         
         Args:
             site_name: 사이트 이름
             base_url: 사이트의 기본 URL
+            fetch_backend: 페이지 가져오기 백엔드 ("selenium" 또는 "http").
+                           None이면 브라우저가 필요 없는 사이트는 "http", 그 외는 "selenium"
+            http_fetcher: HTTP 백엔드에서 사용할 fetcher (기본값: 프로세스 공유 fetcher)
+            boards: 크롤링할 게시판 목록 (기본값: default_boards)
+            pages: 게시판마다 마지막으로 본 idx와 관계없이 읽을 페이지 수
+                   (중단되었던 기간을 채울 때 사용)
         """
+        # 관리자가 같은 크롤러의 여러 페이지를 동시에 크롤링하므로 WebDriver와 문서는 스레드별로 둠
+        self._local = threading.local()
+        if fetch_backend is None:
+            fetch_backend = BACKEND_SELENIUM if self.requires_browser else BACKEND_HTTP
+        if fetch_backend not in FETCH_BACKENDS:
+            raise ValueError(f"알 수 없는 백엔드입니다: {fetch_backend}")
+
         self.site_name = site_name
         self.base_url = base_url
+        self.hot_deal_url = base_url
+        self.fetch_backend = fetch_backend
+        self.http_fetcher = http_fetcher
+        self.boards: List[Optional[str]] = list(boards or self.default_boards) or [None]
+        self.pages = max(1, pages)
         self.logger = logging.getLogger(f"{__name__}.{self.site_name}")
         self.driver = None
+        self.driver_pool: Optional[WebDriverPool] = None
+        self._driver_pages = 0
+        self.document = None
+        self.state_store: Optional[CrawlStateStore] = None
+        self.throttle: Optional[HostThrottle] = None
+        self.health: Optional[SiteHealth] = None
+        self.lifecycle: Optional[LifecycleStore] = None
+        self.slow_pages: Deque[Tuple[str, float]] = collections.deque(maxlen=100)
+        self.metrics: MetricsRegistry = get_registry()
+
+    @property
+    def driver(self):
+        """현재 스레드가 사용하는 WebDriver."""
+        return getattr(self._local, "driver", None)
+
+    @driver.setter
+    def driver(self, value):
+        self._local.driver = value
+
+    @property
+    def document(self):
+        """현재 스레드가 HTTP 백엔드로 가져온 문서."""
+        return getattr(self._local, "document", None)
+
+    @document.setter
+    def document(self, value):
+        self._local.document = value
+
+    @property
+    def _driver_pages(self) -> int:
+        """현재 스레드의 WebDriver로 연 페이지 수."""
+        return getattr(self._local, "driver_pages", 0)
+
+    @_driver_pages.setter
+    def _driver_pages(self, value: int):
+        self._local.driver_pages = value
         
     def _setup_driver(self):
-        """Selenium WebDriver를 설정합니다."""
+        """Selenium WebDriver를 설정합니다. 풀이 설정되어 있으면 풀에서 빌립니다."""
         if self.driver is not None:
             return
             
         try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.set_page_load_timeout(30)  # 페이지 로드 타임아웃 설정
+            # 풀에 남는 브라우저가 없으면 여기서 Chrome이 시작됨
+            with self.metrics.stage("driver_startup", self.site_name):
+                if self.driver_pool is not None:
+                    self.driver = self.driver_pool.acquire()
+                else:
+                    self.driver = create_chrome_driver()
+            self._driver_pages = 0
 
             self.logger.info(f"WebDriver set up for {self.site_name}")
         except Exception as e:
@@ -59,10 +140,13 @@ class BaseCrawler(abc.ABC):
             raise
     
     def _close_driver(self):
-        """Selenium WebDriver를 종료합니다."""
+        """Selenium WebDriver를 종료합니다. 풀에서 빌린 경우 풀에 반납합니다."""
         if self.driver is not None:
             try:
-                self.driver.quit()
+                if self.driver_pool is not None:
+                    self.driver_pool.release(self.driver, self._driver_pages)
+                else:
+                    self.driver.quit()
                 self.driver = None
                 self.logger.info(f"WebDriver closed for {self.site_name}")
             except Exception as e:
@@ -70,7 +154,7 @@ class BaseCrawler(abc.ABC):
     
     def get_page(self, url: str) -> bool:
         """
-        Selenium을 사용하여 페이지로 이동합니다.
+        설정된 백엔드를 사용하여 페이지로 이동합니다.
         
         Args:
             url: 이동할 URL
@@ -78,17 +162,176 @@ class BaseCrawler(abc.ABC):
         Returns:
             bool: 이동이 성공하면 True, 그렇지 않으면 False
         """
+        if self.throttle is not None:
+            with self.metrics.stage("throttle", self.site_name):
+                self.throttle.wait(url)
+
+        start_time = time.monotonic()
+        if self.fetch_backend == BACKEND_HTTP:
+            loaded = self._get_page_http(url)
+        else:
+            loaded = self._get_page_selenium(url)
+        self._check_latency(url, time.monotonic() - start_time)
+        return loaded
+
+    def _get_page_with_retries(self, url: str) -> bool:
+        """
+        페이지로 이동하고, 실패하면 사이트 상태의 재시도 예산 안에서 백오프하며 다시 시도합니다.
+
+        최종 결과는 사이트의 회로 차단기에 기록합니다. 사이트 상태가 없으면 한 번만 시도합니다.
+
+        Args:
+            url: 이동할 URL
+
+        Returns:
+            bool: 이동이 성공하면 True, 그렇지 않으면 False
+        """
+        if self.health is None:
+            return self.get_page(url)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            error = None
+            try:
+                loaded = self.get_page(url)
+            except Exception as e:
+                loaded = False
+                error = f"{type(e).__name__}: {e}"
+            if loaded:
+                self.health.record_success()
+                return True
+
+            delay = self.health.next_retry_delay(attempt)
+            if delay is None:
+                self.health.record_failure(error or f"{url}로 이동하지 못했습니다")
+                return False
+            self.metrics.retries.inc(site=self.site_name)
+            self.logger.warning(f"{url} 페이지를 가져오지 못했습니다. {delay:.1f}초 후 다시 시도합니다 ({attempt}회 실패)")
+            time.sleep(delay)
+
+    def _circuit_open(self, url: str) -> bool:
+        """
+        사이트의 회로 차단기가 열려 있어 페이지를 건너뛰어야 하는지 확인합니다.
+
+        Args:
+            url: 가져오려던 URL
+
+        Returns:
+            bool: 건너뛰어야 하면 True
+        """
+        if self.health is None or self.health.allow():
+            return False
+        self.logger.debug(f"회로 차단기가 열려 있어 {url} 페이지를 건너뜁니다")
+        self.metrics.skipped_pages.inc(site=self.site_name)
+        return True
+
+    def _get_page_selenium(self, url: str) -> bool:
+        """
+        WebDriver로 페이지로 이동하고 준비 선택자가 나타날 때까지 기다립니다.
+
+        Args:
+            url: 이동할 URL
+
+        Returns:
+            bool: 이동이 성공하면 True, 그렇지 않으면 False
+        """
+        # selenium은 import가 느리므로 Selenium 백엔드를 처음 사용할 때 가져옴
+        from selenium.common.exceptions import WebDriverException
+
         if self.driver is None:
             self._setup_driver()
             
         try:
-            self.driver.get(url)
-            # 페이지 로딩 대기
-            time.sleep(2)
-            return True
+            with self.metrics.stage("navigation", self.site_name, url=url):
+                self.driver.get(url)
+            self._driver_pages += 1
         except WebDriverException as e:
             self.logger.error(f"Error navigating to {url}: {e}")
+            self.metrics.pages.inc(site=self.site_name, result="failed")
             return False
+
+        # eager 로드 전략에서는 DOM이 준비되면 바로 반환되므로 목록이 나타났는지만 확인
+        selector = self.ready_selector or (self.row_spec.row_selector if self.row_spec else None)
+        if selector is not None:
+            with self.metrics.stage("wait", self.site_name):
+                ready = self.wait_for_element(BY_CSS_SELECTOR, selector, timeout=self.ready_timeout)
+            if ready is None:
+                # 목록이 나타나지 않은 페이지는 빈 페이지로 읽지 않고 실패로 처리해 다시 시도
+                self.logger.error(f"{url} 페이지에 목록({selector})이 나타나지 않았습니다")
+                self.metrics.pages.inc(site=self.site_name, result="failed")
+                return False
+        self.metrics.pages.inc(site=self.site_name, result="ok")
+        return True
+
+    def _check_latency(self, url: str, elapsed: float):
+        """
+        페이지를 가져오는 데 걸린 시간이 지연 예산을 넘으면 기록합니다.
+
+        Args:
+            url: 가져온 URL
+            elapsed: 걸린 시간(초)
+        """
+        if elapsed <= self.latency_budget:
+            return
+        self.slow_pages.append((url, elapsed))
+        self.metrics.slow_pages.inc(site=self.site_name)
+        self.logger.warning(f"{url} 페이지가 지연 예산 {self.latency_budget:.1f}초를 넘었습니다 ({elapsed:.2f}초)")
+
+    def pop_slow_pages(self) -> List[Tuple[str, float]]:
+        """
+        지연 예산을 넘은 페이지 기록을 꺼내고 비웁니다.
+
+        Returns:
+            List[Tuple[str, float]]: (URL, 걸린 시간(초)) 목록
+        """
+        pages = []
+        while self.slow_pages:
+            pages.append(self.slow_pages.popleft())
+        return pages
+
+    def _get_page_http(self, url: str) -> bool:
+        """
+        브라우저 없이 HTTP 요청으로 페이지를 가져옵니다.
+
+        Args:
+            url: 가져올 URL
+
+        Returns:
+            bool: 가져오기에 성공하면 True, 그렇지 않으면 False
+        """
+        fetcher = self.http_fetcher or get_http_fetcher()
+        try:
+            # HTTP 백엔드의 이동 시간에는 요청과 lxml 문서 생성이 포함됨
+            with self.metrics.stage("navigation", self.site_name, url=url):
+                self.document = fetcher.fetch(url, encoding=self.encoding)
+        except PageUnchanged:
+            # 바뀌지 않은 페이지는 파싱하지 않고 행이 없는 페이지로 처리
+            self.logger.debug(f"{url} 페이지가 바뀌지 않았습니다")
+            self.document = None
+            self.metrics.pages.inc(site=self.site_name, result="unchanged")
+            return True
+        self.metrics.pages.inc(site=self.site_name, result="ok" if self.document is not None else "failed")
+        return self.document is not None
+
+    def find_elements(self, css_selector: str) -> List:
+        """
+        현재 페이지에서 CSS 선택자에 맞는 요소들을 찾습니다.
+
+        HTTP 백엔드에서는 HtmlNode, Selenium 백엔드에서는 WebElement 목록을 반환하며
+        두 요소 모두 text, get_attribute, find_element를 같은 방식으로 사용할 수 있습니다.
+
+        Args:
+            css_selector: 검색할 CSS 선택자
+
+        Returns:
+            찾은 요소 목록
+        """
+        if self.fetch_backend == BACKEND_HTTP:
+            if self.document is None:
+                return []
+            return self.document.find_elements(BY_CSS_SELECTOR, css_selector)
+        return self.driver.find_elements(BY_CSS_SELECTOR, css_selector)
     
     def wait_for_element(self, by, value, timeout=10):
         """
@@ -102,6 +345,10 @@ class BaseCrawler(abc.ABC):
         Returns:
             요소를 찾으면 해당 요소, 찾지 못하면 None
         """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         try:
             return WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located((by, value))
@@ -122,6 +369,10 @@ class BaseCrawler(abc.ABC):
         Returns:
             요소들을 찾으면 해당 요소들, 찾지 못하면 빈 리스트
         """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         try:
             return WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_all_elements_located((by, value))
@@ -130,7 +381,401 @@ class BaseCrawler(abc.ABC):
             self.logger.warning(f"Timeout waiting for elements {by}={value}")
             return []
     
+    def extract_rows(self, document: Optional[HtmlNode] = None) -> List[Dict[str, Optional[str]]]:
+        """
+        현재 페이지에서 row_spec에 맞는 모든 행을 추출합니다.
+
+        Selenium 백엔드에서는 한 번의 execute_script 호출로 모든 행과 필드를 가져오므로
+        필드마다 WebDriver 왕복이 발생하지 않습니다.
+
+        Args:
+            document: 행을 추출할 HTTP 백엔드 문서 (None이면 현재 페이지)
+
+        Returns:
+            List[Dict[str, Optional[str]]]: 필드 이름과 값의 매핑 목록
+        """
+        if self.row_spec is None:
+            raise NotImplementedError(f"{type(self).__name__}에 row_spec이 정의되지 않았습니다")
+        if document is None and self.fetch_backend == BACKEND_HTTP:
+            document = self.document
+            if document is None:
+                return []
+        with self.metrics.stage("extraction", self.site_name):
+            if document is not None:
+                return extract_rows_from_node(document, self.row_spec)
+            return extract_rows_from_driver(self.driver, self.row_spec)
+
     @abc.abstractmethod
+    def parse_row(self, row: Dict[str, Optional[str]]) -> Optional[HotDealItem]:
+        """
+        추출된 행 하나를 핫딜 아이템으로 변환합니다.
+        
+        Args:
+            row: row_spec의 필드 이름과 값의 매핑
+        
+        Returns:
+            핫딜 아이템, 건너뛸 행(공지, 고정 게시글 등)이면 None
+        """
+        pass
+
+    def board_url(self, board: Optional[str]) -> str:
+        """
+        게시판 목록의 첫 페이지 URL을 반환합니다. 기본 구현은 hot_deal_url을 사용합니다.
+        
+        Args:
+            board: 게시판 (None이면 기본 목록)
+        
+        Returns:
+            str: 게시판 URL
+        """
+        return self.hot_deal_url
+
+    def page_url(self, page: int, board: Optional[str] = None) -> str:
+        """
+        목록의 페이지 URL을 반환합니다. 기본 구현은 page 쿼리 파라미터를 사용합니다.
+        
+        Args:
+            page: 1부터 시작하는 페이지 번호
+            board: 게시판 (None이면 hot_deal_url의 목록)
+        
+        Returns:
+            str: 페이지 URL
+        """
+        url = self.hot_deal_url if board is None else self.board_url(board)
+        if page <= 1:
+            return url
+        parts = urlsplit(url)
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "page"]
+        query.append(("page", str(page)))
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    def _state_key(self, board: Optional[str]) -> str:
+        """게시판의 상태 저장 키. 대표 게시판은 이전과 같이 사이트 이름을 사용합니다."""
+        if board is None or (self.default_boards and board == self.default_boards[0]):
+            return self.site_name
+        return f"{self.site_name}/{board}"
+
+    def get_last_idx(self, board: Optional[str]) -> Optional[int]:
+        """
+        게시판에서 마지막으로 본 idx를 반환합니다.
+        
+        Args:
+            board: 게시판
+        
+        Returns:
+            마지막으로 본 idx, 상태 저장소가 없거나 기록이 없으면 None
+        """
+        if self.state_store is None:
+            return None
+        return self.state_store.get_last_idx(self._state_key(board))
+
+    def update_last_idx(self, board: Optional[str], idx: Optional[int]):
+        """
+        게시판의 마지막으로 본 idx를 갱신합니다.
+        
+        Args:
+            board: 게시판
+            idx: 이번 실행에서 본 가장 큰 idx (None이면 갱신하지 않음)
+        """
+        if self.state_store is not None and idx is not None:
+            self.state_store.update_last_idx(self._state_key(board), idx)
+
+    def settle_cached_pages(self, board: Optional[str], pages: Iterable[int], commit: bool):
+        """
+        게시판 페이지들의 응답 캐시 보류 기록을 확정하거나 버립니다.
+
+        게시판의 마지막으로 본 idx를 갱신한 뒤에 확정하고, 갱신하지 않으면 버려서 다음 실행에서
+        같은 페이지를 다시 파싱하게 합니다.
+
+        Args:
+            board: 게시판
+            pages: 이번 실행에서 가져온 페이지 번호
+            commit: True이면 확정, False이면 버림
+        """
+        cache = getattr(self.http_fetcher or get_http_fetcher(), "cache", None)
+        if cache is None:
+            return
+        urls = [self.page_url(page, board) for page in pages]
+        if commit:
+            cache.commit(urls)
+        else:
+            cache.discard(urls)
+
+    def targets(self) -> List[CrawlTarget]:
+        """
+        처음에 크롤링할 목록 페이지를 반환합니다. 게시판마다 1페이지부터 pages 페이지까지입니다.
+        
+        Returns:
+            List[CrawlTarget]: 크롤링 대상 목록
+        """
+        return [CrawlTarget(self.site_name, board, page)
+                for board in self.boards for page in range(1, self.pages + 1)]
+
+    def next_target(self, target: CrawlTarget, last_idx: Optional[int]) -> Optional[CrawlTarget]:
+        """
+        크롤링을 마친 대상 다음에 읽어야 할 페이지를 반환합니다.
+        
+        pages 페이지까지는 항상 읽고, 그 뒤로는 마지막으로 본 idx에 도달하지 못한 경우에만
+        max_pages 페이지까지 읽습니다.
+        
+        Args:
+            target: 크롤링을 마친 대상
+            last_idx: 게시판에서 마지막으로 본 idx
+        
+        Returns:
+            다음 크롤링 대상, 더 읽을 필요가 없으면 None
+        """
+        if target.page < self.pages:
+            return CrawlTarget(self.site_name, target.board, target.page + 1)
+        # 첫 실행이거나 경계에 도달했으면 다음 페이지를 읽을 필요가 없음
+        if last_idx is None or target.reached_boundary or not target.rows or target.page >= self.max_pages:
+            return None
+        return CrawlTarget(self.site_name, target.board, target.page + 1)
+
+    def _parse_rows(self, document: Optional[HtmlNode] = None) -> Iterator[HotDealItem]:
+        """
+        현재 페이지의 행을 순서대로 핫딜 아이템으로 변환합니다.
+        
+        Args:
+            document: 행을 추출할 HTTP 백엔드 문서 (None이면 현재 페이지)
+        
+        Returns:
+            Iterator[HotDealItem]: 건너뛸 행을 제외한 핫딜 아이템
+        """
+        rows = self.extract_rows(document)
+        # 소비자가 딜을 처리하는 시간은 빼고 행 변환에 걸린 시간만 합산
+        parse_time = 0.0
+        try:
+            for row in rows:
+                start = time.perf_counter()
+                try:
+                    deal = self.parse_row(row)
+                    if deal is not None:
+                        # 사이트와 관계없이 제목에서 가격, 배송비, 쇼핑몰, 할인율을 채움
+                        deal = apply_price_info(deal)
+                except Exception as e:
+                    self.logger.error(f"딜 아이템 파싱 오류: {e}")
+                    self.metrics.parse_errors.inc(site=self.site_name)
+                    continue
+                finally:
+                    parse_time += time.perf_counter() - start
+                if deal is not None:
+                    yield deal
+        finally:
+            if rows:
+                self.metrics.stage_seconds.observe(parse_time, stage="parse", site=self.site_name)
+
+    def iter_target(self, target: CrawlTarget, last_idx: Optional[int] = None) -> Iterator[HotDealItem]:
+        """
+        목록 페이지 하나를 크롤링하면서 핫딜 아이템을 하나씩 반환합니다.
+        
+        마지막으로 본 idx에 도달하면 멈추며, 읽은 행 수와 가장 큰 idx, 경계 도달 여부,
+        실패 여부를 target에 기록합니다. WebDriver는 반납하지 않으므로 호출한 쪽에서 _close_driver를 호출해야 합니다.
+        
+        Args:
+            target: 크롤링할 대상
+            last_idx: 게시판에서 마지막으로 본 idx (None이면 페이지 전체)
+        
+        Returns:
+            Iterator[HotDealItem]: 핫딜 아이템
+        """
+        url = self.page_url(target.page, target.board)
+        if self._circuit_open(url):
+            target.failed = True
+            return
+        try:
+            if not self._get_page_with_retries(url):
+                self.logger.error(f"{url}로 이동하지 못했습니다")
+                target.failed = True
+                return
+            yield from self._until_boundary(target, last_idx, self._parse_rows())
+        except Exception as e:
+            self.logger.error(f"{url} 크롤링 오류: {e}")
+            target.failed = True
+
+    def _until_boundary(self, target: CrawlTarget, last_idx: Optional[int],
+                        deals: Iterator[HotDealItem]) -> Iterator[HotDealItem]:
+        """
+        마지막으로 본 idx 전까지의 딜을 반환하면서 target에 결과를 기록합니다.
+
+        수명 주기 저장소가 있으면 경계 뒤의 이미 본 딜도 끝까지 읽어 변경을 확인하고,
+        경계 앞의 딜 중 저장소가 이미 기억하는 딜은 다시 반환하지 않습니다. 저장소 기록은
+        target.tracked에 보류하므로 딜을 전달한 뒤 commit_lifecycle을 호출해야 합니다.
+        """
+        for deal in deals:
+            deal.board = target.board
+            idx = idx_to_int(deal.idx)
+            if last_idx is not None and idx is not None and idx <= last_idx:
+                target.reached_boundary = True
+                if self.lifecycle is None:
+                    break
+                self._track_lifecycle(deal, target, seen=True)
+                continue
+            target.rows += 1
+            if idx is not None and (target.max_idx is None or idx > target.max_idx):
+                target.max_idx = idx
+            if self.lifecycle is None or self._track_lifecycle(deal, target):
+                yield deal
+
+    def _track_lifecycle(self, deal: HotDealItem, target: CrawlTarget, seen: bool = False) -> bool:
+        """
+        딜을 수명 주기 저장소와 비교하고 기록을 target.tracked에 보류합니다.
+
+        Args:
+            deal: 다시 크롤링한 딜
+            target: 딜을 찾은 대상
+            seen: 마지막으로 본 idx 뒤의 이미 본 딜인지 여부
+
+        Returns:
+            bool: 새 딜로 반환해야 하면 True
+        """
+        is_new, _ = self.lifecycle.track(deal, seen=seen, staged=target.tracked)
+        return is_new
+
+    def commit_lifecycle(self, target: CrawlTarget):
+        """
+        대상의 딜을 모두 전달한 뒤 보류한 수명 주기 기록을 반영하고 찾은 변경을 메트릭에 더합니다.
+
+        실패하거나 시간이 초과된 대상은 호출하지 않으므로, 전달하지 못한 딜은 다음 실행에서
+        다시 새 딜로 반환됩니다.
+
+        Args:
+            target: 딜을 모두 전달한 대상
+        """
+        if self.lifecycle is None or not target.tracked:
+            return
+        tracked, target.tracked = target.tracked, []
+        for update in self.lifecycle.commit(tracked):
+            for kind in update.kinds:
+                self.metrics.deal_updates.inc(site=self.site_name, kind=kind)
+
+    async def crawl_target_async(self, target: CrawlTarget, last_idx: Optional[int],
+                                 fetcher: AsyncHttpFetcher) -> List[HotDealItem]:
+        """
+        asyncio 엔진에서 목록 페이지 하나를 크롤링합니다.
+        
+        HTTP 백엔드는 이벤트 루프에서 비동기로 가져오고, Selenium 백엔드는 스레드 풀에서
+        iter_target을 실행합니다. 하위 클래스는 이 메서드를 재정의하여 직접 비동기로 구현할 수 있습니다.
+        
+        Args:
+            target: 크롤링할 대상
+            last_idx: 게시판에서 마지막으로 본 idx (None이면 페이지 전체)
+            fetcher: 비동기 HTTP 백엔드
+        
+        Returns:
+            List[HotDealItem]: 핫딜 아이템 목록
+        """
+        if self.fetch_backend != BACKEND_HTTP:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._crawl_target_in_thread, target, last_idx)
+
+        url = self.page_url(target.page, target.board)
+        if self._circuit_open(url):
+            target.failed = True
+            return []
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.throttle is not None:
+                await asyncio.sleep(self.throttle.reserve(url))
+
+            start_time = time.monotonic()
+            error = None
+            try:
+                with self.metrics.stage("navigation", self.site_name, url=url):
+                    document = await fetcher.fetch(url, encoding=self.encoding)
+            except PageUnchanged:
+                self.logger.debug(f"{url} 페이지가 바뀌지 않았습니다")
+                self.metrics.pages.inc(site=self.site_name, result="unchanged")
+                if self.health is not None:
+                    self.health.record_success()
+                return []
+            except Exception as e:
+                # 사이트 상태가 없으면 재시도하지 않고 엔진에 오류를 넘김
+                if self.health is None:
+                    raise
+                document = None
+                error = f"{type(e).__name__}: {e}"
+            finally:
+                self._check_latency(url, time.monotonic() - start_time)
+            if document is not None:
+                break
+
+            self.metrics.pages.inc(site=self.site_name, result="failed")
+            delay = self.health.next_retry_delay(attempt) if self.health is not None else None
+            if delay is None:
+                self.logger.error(f"{url}로 이동하지 못했습니다")
+                if self.health is not None:
+                    self.health.record_failure(error or f"{url}로 이동하지 못했습니다")
+                target.failed = True
+                return []
+            self.metrics.retries.inc(site=self.site_name)
+            self.logger.warning(f"{url} 페이지를 가져오지 못했습니다. {delay:.1f}초 후 다시 시도합니다 ({attempt}회 실패)")
+            await asyncio.sleep(delay)
+
+        if self.health is not None:
+            self.health.record_success()
+        self.metrics.pages.inc(site=self.site_name, result="ok")
+        return list(self._until_boundary(target, last_idx, self._parse_rows(document)))
+
+    def _crawl_target_in_thread(self, target: CrawlTarget, last_idx: Optional[int]) -> List[HotDealItem]:
+        """스레드 풀에서 목록 페이지 하나를 크롤링하고 같은 스레드에서 WebDriver를 반납합니다."""
+        try:
+            return list(self.iter_target(target, last_idx))
+        finally:
+            self._close_driver()
+
+    def iter_crawl(self) -> Iterator[HotDealItem]:
+        """
+        모든 게시판을 차례로 크롤링하면서 핫딜 아이템을 변환하는 대로 하나씩 반환합니다.
+        
+        상태 저장소가 설정되어 있으면 마지막으로 본 idx에 도달하는 즉시 멈추고,
+        경계에 도달하지 못한 경우에만 다음 페이지를 읽습니다.
+        
+        Returns:
+            Iterator[HotDealItem]: 핫딜 아이템
+        """
+        self.logger.info(f"{self.site_name}에서 핫딜 크롤링 중")
+        count = 0
+
+        try:
+            for board in self.boards:
+                last_idx = self.get_last_idx(board)
+                max_idx = None
+                failed = False
+                seen = set()
+                pages = []
+                target = CrawlTarget(self.site_name, board)
+                try:
+                    while target is not None:
+                        pages.append(target.page)
+                        for deal in self.iter_target(target, last_idx):
+                            # 페이지를 넘기는 사이 새 글이 올라오면 같은 글이 다음 페이지에 다시 나옴
+                            if deal.idx in seen:
+                                continue
+                            seen.add(deal.idx)
+                            count += 1
+                            yield deal
+                        if not target.failed:
+                            self.commit_lifecycle(target)
+                        if target.max_idx is not None and (max_idx is None or target.max_idx > max_idx):
+                            max_idx = target.max_idx
+                        failed = failed or target.failed
+                        target = self.next_target(target, last_idx)
+                finally:
+                    # 중간에 멈추거나 읽지 못한 페이지가 있는 게시판은 다음 실행에서 건너뛴 글이
+                    # 없도록 상태를 갱신하지 않음
+                    if target is None and not failed:
+                        self.update_last_idx(board, max_idx)
+                    elif target is None:
+                        self.logger.warning(f"{board or self.site_name} 게시판에서 읽지 못한 페이지가 있어 "
+                                            f"마지막으로 본 idx를 갱신하지 않습니다")
+                    self.settle_cached_pages(board, pages, commit=target is None and not failed)
+        finally:
+            self._close_driver()
+            self.logger.info(f"{self.site_name}에서 {count}개의 딜을 찾았습니다")
+
     def crawl(self) -> List[HotDealItem]:
         """
         사이트를 크롤링하고 핫딜 아이템 목록을 반환합니다.
@@ -138,7 +783,7 @@ class BaseCrawler(abc.ABC):
         Returns:
             List[HotDealItem]: 핫딜 아이템 목록
         """
-        pass
+        return list(self.iter_crawl())
     
     def __del__(self):
         """WebDriver가 확실히 종료되도록 하는 소멸자."""
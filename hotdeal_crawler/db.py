@@ -0,0 +1,272 @@
+"""
+핫딜 크롤러를 위한 데이터베이스 연결 모듈.
+
+이 모듈은 DB-API 연결 풀과, SQLite/MySQL별 테이블 생성 및 다중 행 upsert SQL을 만드는 방언(dialect)을 제공합니다.
+"""
+
+import contextlib
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from typing import Callable, Iterator, Optional
+
+try:
+    import pymysql
+except ImportError:  # pymysql이 없으면 MySQL에 연결할 수 없음
+    pymysql = None
+
+logger = logging.getLogger(__name__)
+
+# hot_deals 테이블에 저장하는 컬럼 (site, board, idx가 기본 키)
+DEAL_COLUMNS = ("site", "board", "idx", "title", "url", "price", "currency", "shipping", "store",
+                "discount", "canonical_url", "category", "timestamp", "alternate_urls",
+                "sold_out", "recommendations", "comments", "views")
+KEY_COLUMNS = ("site", "board", "idx")
+# 목록에 표시되지 않으면 None인 인기 지표 (upsert할 때 None이면 기존 값을 유지)
+POPULARITY_COLUMNS = ("recommendations", "comments", "views")
+# 처음 만든 테이블 뒤에 추가한 컬럼과 그 정의 (기존 테이블에는 ALTER TABLE로 추가)
+ADDED_COLUMNS = {
+    "sold_out": "SMALLINT NOT NULL DEFAULT 0",
+    "recommendations": "INTEGER",
+    "comments": "INTEGER",
+    "views": "BIGINT",
+}
+
+
+class ConnectionPool:
+    """DB-API 연결을 재사용하는 크기 제한 연결 풀."""
+
+    def __init__(self, factory: Callable[[], object], max_size: int = 4, timeout: float = 30):
+        """
+        연결 풀을 초기화합니다. 연결은 처음 필요할 때 만듭니다.
+
+        Args:
+            factory: 새 DB-API 연결을 만드는 함수
+            max_size: 최대 연결 수
+            timeout: 연결을 빌릴 때 기다릴 최대 시간(초)
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._available = threading.Semaphore(max_size)
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[object]:
+        """
+        연결을 빌려 주고, 블록이 끝나면 반납합니다. 블록에서 예외가 나면 연결을 버립니다.
+
+        Returns:
+            Iterator[object]: DB-API 연결
+
+        Raises:
+            TimeoutError: timeout 안에 연결을 빌리지 못한 경우
+        """
+        if not self._available.acquire(timeout=self.timeout):
+            raise TimeoutError("데이터베이스 연결을 빌리지 못했습니다")
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self.factory()
+                with self._lock:
+                    self._size += 1
+
+            try:
+                yield conn
+            except Exception:
+                self._discard(conn)
+                raise
+            else:
+                self._idle.put(conn)
+        finally:
+            self._available.release()
+
+    def _discard(self, conn):
+        """오류가 난 연결을 닫고 풀에서 제거합니다."""
+        with self._lock:
+            self._size -= 1
+        try:
+            conn.close()
+        except Exception as e:
+            logger.error(f"Error closing database connection: {e}")
+
+    def close(self):
+        """유휴 연결을 모두 닫습니다."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+
+class SqlDialect:
+    """데이터베이스별 SQL 문법 차이를 감추는 기본 클래스."""
+
+    placeholder = "?"
+
+    def create_table_sql(self, table: str) -> str:
+        """
+        딜 테이블 생성 SQL을 반환합니다.
+
+        Args:
+            table: 테이블 이름
+
+        Returns:
+            str: CREATE TABLE 문
+        """
+        return (
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "site VARCHAR(32) NOT NULL, "
+            "board VARCHAR(32) NOT NULL DEFAULT '', "
+            "idx VARCHAR(64) NOT NULL, "
+            "title TEXT NOT NULL, "
+            "url TEXT NOT NULL, "
+            "price BIGINT, "
+            "currency VARCHAR(8) NOT NULL DEFAULT 'KRW', "
+            "shipping BIGINT, "
+            "store VARCHAR(64), "
+            "discount INTEGER, "
+            "canonical_url TEXT, "
+            "category VARCHAR(64), "
+            "timestamp VARCHAR(32) NOT NULL, "
+            "alternate_urls TEXT, "
+            + "".join(f"{column} {definition}, " for column, definition in ADDED_COLUMNS.items())
+            + "PRIMARY KEY (site, board, idx))"
+        )
+
+    def add_column_sql(self, table: str, column: str) -> str:
+        """
+        기존 딜 테이블에 ADDED_COLUMNS의 컬럼을 추가하는 SQL을 반환합니다.
+
+        Args:
+            table: 테이블 이름
+            column: 추가할 컬럼 이름
+
+        Returns:
+            str: ALTER TABLE 문
+        """
+        return f"ALTER TABLE {table} ADD COLUMN {column} {ADDED_COLUMNS[column]}"
+
+    def upsert_sql(self, table: str, row_count: int) -> str:
+        """
+        (site, board, idx) 기준 다중 행 upsert SQL을 반환합니다.
+
+        Args:
+            table: 테이블 이름
+            row_count: 한 문장에 넣을 행 수
+
+        Returns:
+            str: INSERT ... 문
+        """
+        raise NotImplementedError
+
+    def _update_sql(self, new_value: str) -> str:
+        """
+        upsert의 갱신 절을 만듭니다. 인기 지표는 새 값이 없으면 기존 값을 유지합니다.
+
+        Args:
+            new_value: 새 값을 가리키는 식의 형식 문자열 (예: "excluded.{}")
+
+        Returns:
+            str: "컬럼 = 새 값" 목록
+        """
+        updates = []
+        for column in DEAL_COLUMNS:
+            if column in KEY_COLUMNS:
+                continue
+            value = new_value.format(column)
+            if column in POPULARITY_COLUMNS:
+                value = f"COALESCE({value}, {column})"
+            updates.append(f"{column} = {value}")
+        return ", ".join(updates)
+
+    def _values_sql(self, row_count: int) -> str:
+        """VALUES 절의 자리표시자를 만듭니다."""
+        row = "(" + ", ".join([self.placeholder] * len(DEAL_COLUMNS)) + ")"
+        return ", ".join([row] * row_count)
+
+
+class SqliteDialect(SqlDialect):
+    """SQLite 3.24 이상용 방언."""
+
+    # 오래된 SQLite의 바인딩 변수 제한(999개)을 넘지 않도록 한 문장의 행 수를 제한
+    max_rows = 999 // len(DEAL_COLUMNS)
+
+    def upsert_sql(self, table: str, row_count: int) -> str:
+        updates = self._update_sql("excluded.{}")
+        return (
+            f"INSERT INTO {table} ({', '.join(DEAL_COLUMNS)}) VALUES {self._values_sql(row_count)} "
+            f"ON CONFLICT ({', '.join(KEY_COLUMNS)}) DO UPDATE SET {updates}"
+        )
+
+
+class MySqlDialect(SqlDialect):
+    """MySQL/MariaDB용 방언."""
+
+    placeholder = "%s"
+    max_rows = 1000
+
+    def create_table_sql(self, table: str) -> str:
+        return super().create_table_sql(table) + " DEFAULT CHARSET=utf8mb4"
+
+    def upsert_sql(self, table: str, row_count: int) -> str:
+        updates = self._update_sql("VALUES({})")
+        return (
+            f"INSERT INTO {table} ({', '.join(DEAL_COLUMNS)}) VALUES {self._values_sql(row_count)} "
+            f"ON DUPLICATE KEY UPDATE {updates}"
+        )
+
+
+def sqlite_pool(path: str, max_size: int = 1) -> ConnectionPool:
+    """
+    SQLite 데이터베이스 연결 풀을 만듭니다.
+
+    Args:
+        path: 데이터베이스 파일 경로 (":memory:"는 연결마다 별도 DB이므로 max_size=1로 사용)
+        max_size: 최대 연결 수
+
+    Returns:
+        ConnectionPool: 연결 풀
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    return ConnectionPool(lambda: sqlite3.connect(path, check_same_thread=False), max_size=max_size)
+
+
+def mysql_pool_from_env(max_size: int = 4) -> Optional[ConnectionPool]:
+    """
+    DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_DATABASE 환경 변수로 MySQL 연결 풀을 만듭니다.
+
+    Args:
+        max_size: 최대 연결 수
+
+    Returns:
+        연결 풀, DB_HOST가 설정되지 않았으면 None
+
+    Raises:
+        ValueError: pymysql이 설치되어 있지 않은 경우
+    """
+    host = os.environ.get("DB_HOST")
+    if not host:
+        return None
+    if pymysql is None:
+        raise ValueError("MySQL에 저장하려면 pymysql 패키지가 필요합니다")
+
+    def connect():
+        return pymysql.connect(
+            host=host,
+            port=int(os.environ.get("DB_PORT") or 3306),
+            user=os.environ.get("DB_USER"),
+            password=os.environ.get("DB_PASSWORD") or "",
+            database=os.environ.get("DB_DATABASE"),
+            charset="utf8mb4",
+        )
+
+    return ConnectionPool(connect, max_size=max_size)
\ No newline at end of file
@@ -0,0 +1,210 @@
+"""
+핫딜 크롤러를 위한 중복 제거 모듈.
+
+이 모듈은 (사이트, 게시판, idx) 기준의 정확한 중복과 정규화된 제목의 SimHash 기준의 유사 중복을
+일정 시간 동안 기억하여 같은 딜을 하나의 대표 딜로 묶는 인덱스를 제공합니다.
+"""
+
+import collections
+import hashlib
+import re
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .lifecycle import UPDATE_ALTERNATE_URLS, DealUpdate
+from .models import HotDealItem
+
+# 사이트마다 표기가 다른 쇼핑몰 태그 (예: [쿠팡], [G마켓])
+_STORE_TAG_RE = re.compile(r'\[[^\]]*\]')
+# 같은 딜이라도 작성자마다 다르게 쓰는 배송 관련 표현
+_NOISE_WORD_RE = re.compile(r'무료배송|무료|무배|배송비|택배')
+# 제목 정규화 시 남길 문자 (한글, 영문, 숫자)
+_NON_WORD_RE = re.compile(r'[^0-9a-z가-힣]+')
+
+SIMHASH_BITS = 64
+
+
+def normalize_title(title: str) -> str:
+    """
+    비교를 위해 제목을 정규화합니다.
+
+    소문자로 바꾸고 쇼핑몰 태그와 배송 관련 표현, 한글/영문/숫자 외의 문자를 제거합니다.
+
+    Args:
+        title: 딜 제목
+
+    Returns:
+        str: 정규화된 제목
+    """
+    title = _STORE_TAG_RE.sub(' ', title.lower())
+    title = _NOISE_WORD_RE.sub(' ', title)
+    return _NON_WORD_RE.sub('', title)
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """
+    문자 shingle을 사용하여 64비트 SimHash 지문을 계산합니다.
+
+    Args:
+        text: 정규화된 텍스트
+        shingle_size: shingle 길이(문자 수)
+
+    Returns:
+        int: 64비트 지문
+    """
+    if len(text) <= shingle_size:
+        shingles = [text]
+    else:
+        shingles = {text[i:i + shingle_size] for i in range(len(text) - shingle_size + 1)}
+
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+class _Entry:
+    """인덱스에 기억된 대표 딜 하나와 그 딜을 가리키는 다른 게시글의 키."""
+
+    __slots__ = ('deal', 'fingerprint', 'expires_at', 'aliases')
+
+    def __init__(self, deal: HotDealItem, fingerprint: int, expires_at: float):
+        self.deal = deal
+        self.fingerprint = fingerprint
+        self.expires_at = expires_at
+        self.aliases: List[Tuple[str, str, str]] = []
+
+
+class DedupIndex:
+    """정확한 중복과 유사 중복을 제거하는 크기 제한, 시간 만료 인덱스."""
+
+    def __init__(self, ttl: float = 6 * 60 * 60, max_entries: int = 10000, max_distance: int = 3):
+        """
+        중복 제거 인덱스를 초기화합니다.
+
+        Args:
+            ttl: 딜을 기억할 시간(초)
+            max_entries: 기억할 최대 딜 수 (넘으면 오래된 딜부터 잊음)
+            max_distance: 유사 중복으로 판단할 최대 SimHash 해밍 거리
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+        # 해밍 거리가 k 이하인 두 지문은 k+1개 밴드 중 적어도 하나가 일치함 (비둘기집 원리)
+        self._band_count = max_distance + 1
+        self._band_bits = SIMHASH_BITS // self._band_count
+        # 이미 내보낸 대표 딜에 다른 URL이 추가되었을 때 갱신 이벤트를 받을 함수
+        # (예: SinkPipeline.put_update)
+        self.on_update: Optional[Callable[[DealUpdate], None]] = None
+        self.lock = threading.Lock()
+        self._entries: "collections.OrderedDict[Tuple[str, str, str], _Entry]" = collections.OrderedDict()
+        self._bands: Dict[Tuple[int, int], List[_Entry]] = collections.defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def dedupe(self, deals: List[HotDealItem], now: Optional[float] = None) -> List[HotDealItem]:
+        """
+        딜 목록에서 중복을 제거하고 새 대표 딜만 반환합니다.
+
+        유사 중복으로 판단된 딜의 URL은 대표 딜의 alternate_urls에 추가됩니다. 대표 딜은 이미
+        싱크에 기록되었을 수 있으므로, on_update가 설정되어 있으면 갱신 이벤트로도 전달합니다.
+
+        Args:
+            deals: 중복을 제거할 딜 목록
+            now: 기준 시각 (기본값: time.time())
+
+        Returns:
+            List[HotDealItem]: 처음 보는 대표 딜 목록
+        """
+        now = time.time() if now is None else now
+        unique = []
+        updates: List[DealUpdate] = []
+        with self.lock:
+            self._expire(now)
+            for deal in deals:
+                if self._add(deal, now, updates):
+                    unique.append(deal)
+        # 갱신을 받는 쪽이 기다릴 수 있으므로 잠금 밖에서 전달
+        if self.on_update is not None:
+            for update in updates:
+                self.on_update(update)
+        return unique
+
+    def _add(self, deal: HotDealItem, now: float, updates: List[DealUpdate]) -> bool:
+        """딜을 인덱스에 추가하고 새 대표 딜이면 True를 반환합니다. 대표 딜이 바뀌면 updates에 추가합니다."""
+        key = deal.key
+        if key in self._entries:
+            return False
+
+        fingerprint = simhash(normalize_title(deal.title))
+        canonical = self._find_similar(fingerprint)
+        if canonical is not None:
+            if (deal.canonical_url != canonical.deal.canonical_url
+                    and deal.url not in canonical.deal.alternate_urls):
+                canonical.deal.alternate_urls.append(deal.url)
+                updates.append(DealUpdate(canonical.deal, [UPDATE_ALTERNATE_URLS],
+                                          {"alternate_urls": (None, deal.url)}))
+            # 같은 게시글이 다시 나와도 다시 비교하지 않도록 대표 딜을 가리키게 함
+            # (대표 딜이 만료되거나 밀려날 때 함께 제거)
+            self._entries[key] = canonical
+            canonical.aliases.append(key)
+            return False
+
+        entry = _Entry(deal, fingerprint, now + self.ttl)
+        self._entries[key] = entry
+        for band in self._band_keys(fingerprint):
+            self._bands[band].append(entry)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(*self._entries.popitem(last=False))
+        return True
+
+    def _find_similar(self, fingerprint: int) -> Optional[_Entry]:
+        """해밍 거리가 max_distance 이하인 대표 딜을 찾습니다."""
+        for band in self._band_keys(fingerprint):
+            for entry in self._bands.get(band, ()):
+                if bin(entry.fingerprint ^ fingerprint).count('1') <= self.max_distance:
+                    return entry
+        return None
+
+    def _expire(self, now: float):
+        """
+        만료된 딜을 인덱스에서 제거합니다.
+
+        대표 딜은 추가된 순서로 정렬되어 있고 대표 딜을 가리키는 키는 대표 딜과 함께 제거되므로
+        맨 앞 항목은 항상 대표 딜입니다.
+        """
+        while self._entries:
+            entry = next(iter(self._entries.values()))
+            if entry.expires_at > now:
+                break
+            self._remove(*self._entries.popitem(last=False))
+
+    def _remove(self, key: Tuple[str, str, str], entry: _Entry):
+        """제거된 키가 대표 딜 자신의 키이면 대표 딜을 가리키는 키와 밴드 버킷의 대표 딜도 제거합니다."""
+        if entry.deal.key != key:
+            return
+        for alias in entry.aliases:
+            if self._entries.get(alias) is entry:
+                del self._entries[alias]
+        for band in self._band_keys(entry.fingerprint):
+            bucket = self._bands.get(band)
+            if bucket is None:
+                continue
+            bucket[:] = [e for e in bucket if e is not entry]
+            if not bucket:
+                del self._bands[band]
+
+    def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        """지문을 밴드 번호와 밴드 값의 쌍 목록으로 나눕니다."""
+        mask = (1 << self._band_bits) - 1
+        return [(band, fingerprint >> (band * self._band_bits) & mask) for band in range(self._band_count)]
\ No newline at end of file
@@ -0,0 +1,619 @@
+"""
+핫딜 크롤러를 위한 분산 크롤링 모듈.
+
+이 모듈은 (사이트, 게시판, 페이지) 크롤링 대상을 공유 작업 큐에 넣고 여러 작업자 프로세스나
+노드가 리스(lease)를 잡아 나눠 크롤링하는 엔진을 제공합니다. 작업 큐는 SQLite 파일을 사용하며,
+같은 파일에 접근할 수 있는 작업자라면 로컬 프로세스든 다른 노드든 함께 처리할 수 있습니다.
+
+대상 하나는 리스를 잡은 작업자만 크롤링하고, 작업자가 죽어 리스가 만료되면 다른 작업자가 다시
+가져갑니다. 호스트별 동시 요청 수와 요청 간격도 작업 큐에서 모든 작업자에 걸쳐 지킵니다.
+작업자의 결과는 엔진이 모아 관리자의 중복 제거 인덱스와 상태 저장소에 반영합니다.
+회로 차단기와 재시도 예산은 관리자와 같은 설정으로 작업자 프로세스마다 따로 둡니다.
+관리자에 수명 주기 저장소가 있으면 작업자는 페이지 전체를 읽어 넘기고, 엔진이 마지막으로 본 idx
+경계를 적용하면서 이미 본 딜의 변경을 저장소에서 확인합니다.
+"""
+
+import concurrent.futures
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .base_crawler import BaseCrawler
+from .health import HealthTracker
+from .manager import BoardRun, HotDealCrawlerManager
+from .models import CrawlTarget, HotDealItem
+from .plugins import load_object
+from .ratelimit import host_of
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_runs (
+    run_id TEXT PRIMARY KEY,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS crawl_targets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    crawler TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    site TEXT NOT NULL,
+    board TEXT,
+    page INTEGER NOT NULL,
+    last_idx INTEGER,
+    host TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_token TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    rows INTEGER,
+    max_idx INTEGER,
+    reached_boundary INTEGER,
+    deals BLOB,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS crawl_targets_status ON crawl_targets (status, run_id);
+CREATE TABLE IF NOT EXISTS crawl_hosts (
+    host TEXT PRIMARY KEY,
+    next_at REAL NOT NULL
+);
+"""
+
+STATUS_PENDING = "pending"
+STATUS_LEASED = "leased"
+STATUS_DONE = "done"
+
+
+def crawler_path(crawler: BaseCrawler) -> str:
+    """
+    작업자가 크롤러를 다시 만들 수 있도록 크롤러 클래스의 경로를 반환합니다.
+
+    Args:
+        crawler: 크롤러
+
+    Returns:
+        str: "모듈:클래스" 형식의 경로
+    """
+    cls = type(crawler)
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def load_crawler(path: str, fetch_backend: str) -> BaseCrawler:
+    """
+    crawler_path로 만든 경로에서 크롤러를 생성합니다.
+
+    Args:
+        path: "모듈:클래스" 형식의 경로
+        fetch_backend: 페이지 가져오기 백엔드
+
+    Returns:
+        BaseCrawler: 생성된 크롤러
+    """
+    return load_object(path)(fetch_backend=fetch_backend)
+
+
+class Lease:
+    """작업자가 잡은 크롤링 대상 하나의 리스."""
+
+    __slots__ = ('id', 'token', 'run_id', 'crawler', 'backend', 'target', 'last_idx')
+
+    def __init__(self, id: int, token: str, run_id: str, crawler: str, backend: str,
+                 target: CrawlTarget, last_idx: Optional[int]):
+        self.id = id
+        self.token = token
+        self.run_id = run_id
+        self.crawler = crawler
+        self.backend = backend
+        self.target = target
+        self.last_idx = last_idx
+
+
+class TargetResult:
+    """작업자가 마친 크롤링 대상 하나의 결과."""
+
+    __slots__ = ('id', 'target', 'deals', 'error')
+
+    def __init__(self, id: int, target: CrawlTarget, deals: List[HotDealItem], error: Optional[str]):
+        self.id = id
+        self.target = target
+        self.deals = deals
+        self.error = error
+
+
+class LeaseQueue:
+    """
+    크롤링 대상을 리스로 나눠 주는 SQLite 작업 큐.
+
+    대상을 꺼내는 작업은 BEGIN IMMEDIATE 트랜잭션 안에서 이루어지므로 여러 프로세스가
+    동시에 꺼내도 같은 대상을 두 작업자가 잡지 않습니다. 연결은 프로세스마다 새로 만들어야 하므로
+    작업자 프로세스에는 경로를 넘겨 LeaseQueue를 다시 만듭니다.
+    """
+
+    def __init__(self, path: str, max_per_host: int = 2, host_rate: float = 1.0,
+                 lease_seconds: float = 60.0, max_attempts: int = 3):
+        """
+        작업 큐를 엽니다. 파일이 없으면 만듭니다.
+
+        Args:
+            path: SQLite 데이터베이스 파일 경로
+            max_per_host: 모든 작업자에 걸쳐 호스트 하나에 동시에 리스를 줄 최대 대상 수
+            host_rate: 모든 작업자에 걸쳐 호스트 하나에 보낼 초당 요청 수
+            lease_seconds: 리스 유효 시간(초). 작업자는 크롤링하는 동안 리스를 갱신함
+            max_attempts: 리스가 만료된 대상을 다시 나눠 줄 최대 시도 횟수
+        """
+        self.path = path
+        self.max_per_host = max_per_host
+        self.host_rate = host_rate
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        # 트랜잭션은 직접 시작하고 끝냄
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _transaction(self):
+        """쓰기 잠금을 바로 잡는 트랜잭션을 시작합니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def start_run(self) -> str:
+        """
+        새 실행을 등록합니다.
+
+        Returns:
+            str: 실행 ID
+        """
+        run_id = uuid.uuid4().hex
+        with self.lock:
+            self._conn.execute("INSERT INTO crawl_runs (run_id, created) VALUES (?, ?)", (run_id, time.time()))
+        return run_id
+
+    def finish_run(self, run_id: str):
+        """
+        실행을 끝내고 남은 대상을 지웁니다. 그 실행만 처리하던 작업자는 종료합니다.
+
+        Args:
+            run_id: 실행 ID
+        """
+        with self.lock:
+            self._transaction()
+            try:
+                self._conn.execute("DELETE FROM crawl_targets WHERE run_id = ?", (run_id,))
+                self._conn.execute("DELETE FROM crawl_runs WHERE run_id = ?", (run_id,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def run_active(self, run_id: str) -> bool:
+        """
+        실행이 아직 진행 중인지 확인합니다.
+
+        Args:
+            run_id: 실행 ID
+
+        Returns:
+            bool: finish_run이 호출되지 않았으면 True
+        """
+        with self.lock:
+            row = self._conn.execute("SELECT 1 FROM crawl_runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row is not None
+
+    def put(self, run_id: str, crawler: BaseCrawler, target: CrawlTarget, last_idx: Optional[int]) -> int:
+        """
+        크롤링 대상을 추가합니다.
+
+        Args:
+            run_id: 실행 ID
+            crawler: 대상을 크롤링할 크롤러 (작업자는 같은 클래스와 백엔드로 크롤러를 만듦)
+            target: 크롤링할 대상
+            last_idx: 게시판에서 마지막으로 본 idx
+
+        Returns:
+            int: 대상 ID
+        """
+        host = host_of(crawler.page_url(target.page, target.board))
+        with self.lock:
+            cursor = self._conn.execute(
+                "INSERT INTO crawl_targets (run_id, crawler, backend, site, board, page, last_idx, host) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, crawler_path(crawler), crawler.fetch_backend, target.site_name, target.board,
+                 target.page, last_idx, host))
+            return cursor.lastrowid
+
+    def lease(self, owner: str, run_id: Optional[str] = None) -> Optional[Lease]:
+        """
+        호스트별 한도 안에서 크롤링할 대상 하나의 리스를 잡습니다.
+
+        리스가 만료된 대상은 max_attempts까지 다시 나눠 주고, 그 뒤로는 오류로 끝냅니다.
+
+        Args:
+            owner: 작업자 이름 (로그와 디버깅용)
+            run_id: 이 실행의 대상만 꺼내려면 실행 ID (None이면 모든 실행)
+
+        Returns:
+            리스, 지금 꺼낼 수 있는 대상이 없으면 None
+        """
+        now = time.time()
+        run_filter = "" if run_id is None else " AND t.run_id = :run_id"
+        with self.lock:
+            self._transaction()
+            try:
+                self._conn.execute(
+                    "UPDATE crawl_targets SET status = :done, error = '리스가 만료되었습니다' "
+                    "WHERE status = :leased AND lease_expires < :now AND attempts >= :max_attempts",
+                    {"done": STATUS_DONE, "leased": STATUS_LEASED, "now": now,
+                     "max_attempts": self.max_attempts})
+                self._conn.execute(
+                    "UPDATE crawl_targets SET status = :pending, owner = NULL, lease_token = NULL "
+                    "WHERE status = :leased AND lease_expires < :now",
+                    {"pending": STATUS_PENDING, "leased": STATUS_LEASED, "now": now})
+                row = self._conn.execute(
+                    "SELECT t.id, t.run_id, t.crawler, t.backend, t.site, t.board, t.page, t.last_idx, t.host "
+                    "FROM crawl_targets t LEFT JOIN crawl_hosts h ON h.host = t.host "
+                    "WHERE t.status = :pending AND (h.next_at IS NULL OR h.next_at <= :now)"
+                    f"{run_filter} AND (SELECT COUNT(*) FROM crawl_targets l "
+                    "WHERE l.host = t.host AND l.status = :leased) < :max_per_host "
+                    "ORDER BY t.id LIMIT 1",
+                    {"pending": STATUS_PENDING, "leased": STATUS_LEASED, "now": now, "run_id": run_id,
+                     "max_per_host": self.max_per_host}).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+
+                target_id, target_run_id, crawler, backend, site, board, page, last_idx, host = row
+                token = uuid.uuid4().hex
+                self._conn.execute(
+                    "UPDATE crawl_targets SET status = ?, owner = ?, lease_token = ?, lease_expires = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    (STATUS_LEASED, owner, token, now + self.lease_seconds, target_id))
+                if self.host_rate > 0:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO crawl_hosts (host, next_at) VALUES (?, ?)",
+                        (host, now + 1.0 / self.host_rate))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return Lease(target_id, token, target_run_id, crawler, backend, CrawlTarget(site, board, page), last_idx)
+
+    def renew(self, lease: Lease) -> bool:
+        """
+        리스를 lease_seconds만큼 연장합니다.
+
+        Args:
+            lease: 연장할 리스
+
+        Returns:
+            bool: 아직 리스를 잡고 있으면 True
+        """
+        with self.lock:
+            cursor = self._conn.execute(
+                "UPDATE crawl_targets SET lease_expires = ? WHERE id = ? AND lease_token = ? AND status = ?",
+                (time.time() + self.lease_seconds, lease.id, lease.token, STATUS_LEASED))
+            return cursor.rowcount == 1
+
+    def complete(self, lease: Lease, deals: List[HotDealItem], error: Optional[str] = None) -> bool:
+        """
+        크롤링 결과를 기록하고 리스를 반납합니다.
+
+        리스가 만료되어 다른 작업자가 대상을 가져갔으면 결과를 버리므로, 같은 대상의 결과가
+        두 번 합쳐지지 않습니다.
+
+        Args:
+            lease: 크롤링을 마친 리스 (lease.target에 읽은 행 수와 가장 큰 idx가 기록되어 있음)
+            deals: 찾은 핫딜 아이템 목록
+            error: 실패한 경우 오류 메시지
+
+        Returns:
+            bool: 결과가 기록되었으면 True
+        """
+        target = lease.target
+        payload = b"\n".join(deal.to_json() for deal in deals)
+        with self.lock:
+            cursor = self._conn.execute(
+                "UPDATE crawl_targets SET status = ?, rows = ?, max_idx = ?, reached_boundary = ?, "
+                "deals = ?, error = ? WHERE id = ? AND lease_token = ? AND status = ?",
+                (STATUS_DONE, target.rows, target.max_idx, int(target.reached_boundary), payload, error,
+                 lease.id, lease.token, STATUS_LEASED))
+            return cursor.rowcount == 1
+
+    def collect(self, run_id: str) -> List[TargetResult]:
+        """
+        실행에서 끝난 대상의 결과를 꺼내고 큐에서 지웁니다.
+
+        Args:
+            run_id: 실행 ID
+
+        Returns:
+            List[TargetResult]: 끝난 대상의 결과 목록
+        """
+        with self.lock:
+            self._transaction()
+            try:
+                rows = self._conn.execute(
+                    "SELECT id, site, board, page, rows, max_idx, reached_boundary, deals, error "
+                    "FROM crawl_targets WHERE run_id = ? AND status = ? ORDER BY id",
+                    (run_id, STATUS_DONE)).fetchall()
+                self._conn.executemany("DELETE FROM crawl_targets WHERE id = ?", [(row[0],) for row in rows])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        results = []
+        for target_id, site, board, page, row_count, max_idx, reached_boundary, payload, error in rows:
+            target = CrawlTarget(site, board, page)
+            target.rows = row_count or 0
+            target.max_idx = max_idx
+            target.reached_boundary = bool(reached_boundary)
+            deals = [HotDealItem.from_json(line) for line in payload.split(b"\n")] if payload else []
+            results.append(TargetResult(target_id, target, deals, error))
+        return results
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self.lock:
+            self._conn.close()
+
+
+def _default_owner() -> str:
+    """작업자 이름으로 쓸 "호스트명:PID"를 반환합니다."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def run_worker(path: str, run_id: Optional[str] = None, owner: Optional[str] = None,
+               max_per_host: int = 2, host_rate: float = 1.0, lease_seconds: float = 60.0,
+               poll_interval: float = 0.5, replay_dir: Optional[str] = None,
+               health_options: Optional[Dict[str, float]] = None) -> int:
+    """
+    작업 큐에서 대상을 꺼내 크롤링하는 작업자를 실행합니다.
+
+    대상마다 크롤러 클래스와 백엔드로 크롤러를 만들어 재사용하며, 한 번에 대상 하나만
+    크롤링하므로 Selenium 백엔드는 작업자마다 브라우저 하나를 씁니다. 상태 저장소와 중복 제거는
+    엔진이 맡으므로 작업자는 크롤링 결과만 기록합니다.
+
+    Args:
+        path: 작업 큐 SQLite 파일 경로
+        run_id: 이 실행의 대상만 처리하고 실행이 끝나면 종료 (None이면 모든 실행을 계속 처리)
+        owner: 작업자 이름 (기본값: "호스트명:PID")
+        max_per_host: 호스트 하나에 동시에 리스를 줄 최대 대상 수
+        host_rate: 호스트 하나에 보낼 초당 요청 수
+        lease_seconds: 리스 유효 시간(초)
+        poll_interval: 꺼낼 대상이 없을 때 기다릴 시간(초)
+        replay_dir: 네트워크 대신 읽을 목록 페이지 픽스처 디렉토리
+        health_options: 작업자의 사이트별 회로 차단기와 재시도 예산 설정 (HealthTracker 생성자 인자).
+                        재시도 예산은 실행이 바뀔 때마다 채움
+
+    Returns:
+        int: 크롤링한 대상 수
+    """
+    owner = owner or _default_owner()
+    lease_queue = LeaseQueue(path, max_per_host=max_per_host, host_rate=host_rate, lease_seconds=lease_seconds)
+    replay = None
+    if replay_dir is not None:
+        # 재생 모듈이 base_crawler를 가져오므로 필요할 때만 가져옴
+        from .replay import ReplayFetcher
+        replay = ReplayFetcher(replay_dir)
+    crawlers: Dict[Tuple[str, str], BaseCrawler] = {}
+    health = HealthTracker(**(health_options or {}))
+    current_run_id = None
+    count = 0
+    logger.info(f"작업자 {owner}를 시작합니다")
+
+    try:
+        while run_id is None or lease_queue.run_active(run_id):
+            lease = lease_queue.lease(owner, run_id)
+            if lease is None:
+                time.sleep(poll_interval)
+                continue
+
+            if lease.run_id != current_run_id:
+                health.begin_cycle()
+                current_run_id = lease.run_id
+            crawler = crawlers.get((lease.crawler, lease.backend))
+            deals: List[HotDealItem] = []
+            error = None
+            stop_renewing = threading.Event()
+            renewer = threading.Thread(target=_renew_lease, args=(lease_queue, lease, stop_renewing), daemon=True)
+            renewer.start()
+            try:
+                if crawler is None:
+                    crawler = crawlers[(lease.crawler, lease.backend)] = load_crawler(lease.crawler, lease.backend)
+                    crawler.http_fetcher = replay
+                    crawler.health = health.site(crawler.site_name)
+                deals = list(crawler.iter_target(lease.target, lease.last_idx))
+                # iter_target은 오류를 기록만 하므로 코디네이터가 알 수 있게 오류로 넘김
+                if lease.target.failed:
+                    error = "페이지를 가져오지 못했습니다"
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                logger.error(f"작업자 {owner}에서 오류 발생 ({lease.target}): {e}")
+                # 브라우저가 비정상 상태일 수 있으므로 다음 대상은 새 브라우저로 시작
+                if crawler is not None:
+                    crawler._close_driver()
+            finally:
+                stop_renewing.set()
+                renewer.join()
+
+            if not lease_queue.complete(lease, deals, error):
+                logger.warning(f"{lease.target}의 리스가 만료되어 결과를 버립니다")
+            count += 1
+    finally:
+        # 브라우저는 대상마다 새로 띄우지 않고 작업자가 끝날 때 한 번만 닫음
+        for crawler in crawlers.values():
+            crawler._close_driver()
+        lease_queue.close()
+        logger.info(f"작업자 {owner}가 {count}개의 대상을 크롤링했습니다")
+    return count
+
+
+def _renew_lease(lease_queue: LeaseQueue, lease: Lease, stop: threading.Event):
+    """크롤링이 끝날 때까지 리스 유효 시간의 1/3마다 리스를 연장합니다."""
+    while not stop.wait(lease_queue.lease_seconds / 3):
+        if not lease_queue.renew(lease):
+            logger.warning(f"{lease.target}의 리스를 잃었습니다")
+            return
+
+
+class DistributedCrawlEngine:
+    """관리자의 크롤러들을 작업 큐와 작업자 프로세스로 나눠 크롤링하는 엔진."""
+
+    def __init__(self, manager: HotDealCrawlerManager, queue_path: str, processes: Optional[int] = None,
+                 lease_seconds: float = 60.0, poll_interval: float = 0.2, replay_dir: Optional[str] = None):
+        """
+        분산 크롤링 엔진을 초기화합니다.
+
+        크롤러 목록, 중복 제거 인덱스, 상태 저장소는 관리자의 것을 그대로 사용하고,
+        호스트별 동시 요청 수와 요청 속도는 관리자의 HostThrottle 설정을 모든 작업자에 걸쳐 적용합니다.
+
+        Args:
+            manager: 크롤러가 추가된 크롤러 관리자
+            queue_path: 작업 큐 SQLite 파일 경로 (다른 노드의 작업자도 같은 파일을 사용)
+            processes: 이 머신에서 띄울 작업자 프로세스 수
+                       (기본값: CPU 수, 0이면 다른 노드의 작업자에게만 맡김)
+            lease_seconds: 리스 유효 시간(초)
+            poll_interval: 결과를 확인할 간격(초)
+            replay_dir: 로컬 작업자가 네트워크 대신 읽을 목록 페이지 픽스처 디렉토리
+        """
+        self.manager = manager
+        self.processes = (os.cpu_count() or 1) if processes is None else processes
+        self.poll_interval = poll_interval
+        self.replay_dir = replay_dir
+        throttle = manager.throttle
+        self.queue = LeaseQueue(queue_path, max_per_host=throttle.max_concurrency, host_rate=throttle.rate,
+                                lease_seconds=lease_seconds)
+
+    def iter_crawl(self) -> Iterator[HotDealItem]:
+        """
+        모든 사이트의 게시판과 페이지를 작업자들에게 나눠 크롤링하면서 딜을 모이는 대로 반환합니다.
+
+        반복을 중간에 멈추면 실행을 끝내고 남은 대상을 지우며, 로컬 작업자는 진행 중인 대상을
+        마친 뒤 종료합니다.
+
+        Returns:
+            Iterator[HotDealItem]: 중복이 제거된 핫딜 아이템
+        """
+        run_id = self.queue.start_run()
+        pending: Dict[int, Tuple[BoardRun, CrawlTarget]] = {}
+
+        # 수명 주기 저장소는 이 프로세스에만 있으므로 작업자에게는 경계 없이 페이지 전체를 맡기고
+        # 경계와 변경 확인은 결과를 모을 때 처리함
+        track_lifecycle = self.manager.lifecycle is not None
+
+        def submit(run: BoardRun, target: CrawlTarget):
+            run.pending += 1
+            last_idx = None if track_lifecycle else run.last_idx
+            pending[self.queue.put(run_id, run.crawler, target, last_idx)] = (run, target)
+
+        for crawler in self.manager.crawlers:
+            runs = {board: BoardRun(crawler, board) for board in crawler.boards}
+            for target in crawler.targets():
+                submit(runs[target.board], target)
+
+        start_time = time.time()
+        count = 0
+        logger.info(f"{len(pending)}개의 대상으로 분산 크롤링을 시작합니다 (로컬 작업자 {self.processes}개)")
+
+        executor = None
+        workers = []
+        if self.processes:
+            throttle = self.manager.throttle
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.processes)
+            workers = [executor.submit(run_worker, self.queue.path, run_id, None, throttle.max_concurrency,
+                                       throttle.rate, self.queue.lease_seconds, self.poll_interval,
+                                       self.replay_dir, self.manager.health.options())
+                       for _ in range(self.processes)]
+
+        try:
+            while pending:
+                results = self.queue.collect(run_id)
+                if not results:
+                    if workers and all(worker.done() for worker in workers):
+                        for worker in workers:
+                            worker.result()
+                        logger.error(f"로컬 작업자가 모두 종료되어 남은 대상 {len(pending)}개를 크롤링하지 못했습니다")
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+
+                for result in results:
+                    run, target = pending.pop(result.id)
+                    crawler = run.crawler
+                    deals = result.deals
+                    if track_lifecycle:
+                        deals = self._apply_boundary(crawler, result.target, run.last_idx, deals)
+                    if result.error:
+                        logger.error(f"크롤러 {crawler.site_name}에서 오류 발생 ({target}): {result.error}")
+                        # 리스가 만료된 대상도 포함하여 읽지 못한 페이지가 있는 게시판은 경계를 옮기지 않음
+                        result.target.failed = True
+                    run.record(result.target)
+                    run.pending -= 1
+                    # 처음에 넣은 pages 페이지 다음부터는 경계에 도달할 때까지 한 페이지씩 추가
+                    if target.page >= crawler.pages and not result.error:
+                        next_target = crawler.next_target(result.target, run.last_idx)
+                        if next_target is not None:
+                            submit(run, next_target)
+
+                    for deal in self.manager.dedup_index.dedupe(deals):
+                        count += 1
+                        self.manager.metrics.deals.inc(site=deal.site)
+                        yield deal
+                    if not result.error:
+                        crawler.commit_lifecycle(result.target)
+                    if not run.pending:
+                        run.finish()
+        finally:
+            self.queue.finish_run(run_id)
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        elapsed_time = time.time() - start_time
+        self.manager.metrics.cycle_seconds.observe(elapsed_time, site="all")
+        logger.info(f"크롤링이 {elapsed_time:.2f}초 만에 완료되었습니다")
+        logger.info(f"총 {count}개의 딜을 찾았습니다")
+
+    @staticmethod
+    def _apply_boundary(crawler: BaseCrawler, target: CrawlTarget, last_idx: Optional[int],
+                        deals: List[HotDealItem]) -> List[HotDealItem]:
+        """
+        작업자가 경계 없이 읽은 페이지에 마지막으로 본 idx 경계를 적용하고 수명 주기 기록을 target에 보류합니다.
+
+        읽은 행 수, 가장 큰 idx, 경계 도달 여부를 경계 기준으로 target에 다시 기록합니다.
+
+        Args:
+            crawler: 대상의 크롤러 (관리자의 수명 주기 저장소가 연결되어 있음)
+            target: 작업자가 크롤링한 대상
+            last_idx: 게시판에서 마지막으로 본 idx
+            deals: 작업자가 페이지에서 찾은 딜 전체
+
+        Returns:
+            List[HotDealItem]: 새 딜로 반환할 딜
+        """
+        target.rows = 0
+        target.max_idx = None
+        target.reached_boundary = False
+        return list(crawler._until_boundary(target, last_idx, iter(deals)))
+
+    def crawl(self) -> List[HotDealItem]:
+        """
+        모든 사이트의 게시판과 페이지를 작업자들에게 나눠 크롤링합니다.
+
+        Returns:
+            List[HotDealItem]: 중복이 제거된 모든 핫딜 아이템 목록
+        """
+        return list(self.iter_crawl())
+
+    def close(self):
+        """작업 큐 연결을 닫습니다."""
+        self.queue.close()
\ No newline at end of file
@@ -0,0 +1,248 @@
+"""
+핫딜 크롤러를 위한 WebDriver 풀 모듈.
+
+이 모듈은 여러 크롤링에 걸쳐 재사용되는 크기 제한 WebDriver 풀을 제공합니다.
+selenium과 webdriver_manager는 import가 느리므로 WebDriver를 처음 만들 때 가져옵니다.
+"""
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 메모리 기반 재활용을 사용하지 않음
+    psutil = None
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+logger = logging.getLogger(__name__)
+
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+# 목록 파싱에 필요 없는 글꼴과 광고 요청을 막는 URL 패턴 (이미지는 Chrome 설정으로 막음)
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*doubleclick.net*", "*googlesyndication.com*", "*googleadservices.com*",
+    "*adservice.google.*", "*google-analytics.com*", "*googletagmanager.com*",
+    "*criteo.com*", "*adnxs.com*", "*taboola.com*", "*mobon.net*", "*realclick.co.kr*",
+]
+
+
+def resolve_chromedriver_path() -> str:
+    """
+    chromedriver 경로를 프로세스당 한 번만 확인하여 반환합니다.
+
+    Returns:
+        str: chromedriver 실행 파일 경로
+    """
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        with _chromedriver_lock:
+            if _chromedriver_path is None:
+                from webdriver_manager.chrome import ChromeDriverManager
+                _chromedriver_path = ChromeDriverManager().install()
+                logger.info(f"chromedriver 경로: {_chromedriver_path}")
+    return _chromedriver_path
+
+
+def create_chrome_driver(page_load_timeout: int = 30, page_load_strategy: str = "eager",
+                         block_resources: bool = True) -> "webdriver.Chrome":
+    """
+    헤드리스 Chrome WebDriver를 생성합니다.
+
+    Args:
+        page_load_timeout: 페이지 로드 타임아웃(초)
+        page_load_strategy: 페이지 로드 전략. "eager"는 DOM이 준비되면 바로 반환하고
+                            이미지나 광고 스크립트 등 하위 리소스를 기다리지 않음
+        block_resources: 이미지, 글꼴, 광고 요청을 막을지 여부
+
+    Returns:
+        webdriver.Chrome: 생성된 WebDriver
+    """
+    from selenium import webdriver
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    chrome_options = Options()
+    chrome_options.page_load_strategy = page_load_strategy
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    if block_resources:
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
+
+    service = Service(resolve_chromedriver_path())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver.set_page_load_timeout(page_load_timeout)  # 페이지 로드 타임아웃 설정
+    if block_resources:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            logger.warning(f"요청 차단을 설정하지 못했습니다: {e}")
+    return driver
+
+
+class WebDriverPool:
+    """크롤러들이 빌려 쓰고 반납하는 크기 제한 WebDriver 풀."""
+
+    def __init__(self, max_size: int = 2, max_pages: int = 100,
+                 max_memory_mb: Optional[int] = 1024, acquire_timeout: float = 60,
+                 page_load_timeout: int = 30, block_resources: bool = True):
+        """
+        WebDriver 풀을 초기화합니다.
+
+        Args:
+            max_size: 동시에 유지할 최대 WebDriver 수
+            max_pages: WebDriver 하나가 처리할 최대 페이지 수 (넘으면 재생성)
+            max_memory_mb: 브라우저 프로세스의 최대 메모리(MB) (넘으면 재생성, psutil 필요)
+            acquire_timeout: WebDriver를 빌릴 때 기다릴 최대 시간(초)
+            page_load_timeout: 새 WebDriver의 페이지 로드 타임아웃(초)
+            block_resources: 새 WebDriver에서 이미지, 글꼴, 광고 요청을 막을지 여부
+        """
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.acquire_timeout = acquire_timeout
+        self.page_load_timeout = page_load_timeout
+        self.block_resources = block_resources
+        self._idle: List["webdriver.Chrome"] = []
+        self._page_counts: Dict[int, int] = {}
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def acquire(self) -> "webdriver.Chrome":
+        """
+        풀에서 정상 동작하는 WebDriver를 빌립니다.
+
+        유휴 WebDriver가 없고 풀이 가득 찬 경우 반납될 때까지 기다립니다.
+
+        Returns:
+            webdriver.Chrome: 빌린 WebDriver
+
+        Raises:
+            TimeoutError: acquire_timeout 안에 WebDriver를 빌리지 못한 경우
+            RuntimeError: 풀이 이미 닫힌 경우
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("WebDriver 풀이 닫혔습니다")
+                    if self._idle:
+                        driver = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        driver = None
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("WebDriver를 빌리지 못했습니다")
+                    self._condition.wait(remaining)
+
+            if driver is None:
+                break
+            # 죽은 WebDriver는 응답을 기다리다 늦게 실패하므로 확인과 종료는 잠금 밖에서 수행
+            if self._is_healthy(driver):
+                return driver
+            self._discard(driver)
+
+        # 브라우저 시작은 오래 걸리므로 잠금 밖에서 수행
+        try:
+            driver = create_chrome_driver(self.page_load_timeout, block_resources=self.block_resources)
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._page_counts[id(driver)] = 0
+        logger.info(f"새 WebDriver 생성 (풀 크기: {self._size}/{self.max_size})")
+        return driver
+
+    def release(self, driver: "webdriver.Chrome", pages: int = 0):
+        """
+        빌린 WebDriver를 풀에 반납합니다.
+
+        처리한 페이지 수나 메모리 사용량이 한도를 넘으면 반납 대신 종료합니다.
+
+        Args:
+            driver: 반납할 WebDriver
+            pages: 빌린 동안 처리한 페이지 수
+        """
+        with self._condition:
+            self._page_counts[id(driver)] = self._page_counts.get(id(driver), 0) + pages
+            page_count = self._page_counts[id(driver)]
+            closed = self._closed
+
+        if closed:
+            self._discard(driver)
+        elif page_count >= self.max_pages:
+            logger.info(f"WebDriver가 {page_count}페이지를 처리하여 재생성합니다")
+            self._discard(driver)
+        elif self._exceeds_memory(driver):
+            logger.info("WebDriver 메모리 사용량이 한도를 넘어 재생성합니다")
+            self._discard(driver)
+        else:
+            with self._condition:
+                if not self._closed:
+                    self._idle.append(driver)
+                    self._condition.notify()
+                    return
+            self._discard(driver)
+
+    def close(self):
+        """풀의 모든 WebDriver를 종료합니다."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for driver in idle:
+            self._discard(driver)
+
+    def _discard(self, driver: "webdriver.Chrome"):
+        """WebDriver를 풀에서 제거하고 종료합니다. 종료가 오래 걸릴 수 있으므로 잠금 밖에서 호출해야 합니다."""
+        with self._condition:
+            self._page_counts.pop(id(driver), None)
+            self._size -= 1
+            self._condition.notify()
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.error(f"Error closing WebDriver: {e}")
+
+    @staticmethod
+    def _is_healthy(driver: "webdriver.Chrome") -> bool:
+        """WebDriver 세션이 아직 응답하는지 확인합니다."""
+        try:
+            driver.current_url
+            return True
+        except Exception as e:
+            # chromedriver가 죽으면 WebDriverException이 아니라 urllib3나 연결 오류가 남
+            logger.warning(f"응답하지 않는 WebDriver를 폐기합니다: {type(e).__name__}")
+            return False
+
+    def _exceeds_memory(self, driver: "webdriver.Chrome") -> bool:
+        """브라우저 프로세스 트리의 메모리 사용량이 한도를 넘었는지 확인합니다."""
+        if psutil is None or self.max_memory_mb is None:
+            return False
+        try:
+            process = psutil.Process(driver.service.process.pid)
+            rss = sum(p.memory_info().rss for p in [process] + process.children(recursive=True))
+        except (AttributeError, psutil.Error):
+            return False
+        return rss > self.max_memory_mb * 1024 * 1024
\ No newline at end of file
@@ -0,0 +1,438 @@
+"""
+핫딜 크롤러를 위한 페이지 가져오기(fetch) 백엔드 모듈.
+
+이 모듈은 브라우저 없이 requests 세션 풀로 페이지를 가져오는 HTTP 백엔드와 그 asyncio 버전,
+Selenium WebElement와 같은 방식으로 사용할 수 있는 lxml 기반 요소 래퍼를 제공합니다.
+"""
+
+import asyncio
+import functools
+import logging
+import re
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import lxml.html
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .http_cache import PageUnchanged, ResponseCache
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# selenium.webdriver.common.by.By와 같은 값 (selenium을 import하지 않고 HtmlNode에서 사용)
+BY_CSS_SELECTOR = "css selector"
+BY_XPATH = "xpath"
+
+# 절대 URL로 변환해서 돌려줄 속성 (Selenium의 get_attribute와 동일한 동작)
+URL_ATTRIBUTES = ("href", "src")
+# 디코딩하지 않고 바이트를 그대로 파서에 넘기는 인코딩 이름
+UTF8_ENCODINGS = ("utf-8", "utf8")
+
+
+# urljoin이 바꾸지 않는 절대 URL (공백, 경로 파라미터(;), 빈 쿼리/프래그먼트가 없는 URL)
+_SIMPLE_ABSOLUTE_URL_RE = re.compile(r"https?://[^\s/?#;]+(?:/[^\s?#;]*)?(?:\?[^\s#]+)?(?:#\S+)?")
+# urljoin 없이 기준 URL 앞부분에 이어 붙여도 결과가 같은 단순한 상대 경로
+# (스킴, 공백, 경로 파라미터(;), 빈 세그먼트, . 또는 .. 세그먼트, 빈 쿼리/프래그먼트가 없는 경로)
+_SIMPLE_RELATIVE_URL_RE = re.compile(r"(?!\.{1,2}(?:[/?#]|$))(?:[^\s:/?#;]+)?(?:/(?!\.{1,2}(?:[/?#]|$))[^\s:/?#;]+)*/?(?:\?[^\s#]+)?(?:#\S+)?")
+
+
+@functools.lru_cache(maxsize=256)
+def _url_prefixes(base_url: str) -> Tuple[str, str]:
+    """기준 URL의 (스킴과 호스트, 마지막 디렉토리까지의 URL)을 반환합니다."""
+    return urljoin(base_url, "/")[:-1], urljoin(base_url, "_")[:-1]
+
+
+def absolute_url(base_url: str, value: str) -> str:
+    """
+    속성 값을 절대 URL로 변환합니다. 결과는 urljoin과 같습니다.
+
+    Args:
+        base_url: 기준 URL
+        value: href, src 등의 속성 값
+
+    Returns:
+        str: 절대 URL
+    """
+    # 목록의 링크는 대부분 절대 URL이거나 단순한 상대 경로이므로 urljoin을 거치지 않음
+    if value.startswith(("https://", "http://")):
+        return value if _SIMPLE_ABSOLUTE_URL_RE.fullmatch(value) else urljoin(base_url, value)
+    if value and not value.startswith("//") and _SIMPLE_RELATIVE_URL_RE.fullmatch(value):
+        origin, directory = _url_prefixes(base_url)
+        if value[0] == "/":
+            return origin + value
+        if value[0] not in "?#":
+            return directory + value
+    return urljoin(base_url, value)
+
+
+class HtmlNode:
+    """lxml 요소를 Selenium WebElement와 비슷한 인터페이스로 감싸는 클래스."""
+
+    def __init__(self, element: lxml.html.HtmlElement, base_url: str):
+        """
+        요소 래퍼를 초기화합니다.
+
+        Args:
+            element: 감쌀 lxml 요소
+            base_url: 상대 URL을 절대 URL로 바꿀 때 사용할 기준 URL
+        """
+        self.element = element
+        self.base_url = base_url
+
+    @property
+    def text(self) -> str:
+        """공백을 정리한 요소의 텍스트를 반환합니다."""
+        return " ".join(self.element.text_content().split())
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """
+        요소의 속성 값을 반환합니다.
+
+        Args:
+            name: 속성 이름
+
+        Returns:
+            속성 값 (href, src는 절대 URL), 속성이 없으면 None
+        """
+        value = self.element.get(name)
+        if value is not None and name in URL_ATTRIBUTES:
+            return absolute_url(self.base_url, value)
+        return value
+
+    def find_elements(self, by, value) -> List["HtmlNode"]:
+        """
+        하위 요소들을 찾습니다.
+
+        Args:
+            by: 요소를 찾는 방법 (By.CSS_SELECTOR 또는 By.XPATH)
+            value: 검색할 값
+
+        Returns:
+            List[HtmlNode]: 찾은 요소 목록
+        """
+        if by == BY_CSS_SELECTOR:
+            elements = self.element.cssselect(value)
+        elif by == BY_XPATH:
+            elements = self.element.xpath(value)
+        else:
+            raise ValueError(f"지원하지 않는 검색 방법입니다: {by}")
+        return [HtmlNode(element, self.base_url) for element in elements]
+
+    def find_element(self, by, value) -> "HtmlNode":
+        """
+        첫 번째 하위 요소를 찾습니다.
+
+        Args:
+            by: 요소를 찾는 방법 (By.CSS_SELECTOR 또는 By.XPATH)
+            value: 검색할 값
+
+        Returns:
+            HtmlNode: 찾은 요소
+
+        Raises:
+            NoSuchElementException: 요소를 찾지 못한 경우
+        """
+        elements = self.find_elements(by, value)
+        if not elements:
+            # 사이트 크롤러가 Selenium 백엔드와 같은 예외를 처리하도록 같은 예외를 발생시킴
+            from selenium.common.exceptions import NoSuchElementException
+            raise NoSuchElementException(f"Unable to locate element: {by}={value}")
+        return elements[0]
+
+
+# lxml 파서는 스레드 사이에 공유하면 잠금으로 직렬화되므로 스레드별로 하나씩 둠
+_parsers = threading.local()
+
+
+def _utf8_parser() -> lxml.html.HTMLParser:
+    """UTF-8 바이트를 직접 읽는 현재 스레드의 lxml 파서를 반환합니다."""
+    parser = getattr(_parsers, "utf8", None)
+    if parser is None:
+        parser = _parsers.utf8 = lxml.html.HTMLParser(encoding="utf-8")
+    return parser
+
+
+class HtmlDocument(HtmlNode):
+    """
+    응답 본문을 처음 필요할 때 파싱하는 문서 루트.
+
+    행 명세로 추출할 때는 lxml 트리를 만들지 않고 본문 바이트에서 바로 추출할 수 있으며,
+    find_elements 등 요소 인터페이스를 사용하면 그때 lxml로 파싱합니다.
+    """
+
+    def __init__(self, content: bytes, base_url: str, encoding: Optional[str] = None):
+        """
+        문서를 초기화합니다. 파싱은 element에 처음 접근할 때 합니다.
+
+        Args:
+            content: 응답 본문
+            base_url: 최종 응답 URL (상대 URL의 기준)
+            encoding: 문서 인코딩 (None이면 문서의 meta 태그를 사용)
+        """
+        self.content = content
+        self.base_url = base_url
+        self.encoding = encoding
+        self._element: Optional[lxml.html.HtmlElement] = None
+
+    @property
+    def parsed(self) -> bool:
+        """lxml 트리를 이미 만들었으면 True."""
+        return self._element is not None
+
+    @property
+    def element(self) -> lxml.html.HtmlElement:
+        """문서의 lxml 루트 요소."""
+        if self._element is None:
+            if self.encoding and self.encoding.lower() in UTF8_ENCODINGS:
+                # 디코딩한 문자열을 다시 파싱하지 않고 libxml2가 바이트를 직접 읽음.
+                # libxml2는 다른 인코딩에서 잘못된 바이트를 만나면 나머지를 버리므로 UTF-8에서만 사용
+                self._element = lxml.html.document_fromstring(self.content, parser=_utf8_parser())
+            elif self.encoding:
+                self._element = lxml.html.document_fromstring(self.content.decode(self.encoding, errors="replace"))
+            else:
+                # 인코딩을 알 수 없으면 lxml이 meta 태그로 판단하도록 바이트를 그대로 전달
+                self._element = lxml.html.document_fromstring(self.content)
+        return self._element
+
+
+def parse_document(content: bytes, url: str, encoding: Optional[str] = None) -> HtmlDocument:
+    """
+    응답 본문으로 문서를 만듭니다. 실제 파싱은 문서를 처음 사용할 때 합니다.
+
+    Args:
+        content: 응답 본문
+        url: 최종 응답 URL (상대 URL의 기준)
+        encoding: 문서 인코딩 (None이면 문서의 meta 태그를 사용)
+
+    Returns:
+        HtmlDocument: 문서의 루트 요소
+    """
+    return HtmlDocument(content, url, encoding)
+
+
+class HttpFetcher:
+    """requests 세션 풀을 사용하여 브라우저 없이 페이지를 가져오는 백엔드."""
+
+    DEFAULT_HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        ),
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    }
+
+    def __init__(self, timeout: float = 10.0, pool_maxsize: int = 10,
+                 headers: Optional[Dict[str, str]] = None, cache: Optional[ResponseCache] = None):
+        """
+        HTTP 백엔드를 초기화합니다.
+
+        Args:
+            timeout: 요청 타임아웃(초)
+            pool_maxsize: 호스트별로 유지할 최대 연결 수
+            headers: 기본 헤더에 덧붙일 요청 헤더 (선택 사항)
+            cache: 조건부 요청과 본문 해시 비교에 사용할 응답 캐시 (None이면 항상 전체를 파싱)
+        """
+        self.timeout = timeout
+        self.cache = cache
+        self.pool_maxsize = pool_maxsize
+        self.headers = dict(self.DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+        self._session = None
+        self._lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """연결 풀이 설정된 공유 세션을 반환합니다."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_maxsize,
+                        pool_maxsize=self.pool_maxsize,
+                        max_retries=Retry(total=2, backoff_factor=0.3,
+                                          status_forcelist=(502, 503, 504)),
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    session.headers.update(self.headers)
+                    self._session = session
+        return self._session
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
+        """
+        페이지를 요청하고 파싱하지 않은 응답을 반환합니다.
+
+        Args:
+            url: 가져올 URL
+            headers: 이 요청에만 덧붙일 헤더 (선택 사항)
+
+        Returns:
+            응답, 실패하면 None
+        """
+        try:
+            response = self._get_session().get(url, timeout=self.timeout, headers=headers)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return None
+        return response
+
+    def fetch(self, url: str, encoding: Optional[str] = None) -> Optional[HtmlNode]:
+        """
+        페이지를 가져와 파싱합니다.
+
+        Args:
+            url: 가져올 URL
+            encoding: 문서 인코딩 (None이면 응답 헤더나 문서의 meta 태그를 사용)
+
+        Returns:
+            파싱된 문서의 루트 요소, 실패하면 None
+
+        Raises:
+            PageUnchanged: 응답 캐시가 설정되어 있고 페이지가 마지막으로 가져온 뒤로 바뀌지 않은 경우
+        """
+        headers = self.cache.conditional_headers(url) if self.cache is not None else None
+        response = self.get(url, headers=headers)
+        if response is None:
+            return None
+
+        if self.cache is not None and self.cache.record_response(
+                url, response.status_code, response.content,
+                response.headers.get("ETag"), response.headers.get("Last-Modified")):
+            raise PageUnchanged(url)
+
+        if encoding is None and "charset" in response.headers.get("Content-Type", "").lower():
+            encoding = response.encoding
+
+        return parse_document(response.content, response.url, encoding)
+
+    def close(self):
+        """세션과 연결 풀을 닫습니다."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_default_fetcher = None
+_default_fetcher_lock = threading.Lock()
+
+
+def get_http_fetcher() -> HttpFetcher:
+    """
+    프로세스 전체에서 공유하는 HTTP 백엔드를 반환합니다.
+
+    Returns:
+        HttpFetcher: 공유 HTTP 백엔드
+    """
+    global _default_fetcher
+    if _default_fetcher is None:
+        with _default_fetcher_lock:
+            if _default_fetcher is None:
+                _default_fetcher = HttpFetcher()
+    return _default_fetcher
+
+
+@functools.lru_cache(maxsize=None)
+def _import_aiohttp():
+    """
+    aiohttp를 처음 사용할 때 가져옵니다. import가 느리므로 비동기 엔진을 쓸 때만 가져옵니다.
+
+    Returns:
+        aiohttp 모듈, 설치되어 있지 않으면 None
+    """
+    try:
+        import aiohttp
+    except ImportError:  # aiohttp가 없으면 AsyncHttpFetcher가 스레드 풀에서 HttpFetcher를 사용
+        return None
+    return aiohttp
+
+
+class AsyncHttpFetcher:
+    """asyncio 이벤트 루프에서 페이지를 가져오는 HTTP 백엔드."""
+
+    def __init__(self, timeout: float = 10.0, limit: int = 100,
+                 headers: Optional[Dict[str, str]] = None,
+                 http_fetcher: Optional[HttpFetcher] = None, cache: Optional[ResponseCache] = None):
+        """
+        비동기 HTTP 백엔드를 초기화합니다.
+
+        aiohttp가 설치되어 있지 않으면 HttpFetcher를 스레드 풀에서 실행합니다.
+
+        Args:
+            timeout: 요청 타임아웃(초)
+            limit: 전체 최대 연결 수 (aiohttp 사용 시)
+            headers: 기본 헤더에 덧붙일 요청 헤더 (선택 사항)
+            http_fetcher: aiohttp가 없을 때 사용할 fetcher (기본값: 프로세스 공유 fetcher)
+            cache: 조건부 요청과 본문 해시 비교에 사용할 응답 캐시 (aiohttp 사용 시,
+                   aiohttp가 없으면 http_fetcher의 캐시를 사용)
+        """
+        self.timeout = timeout
+        self.cache = cache
+        self.limit = limit
+        self.headers = dict(HttpFetcher.DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+        self.http_fetcher = http_fetcher
+        self._session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """연결 풀이 설정된 세션을 반환합니다. 이벤트 루프 안에서 호출해야 합니다."""
+        aiohttp = _import_aiohttp()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.limit),
+            )
+        return self._session
+
+    async def fetch(self, url: str, encoding: Optional[str] = None) -> Optional[HtmlNode]:
+        """
+        페이지를 가져와 파싱합니다.
+
+        Args:
+            url: 가져올 URL
+            encoding: 문서 인코딩 (None이면 응답 헤더나 문서의 meta 태그를 사용)
+
+        Returns:
+            파싱된 문서의 루트 요소, 실패하면 None
+
+        Raises:
+            PageUnchanged: 응답 캐시가 설정되어 있고 페이지가 마지막으로 가져온 뒤로 바뀌지 않은 경우
+        """
+        aiohttp = _import_aiohttp()
+        if aiohttp is None:
+            fetcher = self.http_fetcher or get_http_fetcher()
+            return await asyncio.get_running_loop().run_in_executor(None, fetcher.fetch, url, encoding)
+
+        headers = self.cache.conditional_headers(url) if self.cache is not None else None
+        try:
+            async with self._get_session().get(url, headers=headers) as response:
+                response.raise_for_status()
+                content = await response.read()
+                final_url = str(response.url)
+                charset = response.charset
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return None
+
+        if self.cache is not None and self.cache.record_response(
+                url, response.status, content,
+                response.headers.get("ETag"), response.headers.get("Last-Modified")):
+            raise PageUnchanged(url)
+        return parse_document(content, final_url, encoding or charset)
+
+    async def close(self):
+        """세션과 연결 풀을 닫습니다."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
\ No newline at end of file
@@ -0,0 +1,368 @@
+"""
+핫딜 크롤러를 위한 사이트 상태 추적 모듈.
+
+이 모듈은 사이트별로 목록 페이지 요청의 성공과 실패를 추적하는 회로 차단기와, 실행 한 번에
+허용할 재시도 횟수를 제한하는 재시도 예산을 제공합니다. 계속 실패하는 사이트는 회로 차단기가
+열려 냉각 시간 동안 요청하지 않으므로, 죽은 사이트 하나가 매 실행마다 작업자와 브라우저를
+페이지 로드 타임아웃만큼 붙잡지 않습니다.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_HALF_OPEN = "half_open"
+STATE_OPEN = "open"
+
+# 메트릭으로 내보낼 때의 상태 값
+STATE_VALUES = {STATE_CLOSED: 0, STATE_HALF_OPEN: 1, STATE_OPEN: 2}
+
+
+def backoff_delay(attempt: int, base: float = 1.0, maximum: float = 30.0) -> float:
+    """
+    재시도 전에 기다릴 시간을 지수 백오프와 전체 지터로 계산합니다.
+
+    Args:
+        attempt: 1부터 시작하는 재시도 번호
+        base: 첫 재시도의 최대 대기 시간(초)
+        maximum: 최대 대기 시간(초)
+
+    Returns:
+        float: 기다릴 시간(초)
+    """
+    return random.uniform(0, min(maximum, base * (2 ** (attempt - 1))))
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수로 요청을 막는 회로 차단기.
+
+    닫힘 상태에서 연속 failure_threshold번 실패하면 열리고, 냉각 시간이 지나면 반열림 상태가 되어
+    시험 요청 하나만 허용합니다. 시험 요청이 성공하면 닫히고, 실패하면 냉각 시간을 두 배로 늘려
+    (max_cooldown까지) 다시 열립니다.
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 60.0, max_cooldown: float = 600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        회로 차단기를 초기화합니다.
+
+        Args:
+            failure_threshold: 차단기를 열 연속 실패 횟수
+            cooldown: 처음 열렸을 때의 냉각 시간(초)
+            max_cooldown: 최대 냉각 시간(초)
+            clock: 현재 시각을 반환하는 함수
+        """
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.cooldown = cooldown
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        요청을 보내도 되는지 확인합니다. 냉각 시간이 지났으면 시험 요청 하나를 허용합니다.
+
+        Returns:
+            bool: 요청을 보내도 되면 True
+        """
+        with self.lock:
+            if self.state == STATE_CLOSED:
+                return True
+            if self.state == STATE_OPEN:
+                if self.clock() - self.opened_at < self.cooldown:
+                    return False
+                self.state = STATE_HALF_OPEN
+                self._probing = False
+            # 반열림 상태에서는 결과가 나올 때까지 시험 요청 하나만 보냄
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> bool:
+        """
+        요청 성공을 기록합니다.
+
+        Returns:
+            bool: 차단기 상태가 바뀌었으면 True
+        """
+        with self.lock:
+            changed = self.state != STATE_CLOSED
+            self.state = STATE_CLOSED
+            self.failures = 0
+            self.cooldown = self.base_cooldown
+            self.opened_at = None
+            self._probing = False
+            return changed
+
+    def record_failure(self) -> bool:
+        """
+        요청 실패를 기록합니다.
+
+        Returns:
+            bool: 차단기 상태가 바뀌었으면 True
+        """
+        with self.lock:
+            self.failures += 1
+            if self.state == STATE_HALF_OPEN:
+                self.cooldown = min(self.max_cooldown, self.cooldown * 2)
+            elif self.state == STATE_OPEN or self.failures < self.failure_threshold:
+                return False
+            self.state = STATE_OPEN
+            self.opened_at = self.clock()
+            self._probing = False
+            return True
+
+    def release_probe(self):
+        """결과 없이 취소된 시험 요청을 풀어 다음 요청이 다시 시험할 수 있게 합니다."""
+        with self.lock:
+            if self.state == STATE_HALF_OPEN:
+                self._probing = False
+
+    def retry_after(self) -> float:
+        """
+        열린 차단기가 시험 요청을 허용할 때까지 남은 시간을 반환합니다.
+
+        Returns:
+            float: 남은 시간(초), 열려 있지 않으면 0
+        """
+        with self.lock:
+            if self.state != STATE_OPEN:
+                return 0.0
+            return max(0.0, self.cooldown - (self.clock() - self.opened_at))
+
+
+class RetryBudget:
+    """실행 한 번에 허용할 재시도 횟수를 제한하는 예산."""
+
+    def __init__(self, retries_per_cycle: int = 3):
+        """
+        재시도 예산을 초기화합니다.
+
+        Args:
+            retries_per_cycle: 실행 한 번에 허용할 재시도 횟수
+        """
+        self.retries_per_cycle = retries_per_cycle
+        self.remaining = retries_per_cycle
+        self.lock = threading.Lock()
+
+    def reset(self):
+        """새 실행을 시작하며 예산을 채웁니다."""
+        with self.lock:
+            self.remaining = self.retries_per_cycle
+
+    def try_acquire(self) -> bool:
+        """
+        재시도 하나를 예산에서 씁니다.
+
+        Returns:
+            bool: 예산이 남아 있었으면 True
+        """
+        with self.lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+
+class SiteHealth:
+    """사이트 하나의 회로 차단기와 재시도 예산."""
+
+    def __init__(self, site_name: str, breaker: CircuitBreaker, budget: RetryBudget,
+                 max_attempts: int = 3, backoff_base: float = 1.0, backoff_max: float = 30.0):
+        """
+        사이트 상태를 초기화합니다.
+
+        Args:
+            site_name: 사이트 이름
+            breaker: 사이트의 회로 차단기
+            budget: 사이트의 실행별 재시도 예산
+            max_attempts: 페이지 하나에 시도할 최대 횟수 (첫 시도 포함)
+            backoff_base: 첫 재시도의 최대 대기 시간(초)
+            backoff_max: 최대 대기 시간(초)
+        """
+        self.site_name = site_name
+        self.breaker = breaker
+        self.budget = budget
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        """회로 차단기 상태."""
+        return self.breaker.state
+
+    def allow(self) -> bool:
+        """
+        사이트에 요청을 보내도 되는지 확인합니다.
+
+        Returns:
+            bool: 요청을 보내도 되면 True
+        """
+        return self.breaker.allow()
+
+    def next_retry_delay(self, attempt: int) -> Optional[float]:
+        """
+        실패한 요청을 다시 시도할 수 있으면 기다릴 시간을 반환합니다.
+
+        차단기가 닫혀 있고 시도 횟수와 재시도 예산이 남아 있을 때만 재시도합니다.
+
+        Args:
+            attempt: 지금까지 시도한 횟수
+
+        Returns:
+            기다릴 시간(초), 재시도하지 않으면 None
+        """
+        if attempt >= self.max_attempts or self.breaker.state != STATE_CLOSED:
+            return None
+        if not self.budget.try_acquire():
+            return None
+        return backoff_delay(attempt, self.backoff_base, self.backoff_max)
+
+    def record_success(self):
+        """요청 성공을 기록합니다."""
+        if self.breaker.record_success():
+            logger.info(f"{self.site_name}: 회로 차단기가 닫혔습니다. 정상 크롤링을 재개합니다")
+
+    def record_failure(self, error: Optional[str] = None):
+        """
+        요청 실패를 기록합니다.
+
+        Args:
+            error: 실패 원인
+        """
+        if error is not None:
+            self.last_error = error
+        if self.breaker.record_failure():
+            logger.warning(f"{self.site_name}: 회로 차단기가 열렸습니다. "
+                           f"{self.breaker.cooldown:.0f}초 동안 요청하지 않습니다 (마지막 오류: {self.last_error})")
+
+    def release_probe(self):
+        """결과 없이 취소된 요청이 잡고 있던 시험 요청 자리를 풉니다."""
+        self.breaker.release_probe()
+
+    def report(self) -> Dict[str, object]:
+        """
+        사이트 상태를 반환합니다.
+
+        Returns:
+            Dict[str, object]: 사이트 이름, 차단기 상태, 연속 실패 횟수, 남은 냉각 시간,
+                               남은 재시도 예산, 마지막 오류
+        """
+        return {
+            "site": self.site_name,
+            "state": self.breaker.state,
+            "failures": self.breaker.failures,
+            "retry_after": round(self.breaker.retry_after(), 1),
+            "retry_budget": self.budget.remaining,
+            "last_error": self.last_error,
+        }
+
+
+class HealthTracker:
+    """사이트별 상태를 만들고 모아 두는 클래스."""
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 60.0, max_cooldown: float = 600.0,
+                 retries_per_cycle: int = 3, max_attempts: int = 3, backoff_base: float = 1.0,
+                 backoff_max: float = 30.0):
+        """
+        상태 추적기를 초기화합니다. 인자는 사이트마다 만드는 차단기와 재시도 예산의 설정입니다.
+
+        Args:
+            failure_threshold: 차단기를 열 연속 실패 횟수
+            cooldown: 처음 열렸을 때의 냉각 시간(초)
+            max_cooldown: 최대 냉각 시간(초)
+            retries_per_cycle: 사이트마다 실행 한 번에 허용할 재시도 횟수
+            max_attempts: 페이지 하나에 시도할 최대 횟수 (첫 시도 포함)
+            backoff_base: 첫 재시도의 최대 대기 시간(초)
+            backoff_max: 최대 대기 시간(초)
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.retries_per_cycle = retries_per_cycle
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.sites: Dict[str, SiteHealth] = {}
+        self.lock = threading.Lock()
+
+    def options(self) -> Dict[str, float]:
+        """
+        같은 설정의 추적기를 다른 프로세스에서 만들 수 있도록 생성자 인자를 반환합니다.
+
+        Returns:
+            Dict[str, float]: HealthTracker 생성자 인자
+        """
+        return {
+            "failure_threshold": self.failure_threshold,
+            "cooldown": self.cooldown,
+            "max_cooldown": self.max_cooldown,
+            "retries_per_cycle": self.retries_per_cycle,
+            "max_attempts": self.max_attempts,
+            "backoff_base": self.backoff_base,
+            "backoff_max": self.backoff_max,
+        }
+
+    def site(self, site_name: str) -> SiteHealth:
+        """
+        사이트의 상태를 반환합니다. 없으면 만듭니다.
+
+        Args:
+            site_name: 사이트 이름
+
+        Returns:
+            SiteHealth: 사이트 상태
+        """
+        with self.lock:
+            health = self.sites.get(site_name)
+            if health is None:
+                health = self.sites[site_name] = SiteHealth(
+                    site_name,
+                    CircuitBreaker(self.failure_threshold, self.cooldown, self.max_cooldown),
+                    RetryBudget(self.retries_per_cycle),
+                    self.max_attempts, self.backoff_base, self.backoff_max
+                )
+            return health
+
+    def begin_cycle(self, site_name: Optional[str] = None):
+        """
+        새 실행을 시작하며 재시도 예산을 채웁니다.
+
+        Args:
+            site_name: 실행할 사이트 (None이면 모든 사이트)
+        """
+        sites = [self.site(site_name)] if site_name is not None else list(self.sites.values())
+        for health in sites:
+            health.budget.reset()
+
+    def degraded_sites(self) -> List[str]:
+        """
+        회로 차단기가 닫혀 있지 않은 사이트 목록을 반환합니다.
+
+        Returns:
+            List[str]: 사이트 이름 목록
+        """
+        return [name for name, health in self.sites.items() if health.state != STATE_CLOSED]
+
+    def report(self) -> List[Dict[str, object]]:
+        """
+        모든 사이트의 상태를 반환합니다.
+
+        Returns:
+            List[Dict[str, object]]: SiteHealth.report()의 목록
+        """
+        return [health.report() for health in self.sites.values()]
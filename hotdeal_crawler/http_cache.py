@@ -0,0 +1,201 @@
+"""
+핫딜 크롤러를 위한 HTTP 응답 캐시 모듈.
+
+이 모듈은 URL별 ETag, Last-Modified 값과 본문 해시를 로컬 JSON 파일에 저장하여
+조건부 요청을 보내고, 바뀌지 않은 목록 페이지는 파싱하지 않도록 하는 캐시를 제공합니다.
+"""
+
+import collections
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PageUnchanged(Exception):
+    """페이지가 마지막으로 가져온 뒤로 바뀌지 않았음을 알리는 예외."""
+
+
+def content_hash(content: bytes) -> str:
+    """
+    응답 본문의 해시를 계산합니다.
+
+    Args:
+        content: 응답 본문
+
+    Returns:
+        str: 16진수 해시
+    """
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """
+    URL별 검증자(ETag, Last-Modified)와 본문 해시를 기억하는 크기 제한 캐시.
+
+    새로 가져온 응답의 기록은 보류해 두었다가 commit으로 확정합니다. 페이지의 딜을 모두 처리하고
+    게시판의 마지막으로 본 idx를 갱신하기 전에 기록하면, 처리하지 못한 페이지가 다음 실행에서
+    바뀌지 않은 페이지로 건너뛰어져 딜이 빠지기 때문입니다.
+    """
+
+    def __init__(self, path: str = os.path.join("result", "http_cache.json"),
+                 max_entries: int = 1000, flush_interval: float = 5):
+        """
+        응답 캐시를 초기화하고 기존 캐시를 읽어옵니다.
+
+        Args:
+            path: 캐시를 저장할 JSON 파일 경로
+            max_entries: 기억할 최대 URL 수 (넘으면 가장 오래 쓰지 않은 URL부터 잊음)
+            flush_interval: 캐시를 디스크에 저장하는 최소 간격(초)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.not_modified = 0
+        self.unchanged = 0
+        self.misses = 0
+        self._entries: "collections.OrderedDict[str, Dict[str, Optional[str]]]" = collections.OrderedDict()
+        # 확정하지 않은 응답 기록
+        self._pending: Dict[str, Dict[str, Optional[str]]] = {}
+        self._dirty = False
+        self._saved_at = time.time()
+        self._load()
+
+    def _load(self):
+        """파일에서 캐시를 읽어옵니다."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = collections.OrderedDict(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.error(f"HTTP 캐시 파일을 읽지 못했습니다 ({self.path}): {e}")
+            self._entries = collections.OrderedDict()
+
+    def _save(self):
+        """캐시를 임시 파일에 쓴 뒤 교체하여 원자적으로 저장합니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        self._saved_at = time.time()
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        URL에 보낼 조건부 요청 헤더를 반환합니다.
+
+        Args:
+            url: 요청할 URL
+
+        Returns:
+            Dict[str, str]: If-None-Match, If-Modified-Since 헤더 (기록이 없으면 빈 딕셔너리)
+        """
+        with self.lock:
+            entry = self._entries.get(url)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record_response(self, url: str, status: int, content: bytes,
+                        etag: Optional[str] = None, last_modified: Optional[str] = None) -> bool:
+        """
+        응답을 보류 기록에 넣고, 페이지가 확정된 기록 뒤로 바뀌지 않았는지 반환합니다.
+
+        Args:
+            url: 요청한 URL
+            status: 응답 상태 코드
+            content: 응답 본문
+            etag: 응답의 ETag 헤더
+            last_modified: 응답의 Last-Modified 헤더
+
+        Returns:
+            bool: 304 응답이거나 본문 해시가 같으면 True
+        """
+        with self.lock:
+            entry = self._entries.get(url)
+            # 조건부 헤더는 기록이 있을 때만 보내므로 304 응답이면 항상 기록이 있음
+            if status == 304 and entry is not None:
+                self.not_modified += 1
+                self._entries.move_to_end(url)
+                return True
+
+            digest = content_hash(content)
+            unchanged = entry is not None and entry.get("hash") == digest
+            if unchanged:
+                self.unchanged += 1
+            else:
+                self.misses += 1
+
+            if unchanged:
+                self._entries.move_to_end(url)
+            self._pending[url] = {"etag": etag, "last_modified": last_modified, "hash": digest}
+            return unchanged
+
+    def commit(self, urls: Iterable[str]):
+        """
+        URL들의 보류 기록을 확정합니다. 다음 요청부터 확정한 기록과 비교합니다.
+
+        Args:
+            urls: 딜을 모두 처리한 페이지의 URL
+        """
+        with self.lock:
+            for url in urls:
+                entry = self._pending.pop(url, None)
+                if entry is None:
+                    continue
+                self._entries[url] = entry
+                self._entries.move_to_end(url)
+                self._dirty = True
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self._dirty and time.time() - self._saved_at >= self.flush_interval:
+                self._save()
+
+    def discard(self, urls: Iterable[str]):
+        """
+        URL들의 보류 기록을 버립니다. 다음 실행에서 이전 기록과 비교하여 다시 파싱합니다.
+
+        Args:
+            urls: 처리하지 못한 페이지가 있는 게시판의 페이지 URL
+        """
+        with self.lock:
+            for url in urls:
+                self._pending.pop(url, None)
+
+    def flush(self):
+        """확정한 기록 중 바뀐 것을 디스크에 저장합니다."""
+        with self.lock:
+            if self._dirty:
+                self._save()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 적중 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 304 응답 수, 본문 해시 일치 수, 변경된 응답 수, 적중률
+        """
+        with self.lock:
+            total = self.not_modified + self.unchanged + self.misses
+            return {
+                "not_modified": self.not_modified,
+                "unchanged": self.unchanged,
+                "misses": self.misses,
+                "hit_ratio": (self.not_modified + self.unchanged) / total if total else 0.0,
+            }
\ No newline at end of file
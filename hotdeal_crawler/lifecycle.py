@@ -0,0 +1,287 @@
+"""
+핫딜 크롤러를 위한 딜 수명 주기 추적 모듈.
+
+이 모듈은 다시 크롤링한 딜을 (사이트, 게시판, idx)별로 기억한 값과 비교하여 제목과 가격 수정,
+품절 표시, 추천/댓글/조회 수 변화를 찾는 저장소를 제공합니다. 딜마다 내용 필드의 64비트 지문과
+인기 지표만 로컬 JSON 파일에 저장하고, 실제로 바뀐 딜만 갱신 이벤트(DealUpdate)로 내보내므로
+바뀌지 않은 딜을 실행마다 싱크에 다시 쓰지 않습니다.
+"""
+
+import collections
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .models import HotDealItem, canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# 갱신 종류
+UPDATE_EDITED = "edited"
+UPDATE_SOLD_OUT = "sold_out"
+UPDATE_RESTOCKED = "restocked"
+UPDATE_POPULARITY = "popularity"
+# 중복 제거에서 유사 중복의 URL이 대표 딜에 추가됨
+UPDATE_ALTERNATE_URLS = "alternate_urls"
+
+# 비교할 인기 지표
+POPULARITY_FIELDS = ("recommendations", "comments", "views")
+
+# 저장하는 항목의 열 순서
+_FINGERPRINT, _SOLD_OUT, _RECOMMENDATIONS, _COMMENTS, _VIEWS, _FIRST_SEEN, _LAST_SEEN = range(7)
+
+
+def deal_fingerprint(deal: HotDealItem) -> str:
+    """
+    딜의 내용(제목, 정규화한 URL, 가격, 배송비)의 지문을 계산합니다.
+
+    게시글이 목록의 다른 페이지로 밀리면 URL의 page 같은 파라미터가 바뀌므로 정규화한 URL을 사용합니다.
+
+    Args:
+        deal: 핫딜 아이템
+
+    Returns:
+        str: 16자리 16진수 지문
+    """
+    text = "\x1f".join((deal.title, canonicalize_url(deal.url), str(deal.price), deal.currency,
+                        str(deal.shipping)))
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class DealUpdate:
+    """다시 크롤링한 딜에서 찾은 변경."""
+
+    __slots__ = ('deal', 'kinds', 'changes')
+
+    def __init__(self, deal: HotDealItem, kinds: List[str], changes: Dict[str, Tuple[Any, Any]]):
+        """
+        갱신 이벤트를 초기화합니다.
+
+        Args:
+            deal: 다시 크롤링한 딜 (바뀐 뒤의 값)
+            kinds: 갱신 종류 목록 (UPDATE_EDITED, UPDATE_SOLD_OUT, UPDATE_RESTOCKED, UPDATE_POPULARITY,
+                   UPDATE_ALTERNATE_URLS)
+            changes: 바뀐 필드의 (이전 값, 새 값). 내용 수정은 지문만 저장하므로 이전 값이 None
+        """
+        self.deal = deal
+        self.kinds = kinds
+        self.changes = changes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON으로 저장할 수 있는 딕셔너리로 변환합니다.
+
+        Returns:
+            Dict[str, Any]: 갱신 종류, 바뀐 필드, 딜
+        """
+        return {
+            "kinds": self.kinds,
+            "changes": {name: list(values) for name, values in self.changes.items()},
+            "deal": self.deal.to_dict(),
+        }
+
+    def __str__(self) -> str:
+        changes = ", ".join(f"{name} {old}->{new}" for name, (old, new) in self.changes.items()
+                            if name in POPULARITY_FIELDS)
+        return f"[{'/'.join(self.kinds)}] {self.deal}" + (f" ({changes})" if changes else "")
+
+    def __repr__(self) -> str:
+        return f"DealUpdate({self.deal.key!r}, kinds={self.kinds!r})"
+
+
+class LifecycleStore:
+    """딜별 내용 지문과 인기 지표를 기억하고 다시 크롤링한 딜의 변경을 찾는 크기 제한 저장소."""
+
+    def __init__(self, path: str = os.path.join("result", "lifecycle.json"),
+                 max_entries: int = 20000, view_step: int = 100, flush_interval: float = 5):
+        """
+        저장소를 초기화하고 기존 기록을 읽어옵니다.
+
+        Args:
+            path: 기록을 저장할 JSON 파일 경로
+            max_entries: 기억할 최대 딜 수 (넘으면 가장 오래 보지 못한 딜부터 잊음)
+            view_step: 갱신으로 볼 최소 조회 수 증가량 (조회 수는 실행마다 조금씩 늘어나므로)
+            flush_interval: 기록을 디스크에 저장하는 최소 간격(초)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.view_step = view_step
+        self.flush_interval = flush_interval
+        # 갱신 이벤트를 받을 함수 (예: SinkPipeline.put_update)
+        self.on_update: Optional[Callable[[DealUpdate], None]] = None
+        self.lock = threading.Lock()
+        self.created = 0
+        self.unchanged = 0
+        self.updated = 0
+        self._entries: "collections.OrderedDict[str, list]" = collections.OrderedDict()
+        self._dirty = False
+        self._saved_at = time.time()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self):
+        """파일에서 기록을 읽어옵니다."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = collections.OrderedDict(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.error(f"딜 수명 주기 파일을 읽지 못했습니다 ({self.path}): {e}")
+            self._entries = collections.OrderedDict()
+
+    def _save(self):
+        """기록을 임시 파일에 쓴 뒤 교체하여 원자적으로 저장합니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        self._saved_at = time.time()
+
+    @staticmethod
+    def _key(deal: HotDealItem) -> str:
+        """딜의 (사이트, 게시판, idx) 키를 저장용 문자열로 만듭니다."""
+        return "\t".join(deal.key)
+
+    def track(self, deal: HotDealItem, seen: bool = False,
+              staged: Optional[list] = None) -> Tuple[bool, Optional[DealUpdate]]:
+        """
+        딜을 기억한 값과 비교하여 변경을 찾고 기록합니다.
+
+        처음 보는 딜은 기록만 하고, 바뀐 딜은 기록을 고친 뒤 on_update에 갱신 이벤트를 전달합니다.
+        조회 수는 마지막으로 갱신을 낸 값보다 view_step 이상 늘었을 때만 변경으로 봅니다.
+
+        staged 목록을 주면 기록과 갱신 이벤트를 그 목록에 보류해 두고, commit을 호출해야 반영합니다.
+        딜을 실제로 전달하기 전에 기록하면, 전달하지 못한 딜을 다음 실행에서 이미 본 딜로 건너뛰기
+        때문입니다. 보류한 목록을 버리면 아무것도 기록하지 않은 것과 같습니다.
+
+        Args:
+            deal: 다시 크롤링한 딜
+            seen: 상태 저장소 기준으로 이미 내보낸 딜인지 여부 (True이면 처음 보더라도 새 딜이 아님)
+            staged: 기록을 보류할 목록 (None이면 바로 기록)
+
+        Returns:
+            Tuple[bool, Optional[DealUpdate]]: 새 딜로 내보내야 하는지 여부와 갱신 이벤트 (없으면 None)
+        """
+        key = self._key(deal)
+        fingerprint = deal_fingerprint(deal)
+        now = int(time.time())
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                new_entry = [fingerprint, deal.sold_out, deal.recommendations, deal.comments, deal.views,
+                             now, now]
+                update = None
+            else:
+                # 보류하는 동안 기억한 항목이 바뀌지 않도록 복사본과 비교
+                new_entry = list(entry)
+                update = self._compare(new_entry, deal, fingerprint)
+                new_entry[_LAST_SEEN] = now
+
+        change = (key, new_entry, entry is None, update)
+        if staged is not None:
+            staged.append(change)
+        else:
+            self.commit([change])
+        return entry is None and not seen, update
+
+    def commit(self, staged: List[tuple]) -> List[DealUpdate]:
+        """
+        track으로 보류한 기록을 반영하고 갱신 이벤트를 on_update에 전달합니다.
+
+        Args:
+            staged: track에 넘긴 보류 목록
+
+        Returns:
+            List[DealUpdate]: 전달한 갱신 이벤트
+        """
+        updates = []
+        with self.lock:
+            for key, entry, created, update in staged:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                if created:
+                    self.created += 1
+                elif update is None:
+                    self.unchanged += 1
+                else:
+                    self.updated += 1
+                    updates.append(update)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if staged:
+                self._dirty = True
+            if self._dirty and time.time() - self._saved_at >= self.flush_interval:
+                self._save()
+
+        if self.on_update is not None:
+            for update in updates:
+                self.on_update(update)
+        return updates
+
+    def _compare(self, entry: list, deal: HotDealItem, fingerprint: str) -> Optional[DealUpdate]:
+        """기억한 항목과 딜을 비교하여 바뀐 값을 항목에 반영하고 갱신 이벤트를 만듭니다."""
+        kinds = []
+        changes = {}
+        if entry[_FINGERPRINT] != fingerprint:
+            kinds.append(UPDATE_EDITED)
+            changes.update(title=(None, deal.title), price=(None, deal.price))
+            entry[_FINGERPRINT] = fingerprint
+        if bool(entry[_SOLD_OUT]) != deal.sold_out:
+            kinds.append(UPDATE_SOLD_OUT if deal.sold_out else UPDATE_RESTOCKED)
+            changes["sold_out"] = (bool(entry[_SOLD_OUT]), deal.sold_out)
+            entry[_SOLD_OUT] = deal.sold_out
+
+        popular = False
+        for column, name in zip((_RECOMMENDATIONS, _COMMENTS, _VIEWS), POPULARITY_FIELDS):
+            old, new = entry[column], getattr(deal, name)
+            # 목록에 표시되지 않은 값은 비교하지 않음
+            if new is None or old == new:
+                continue
+            if name == "views" and old is not None and abs(new - old) < self.view_step:
+                continue
+            changes[name] = (old, new)
+            entry[column] = new
+            popular = True
+        if popular:
+            kinds.append(UPDATE_POPULARITY)
+
+        if not changes:
+            return None
+        return DealUpdate(deal, kinds, changes)
+
+    def flush(self):
+        """바뀐 기록을 디스크에 저장합니다."""
+        with self.lock:
+            if self._dirty:
+                self._save()
+
+    def close(self):
+        """기록을 저장합니다."""
+        self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        추적 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 처음 본 딜 수, 바뀌지 않은 딜 수, 바뀐 딜 수, 기억하는 딜 수
+        """
+        with self.lock:
+            return {
+                "created": self.created,
+                "unchanged": self.unchanged,
+                "updated": self.updated,
+                "entries": len(self._entries),
+            }
\ No newline at end of file
@@ -4,26 +4,171 @@
 이 모듈은 여러 크롤러를 병렬로 조율하기 위한 관리자 클래스를 제공합니다.
 """
 
+import collections
 import logging
+import queue
 import threading
 import time
 import concurrent.futures
-from typing import List
+from typing import Callable, Iterator, List, Optional, Tuple
 
 from .base_crawler import BaseCrawler
-from .models import HotDealItem
+from .dedup import DedupIndex
+from .driver_pool import WebDriverPool
+from .health import STATE_CLOSED, STATE_VALUES, HealthTracker
+from .lifecycle import LifecycleStore
+from .metrics import MetricsRegistry, get_registry
+from .models import CrawlTarget, HotDealItem
+from .ratelimit import HostThrottle, host_of
+from .scheduler import AdaptiveScheduler
+from .state import CrawlStateStore
 
 logger = logging.getLogger(__name__)
 
+# 스트리밍 큐에서 작업자 하나가 끝났음을 알리는 표시
+_CRAWLER_DONE = object()
+
+
+class BoardRun:
+    """한 번의 크롤링에서 게시판 하나의 진행 상황."""
+
+    def __init__(self, crawler: BaseCrawler, board: Optional[str]):
+        self.crawler = crawler
+        self.board = board
+        # 같은 게시판의 페이지들이 동시에 크롤링되므로 실행 시작 시점의 경계를 고정해 둠
+        self.last_idx = crawler.get_last_idx(board)
+        self.max_idx: Optional[int] = None
+        self.failed = False
+        self.pending = 0
+        self.pages: List[int] = []
+
+    def record(self, target: CrawlTarget):
+        """크롤링을 마친 대상에서 본 가장 큰 idx와 실패 여부를 반영합니다."""
+        self.pages.append(target.page)
+        if target.max_idx is not None and (self.max_idx is None or target.max_idx > self.max_idx):
+            self.max_idx = target.max_idx
+        self.failed = self.failed or target.failed
+
+    def finish(self):
+        """
+        게시판의 모든 페이지를 마쳤을 때 마지막으로 본 idx를 갱신하고 응답 캐시 기록을 확정합니다.
+
+        읽지 못한 페이지가 있으면 그 페이지의 딜이 다음 실행에서 경계 뒤로 밀려 영영 빠지므로
+        갱신하지 않고 응답 캐시 기록도 버려서, 다음 실행에서 같은 경계부터 다시 읽습니다.
+        """
+        if self.failed:
+            logger.warning(f"{self.crawler.site_name}/{self.board or '-'}: 읽지 못한 페이지가 있어 "
+                           f"마지막으로 본 idx를 갱신하지 않습니다")
+            self.crawler.settle_cached_pages(self.board, self.pages, commit=False)
+            return
+        self.crawler.update_last_idx(self.board, self.max_idx)
+        self.crawler.settle_cached_pages(self.board, self.pages, commit=True)
+
+
+class _TargetQueue:
+    """호스트별 동시 요청 수 한도 안에서 크롤링 대상을 나눠 주는 작업 큐."""
+
+    def __init__(self, throttle: HostThrottle, cancelled: threading.Event):
+        """
+        작업 큐를 초기화합니다.
+
+        Args:
+            throttle: 호스트별 동시 요청 수를 기록하는 제한기
+            cancelled: 소비자가 더 이상 딜을 받지 않을 때 설정되는 이벤트
+        """
+        self.throttle = throttle
+        self.cancelled = cancelled
+        self._pending = collections.deque()
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def put(self, run: BoardRun, target: CrawlTarget):
+        """크롤링 대상을 큐에 추가합니다."""
+        host = host_of(run.crawler.page_url(target.page, target.board))
+        with self._condition:
+            self._pending.append((run, target, host))
+            run.pending += 1
+            self._condition.notify()
+
+    def get(self) -> Optional[Tuple[BoardRun, CrawlTarget, str]]:
+        """
+        호스트에 여유가 있는 크롤링 대상을 하나 꺼냅니다. 여유가 생길 때까지 기다립니다.
+
+        Returns:
+            (게시판 실행, 대상, 호스트), 모든 대상을 마쳤거나 취소되었으면 None
+        """
+        with self._condition:
+            while not self.cancelled.is_set():
+                # 진행 중인 대상이 다음 페이지를 추가할 수 있으므로 그것까지 끝나야 완료
+                if not self._pending and not self._in_flight:
+                    return None
+                for item in self._pending:
+                    if self.throttle.has_capacity(item[2]):
+                        self._pending.remove(item)
+                        self.throttle.start(item[2])
+                        self._in_flight += 1
+                        return item
+                self._condition.wait(0.5)
+            return None
+
+    def task_done(self, run: BoardRun, target: CrawlTarget, host: str,
+                  next_target: Optional[CrawlTarget] = None) -> bool:
+        """
+        크롤링을 마친 대상을 기록하고 다음 페이지가 있으면 큐에 추가합니다.
+
+        Returns:
+            bool: 게시판의 모든 페이지를 마쳤으면 True
+        """
+        with self._condition:
+            self.throttle.finish(host)
+            self._in_flight -= 1
+            run.record(target)
+            if next_target is not None:
+                self._pending.append((run, next_target, host))
+                run.pending += 1
+            run.pending -= 1
+            self._condition.notify_all()
+            return run.pending == 0
+
 
 class HotDealCrawlerManager:
     """여러 크롤러를 병렬로 조율하기 위한 관리자 클래스."""
     
-    def __init__(self):
-        """크롤러 관리자를 초기화합니다."""
+    def __init__(self, driver_pool: WebDriverPool = None, state_store: CrawlStateStore = None,
+                 dedup_index: DedupIndex = None, throttle: HostThrottle = None,
+                 metrics: MetricsRegistry = None, health: HealthTracker = None,
+                 lifecycle: LifecycleStore = None):
+        """
+        크롤러 관리자를 초기화합니다.
+        
+        Args:
+            driver_pool: 크롤러들이 공유할 WebDriver 풀
+                         (기본값: 브라우저 2개 크기의 새 풀, 처음 빌릴 때 브라우저 시작)
+            state_store: 사이트별 마지막으로 본 idx 저장소
+                         (None이면 매번 첫 페이지 전체를 크롤링)
+            dedup_index: 실행과 사이트를 가로질러 중복 딜을 제거할 인덱스
+                         (기본값: 기본 설정의 새 DedupIndex)
+            throttle: 호스트별 동시 요청 수와 요청 속도 제한
+                      (기본값: 기본 설정의 새 HostThrottle)
+            metrics: 크롤러들이 단계별 시간과 카운터를 기록할 레지스트리
+                     (기본값: 프로세스 공유 레지스트리)
+            health: 사이트별 회로 차단기와 재시도 예산
+                    (기본값: 기본 설정의 새 HealthTracker)
+            lifecycle: 다시 크롤링한 딜의 수정, 품절, 인기 변화를 찾을 저장소
+                       (None이면 마지막으로 본 idx 뒤의 딜은 다시 읽지 않음)
+        """
         self.crawlers = []
         self.results = []
         self.lock = threading.Lock()
+        self.driver_pool = driver_pool or WebDriverPool()
+        self.state_store = state_store
+        self.dedup_index = dedup_index or DedupIndex()
+        self.throttle = throttle or HostThrottle()
+        self.metrics = metrics or get_registry()
+        self.health = health or HealthTracker()
+        self.lifecycle = lifecycle
+        self._stopping = False
+        self._wakeup = threading.Event()
     
     def add_crawler(self, crawler: BaseCrawler):
         """
@@ -32,48 +177,256 @@ class HotDealCrawlerManager:
         Args:
             crawler: 추가할 크롤러
         """
+        crawler.driver_pool = self.driver_pool
+        crawler.state_store = self.state_store
+        crawler.throttle = self.throttle
+        crawler.metrics = self.metrics
+        crawler.health = self.health.site(crawler.site_name)
+        crawler.lifecycle = self.lifecycle
         self.crawlers.append(crawler)
+
+    def close(self):
+        """관리자가 소유한 WebDriver 풀을 종료합니다."""
+        self.driver_pool.close()
     
-    def _crawl_site(self, crawler: BaseCrawler):
+    def crawl_all(self, max_workers: int = None) -> List[HotDealItem]:
         """
-        사이트를 크롤링하고 결과를 저장합니다.
+        모든 사이트의 게시판과 페이지를 병렬로 크롤링합니다.
         
         Args:
-            crawler: 사용할 크롤러
+            max_workers: 사용할 최대 작업자 스레드 수
+                         (기본값: 호스트 수 x 호스트별 동시 요청 수)
+        
+        Returns:
+            List[HotDealItem]: 중복이 제거된 모든 핫딜 아이템 목록
+        """
+        self.results = list(self.iter_crawl(max_workers))
+        return self.results
+
+    def _work_targets(self, targets: _TargetQueue, deal_queue: queue.Queue,
+                      cancelled: threading.Event):
+        """
+        작업 큐에서 크롤링 대상을 꺼내 크롤링하면서 변환된 딜을 바로 딜 큐에 넣습니다.
+        
+        Args:
+            targets: 크롤링 대상 작업 큐
+            deal_queue: 딜을 넣을 크기 제한 큐
+            cancelled: 소비자가 더 이상 딜을 받지 않을 때 설정되는 이벤트
         """
         try:
-            deals = crawler.crawl()
-            with self.lock:
-                self.results.extend(deals)
-        except Exception as e:
-            logger.error(f"크롤러 {crawler.site_name}에서 오류 발생: {e}")
-    
-    def crawl_all(self, max_workers: int = None) -> List[HotDealItem]:
+            while True:
+                item = targets.get()
+                if item is None:
+                    break
+                run, target, host = item
+                crawler = run.crawler
+                next_target = None
+                try:
+                    with self.metrics.span("crawl_target", site=crawler.site_name, board=target.board,
+                                           page=target.page) as span:
+                        deals = crawler.iter_target(target, run.last_idx)
+                        try:
+                            for deal in deals:
+                                if not self._put_until_cancelled(deal_queue, deal, cancelled):
+                                    break
+                        finally:
+                            deals.close()
+                            # 다른 작업자가 쓸 수 있도록 페이지마다 WebDriver를 풀에 반납
+                            crawler._close_driver()
+                        span["rows"] = target.rows
+                    # 딜을 모두 큐에 넣은 대상만 수명 주기 저장소에 반영
+                    if not target.failed and not cancelled.is_set():
+                        crawler.commit_lifecycle(target)
+                    # 처음에 넣은 pages 페이지 다음부터는 경계에 도달할 때까지 한 페이지씩 추가
+                    if target.page >= crawler.pages and not cancelled.is_set():
+                        next_target = crawler.next_target(target, run.last_idx)
+                except Exception as e:
+                    logger.error(f"크롤러 {crawler.site_name}에서 오류 발생 ({target}): {e}")
+                    target.failed = True
+                finally:
+                    if targets.task_done(run, target, host, next_target) and not cancelled.is_set():
+                        run.finish()
+        finally:
+            self._put_until_cancelled(deal_queue, _CRAWLER_DONE, cancelled)
+
+    @staticmethod
+    def _put_until_cancelled(deal_queue: queue.Queue, item, cancelled: threading.Event) -> bool:
+        """큐에 자리가 날 때까지 기다렸다가 넣습니다. 취소되면 False를 반환합니다."""
+        while not cancelled.is_set():
+            try:
+                deal_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def iter_crawl(self, max_workers: int = None, queue_size: int = 1000) -> Iterator[HotDealItem]:
         """
-        ThreadPoolExecutor를 사용하여 모든 사이트를 병렬로 크롤링합니다.
+        모든 사이트의 게시판과 페이지를 병렬로 크롤링하면서 딜을 찾는 대로 하나씩 반환합니다.
+        
+        크롤러마다의 (게시판, 페이지) 대상을 하나의 작업 큐로 나눠 처리하며, 같은 호스트에는
+        HostThrottle의 동시 요청 수와 요청 속도 한도를 넘지 않게 요청합니다. 느린 사이트가
+        빠른 사이트의 결과를 막지 않으며, 큐 크기가 제한되어 있어 소비자가 느리면 크롤러가
+        기다리므로 메모리 사용량이 일정하게 유지됩니다.
         
         Args:
             max_workers: 사용할 최대 작업자 스레드 수
-                         (기본값: 크롤러 수)
+                         (기본값: 호스트 수 x 호스트별 동시 요청 수)
+            queue_size: 크롤러와 소비자 사이 큐의 최대 크기
         
         Returns:
-            List[HotDealItem]: 발견된 모든 핫딜 아이템 목록
+            Iterator[HotDealItem]: 중복이 제거된 핫딜 아이템
         """
-        self.results = []
-        start_time = time.time()
-        
-        # If max_workers is not specified, use the number of crawlers
+        if not self.crawlers:
+            return
+
+        self.health.begin_cycle()
+        deal_queue = queue.Queue(maxsize=queue_size)
+        cancelled = threading.Event()
+        targets = _TargetQueue(self.throttle, cancelled)
+        hosts = set()
+        for crawler in self.crawlers:
+            runs = {board: BoardRun(crawler, board) for board in crawler.boards}
+            for target in crawler.targets():
+                targets.put(runs[target.board], target)
+                hosts.add(host_of(crawler.page_url(target.page, target.board)))
+
         if max_workers is None:
-            max_workers = len(self.crawlers)
-        
-        logger.info(f"{max_workers}개의 작업자로 병렬 크롤링을 시작합니다")
+            max_workers = len(hosts) * self.throttle.max_concurrency
+        start_time = time.time()
+        count = 0
+
+        logger.info(f"{max_workers}개의 작업자로 스트리밍 크롤링을 시작합니다")
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(self._crawl_site, crawler) for crawler in self.crawlers]
-            concurrent.futures.wait(futures)
-        
+            for _ in range(max_workers):
+                executor.submit(self._work_targets, targets, deal_queue, cancelled)
+            
+            try:
+                remaining = max_workers
+                while remaining:
+                    item = deal_queue.get()
+                    if item is _CRAWLER_DONE:
+                        remaining -= 1
+                        continue
+                    for deal in self.dedup_index.dedupe([item]):
+                        count += 1
+                        self.metrics.deals.inc(site=deal.site)
+                        yield deal
+            finally:
+                # 소비자가 중간에 멈춰도 작업자가 큐에서 막히지 않도록 함
+                cancelled.set()
+
+        for crawler in self.crawlers:
+            self.report_slow_pages(crawler)
+        self.report_health()
         elapsed_time = time.time() - start_time
+        self.metrics.cycle_seconds.observe(elapsed_time, site="all")
         logger.info(f"크롤링이 {elapsed_time:.2f}초 만에 완료되었습니다")
-        logger.info(f"총 {len(self.results)}개의 딜을 찾았습니다")
+        logger.info(f"총 {count}개의 딜을 찾았습니다")
+
+    @staticmethod
+    def report_slow_pages(crawler: BaseCrawler):
+        """
+        크롤러에서 지연 예산을 넘은 페이지를 요약하여 기록합니다.
         
-        return self.results
\ No newline at end of file
+        Args:
+            crawler: 확인할 크롤러
+        """
+        slow_pages = crawler.pop_slow_pages()
+        if not slow_pages:
+            return
+        url, elapsed = max(slow_pages, key=lambda page: page[1])
+        logger.warning(f"{crawler.site_name}: 지연 예산 {crawler.latency_budget:.1f}초를 넘은 페이지 "
+                       f"{len(slow_pages)}개 (가장 느린 페이지 {elapsed:.2f}초: {url})")
+
+    def report_health(self, site_name: Optional[str] = None):
+        """
+        사이트별 회로 차단기 상태를 메트릭에 반영하고, 닫혀 있지 않은 사이트를 기록합니다.
+        
+        Args:
+            site_name: 보고할 사이트 (None이면 모든 사이트)
+        """
+        sites = [self.health.site(site_name)] if site_name is not None else list(self.health.sites.values())
+        for health in sites:
+            self.metrics.circuit_state.set(STATE_VALUES[health.state], site=health.site_name)
+            if health.state == STATE_CLOSED:
+                continue
+            report = health.report()
+            logger.warning(f"{health.site_name}: 회로 차단기 {report['state']} 상태로 크롤링을 건너뛰는 중 "
+                           f"(재시도까지 {report['retry_after']:.0f}초, 연속 실패 {report['failures']}회, "
+                           f"마지막 오류: {report['last_error']})")
+
+    def _run_scheduled(self, crawler: BaseCrawler, scheduler: AdaptiveScheduler,
+                       on_deals: Optional[Callable[[str, List[HotDealItem]], None]]):
+        """
+        스케줄러가 정한 사이트 한 번의 실행을 수행합니다.
+        
+        Args:
+            crawler: 사용할 크롤러
+            scheduler: 실행 결과를 반영할 스케줄러
+            on_deals: 새 딜을 전달받을 콜백 (사이트 이름, 새 딜 목록)
+        """
+        deals = []
+        start_time = time.time()
+        self.health.begin_cycle(crawler.site_name)
+        try:
+            with self.metrics.span("crawl_site", site=crawler.site_name) as span:
+                deals = crawler.crawl()
+                span["deals"] = len(deals)
+        except Exception as e:
+            logger.error(f"크롤러 {crawler.site_name}에서 오류 발생: {e}")
+            self.health.site(crawler.site_name).record_failure(f"{type(e).__name__}: {e}")
+        finally:
+            new_deals = scheduler.finish(crawler.site_name, deals)
+            self.metrics.cycle_seconds.observe(time.time() - start_time, site=crawler.site_name)
+            self._wakeup.set()
+        self.report_slow_pages(crawler)
+        self.report_health(crawler.site_name)
+        new_deals = self.dedup_index.dedupe(new_deals)
+        self.metrics.deals.inc(len(new_deals), site=crawler.site_name)
+
+        schedule = scheduler.schedules[crawler.site_name]
+        logger.info(f"{crawler.site_name}: 새 딜 {len(new_deals)}개, "
+                    f"다음 간격 {schedule.interval:.0f}초")
+        if new_deals and on_deals is not None:
+            try:
+                on_deals(crawler.site_name, new_deals)
+            except Exception as e:
+                logger.error(f"{crawler.site_name} 결과 처리 중 오류 발생: {e}")
+
+    def run_daemon(self, scheduler: AdaptiveScheduler = None,
+                   on_deals: Optional[Callable[[str, List[HotDealItem]], None]] = None):
+        """
+        stop()이 호출될 때까지 사이트별 적응형 간격으로 계속 크롤링합니다.
+        
+        같은 사이트의 실행은 겹치지 않으며, 각 사이트는 실행이 끝날 때마다
+        새 글 빈도에 따라 다음 실행 시각이 정해집니다.
+        
+        Args:
+            scheduler: 사용할 스케줄러 (기본값: 기본 설정의 AdaptiveScheduler)
+            on_deals: 실행마다 새 딜을 전달받을 콜백 (사이트 이름, 새 딜 목록)
+        """
+        scheduler = scheduler or AdaptiveScheduler()
+        crawlers = {crawler.site_name: crawler for crawler in self.crawlers}
+        for site_name in crawlers:
+            scheduler.add_site(site_name)
+
+        self._stopping = False
+        logger.info(f"{len(crawlers)}개 사이트로 데몬 모드를 시작합니다")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(crawlers))) as executor:
+            while not self._stopping:
+                for site_name in scheduler.due_sites():
+                    executor.submit(self._run_scheduled, crawlers[site_name], scheduler, on_deals)
+
+                # 대기 시간을 계산하기 전에 이벤트를 비워야 그 사이에 끝난 실행을 놓치지 않음
+                self._wakeup.clear()
+                self._wakeup.wait(scheduler.seconds_until_next())
+
+        logger.info("데몬 모드를 종료합니다")
+
+    def stop(self):
+        """run_daemon 루프에 종료를 요청합니다. 실행 중인 크롤링은 끝까지 진행됩니다."""
+        self._stopping = True
+        self._wakeup.set()
\ No newline at end of file
@@ -0,0 +1,357 @@
+"""
+핫딜 크롤러를 위한 키워드 구독 매칭 모듈.
+
+이 모듈은 사용자의 키워드 구독을 딜 제목과 맞춰 보는 매처를 제공합니다.
+모든 구독의 키워드를 하나의 Aho-Corasick 오토마톤으로 묶어 제목을 한 번만 훑으므로,
+구독 수가 늘어나도 딜 하나를 매칭하는 비용은 거의 늘지 않습니다.
+"""
+
+import json
+import logging
+import re
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .models import HotDealItem
+
+logger = logging.getLogger(__name__)
+
+# 매칭 시 남길 문자 (한글, 영문, 숫자)
+_NON_WORD_RE = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def normalize_text(text: str) -> str:
+    """
+    매칭을 위해 제목이나 키워드를 정규화합니다.
+
+    소문자로 바꾸고 한글/영문/숫자 외의 문자를 공백까지 모두 제거하므로
+    "갤럭시 버즈"와 "갤럭시버즈"가 같은 키워드로 매칭됩니다.
+
+    Args:
+        text: 제목 또는 키워드
+
+    Returns:
+        str: 정규화된 문자열
+    """
+    return _NON_WORD_RE.sub('', text.lower())
+
+
+class Subscription:
+    """키워드와 가격, 사이트, 카테고리 조건으로 이루어진 구독 하나."""
+
+    __slots__ = ('id', 'keywords', 'exclude', 'sites', 'categories', 'min_price', 'max_price', 'currency')
+
+    def __init__(self, id: str, keywords: Iterable[str] = (), exclude: Iterable[str] = (),
+                 sites: Optional[Iterable[str]] = None, categories: Optional[Iterable[str]] = None,
+                 min_price: Optional[int] = None, max_price: Optional[int] = None, currency: str = "KRW"):
+        """
+        구독을 초기화합니다.
+
+        Args:
+            id: 구독 ID
+            keywords: 제목에 모두 들어 있어야 하는 키워드 목록 (비어 있으면 조건만으로 매칭)
+            exclude: 제목에 하나라도 들어 있으면 안 되는 키워드 목록
+            sites: 허용할 사이트 이름 목록 (None이면 모든 사이트)
+            categories: 허용할 카테고리 목록 (None이면 모든 카테고리)
+            min_price: 최소 가격 (포함)
+            max_price: 최대 가격 (포함)
+            currency: min_price, max_price의 통화 코드 (다른 통화의 딜은 가격 조건을 통과하지 못함)
+
+        Raises:
+            ValueError: 정규화하면 빈 문자열이 되는 키워드가 있는 경우
+        """
+        self.id = id
+        self.keywords = frozenset(self._normalize_keywords(keywords))
+        self.exclude = frozenset(self._normalize_keywords(exclude))
+        self.sites = frozenset(sites) if sites is not None else None
+        self.categories = frozenset(categories) if categories is not None else None
+        self.min_price = min_price
+        self.max_price = max_price
+        self.currency = currency
+
+    @staticmethod
+    def _normalize_keywords(keywords: Iterable[str]) -> List[str]:
+        """키워드 목록을 정규화합니다."""
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        normalized = []
+        for keyword in keywords:
+            text = normalize_text(keyword)
+            if not text:
+                raise ValueError(f"매칭할 수 없는 키워드입니다: {keyword!r}")
+            normalized.append(text)
+        return normalized
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Subscription':
+        """
+        딕셔너리에서 구독을 생성합니다.
+
+        Args:
+            data: 구독 딕셔너리 (id 외의 키는 생략 가능)
+
+        Returns:
+            Subscription: 생성된 구독
+        """
+        return cls(
+            id=str(data["id"]),
+            keywords=data.get("keywords", ()),
+            exclude=data.get("exclude", ()),
+            sites=data.get("sites"),
+            categories=data.get("categories"),
+            min_price=data.get("min_price"),
+            max_price=data.get("max_price"),
+            currency=data.get("currency", "KRW")
+        )
+
+    def accepts(self, deal: HotDealItem) -> bool:
+        """
+        키워드 외의 조건(사이트, 카테고리, 가격)을 딜이 만족하는지 확인합니다.
+
+        Args:
+            deal: 핫딜 아이템
+
+        Returns:
+            bool: 모든 조건을 만족하면 True
+        """
+        if self.sites is not None and deal.site not in self.sites:
+            return False
+        if self.categories is not None and deal.category not in self.categories:
+            return False
+        if self.min_price is not None or self.max_price is not None:
+            # 가격을 모르거나 통화가 다르면 가격 조건을 확인할 수 없음
+            if deal.price is None or deal.currency != self.currency:
+                return False
+            if self.min_price is not None and deal.price < self.min_price:
+                return False
+            if self.max_price is not None and deal.price > self.max_price:
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"Subscription(id={self.id!r}, keywords={sorted(self.keywords)!r})"
+
+
+class _Automaton:
+    """여러 키워드를 한 번에 찾는 Aho-Corasick 오토마톤."""
+
+    __slots__ = ('_goto', '_fail', '_outputs')
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        키워드 목록으로 오토마톤을 만듭니다.
+
+        Args:
+            keywords: 정규화된 키워드 목록
+        """
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[str, ...]] = [()]
+        for keyword in keywords:
+            state = 0
+            for ch in keyword:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    outputs.append(())
+                state = next_state
+            outputs[state] = (keyword,)
+
+        # 너비 우선으로 실패 링크를 만들고, 실패 링크를 따라가며 나오는 키워드를 미리 합쳐 둠
+        fail = [0] * len(goto)
+        frontier = list(goto[0].values())
+        while frontier:
+            next_frontier = []
+            for state in frontier:
+                for ch, child in goto[state].items():
+                    link = fail[state]
+                    while link and ch not in goto[link]:
+                        link = fail[link]
+                    target = goto[link].get(ch, 0)
+                    fail[child] = target if target != child else 0
+                    if outputs[fail[child]]:
+                        outputs[child] = outputs[child] + outputs[fail[child]]
+                    next_frontier.append(child)
+            frontier = next_frontier
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def search(self, text: str) -> Set[str]:
+        """
+        텍스트에 들어 있는 키워드를 찾습니다.
+
+        Args:
+            text: 정규화된 텍스트
+
+        Returns:
+            Set[str]: 찾은 키워드 집합
+        """
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
+class DealMatcher:
+    """구독을 추가, 삭제하면서 딜과 매칭하는 스레드 안전한 매처."""
+
+    def __init__(self, subscriptions: Iterable[Subscription] = ()):
+        """
+        매처를 초기화합니다.
+
+        Args:
+            subscriptions: 처음 등록할 구독 목록
+        """
+        self.lock = threading.Lock()
+        self._subscriptions: Dict[str, Subscription] = {}
+        # 키워드별로 그 키워드를 포함(또는 제외)하는 구독 ID
+        self._required: Dict[str, Set[str]] = {}
+        self._excluded: Dict[str, Set[str]] = {}
+        # 키워드가 없어 조건만으로 매칭하는 구독 ID
+        self._unconditional: Set[str] = set()
+        self._automaton = _Automaton(())
+        self._automaton_keywords: Set[str] = set()
+        self._dirty = False
+        for subscription in subscriptions:
+            self.add(subscription)
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def add(self, subscription: Subscription):
+        """
+        구독을 등록합니다. 같은 ID의 구독이 있으면 바꿉니다.
+
+        이미 오토마톤에 있는 키워드만 쓰는 구독은 오토마톤을 다시 만들지 않고,
+        새 키워드가 생기면 다음 매칭 때 한 번만 다시 만듭니다.
+
+        Args:
+            subscription: 등록할 구독
+        """
+        with self.lock:
+            if subscription.id in self._subscriptions:
+                self._remove(subscription.id)
+            self._subscriptions[subscription.id] = subscription
+            if not subscription.keywords:
+                self._unconditional.add(subscription.id)
+            for keyword in subscription.keywords:
+                self._required.setdefault(keyword, set()).add(subscription.id)
+            for keyword in subscription.exclude:
+                self._excluded.setdefault(keyword, set()).add(subscription.id)
+            if not self._automaton_keywords.issuperset(subscription.keywords | subscription.exclude):
+                self._dirty = True
+
+    def remove(self, subscription_id: str) -> bool:
+        """
+        구독을 삭제합니다.
+
+        삭제된 구독만 쓰던 키워드는 구독자가 없어 매칭 결과에 영향을 주지 않으므로,
+        오토마톤은 다음에 다시 만들 때 정리합니다.
+
+        Args:
+            subscription_id: 삭제할 구독 ID
+
+        Returns:
+            bool: 구독이 있었으면 True
+        """
+        with self.lock:
+            return self._remove(subscription_id)
+
+    def _remove(self, subscription_id: str) -> bool:
+        """구독을 삭제합니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return False
+        self._unconditional.discard(subscription_id)
+        for index, keywords in ((self._required, subscription.keywords),
+                                (self._excluded, subscription.exclude)):
+            for keyword in keywords:
+                ids = index.get(keyword)
+                if ids is None:
+                    continue
+                ids.discard(subscription_id)
+                if not ids:
+                    del index[keyword]
+        return True
+
+    def _current_automaton(self) -> _Automaton:
+        """새 키워드가 등록되었으면 오토마톤을 다시 만들어 반환합니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        if self._dirty:
+            keywords = set(self._required) | set(self._excluded)
+            self._automaton = _Automaton(keywords)
+            self._automaton_keywords = keywords
+            self._dirty = False
+            logger.debug(f"키워드 {len(keywords)}개로 매칭 오토마톤을 다시 만들었습니다")
+        return self._automaton
+
+    def match(self, deal: HotDealItem) -> List[Subscription]:
+        """
+        딜과 매칭되는 구독을 찾습니다.
+
+        Args:
+            deal: 핫딜 아이템
+
+        Returns:
+            List[Subscription]: 매칭된 구독 목록
+        """
+        with self.lock:
+            found = self._current_automaton().search(normalize_text(deal.title))
+
+            # 구독별로 제목에서 찾은 필수 키워드 수를 세어 모두 찾은 구독만 남김
+            hits: Dict[str, int] = {}
+            for keyword in found:
+                for subscription_id in self._required.get(keyword, ()):
+                    hits[subscription_id] = hits.get(subscription_id, 0) + 1
+            excluded = set()
+            for keyword in found:
+                excluded.update(self._excluded.get(keyword, ()))
+
+            subscriptions = self._subscriptions
+            candidates = [subscriptions[subscription_id] for subscription_id, count in hits.items()
+                          if count == len(subscriptions[subscription_id].keywords)]
+            candidates.extend(subscriptions[subscription_id] for subscription_id in self._unconditional)
+
+        return [subscription for subscription in candidates
+                if subscription.id not in excluded and subscription.accepts(deal)]
+
+    def match_all(self, deals: Iterable[HotDealItem]) -> Iterator[Tuple[HotDealItem, List[Subscription]]]:
+        """
+        딜 스트림에서 구독과 매칭되는 딜을 찾습니다.
+
+        Args:
+            deals: 딜 스트림 (예: HotDealCrawlerManager.crawl_all()의 결과)
+
+        Returns:
+            Iterator[Tuple[HotDealItem, List[Subscription]]]: 매칭된 딜과 구독 목록
+        """
+        for deal in deals:
+            matched = self.match(deal)
+            if matched:
+                yield deal, matched
+
+
+def load_subscriptions(path: str) -> List[Subscription]:
+    """
+    JSON 파일에서 구독 목록을 읽습니다.
+
+    파일은 Subscription.from_dict가 받는 딕셔너리의 배열입니다.
+
+    Args:
+        path: 구독 파일 경로
+
+    Returns:
+        List[Subscription]: 구독 목록
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return [Subscription.from_dict(data) for data in json.load(f)]
\ No newline at end of file
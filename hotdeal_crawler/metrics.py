@@ -0,0 +1,464 @@
+"""
+핫딜 크롤러를 위한 메트릭과 추적 모듈.
+
+이 모듈은 크롤링 단계별 소요 시간 히스토그램과 카운터를 모으는 레지스트리, 이를 Prometheus
+텍스트 형식으로 내보내는 로컬 HTTP 엔드포인트, 크롤링마다 단계별 스팬을 JSON Lines로
+기록하는 선택적 추적기를 제공합니다.
+"""
+
+import contextlib
+import contextvars
+import http.server
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 단계 소요 시간 히스토그램의 기본 버킷(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _format_labels(labelnames: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """레이블을 Prometheus 텍스트 형식으로 만듭니다."""
+    pairs = []
+    for name, value in zip(labelnames, values):
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{value}"')
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """값을 Prometheus 텍스트 형식으로 만듭니다."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """레이블별로 증가만 하는 카운터."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        """
+        카운터를 초기화합니다.
+
+        Args:
+            name: 메트릭 이름
+            help: 메트릭 설명
+            labelnames: 레이블 이름 목록
+        """
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        """
+        카운터를 증가시킵니다.
+
+        Args:
+            amount: 증가량
+            **labels: 레이블 값
+        """
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        """
+        레이블의 현재 값을 반환합니다.
+
+        Args:
+            **labels: 레이블 값
+
+        Returns:
+            float: 현재 값
+        """
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            return self._values.get(key, 0)
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 형식의 줄 목록을 반환합니다."""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.metric_type}"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """레이블별로 현재 값을 설정하는 게이지."""
+
+    metric_type = "gauge"
+
+    def set(self, value: float, **labels):
+        """
+        게이지 값을 설정합니다.
+
+        Args:
+            value: 설정할 값
+            **labels: 레이블 값
+        """
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram:
+    """레이블별로 값의 분포를 누적 버킷으로 세는 히스토그램."""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        히스토그램을 초기화합니다.
+
+        Args:
+            name: 메트릭 이름
+            help: 메트릭 설명
+            labelnames: 레이블 이름 목록
+            buckets: 버킷 상한 목록 (오름차순)
+        """
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # 레이블별 [버킷별 개수..., 합계, 개수]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        """
+        값 하나를 기록합니다.
+
+        Args:
+            value: 기록할 값
+            **labels: 레이블 값
+        """
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            counts[-2] += value
+            counts[-1] += 1
+
+    def summary(self, **labels) -> Tuple[int, float]:
+        """
+        레이블의 기록 수와 합계를 반환합니다.
+
+        Args:
+            **labels: 레이블 값
+
+        Returns:
+            Tuple[int, float]: (기록 수, 합계)
+        """
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            counts = self._values.get(key)
+            return (int(counts[-1]), counts[-2]) if counts else (0, 0.0)
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 형식의 줄 목록을 반환합니다."""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, counts in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{labels} {int(counts[-1])}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(counts[-2])}")
+                lines.append(f"{self.name}_count{labels} {int(counts[-1])}")
+        return lines
+
+
+# 현재 실행 중인 스팬의 (trace_id, span_id). 스레드와 asyncio 태스크마다 따로 유지됨
+_current_span: contextvars.ContextVar[Optional[Tuple[str, str]]] = contextvars.ContextVar(
+    "hotdeal_current_span", default=None)
+
+
+class Tracer:
+    """끝난 스팬을 JSON Lines 파일에 기록하는 추적기."""
+
+    def __init__(self, path: str):
+        """
+        추적기를 초기화하고 파일을 추가 모드로 엽니다.
+
+        Args:
+            path: 스팬을 기록할 JSON Lines 파일 경로
+        """
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self.lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Dict[str, object]]:
+        """
+        스팬 하나를 실행합니다. 실행 중인 스팬이 있으면 그 스팬의 자식이 됩니다.
+
+        Args:
+            name: 스팬 이름
+            **attributes: 스팬 속성
+
+        Returns:
+            Iterator[Dict[str, object]]: 블록 안에서 속성을 더 추가할 수 있는 딕셔너리
+        """
+        parent = _current_span.get()
+        trace_id = parent[0] if parent else secrets.token_hex(16)
+        span_id = secrets.token_hex(8)
+        token = _current_span.set((trace_id, span_id))
+        start_time = time.time()
+        start = time.perf_counter()
+        error = None
+        try:
+            yield attributes
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            record = {
+                "trace_id": trace_id,
+                "span_id": span_id,
+                "parent_id": parent[1] if parent else None,
+                "name": name,
+                "start": start_time,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                "attributes": attributes,
+            }
+            if error is not None:
+                record["error"] = error
+            line = json.dumps(record, ensure_ascii=False, default=str)
+            with self.lock:
+                if not self._file.closed:
+                    self._file.write(line + "\n")
+
+    def close(self):
+        """파일을 닫습니다."""
+        with self.lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class MetricsRegistry:
+    """크롤러가 사용하는 메트릭을 모아 두는 레지스트리."""
+
+    def __init__(self):
+        """레지스트리를 초기화하고 크롤러의 표준 메트릭을 등록합니다."""
+        self._metrics: List[object] = []
+        self.tracer: Optional[Tracer] = None
+
+        self.stage_seconds = self.histogram(
+            "hotdeal_stage_seconds", "크롤링 단계별 소요 시간(초)", ("stage", "site"))
+        self.pages = self.counter(
+            "hotdeal_pages_total", "가져온 목록 페이지 수", ("site", "result"))
+        self.parse_errors = self.counter(
+            "hotdeal_parse_errors_total", "딜로 변환하지 못한 행 수", ("site",))
+        self.slow_pages = self.counter(
+            "hotdeal_slow_pages_total", "지연 예산을 넘은 페이지 수", ("site",))
+        self.deals = self.counter(
+            "hotdeal_deals_total", "중복 제거 후 내보낸 딜 수", ("site",))
+        self.cycle_seconds = self.histogram(
+            "hotdeal_cycle_seconds", "크롤링 실행 한 번의 소요 시간(초)", ("site",))
+        self.sink_seconds = self.histogram(
+            "hotdeal_sink_seconds", "싱크 작업별 소요 시간(초)", ("sink", "operation"))
+        self.sink_errors = self.counter(
+            "hotdeal_sink_errors_total", "싱크에서 난 오류 수", ("sink",))
+        self.retries = self.counter(
+            "hotdeal_retries_total", "실패한 목록 페이지 요청을 다시 시도한 횟수", ("site",))
+        self.skipped_pages = self.counter(
+            "hotdeal_skipped_pages_total", "회로 차단기가 열려 있어 건너뛴 목록 페이지 수", ("site",))
+        self.circuit_state = self.gauge(
+            "hotdeal_circuit_state", "사이트별 회로 차단기 상태 (0 닫힘, 1 반열림, 2 열림)", ("site",))
+        self.deal_updates = self.counter(
+            "hotdeal_deal_updates_total", "다시 크롤링한 딜에서 찾은 변경 수", ("site", "kind"))
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """
+        카운터를 만들어 등록합니다.
+
+        Args:
+            name: 메트릭 이름
+            help: 메트릭 설명
+            labelnames: 레이블 이름 목록
+
+        Returns:
+            Counter: 등록된 카운터
+        """
+        counter = Counter(name, help, labelnames)
+        self._metrics.append(counter)
+        return counter
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """
+        게이지를 만들어 등록합니다.
+
+        Args:
+            name: 메트릭 이름
+            help: 메트릭 설명
+            labelnames: 레이블 이름 목록
+
+        Returns:
+            Gauge: 등록된 게이지
+        """
+        gauge = Gauge(name, help, labelnames)
+        self._metrics.append(gauge)
+        return gauge
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """
+        히스토그램을 만들어 등록합니다.
+
+        Args:
+            name: 메트릭 이름
+            help: 메트릭 설명
+            labelnames: 레이블 이름 목록
+            buckets: 버킷 상한 목록
+
+        Returns:
+            Histogram: 등록된 히스토그램
+        """
+        histogram = Histogram(name, help, labelnames, buckets)
+        self._metrics.append(histogram)
+        return histogram
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Dict[str, object]]:
+        """
+        추적기가 설정되어 있으면 스팬을 기록합니다.
+
+        Args:
+            name: 스팬 이름
+            **attributes: 스팬 속성
+
+        Returns:
+            Iterator[Dict[str, object]]: 블록 안에서 속성을 더 추가할 수 있는 딕셔너리
+        """
+        if self.tracer is None:
+            yield attributes
+            return
+        with self.tracer.span(name, **attributes) as span_attributes:
+            yield span_attributes
+
+    @contextlib.contextmanager
+    def stage(self, stage: str, site: str, **attributes) -> Iterator[None]:
+        """
+        크롤링 단계 하나의 소요 시간을 기록하고, 추적기가 설정되어 있으면 스팬도 기록합니다.
+
+        Args:
+            stage: 단계 이름 (예: "navigation", "extraction")
+            site: 사이트 이름
+            **attributes: 스팬 속성
+        """
+        start = time.perf_counter()
+        try:
+            with self.span(stage, site=site, **attributes):
+                yield
+        finally:
+            self.stage_seconds.observe(time.perf_counter() - start, stage=stage, site=site)
+
+    def render(self) -> str:
+        """
+        모든 메트릭을 Prometheus 텍스트 형식으로 반환합니다.
+
+        Returns:
+            str: Prometheus 텍스트 노출 형식
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+_default_registry = None
+_default_registry_lock = threading.Lock()
+
+
+def get_registry() -> MetricsRegistry:
+    """
+    프로세스 전체에서 공유하는 메트릭 레지스트리를 반환합니다.
+
+    Returns:
+        MetricsRegistry: 공유 레지스트리
+    """
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = MetricsRegistry()
+    return _default_registry
+
+
+class MetricsServer:
+    """레지스트리를 /metrics 경로로 내보내는 로컬 HTTP 서버."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, host: str = "127.0.0.1", port: int = 9108):
+        """
+        메트릭 서버를 초기화합니다. start()를 호출해야 요청을 받습니다.
+
+        Args:
+            registry: 내보낼 레지스트리 (기본값: 프로세스 공유 레지스트리)
+            host: 바인딩할 주소
+            port: 바인딩할 포트 (0이면 임의의 빈 포트)
+        """
+        registry = registry or get_registry()
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"메트릭 요청: {format % args}")
+
+        self.registry = registry
+        self._server = http.server.ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """실제로 바인딩된 포트."""
+        return self._server.server_address[1]
+
+    def start(self):
+        """백그라운드 스레드에서 요청을 받기 시작합니다."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        logger.info(f"메트릭 엔드포인트: http://{self._server.server_address[0]}:{self.port}/metrics")
+
+    def close(self):
+        """서버를 종료합니다."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
\ No newline at end of file
@@ -2,36 +2,334 @@
 핫딜 크롤러를 위한 데이터 모델.
 """
 
+import json
+import re
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈로 직렬화
+    orjson = None
+
+# 가격 문자열에서 숫자 외에 허용할 표기 (예: "12,900원", "₩ 12900")
+_PRICE_NOISE_RE = re.compile(r'[\s,원₩]')
+# 추천 수, 댓글 수, 조회 수 문자열의 첫 숫자 (예: "5 - 0", "(12)", "조회 1,234")
+_COUNT_RE = re.compile(r'\d[\d,]*')
+# 품절이나 종료를 알리는 제목 표기 (예: "[품절]", "(종료)", "sold out")
+_SOLD_OUT_RE = re.compile(
+    # 괄호 태그 (예: "[품절]", "(종료)", "【마감】")
+    r'[\[(【]\s*(?:품절|종료|마감|sold\s*out)\s*[\])】]'
+    # "품절" 표기 ("품절임박", "품절 예정" 같은 재촉 표현은 제외)
+    r'|품절(?!\s*(?:임박|예정|직전|대란|주의|되기|전|시))'
+    r'|sold\s*out'
+    # 제목 끝에 따로 붙은 "종료", "마감" ("오늘마감", "선착순 마감", "12시 마감" 같은 기한은 제외)
+    r'|(?<![가-힣])(?<!선착순 )(?<!시 )(?<!일 )(?<!분 )(?:종료|마감)\s*[.!]*\s*$',
+    re.IGNORECASE)
+# 센트 같은 보조 단위가 있는 통화 (가격을 보조 단위 정수로 저장)
+MINOR_UNIT_CURRENCIES = frozenset(["USD", "EUR", "GBP"])
+# 같은 게시글을 가리켜도 URL마다 달라지는 쿼리 파라미터 (페이지, 검색 조건, 추적 파라미터)
+_URL_NOISE_PARAMS = frozenset([
+    "page", "divpage", "sca", "sfl", "stx", "sop", "spt", "search_type", "search_key", "keyword",
+    "fbclid", "gclid",
+])
+
+
+def parse_price(value: Union[int, str, None]) -> Optional[int]:
+    """
+    가격을 원 단위 정수로 변환합니다.
+
+    Args:
+        value: 가격 (정수 또는 "12,900원" 같은 문자열)
+
+    Returns:
+        원 단위 가격, 숫자로 읽을 수 없으면 None
+    """
+    if value is None or isinstance(value, int):
+        return value
+    text = _PRICE_NOISE_RE.sub('', value)
+    return int(text) if text.isdigit() else None
+
+
+def parse_count(value: Optional[str]) -> Optional[int]:
+    """
+    추천 수, 댓글 수, 조회 수 문자열을 정수로 변환합니다.
+
+    Args:
+        value: 숫자가 들어 있는 문자열 (예: "12", "(3)", "5 - 0")
+
+    Returns:
+        문자열의 첫 숫자, 숫자가 없으면 None
+    """
+    if not value:
+        return None
+    match = _COUNT_RE.search(value)
+    return int(match.group().replace(',', '')) if match else None
+
+
+def is_sold_out(title: str) -> bool:
+    """
+    제목에 품절이나 종료 표기가 있는지 확인합니다.
+
+    Args:
+        title: 딜 제목
+
+    Returns:
+        bool: 품절이나 종료 표기가 있으면 True
+    """
+    return _SOLD_OUT_RE.search(title) is not None
+
+
+def format_price(price: int, currency: str) -> str:
+    """
+    최소 단위 정수 가격을 표시용 문자열로 변환합니다.
+
+    Args:
+        price: 통화의 최소 단위 정수 가격 (USD/EUR/GBP는 센트)
+        currency: 통화 코드
+
+    Returns:
+        str: 표시용 가격 (예: "12,900원", "19.99 USD", "1,980 JPY")
+    """
+    if currency == "KRW":
+        return f"{price:,}원"
+    if currency in MINOR_UNIT_CURRENCIES:
+        units, cents = divmod(price, 100)
+        return f"{units:,}.{cents:02d} {currency}"
+    return f"{price:,} {currency}"
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    같은 게시글을 가리키는 URL이 같은 문자열이 되도록 정규화합니다.
+
+    스킴과 호스트를 소문자로 바꾸고, 프래그먼트와 페이지/검색/추적 쿼리 파라미터를 제거한 뒤
+    남은 파라미터를 정렬합니다.
+
+    Args:
+        url: 게시글 URL
+
+    Returns:
+        str: 정규화된 URL
+    """
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if k not in _URL_NOISE_PARAMS and not k.startswith("utm_"))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ""))
 
 
 class HotDealItem:
-    """핫딜 아이템을 나타내는 클래스."""
-    
-    def __init__(self, idx: str, title: str, url: str, price: Optional[str] = None,
-                 timestamp: Optional[datetime] = None, site: str = "", 
-                 category: Optional[str] = None):
+    """
+    핫딜 아이템을 나타내는 클래스.
+
+    인스턴스별 __dict__가 없는 __slots__ 클래스로, 많은 딜을 메모리에 오래 두어도
+    객체당 오버헤드가 작습니다.
+
+    Attributes:
+        idx: 핫딜 아이템의 고유 인덱스
+        title: 핫딜의 제목
+        url: 핫딜의 URL
+        price: 통화의 최소 단위 정수 가격 (KRW/JPY는 원/엔, USD/EUR/GBP는 센트)
+        timestamp: 딜이 게시된 시간 (기본값: 생성 시각)
+        site: 딜이 발견된 사이트의 이름
+        category: 딜의 카테고리
+        alternate_urls: 같은 딜을 다른 곳에서 올린 게시글의 URL 목록
+        board: 딜이 발견된 게시판
+        currency: 가격의 통화 코드
+        shipping: 원 단위 배송비 (0이면 무료배송, None이면 알 수 없음)
+        canonical_url: 정규화된 게시글 URL (기본값: url을 정규화한 값)
+        store: 쇼핑몰 이름 (예: 제목의 "[쿠팡]")
+        discount: 할인율(%)
+        history_min: 이 딜 이전까지 같은 상품의 최저가
+        history_median: 이 딜 이전까지 같은 상품 가격의 중앙값
+        below_median: 가격이 history_median보다 싼 비율(%, 비싸면 음수)
+        recommendations: 목록에 표시된 추천 수
+        comments: 목록에 표시된 댓글 수
+        views: 목록에 표시된 조회 수
+        sold_out: 품절이나 종료로 표시되었는지 여부
+    """
+
+    __slots__ = ('idx', 'title', 'url', 'price', 'timestamp', 'site', 'category', 'alternate_urls',
+                 'board', 'currency', 'shipping', 'canonical_url', 'store', 'discount', 'history_min',
+                 'history_median', 'below_median', 'recommendations', 'comments', 'views', 'sold_out')
+
+    def __init__(self, idx: str, title: str, url: str, price: Union[int, str, None] = None,
+                 timestamp: Optional[datetime] = None, site: str = "", category: Optional[str] = None,
+                 alternate_urls: Optional[List[str]] = None, board: Optional[str] = None,
+                 currency: str = "KRW", shipping: Optional[int] = None,
+                 canonical_url: Optional[str] = None, store: Optional[str] = None,
+                 discount: Optional[int] = None, history_min: Optional[int] = None,
+                 history_median: Optional[int] = None, below_median: Optional[float] = None,
+                 recommendations: Optional[int] = None, comments: Optional[int] = None,
+                 views: Optional[int] = None, sold_out: bool = False):
         """
         핫딜 아이템을 초기화합니다.
-        
+
         Args:
-            idx: 핫딜 아이템의 고유 인덱스
-            title: 핫딜의 제목
-            url: 핫딜의 URL
-            price: 아이템의 가격 (선택 사항)
-            timestamp: 딜이 게시된 시간 (선택 사항)
-            site: 딜이 발견된 사이트의 이름 (선택 사항)
-            category: 딜의 카테고리 (선택 사항)
+            price: 가격 (정수, 호환성을 위해 "12,900원" 같은 원 단위 문자열도 받아 변환)
+            나머지 인자는 같은 이름의 속성을 참고하세요.
         """
         self.idx = idx
         self.title = title
         self.url = url
-        self.price = price
-        self.timestamp = timestamp or datetime.now()
+        self.price = parse_price(price)
+        self.timestamp = timestamp if timestamp is not None else datetime.now()
         self.site = site
         self.category = category
+        self.alternate_urls = alternate_urls if alternate_urls is not None else []
+        self.board = board
+        self.currency = currency
+        self.shipping = shipping
+        self.canonical_url = canonical_url if canonical_url is not None or not url else canonicalize_url(url)
+        self.store = store
+        self.discount = discount
+        self.history_min = history_min
+        self.history_median = history_median
+        self.below_median = below_median
+        self.recommendations = recommendations
+        self.comments = comments
+        self.views = views
+        self.sold_out = sold_out
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        """
+        게시글을 식별하는 (사이트, 게시판, idx) 키.
+        
+        게시판마다 게시글 번호를 따로 매기므로 idx만으로는 게시글을 구분할 수 없습니다.
+        """
+        return (self.site, self.board or "", self.idx)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON으로 저장할 수 있는 딕셔너리로 변환합니다.
+        
+        Returns:
+            Dict[str, Any]: 핫딜 아이템의 필드
+        """
+        return {
+            "idx": self.idx,
+            "title": self.title,
+            "url": self.url,
+            "price": self.price,
+            "timestamp": self.timestamp.isoformat(),
+            "site": self.site,
+            "category": self.category,
+            "alternate_urls": self.alternate_urls,
+            "board": self.board,
+            "currency": self.currency,
+            "shipping": self.shipping,
+            "canonical_url": self.canonical_url,
+            "store": self.store,
+            "discount": self.discount,
+            "history_min": self.history_min,
+            "history_median": self.history_median,
+            "below_median": self.below_median,
+            "recommendations": self.recommendations,
+            "comments": self.comments,
+            "views": self.views,
+            "sold_out": self.sold_out
+        }
+
+    def to_json(self) -> bytes:
+        """
+        UTF-8로 인코딩된 JSON으로 변환합니다. orjson이 있으면 orjson을 사용합니다.
+        
+        Returns:
+            bytes: JSON 바이트 (줄바꿈 없음)
+        """
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "HotDealItem":
+        """
+        to_dict로 만든 딕셔너리에서 핫딜 아이템을 만듭니다.
+        
+        Args:
+            record: 핫딜 아이템의 필드 (이전 버전의 레코드처럼 일부 필드가 없어도 됨)
+        
+        Returns:
+            HotDealItem: 핫딜 아이템
+        """
+        timestamp = record.get("timestamp")
+        return cls(
+            idx=record["idx"],
+            title=record["title"],
+            url=record["url"],
+            price=record.get("price"),
+            timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
+            site=record.get("site", ""),
+            category=record.get("category"),
+            alternate_urls=list(record.get("alternate_urls") or []),
+            board=record.get("board"),
+            currency=record.get("currency") or "KRW",
+            shipping=record.get("shipping"),
+            canonical_url=record.get("canonical_url"),
+            store=record.get("store"),
+            discount=record.get("discount"),
+            history_min=record.get("history_min"),
+            history_median=record.get("history_median"),
+            below_median=record.get("below_median"),
+            recommendations=record.get("recommendations"),
+            comments=record.get("comments"),
+            views=record.get("views"),
+            sold_out=bool(record.get("sold_out")),
+        )
+
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "HotDealItem":
+        """
+        to_json으로 만든 JSON에서 핫딜 아이템을 만듭니다.
+        
+        Args:
+            data: JSON 바이트 또는 문자열
+        
+        Returns:
+            HotDealItem: 핫딜 아이템
+        """
+        record = orjson.loads(data) if orjson is not None else json.loads(data)
+        return cls.from_dict(record)
+
+    def __repr__(self) -> str:
+        return f"HotDealItem(site={self.site!r}, board={self.board!r}, idx={self.idx!r}, title={self.title!r})"
 
     def __str__(self) -> str:
         """핫딜 아이템의 문자열 표현을 반환합니다."""
-        return f"[{self.site}] {self.title} - {self.price or 'N/A'} ({self.url})"
\ No newline at end of file
+        price = format_price(self.price, self.currency) if self.price is not None else None
+        if self.history_min is not None and self.price is not None and self.price < self.history_min:
+            price = f"{price}, 역대 최저가"
+        price = price or 'N/A'
+        if self.sold_out:
+            price = f"{price}, 품절"
+        return f"[{self.site}] {self.title} - {price} ({self.url})"
+
+
+class CrawlTarget:
+    """크롤링할 게시판의 목록 페이지 하나와 그 크롤링 결과를 나타내는 클래스."""
+
+    def __init__(self, site_name: str, board: Optional[str], page: int = 1):
+        """
+        크롤링 대상을 초기화합니다.
+        
+        Args:
+            site_name: 사이트 이름
+            board: 게시판 (None이면 크롤러의 기본 목록)
+            page: 1부터 시작하는 페이지 번호
+        """
+        self.site_name = site_name
+        self.board = board
+        self.page = page
+        # 크롤링하면서 채워지는 결과
+        self.rows = 0
+        self.max_idx: Optional[int] = None
+        self.reached_boundary = False
+        # 페이지를 가져오거나 읽지 못했으면 True (게시판의 마지막으로 본 idx를 갱신하지 않음)
+        self.failed = False
+        # 딜을 전달한 뒤 수명 주기 저장소에 반영할 보류 기록
+        self.tracked: list = []
+
+    def __repr__(self) -> str:
+        return f"CrawlTarget({self.site_name!r}, {self.board!r}, page={self.page})"
\ No newline at end of file
@@ -0,0 +1,188 @@
+"""
+핫딜 크롤러를 위한 사이트 크롤러 플러그인 레지스트리.
+
+이 모듈은 사이트 크롤러를 이름으로 찾고 처음 사용할 때 import하는 레지스트리를 제공합니다.
+패키지에 포함된 사이트 외에도 "hotdeal_crawler.sites" 엔트리 포인트 그룹에 등록된 배포판의
+크롤러를 찾으므로, 패키지를 고치지 않고 사이트를 추가할 수 있습니다.
+
+    # 사이트를 추가하는 배포판의 pyproject.toml
+    [project.entry-points."hotdeal_crawler.sites"]
+    quasarzone = "my_crawlers.quasarzone:QuasarzoneCrawler"
+"""
+
+import importlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Type, Union
+
+if TYPE_CHECKING:
+    from .base_crawler import BaseCrawler
+
+logger = logging.getLogger(__name__)
+
+# 사이트 크롤러를 등록하는 엔트리 포인트 그룹
+ENTRY_POINT_GROUP = "hotdeal_crawler.sites"
+
+# 패키지에 포함된 사이트 크롤러 ("모듈:클래스" 형식, 처음 사용할 때 import)
+BUILTIN_SITES = {
+    "ppomppu": "hotdeal_crawler.site_crawlers.ppomppu_crawler:PPomppuCrawler",
+    "ruliweb": "hotdeal_crawler.site_crawlers.ruliweb_crawler:RuliwebCrawler",
+    "coolenjoy": "hotdeal_crawler.site_crawlers.coolenjoy_crawler:CoolenjoyCrawler",
+}
+
+
+def load_object(path: str):
+    """
+    "모듈:이름" 형식의 경로에서 객체를 import합니다.
+
+    Args:
+        path: "모듈:이름" 형식의 경로 (이름은 점으로 구분한 중첩 이름 가능)
+
+    Returns:
+        import한 객체
+
+    Raises:
+        ImportError: 모듈을 import할 수 없는 경우
+        AttributeError: 모듈에 이름이 없는 경우
+    """
+    module_name, _, qualname = path.partition(":")
+    value = importlib.import_module(module_name)
+    for name in filter(None, qualname.split(".")):
+        value = getattr(value, name)
+    return value
+
+
+def _entry_points() -> list:
+    """ENTRY_POINT_GROUP에 등록된 엔트리 포인트 목록을 반환합니다."""
+    from importlib.metadata import entry_points
+
+    try:
+        return list(entry_points(group=ENTRY_POINT_GROUP))
+    except TypeError:  # Python 3.9 이하는 그룹별 딕셔너리를 반환
+        return list(entry_points().get(ENTRY_POINT_GROUP, []))
+
+
+class SiteRegistry:
+    """사이트 이름으로 크롤러 클래스를 찾아 처음 사용할 때 import하는 레지스트리."""
+
+    def __init__(self, sites: Optional[Dict[str, str]] = None, discover: bool = True):
+        """
+        레지스트리를 초기화합니다.
+
+        Args:
+            sites: 처음 등록할 사이트 이름과 "모듈:클래스" 경로의 매핑 (기본값: BUILTIN_SITES)
+            discover: 엔트리 포인트로 등록된 사이트도 찾을지 여부
+        """
+        self._sources: Dict[str, object] = dict(BUILTIN_SITES if sites is None else sites)
+        self._classes: Dict[str, type] = {}
+        self._discovered = not discover
+        self.lock = threading.Lock()
+
+    def register(self, name: str, crawler: Union[str, type]):
+        """
+        사이트를 등록합니다. 같은 이름의 사이트가 있으면 바꿉니다.
+
+        Args:
+            name: 사이트 이름
+            crawler: 크롤러 클래스나 "모듈:클래스" 경로
+        """
+        with self.lock:
+            self._sources[name] = crawler
+            self._classes.pop(name, None)
+
+    def _discover(self):
+        """엔트리 포인트로 등록된 사이트를 한 번만 찾습니다. 플러그인 모듈은 import하지 않습니다."""
+        if self._discovered:
+            return
+        with self.lock:
+            if self._discovered:
+                return
+            for entry_point in _entry_points():
+                if entry_point.name in self._sources:
+                    logger.warning(f"이미 등록된 사이트 {entry_point.name}의 플러그인 "
+                                   f"{entry_point.value}를 무시합니다")
+                    continue
+                self._sources[entry_point.name] = entry_point
+            self._discovered = True
+
+    def names(self) -> List[str]:
+        """
+        등록된 사이트 이름 목록을 반환합니다.
+
+        Returns:
+            List[str]: 패키지에 포함된 사이트, 엔트리 포인트로 등록된 사이트 순서의 이름 목록
+        """
+        self._discover()
+        return list(self._sources)
+
+    def __contains__(self, name: str) -> bool:
+        if name not in self._sources:
+            self._discover()
+        return name in self._sources
+
+    def get(self, name: str) -> Type["BaseCrawler"]:
+        """
+        사이트의 크롤러 클래스를 반환합니다. 처음 요청할 때 크롤러 모듈을 import합니다.
+
+        Args:
+            name: 사이트 이름
+
+        Returns:
+            Type[BaseCrawler]: 크롤러 클래스
+
+        Raises:
+            KeyError: 등록되지 않은 사이트인 경우
+            TypeError: 등록된 객체가 BaseCrawler의 하위 클래스가 아닌 경우
+        """
+        crawler_class = self._classes.get(name)
+        if crawler_class is not None:
+            return crawler_class
+        if name not in self:
+            raise KeyError(f"등록되지 않은 사이트입니다: {name}")
+
+        from .base_crawler import BaseCrawler
+
+        source = self._sources[name]
+        if isinstance(source, str):
+            crawler_class = load_object(source)
+        elif isinstance(source, type):
+            crawler_class = source
+        else:
+            crawler_class = source.load()
+        if not (isinstance(crawler_class, type) and issubclass(crawler_class, BaseCrawler)):
+            raise TypeError(f"{name} 사이트의 크롤러가 BaseCrawler의 하위 클래스가 아닙니다: {crawler_class!r}")
+        with self.lock:
+            self._classes[name] = crawler_class
+        return crawler_class
+
+    def create(self, name: str, **kwargs) -> "BaseCrawler":
+        """
+        사이트의 크롤러를 생성합니다.
+
+        Args:
+            name: 사이트 이름
+            **kwargs: 크롤러 생성자에 넘길 인자 (fetch_backend, boards, pages 등)
+
+        Returns:
+            BaseCrawler: 생성된 크롤러
+        """
+        return self.get(name)(**kwargs)
+
+
+_default_site_registry = None
+_default_site_registry_lock = threading.Lock()
+
+
+def get_site_registry() -> SiteRegistry:
+    """
+    프로세스 전체에서 공유하는 사이트 레지스트리를 반환합니다.
+
+    Returns:
+        SiteRegistry: 공유 레지스트리
+    """
+    global _default_site_registry
+    if _default_site_registry is None:
+        with _default_site_registry_lock:
+            if _default_site_registry is None:
+                _default_site_registry = SiteRegistry()
+    return _default_site_registry
\ No newline at end of file
@@ -0,0 +1,383 @@
+"""
+핫딜 크롤러를 위한 가격 이력 저장소 모듈.
+
+이 모듈은 상품별 가격 관측값을 열(column)별 배열에 저장하고, 새 딜에 역대 최저가,
+중앙값, 중앙값 대비 할인율을 붙이는 저장소를 제공합니다.
+
+디스크에는 상품 키 목록(products.txt)과 관측값의 상품 번호, 시각, 가격을 열별로
+이어 쓴 이진 파일(product_ids.bin, times.bin, prices.bin)을 저장합니다.
+"""
+
+import bisect
+import logging
+import os
+import re
+import threading
+import time
+from array import array
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .dedup import normalize_title
+from .models import HotDealItem
+
+logger = logging.getLogger(__name__)
+
+# 같은 상품이라도 딜마다 달라지는 가격, 배송비, 할인율 표기
+_PRICE_TEXT_RE = re.compile(
+    r'\([^()]*(?:원|무료|무배|/|[$€£¥₩])[^()]*\)'
+    r'|[$€£¥₩]\s*\d[\d,.]*'
+    r'|\d[\d,.]*\s*(?:만\s*)?원'
+    r'|\d{1,2}\s*%')
+
+
+def product_key(deal: HotDealItem) -> Optional[str]:
+    """
+    딜의 상품을 식별하는 키를 만듭니다.
+
+    제목에서 가격, 배송비, 할인율 표기를 뺀 뒤 정규화하고 통화 코드를 붙이므로,
+    같은 상품이 다른 가격으로 다시 올라와도 같은 키가 됩니다.
+
+    Args:
+        deal: 핫딜 아이템
+
+    Returns:
+        상품 키 (예: "KRW:삼성갤럭시버즈2프로"), 제목에 상품 이름이 남지 않으면 None
+    """
+    name = normalize_title(_PRICE_TEXT_RE.sub(' ', deal.title))
+    if not name:
+        return None
+    return f"{deal.currency}:{name}"
+
+
+class PriceStats:
+    """상품 하나의 가격 이력 요약."""
+
+    __slots__ = ('count', 'min', 'median', 'last_price', 'first_seen', 'last_seen')
+
+    def __init__(self, count: int, min: int, median: int, last_price: int,
+                 first_seen: datetime, last_seen: datetime):
+        """
+        가격 이력 요약을 초기화합니다.
+
+        Args:
+            count: 관측 수
+            min: 최저가
+            median: 중앙값 (관측 수가 짝수면 가운데 두 값의 평균)
+            last_price: 가장 최근 가격
+            first_seen: 처음 관측한 시각
+            last_seen: 마지막으로 관측한 시각
+        """
+        self.count = count
+        self.min = min
+        self.median = median
+        self.last_price = last_price
+        self.first_seen = first_seen
+        self.last_seen = last_seen
+
+    def below_median(self, price: int) -> Optional[float]:
+        """
+        가격이 중앙값보다 몇 % 싼지 계산합니다.
+
+        Args:
+            price: 비교할 가격
+
+        Returns:
+            중앙값 대비 할인율(%, 비싸면 음수), 중앙값이 0이면 None
+        """
+        if self.median <= 0:
+            return None
+        return round((self.median - price) / self.median * 100, 1)
+
+    def __repr__(self) -> str:
+        return (f"PriceStats(count={self.count}, min={self.min}, median={self.median}, "
+                f"last_price={self.last_price})")
+
+
+class _Series:
+    """상품 하나의 관측값. 시각순 배열과 가격순 배열을 함께 유지합니다."""
+
+    __slots__ = ('times', 'prices', 'sorted_prices')
+
+    def __init__(self):
+        self.times = array('q')
+        self.prices = array('q')
+        self.sorted_prices = array('q')
+
+    def add(self, timestamp: int, price: int):
+        """관측값 하나를 추가합니다. 보통 시각순으로 들어오므로 대부분 끝에 붙습니다."""
+        if not self.times or timestamp >= self.times[-1]:
+            self.times.append(timestamp)
+            self.prices.append(price)
+        else:
+            position = bisect.bisect_right(self.times, timestamp)
+            self.times.insert(position, timestamp)
+            self.prices.insert(position, price)
+        bisect.insort(self.sorted_prices, price)
+
+    @classmethod
+    def from_columns(cls, times: array, prices: array) -> '_Series':
+        """저장된 순서의 관측값으로 시리즈를 만듭니다. 관측값마다 삽입하지 않고 한 번에 정렬합니다."""
+        series = cls()
+        if any(times[i] > times[i + 1] for i in range(len(times) - 1)):
+            pairs = sorted(zip(times, prices), key=lambda pair: pair[0])
+            times = array('q', [timestamp for timestamp, _ in pairs])
+            prices = array('q', [price for _, price in pairs])
+        series.times = times
+        series.prices = prices
+        series.sorted_prices = array('q', sorted(prices))
+        return series
+
+    def stats(self) -> PriceStats:
+        """가격 이력 요약을 반환합니다."""
+        prices = self.sorted_prices
+        middle = len(prices) // 2
+        median = prices[middle] if len(prices) % 2 else (prices[middle - 1] + prices[middle]) // 2
+        return PriceStats(
+            count=len(prices),
+            min=prices[0],
+            median=median,
+            last_price=self.prices[-1],
+            first_seen=datetime.fromtimestamp(self.times[0]),
+            last_seen=datetime.fromtimestamp(self.times[-1])
+        )
+
+
+class PriceHistoryStore:
+    """상품별 가격 관측값을 저장하고 새 딜에 가격 이력을 붙이는 저장소."""
+
+    PRODUCTS_FILE = "products.txt"
+    COLUMN_FILES = (("product_ids.bin", 'I'), ("times.bin", 'q'), ("prices.bin", 'q'))
+
+    def __init__(self, directory: str = os.path.join("result", "price_history"),
+                 repeat_interval: float = 24 * 60 * 60, flush_interval: float = 5):
+        """
+        가격 이력 저장소를 초기화하고 저장된 관측값을 읽어옵니다.
+
+        Args:
+            directory: 이력 파일을 저장할 디렉토리
+            repeat_interval: 같은 상품의 같은 가격을 다시 기록하지 않는 시간(초)
+            flush_interval: 새 관측값을 디스크에 내보내는 최소 간격(초)
+        """
+        self.directory = directory
+        self.repeat_interval = repeat_interval
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+
+        self._series: Dict[str, _Series] = {}
+        self._product_ids: Dict[str, int] = {}
+        self._products: List[str] = []
+        # 아직 디스크에 쓰지 않은 상품 키와 관측값
+        self._pending_products: List[str] = []
+        self._pending = tuple(array(typecode) for _, typecode in self.COLUMN_FILES)
+        self._flushed_at = time.time()
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def _load(self):
+        """저장된 상품 키와 관측값을 읽어옵니다."""
+        path = os.path.join(self.directory, self.PRODUCTS_FILE)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    key = line.rstrip('\n')
+                    self._product_ids[key] = len(self._products)
+                    self._products.append(key)
+
+        columns = []
+        for name, typecode in self.COLUMN_FILES:
+            column = array(typecode)
+            path = os.path.join(self.directory, name)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    column.fromfile(f, os.path.getsize(path) // column.itemsize)
+            columns.append(column)
+
+        # 쓰는 도중 중단되어 열 길이가 다르면 모든 열에 있는 관측값만 사용하고 나머지는 잘라냄
+        count = min(len(column) for column in columns)
+        if any(len(column) != count for column in columns):
+            logger.warning(f"가격 이력 파일의 길이가 달라 {count}번째 관측값 이후를 버립니다")
+            for (name, _), column in zip(self.COLUMN_FILES, columns):
+                del column[count:]
+                with open(os.path.join(self.directory, name), 'wb') as f:
+                    column.tofile(f)
+
+        product_ids, times, prices = columns
+        grouped: Dict[int, Tuple[array, array]] = {}
+        for product_id, timestamp, price in zip(product_ids, times, prices):
+            group = grouped.get(product_id)
+            if group is None:
+                group = grouped[product_id] = (array('q'), array('q'))
+            group[0].append(timestamp)
+            group[1].append(price)
+        for product_id, (group_times, group_prices) in grouped.items():
+            if product_id < len(self._products):
+                self._series[self._products[product_id]] = _Series.from_columns(group_times, group_prices)
+        if count:
+            logger.info(f"가격 이력을 읽었습니다: 상품 {len(self._series)}개, 관측값 {count}개")
+
+    def record(self, key: str, price: int, timestamp: Optional[datetime] = None) -> bool:
+        """
+        상품의 가격 관측값 하나를 추가합니다.
+
+        같은 가격이 repeat_interval 안에 다시 관측되면 중앙값이 한 게시글에 치우치지 않도록 기록하지 않습니다.
+
+        Args:
+            key: 상품 키
+            price: 가격
+            timestamp: 관측 시각 (기본값: 현재 시각)
+
+        Returns:
+            bool: 기록했으면 True
+        """
+        seconds = int((timestamp or datetime.now()).timestamp())
+        with self.lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            elif (series.prices[-1] == price
+                  and abs(seconds - series.times[-1]) < self.repeat_interval):
+                return False
+            series.add(seconds, price)
+
+            product_id = self._product_ids.get(key)
+            if product_id is None:
+                product_id = self._product_ids[key] = len(self._products)
+                self._products.append(key)
+                self._pending_products.append(key)
+            for column, value in zip(self._pending, (product_id, seconds, price)):
+                column.append(value)
+
+            if time.time() - self._flushed_at >= self.flush_interval:
+                self._flush()
+        return True
+
+    def stats(self, key: str) -> Optional[PriceStats]:
+        """
+        상품의 가격 이력 요약을 반환합니다. 관측 수와 관계없이 상수 시간이 걸립니다.
+
+        Args:
+            key: 상품 키
+
+        Returns:
+            가격 이력 요약, 관측값이 없으면 None
+        """
+        with self.lock:
+            series = self._series.get(key)
+            return series.stats() if series is not None else None
+
+    def price_at(self, key: str, when: datetime) -> Optional[int]:
+        """
+        주어진 시각에 마지막으로 관측된 가격을 이진 탐색으로 찾습니다.
+
+        Args:
+            key: 상품 키
+            when: 기준 시각
+
+        Returns:
+            그 시각 이전의 마지막 가격, 관측값이 없으면 None
+        """
+        with self.lock:
+            series = self._series.get(key)
+            if series is None:
+                return None
+            position = bisect.bisect_right(series.times, int(when.timestamp()))
+            return series.prices[position - 1] if position else None
+
+    def observations(self, key: str, start: Optional[datetime] = None,
+                     end: Optional[datetime] = None) -> List[Tuple[datetime, int]]:
+        """
+        시간 범위 안의 관측값을 시각순으로 반환합니다. 범위의 시작과 끝은 이진 탐색으로 찾습니다.
+
+        Args:
+            key: 상품 키
+            start: 시작 시각 (포함, None이면 제한 없음)
+            end: 끝 시각 (미포함, None이면 제한 없음)
+
+        Returns:
+            List[Tuple[datetime, int]]: (관측 시각, 가격) 목록
+        """
+        with self.lock:
+            series = self._series.get(key)
+            if series is None:
+                return []
+            first = bisect.bisect_left(series.times, int(start.timestamp())) if start else 0
+            last = bisect.bisect_left(series.times, int(end.timestamp())) if end else len(series.times)
+            return [(datetime.fromtimestamp(series.times[i]), series.prices[i]) for i in range(first, last)]
+
+    def annotate(self, deal: HotDealItem) -> HotDealItem:
+        """
+        딜에 지금까지의 가격 이력을 붙이고, 딜의 가격을 이력에 추가합니다.
+
+        Args:
+            deal: 핫딜 아이템
+
+        Returns:
+            HotDealItem: 같은 핫딜 아이템
+        """
+        if deal.price is None:
+            return deal
+        key = product_key(deal)
+        if key is None:
+            return deal
+
+        stats = self.stats(key)
+        if stats is not None:
+            deal.history_min = stats.min
+            deal.history_median = stats.median
+            deal.below_median = stats.below_median(deal.price)
+        self.record(key, deal.price, deal.timestamp)
+        return deal
+
+    def annotate_all(self, deals: Iterable[HotDealItem]) -> Iterator[HotDealItem]:
+        """
+        딜 스트림의 딜마다 가격 이력을 붙입니다.
+
+        Args:
+            deals: 딜 스트림 (예: HotDealCrawlerManager.iter_crawl())
+
+        Returns:
+            Iterator[HotDealItem]: 가격 이력이 붙은 딜 스트림
+        """
+        for deal in deals:
+            yield self.annotate(deal)
+
+    async def annotate_async(self, deals: AsyncIterable[HotDealItem]) -> AsyncIterator[HotDealItem]:
+        """
+        비동기 딜 스트림의 딜마다 가격 이력을 붙입니다.
+
+        Args:
+            deals: 딜 스트림 (예: AsyncCrawlEngine.iter_crawl())
+
+        Returns:
+            AsyncIterator[HotDealItem]: 가격 이력이 붙은 딜 스트림
+        """
+        async for deal in deals:
+            yield self.annotate(deal)
+
+    def flush(self):
+        """새 관측값을 디스크에 내보냅니다."""
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        """새 관측값을 열별 파일에 이어 씁니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        if self._pending_products:
+            with open(os.path.join(self.directory, self.PRODUCTS_FILE), 'a', encoding='utf-8') as f:
+                f.writelines(f"{key}\n" for key in self._pending_products)
+            self._pending_products = []
+        for (name, _), column in zip(self.COLUMN_FILES, self._pending):
+            if column:
+                with open(os.path.join(self.directory, name), 'ab') as f:
+                    column.tofile(f)
+                del column[:]
+        self._flushed_at = time.time()
+
+    def close(self):
+        """새 관측값을 디스크에 내보냅니다."""
+        self.flush()
\ No newline at end of file
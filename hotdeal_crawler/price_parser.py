@@ -0,0 +1,246 @@
+"""
+핫딜 크롤러를 위한 가격 정보 추출 모듈.
+
+이 모듈은 "[쿠팡] 상품명 (29,900원/무료)" 같은 딜 제목에서 쇼핑몰, 가격, 배송비, 할인율을
+미리 컴파일된 정규식으로 추출하는 함수를 제공합니다.
+"""
+
+import re
+from typing import Optional, Tuple
+
+from .models import MINOR_UNIT_CURRENCIES, HotDealItem
+
+# 제목 앞의 쇼핑몰 태그 (예: "[쿠팡]", "[G마켓]")
+_STORE_RE = re.compile(r'^\s*\[([^\[\]]{1,30})\]')
+# 가격/배송비 괄호 (예: "(29,900원/무료)")
+_PARENS_RE = re.compile(r'\(([^()]*)\)')
+# 금액 숫자: 천 단위 쉼표가 있으면 세 자리씩 묶인 경우만 (예: "29,900", "1,2345"는 아님).
+# 잘못 묶인 숫자의 뒷부분("2345")만 따로 읽지 않도록 숫자나 쉼표 바로 뒤에서는 시작하지 않음
+_NUMBER = r'(?<![\d,])(?:\d{1,3}(?:,\d{3})+(?!,?\d)|\d+)'
+# 가격 표기: 통화 기호, 숫자(천 단위 쉼표, 소수점), 단위
+_PRICE_RE = re.compile(
+    r'(?P<symbol>[$€£¥₩])?\s*'
+    rf'(?P<number>{_NUMBER})(?:\.(?P<decimal>\d{{1,2}}))?\s*'
+    r'(?P<unit>만\s*원|만|원|달러|불|유로|엔|usd|eur|jpy)?',
+    re.IGNORECASE)
+# 만/천/백을 섞은 금액 (예: "1만2천원", "12만9900원", "2천5백원"). 천이 없으면 "원"을 요구
+_COMPOUND_AMOUNT_RE = re.compile(
+    r'(?<![\d.,])(?:'
+    r'(?P<man>\d{1,4})\s*만\s*(?P<man_cheon>\d)\s*천\s*(?:(?P<man_baek>\d)\s*백\s*)?(?P<man_rest>\d{1,3})?\s*원?'
+    r'|(?P<man2>\d{1,4})\s*만\s*(?P<man2_rest>\d{1,4})\s*원'
+    r'|(?P<cheon>\d)\s*천\s*(?:(?P<baek>\d)\s*백\s*)?(?P<rest>\d{1,3})?\s*원'
+    r')')
+# 괄호 밖의 가격 (원 단위나 통화 기호가 있는 경우만). 숫자는 _PRICE_RE와 같은 규칙으로 묶음
+_INLINE_PRICE_RE = re.compile(
+    rf'(?:[$€£¥₩]\s*(?:{_NUMBER})(?:\.\d{{1,2}})?'
+    rf'|(?:{_NUMBER})(?:\.\d)?\s*만\s*원'
+    rf'|(?:{_NUMBER})\s*원)')
+# 단위 없는 숫자 뒤에 오면 가격이 아닌 표기 (예: "2개", "1+1", "27까지", "11/27", "11.27")
+_BARE_NUMBER_SUFFIX_RE = re.compile(r'\s*(?:개|\+|까지|[/.~]\s*\d)')
+# 괄호 안의 날짜 (예: "(11/27까지)"). 슬래시를 가격/배송비 구분으로 보지 않음
+_DATE_RE = re.compile(r'^\s*\d{1,2}\s*/\s*\d{1,2}(?!\d)')
+# 단위 없는 숫자를 가격으로 볼 최소 금액
+_BARE_PRICE_FLOOR = 100
+# 무료 배송 표현
+_FREE_SHIPPING_RE = re.compile(r'무료|무배|free', re.IGNORECASE)
+# 괄호 밖의 배송비 표기 (예: "배송비 3,000원")
+_SHIPPING_RE = re.compile(r'배송비\s*:?\s*(\d[\d,]*)\s*원')
+# 할인율 (예: "30%", "-30%", "30% 할인")
+_DISCOUNT_RE = re.compile(r'(?<![\d.])(\d{1,2})\s*%')
+
+# 통화 기호와 단위별 통화 코드
+_CURRENCIES = {
+    "$": "USD", "달러": "USD", "불": "USD", "usd": "USD",
+    "€": "EUR", "유로": "EUR", "eur": "EUR",
+    "£": "GBP",
+    "¥": "JPY", "엔": "JPY", "jpy": "JPY",
+}
+
+
+class PriceInfo:
+    """딜 제목에서 추출한 가격 정보."""
+
+    __slots__ = ('store', 'price', 'currency', 'shipping', 'discount')
+
+    def __init__(self, store: Optional[str] = None, price: Optional[int] = None,
+                 currency: str = "KRW", shipping: Optional[int] = None,
+                 discount: Optional[int] = None):
+        """
+        가격 정보를 초기화합니다.
+
+        Args:
+            store: 쇼핑몰 이름
+            price: 가격 (원, 또는 USD/EUR/GBP는 센트 단위 정수)
+            currency: 가격의 통화 코드
+            shipping: 배송비 (0이면 무료배송, None이면 알 수 없음)
+            discount: 할인율(%)
+        """
+        self.store = store
+        self.price = price
+        self.currency = currency
+        self.shipping = shipping
+        self.discount = discount
+
+    def __repr__(self) -> str:
+        return (f"PriceInfo(store={self.store!r}, price={self.price!r}, currency={self.currency!r}, "
+                f"shipping={self.shipping!r}, discount={self.discount!r})")
+
+
+def _compound_amount(match) -> str:
+    """만/천/백을 섞은 금액 표기를 "12,000원" 형식으로 바꿉니다."""
+    if match.group('man') is not None:
+        value = (int(match.group('man')) * 10000 + int(match.group('man_cheon')) * 1000
+                 + int(match.group('man_baek') or 0) * 100 + int(match.group('man_rest') or 0))
+    elif match.group('man2') is not None:
+        value = int(match.group('man2')) * 10000 + int(match.group('man2_rest'))
+    else:
+        value = (int(match.group('cheon')) * 1000 + int(match.group('baek') or 0) * 100
+                 + int(match.group('rest') or 0))
+    return f"{value:,}원"
+
+
+def _normalize_amounts(text: str) -> str:
+    """만/천/백을 섞은 금액 표기를 숫자로 바꿉니다."""
+    if '천' not in text and '만' not in text:
+        return text
+    return _COMPOUND_AMOUNT_RE.sub(_compound_amount, text)
+
+
+def parse_amount(text: str, require_unit: bool = False) -> Optional[Tuple[int, str]]:
+    """
+    가격 표기 하나를 (정수 금액, 통화 코드)로 변환합니다.
+
+    통화 기호, 단위, 천 단위 쉼표가 없는 숫자는 _BARE_PRICE_FLOOR 이상이고 뒤에 수량, "+",
+    "까지", 날짜가 오지 않을 때만 가격으로 봅니다.
+
+    Args:
+        text: 가격 표기 (예: "29,900원", "$12.99", "3만원", "1만2천원")
+        require_unit: True면 통화 기호, 단위, 천 단위 쉼표가 없는 숫자는 가격으로 보지 않음
+
+    Returns:
+        (금액, 통화 코드), 가격이 아니면 None
+    """
+    text = _normalize_amounts(text)
+    # "2+1 29,900원"처럼 숫자가 여러 개면 통화 기호, 단위, 쉼표가 있는 첫 금액을 사용
+    match = None
+    fallback = None
+    for candidate in _PRICE_RE.finditer(text):
+        if candidate.group('symbol') or candidate.group('unit') or ',' in candidate.group('number'):
+            match = candidate
+            break
+        fallback = candidate
+    if match is None:
+        if require_unit or fallback is None or not _is_bare_price(text, fallback):
+            return None
+        match = fallback
+    symbol, number, decimal, unit = match.group('symbol', 'number', 'decimal', 'unit')
+    unit = unit.replace(' ', '').lower() if unit else None
+
+    currency = _CURRENCIES.get(symbol or unit or "", "KRW")
+    value = int(number.replace(',', ''))
+    if unit in ("만원", "만"):
+        # "1.5만원" 같은 표기
+        return value * 10000 + int((decimal or "0").ljust(4, "0")[:4]), currency
+    if currency in MINOR_UNIT_CURRENCIES:
+        return value * 100 + int((decimal or "0").ljust(2, "0")), currency
+    return value, currency
+
+
+def _is_bare_price(text: str, match) -> bool:
+    """단위 없는 숫자 표기가 가격으로 볼 만한지 확인합니다."""
+    if int(match.group('number')) < _BARE_PRICE_FLOOR:
+        return False
+    start = match.start('number')
+    if start and text[start - 1] == '+':
+        return False
+    return not _BARE_NUMBER_SUFFIX_RE.match(text, match.end('number'))
+
+
+def _parse_shipping(text: str) -> Optional[int]:
+    """배송비 표기를 원 단위 정수로 변환합니다. 무료면 0을 반환합니다."""
+    if _FREE_SHIPPING_RE.search(text):
+        return 0
+    amount = parse_amount(text)
+    return amount[0] if amount is not None else None
+
+
+def extract_price_info(title: str) -> PriceInfo:
+    """
+    딜 제목에서 쇼핑몰, 가격, 배송비, 할인율을 추출합니다.
+
+    뒤쪽의 "(가격/배송비)" 괄호를 먼저 보고, 없으면 배송비 표기를 뺀 제목에서 "원" 단위나
+    통화 기호가 붙은 첫 번째 금액을 가격으로 사용합니다.
+
+    Args:
+        title: 딜 제목
+
+    Returns:
+        PriceInfo: 추출한 가격 정보 (찾지 못한 항목은 None)
+    """
+    info = PriceInfo()
+
+    match = _STORE_RE.match(title)
+    if match is not None:
+        info.store = match.group(1).strip()
+
+    # "1만2천원" 같은 표기를 먼저 숫자로 바꿈
+    title = _normalize_amounts(title)
+
+    # 괄호가 여러 개면 가격 괄호는 보통 뒤쪽에 있음
+    for match in reversed(_PARENS_RE.findall(title)):
+        if _DATE_RE.match(match):
+            # "(11/27까지)" 같은 날짜 괄호는 단위가 있는 금액만 가격으로 봄
+            price_text, slash, shipping_text = match, "", ""
+        else:
+            price_text, slash, shipping_text = match.partition('/')
+        # "(2개)", "(500ml)" 같은 괄호를 가격으로 읽지 않도록 배송비가 없으면 단위를 요구
+        amount = parse_amount(price_text, require_unit=not slash)
+        if amount is None:
+            continue
+        info.price, info.currency = amount
+        if slash:
+            info.shipping = _parse_shipping(shipping_text)
+        break
+
+    rest = title
+    match = _SHIPPING_RE.search(title)
+    if match is not None:
+        if info.shipping is None:
+            info.shipping = int(match.group(1).replace(',', ''))
+        rest = title[:match.start()] + title[match.end():]
+
+    if info.price is None:
+        match = _INLINE_PRICE_RE.search(rest)
+        amount = parse_amount(match.group(0)) if match is not None else None
+        if amount is not None:
+            info.price, info.currency = amount
+
+    match = _DISCOUNT_RE.search(title)
+    if match is not None and int(match.group(1)) > 0:
+        info.discount = int(match.group(1))
+    return info
+
+
+def apply_price_info(deal: HotDealItem) -> HotDealItem:
+    """
+    딜 제목에서 추출한 가격 정보로 비어 있는 필드를 채웁니다.
+
+    사이트가 따로 제공한 가격 등 이미 채워진 필드는 덮어쓰지 않습니다.
+
+    Args:
+        deal: 핫딜 아이템
+
+    Returns:
+        HotDealItem: 같은 핫딜 아이템
+    """
+    info = extract_price_info(deal.title)
+    if deal.price is None and info.price is not None:
+        deal.price = info.price
+        deal.currency = info.currency
+    if deal.shipping is None:
+        deal.shipping = info.shipping
+    if deal.store is None:
+        deal.store = info.store
+    if deal.discount is None:
+        deal.discount = info.discount
+    return deal
\ No newline at end of file
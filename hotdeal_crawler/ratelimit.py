@@ -0,0 +1,146 @@
+"""
+핫딜 크롤러를 위한 호스트별 요청 제한 모듈.
+
+이 모듈은 토큰 버킷 속도 제한과 호스트별 동시 요청 수 제한을 제공합니다.
+"""
+
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+def host_of(url: str) -> str:
+    """
+    URL의 호스트 이름을 반환합니다.
+
+    Args:
+        url: URL
+
+    Returns:
+        str: 호스트 이름 (포트 포함)
+    """
+    return urlsplit(url).netloc.lower()
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        토큰 버킷을 초기화합니다. 처음에는 가득 찬 상태입니다.
+
+        Args:
+            rate: 초당 채워지는 토큰 수
+            capacity: 최대 토큰 수 (순간적으로 허용할 요청 수)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        토큰 하나를 예약하고 그 토큰을 쓸 수 있을 때까지 기다려야 할 시간을 반환합니다.
+
+        토큰이 모자라면 빚(음수 토큰)으로 예약하므로 먼저 예약한 요청이 먼저 실행됩니다.
+
+        Returns:
+            float: 기다려야 할 시간(초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 기다립니다."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class HostThrottle:
+    """호스트별 동시 요청 수와 요청 속도를 제한하는 클래스."""
+
+    def __init__(self, max_concurrency: int = 2, rate: float = 1.0, burst: float = 2):
+        """
+        호스트별 제한을 초기화합니다.
+
+        Args:
+            max_concurrency: 호스트 하나에 동시에 보낼 최대 요청 수
+            rate: 호스트 하나에 보낼 초당 요청 수
+            burst: 호스트 하나에 순간적으로 허용할 요청 수
+        """
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url: str) -> TokenBucket:
+        """URL의 호스트에 대한 토큰 버킷을 반환합니다."""
+        host = host_of(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    def wait(self, url: str):
+        """
+        URL의 호스트에 요청을 보내도 될 때까지 토큰 버킷에서 기다립니다.
+
+        Args:
+            url: 요청할 URL
+        """
+        self._bucket(url).acquire()
+
+    def reserve(self, url: str) -> float:
+        """
+        URL의 호스트에 보낼 요청 하나를 예약합니다. asyncio에서 asyncio.sleep으로 기다릴 때 사용합니다.
+
+        Args:
+            url: 요청할 URL
+
+        Returns:
+            float: 요청 전에 기다려야 할 시간(초)
+        """
+        return self._bucket(url).reserve()
+
+    def has_capacity(self, host: str) -> bool:
+        """
+        호스트에 동시 요청을 하나 더 보낼 수 있는지 확인합니다.
+
+        Args:
+            host: 호스트 이름
+
+        Returns:
+            bool: 동시 요청 수가 한도보다 적으면 True
+        """
+        with self._lock:
+            return self._in_flight.get(host, 0) < self.max_concurrency
+
+    def start(self, host: str):
+        """
+        호스트에 대한 요청 시작을 기록합니다.
+
+        Args:
+            host: 호스트 이름
+        """
+        with self._lock:
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+
+    def finish(self, host: str):
+        """
+        호스트에 대한 요청 종료를 기록합니다.
+
+        Args:
+            host: 호스트 이름
+        """
+        with self._lock:
+            self._in_flight[host] = max(0, self._in_flight.get(host, 0) - 1)
\ No newline at end of file
@@ -0,0 +1,249 @@
+"""
+핫딜 크롤러를 위한 목록 페이지 기록과 재생 모듈.
+
+이 모듈은 사이트별 목록 페이지 HTML을 픽스처 디렉토리에 기록하는 기록기와, 네트워크 없이
+기록된 페이지를 HTTP 백엔드처럼 돌려주는 재생 백엔드를 제공합니다.
+오프라인 벤치마크와 선택자 회귀 검사에 사용합니다.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from .base_crawler import BACKEND_HTTP, BaseCrawler
+from .fetchers import HtmlNode, HttpFetcher, get_http_fetcher, parse_document
+
+logger = logging.getLogger(__name__)
+
+# 픽스처 파일 이름에 남길 문자
+_UNSAFE_NAME_RE = re.compile(r'[^0-9A-Za-z]+')
+
+INDEX_FILE = "index.json"
+
+
+def fixture_name(url: str) -> str:
+    """
+    URL을 기록할 픽스처 파일의 상대 경로를 만듭니다.
+
+    Args:
+        url: 목록 페이지 URL
+
+    Returns:
+        str: "호스트/경로_쿼리.html" 형식의 상대 경로
+    """
+    parts = urlsplit(url)
+    slug = _UNSAFE_NAME_RE.sub('_', f"{parts.path}?{parts.query}").strip('_') or "index"
+    return f"{parts.netloc.lower()}/{slug}.html"
+
+
+def _load_index(directory: str) -> Dict[str, Dict[str, Optional[str]]]:
+    """픽스처 디렉토리의 URL별 항목을 읽습니다."""
+    path = os.path.join(directory, INDEX_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class FixtureRecorder:
+    """목록 페이지 HTML을 픽스처 디렉토리에 기록하는 클래스."""
+
+    def __init__(self, directory: str, http_fetcher: Optional[HttpFetcher] = None):
+        """
+        기록기를 초기화합니다. 이미 기록된 픽스처는 새로 기록하면 덮어씁니다.
+
+        Args:
+            directory: 픽스처 디렉토리
+            http_fetcher: HTTP 백엔드 크롤러의 페이지를 가져올 fetcher (기본값: 프로세스 공유 fetcher)
+        """
+        self.directory = directory
+        self.http_fetcher = http_fetcher
+        self.lock = threading.Lock()
+        self._index = _load_index(directory)
+
+    def record(self, url: str, content: bytes, encoding: Optional[str] = None,
+               final_url: Optional[str] = None) -> str:
+        """
+        페이지 하나를 기록합니다.
+
+        Args:
+            url: 크롤러가 요청하는 URL
+            content: 응답 본문
+            encoding: 문서 인코딩 (None이면 재생할 때 문서의 meta 태그를 사용)
+            final_url: 리디렉션 후의 URL (상대 URL의 기준, 기본값: url)
+
+        Returns:
+            str: 기록한 파일 경로
+        """
+        name = fixture_name(url)
+        path = os.path.join(self.directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+
+        with self.lock:
+            self._index[url] = {"file": name, "encoding": encoding, "final_url": final_url or url}
+            self._save_index()
+        return path
+
+    def _save_index(self):
+        """URL별 항목을 원자적으로 저장합니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        path = os.path.join(self.directory, INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def record_crawler(self, crawler: BaseCrawler, pages: int = 1) -> int:
+        """
+        크롤러의 게시판마다 목록 페이지를 기록합니다.
+
+        HTTP 백엔드는 응답 본문을 그대로, Selenium 백엔드는 렌더링된 page_source를 UTF-8로 기록합니다.
+
+        Args:
+            crawler: 기록할 사이트의 크롤러
+            pages: 게시판마다 기록할 페이지 수
+
+        Returns:
+            int: 기록한 페이지 수
+        """
+        count = 0
+        try:
+            for board in crawler.boards:
+                for page in range(1, pages + 1):
+                    url = crawler.page_url(page, board)
+                    if crawler.fetch_backend == BACKEND_HTTP:
+                        response = (self.http_fetcher or get_http_fetcher()).get(url)
+                        if response is None:
+                            continue
+                        self.record(url, response.content, crawler.encoding, response.url)
+                    else:
+                        if not crawler.get_page(url):
+                            continue
+                        self.record(url, crawler.driver.page_source.encode('utf-8'), 'utf-8',
+                                    crawler.driver.current_url)
+                    count += 1
+                    logger.info(f"{url} 페이지를 기록했습니다")
+        finally:
+            crawler._close_driver()
+        return count
+
+
+class ReplayFetcher:
+    """기록된 픽스처를 네트워크 없이 돌려주는 HTTP 백엔드 대체 클래스."""
+
+    def __init__(self, directory: str):
+        """
+        재생 백엔드를 초기화합니다. 페이지 본문은 처음 요청될 때 읽어 메모리에 둡니다.
+
+        Args:
+            directory: 픽스처 디렉토리
+        """
+        self.directory = directory
+        self._index = _load_index(directory)
+        self._contents: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def urls(self) -> List[str]:
+        """
+        기록된 URL 목록을 반환합니다.
+
+        Returns:
+            List[str]: URL 목록
+        """
+        return sorted(self._index)
+
+    def has(self, url: str) -> bool:
+        """
+        URL이 기록되어 있는지 확인합니다.
+
+        Args:
+            url: 확인할 URL
+
+        Returns:
+            bool: 기록되어 있으면 True
+        """
+        return url in self._index
+
+    def file_url(self, url: str) -> Optional[str]:
+        """
+        기록된 페이지의 file:// URL을 반환합니다. Selenium 백엔드로 재생할 때 사용합니다.
+
+        Args:
+            url: 기록된 URL
+
+        Returns:
+            file:// URL, 기록되어 있지 않으면 None
+        """
+        entry = self._index.get(url)
+        if entry is None:
+            return None
+        return "file://" + os.path.abspath(os.path.join(self.directory, entry["file"]))
+
+    def content(self, url: str) -> Optional[bytes]:
+        """
+        기록된 페이지의 본문을 반환합니다.
+
+        Args:
+            url: 기록된 URL
+
+        Returns:
+            본문, 기록되어 있지 않으면 None
+        """
+        entry = self._index.get(url)
+        if entry is None:
+            return None
+        with self._lock:
+            content = self._contents.get(url)
+            if content is None:
+                with open(os.path.join(self.directory, entry["file"]), 'rb') as f:
+                    content = self._contents[url] = f.read()
+        return content
+
+    def fetch(self, url: str, encoding: Optional[str] = None) -> Optional[HtmlNode]:
+        """
+        기록된 페이지를 파싱합니다. HttpFetcher.fetch와 같은 방식으로 사용합니다.
+
+        Args:
+            url: 가져올 URL
+            encoding: 문서 인코딩 (None이면 기록할 때의 인코딩이나 문서의 meta 태그를 사용)
+
+        Returns:
+            파싱된 문서의 루트 요소, 기록되어 있지 않으면 None
+        """
+        content = self.content(url)
+        if content is None:
+            logger.error(f"기록된 페이지가 없습니다: {url}")
+            return None
+        entry = self._index[url]
+        return parse_document(content, entry["final_url"], encoding or entry["encoding"])
+
+    def close(self):
+        """메모리에 둔 페이지 본문을 비웁니다."""
+        with self._lock:
+            self._contents.clear()
+
+
+class AsyncReplayFetcher:
+    """ReplayFetcher를 AsyncHttpFetcher처럼 asyncio 엔진에서 사용하는 클래스."""
+
+    def __init__(self, replay: ReplayFetcher):
+        """
+        비동기 재생 백엔드를 초기화합니다.
+
+        Args:
+            replay: 기록된 페이지를 돌려줄 재생 백엔드
+        """
+        self.replay = replay
+
+    async def fetch(self, url: str, encoding: Optional[str] = None) -> Optional[HtmlNode]:
+        """기록된 페이지를 파싱합니다."""
+        return self.replay.fetch(url, encoding)
+
+    async def close(self):
+        """닫을 연결이 없으므로 아무것도 하지 않습니다."""
+        pass
\ No newline at end of file
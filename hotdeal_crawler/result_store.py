@@ -0,0 +1,316 @@
+"""
+핫딜 크롤러를 위한 결과 저장소 모듈.
+
+이 모듈은 딜을 회전(rotation)되는 JSON Lines 세그먼트 파일에 이어 쓰고,
+사이트와 시간 범위별 사이드카 인덱스로 필요한 세그먼트만 읽는 저장소를 제공합니다.
+"""
+
+import gzip
+import io
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .models import HotDealItem
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없으면 zstd 압축을 사용할 수 없음
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# 압축 방식별 세그먼트 파일 확장자
+SEGMENT_EXTENSIONS = {
+    None: ".jsonl",
+    "gzip": ".jsonl.gz",
+    "zstd": ".jsonl.zst",
+}
+
+
+class _GzipMemberWriter:
+    """
+    gzip 세그먼트 작성기. flush할 때마다 gzip 멤버를 닫아, 쓰는 중인 세그먼트도 끝까지 읽을 수 있게 합니다.
+
+    gzip 리더는 이어 붙은 여러 멤버를 한 스트림으로 읽으므로 읽는 쪽은 바꿀 필요가 없습니다.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'ab')
+        self._member: Optional[gzip.GzipFile] = None
+
+    def write(self, data: bytes):
+        if self._member is None:
+            self._member = gzip.GzipFile(fileobj=self._file, mode='ab')
+        self._member.write(data)
+
+    def flush(self):
+        if self._member is not None:
+            # GzipFile은 넘겨받은 파일을 닫지 않고 멤버의 끝(CRC와 길이)만 씀
+            self._member.close()
+            self._member = None
+        self._file.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+class ResultStore:
+    """회전되는 JSON Lines 세그먼트에 딜을 이어 쓰고 시간 범위로 읽는 저장소."""
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory: str = os.path.join("result", "store"),
+                 compression: Optional[str] = None,
+                 segment_max_bytes: int = 64 * 1024 * 1024,
+                 segment_max_age: float = 60 * 60, flush_interval: float = 5):
+        """
+        결과 저장소를 초기화하고 사이드카 인덱스를 읽어옵니다.
+
+        Args:
+            directory: 세그먼트와 인덱스를 저장할 디렉토리
+            compression: 세그먼트 압축 방식 (None, "gzip", "zstd")
+            segment_max_bytes: 세그먼트 하나의 최대 크기 (압축 전 바이트)
+            segment_max_age: 세그먼트 하나에 쓰는 최대 시간(초)
+            flush_interval: 버퍼와 인덱스를 디스크에 내보내는 최소 간격(초)
+        """
+        if compression not in SEGMENT_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다")
+
+        self.directory = directory
+        self.compression = compression
+        self.segment_max_bytes = segment_max_bytes
+        self.segment_max_age = segment_max_age
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._segment: Optional[str] = None
+        self._writer = None
+        self._opened_at = 0.0
+        self._flushed_at = time.time()
+        self._sequence = 0
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self._load_index()
+
+    def _load_index(self):
+        """사이드카 인덱스를 읽고, 이전 실행에서 닫히지 않은 세그먼트를 닫힘으로 표시합니다."""
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._index = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"결과 인덱스를 읽지 못했습니다 ({path}): {e}")
+            self._index = {}
+        for entry in self._index.values():
+            entry["closed"] = True
+
+    def _save_index(self):
+        """사이드카 인덱스를 원자적으로 저장합니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def _open_segment(self):
+        """새 세그먼트 파일을 엽니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        self._sequence += 1
+        name = (f"segment-{datetime.now().strftime('%Y%m%d_%H%M%S')}-{os.getpid()}-"
+                f"{self._sequence:04d}{SEGMENT_EXTENSIONS[self.compression]}")
+        path = os.path.join(self.directory, name)
+
+        if self.compression == "gzip":
+            self._writer = _GzipMemberWriter(path)
+        elif self.compression == "zstd":
+            self._writer = zstandard.ZstdCompressor().stream_writer(open(path, 'ab'), closefd=True)
+        else:
+            self._writer = open(path, 'ab')
+
+        self._segment = name
+        self._opened_at = time.time()
+        self._index[name] = {
+            "count": 0,
+            "bytes": 0,
+            "min_time": None,
+            "max_time": None,
+            "sites": {},
+            "closed": False,
+        }
+        logger.info(f"새 결과 세그먼트: {path}")
+
+    def _close_segment(self):
+        """현재 세그먼트를 닫고 인덱스에 반영합니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._index[self._segment]["closed"] = True
+        self._writer = None
+        self._segment = None
+        self._save_index()
+
+    def _needs_rotation(self) -> bool:
+        """현재 세그먼트를 닫고 새 세그먼트를 열어야 하는지 확인합니다."""
+        if self._writer is None:
+            return True
+        entry = self._index[self._segment]
+        return (entry["bytes"] >= self.segment_max_bytes
+                or time.time() - self._opened_at >= self.segment_max_age)
+
+    def append(self, deal: HotDealItem):
+        """
+        딜 하나를 현재 세그먼트에 이어 씁니다.
+
+        Args:
+            deal: 저장할 딜
+        """
+        line = deal.to_json() + b"\n"
+        record_time = deal.timestamp.timestamp()
+
+        with self.lock:
+            if self._needs_rotation():
+                self._close_segment()
+                self._open_segment()
+
+            self._writer.write(line)
+
+            entry = self._index[self._segment]
+            entry["count"] += 1
+            entry["bytes"] += len(line)
+            entry["sites"][deal.site] = entry["sites"].get(deal.site, 0) + 1
+            if entry["min_time"] is None or record_time < entry["min_time"]:
+                entry["min_time"] = record_time
+            if entry["max_time"] is None or record_time > entry["max_time"]:
+                entry["max_time"] = record_time
+
+            # 오래 실행되는 데몬이 비정상 종료되어도 인덱스가 크게 뒤처지지 않도록 함
+            if time.time() - self._flushed_at >= self.flush_interval:
+                self._flush()
+
+    def extend(self, deals: Iterable[HotDealItem]):
+        """
+        여러 딜을 이어 씁니다.
+
+        Args:
+            deals: 저장할 딜 목록
+        """
+        for deal in deals:
+            self.append(deal)
+
+    def flush(self):
+        """현재 세그먼트의 버퍼를 파일에 쓰고 인덱스를 저장합니다."""
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        """버퍼와 인덱스를 내보냅니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        if self._writer is not None:
+            if self.compression == "zstd":
+                # 프레임을 닫아야 세그먼트를 쓰는 도중에도 읽을 수 있음
+                self._writer.flush(zstandard.FLUSH_FRAME)
+            else:
+                # gzip 작성기는 멤버를 닫음
+                self._writer.flush()
+        self._save_index()
+        self._flushed_at = time.time()
+
+    def close(self):
+        """현재 세그먼트를 닫습니다."""
+        with self.lock:
+            self._close_segment()
+
+    def segments(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                 sites: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        시간 범위와 사이트 조건에 맞는 딜이 있을 수 있는 세그먼트를 오래된 순서로 반환합니다.
+
+        Args:
+            start: 시작 시각 (포함, None이면 제한 없음)
+            end: 끝 시각 (미포함, None이면 제한 없음)
+            sites: 사이트 이름 목록 (None이면 모든 사이트)
+
+        Returns:
+            List[str]: 세그먼트 파일 이름 목록
+        """
+        start_time = start.timestamp() if start else None
+        end_time = end.timestamp() if end else None
+        site_set = set(sites) if sites is not None else None
+
+        with self.lock:
+            entries = [(name, dict(entry)) for name, entry in self._index.items()]
+
+        selected = []
+        for name, entry in entries:
+            if entry["count"] == 0:
+                continue
+            if start_time is not None and entry["max_time"] < start_time:
+                continue
+            if end_time is not None and entry["min_time"] >= end_time:
+                continue
+            if site_set is not None and not site_set.intersection(entry["sites"]):
+                continue
+            selected.append((entry["min_time"], name))
+        return [name for _, name in sorted(selected)]
+
+    def scan(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+             sites: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        시간 범위와 사이트 조건에 맞는 딜을 저장된 순서대로 읽습니다.
+
+        인덱스로 조건에 맞지 않는 세그먼트는 열지 않고 건너뜁니다.
+
+        Args:
+            start: 시작 시각 (포함, None이면 제한 없음)
+            end: 끝 시각 (미포함, None이면 제한 없음)
+            sites: 사이트 이름 목록 (None이면 모든 사이트)
+
+        Returns:
+            Iterator[Dict[str, Any]]: 딜 레코드
+        """
+        site_set = set(sites) if sites is not None else None
+        start_text = start.isoformat() if start else None
+        end_text = end.isoformat() if end else None
+
+        # 쓰는 중인 세그먼트의 버퍼도 읽을 수 있도록 먼저 내보냄
+        self.flush()
+
+        for name in self.segments(start, end, site_set):
+            with self._open_reader(name) as f:
+                try:
+                    for line in f:
+                        record = json.loads(line)
+                        if site_set is not None and record["site"] not in site_set:
+                            continue
+                        # isoformat 문자열은 같은 형식끼리 사전순 비교가 시간순 비교와 같음
+                        if start_text is not None and record["timestamp"] < start_text:
+                            continue
+                        if end_text is not None and record["timestamp"] >= end_text:
+                            continue
+                        yield record
+                except EOFError:
+                    # 비정상 종료로 마지막 압축 블록이 잘린 세그먼트는 온전한 부분까지만 읽음
+                    logger.warning(f"결과 세그먼트 {name}의 끝이 잘려 있어 나머지를 건너뜁니다")
+
+    def _open_reader(self, name: str) -> io.TextIOBase:
+        """세그먼트를 텍스트 모드로 엽니다."""
+        path = os.path.join(self.directory, name)
+        if name.endswith(SEGMENT_EXTENSIONS["gzip"]):
+            return gzip.open(path, 'rt', encoding='utf-8')
+        if name.endswith(SEGMENT_EXTENSIONS["zstd"]):
+            if zstandard is None:
+                raise ValueError("zstd 세그먼트를 읽으려면 zstandard 패키지가 필요합니다")
+            reader = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), read_across_frames=True,
+                                                                closefd=True)
+            return io.TextIOWrapper(reader, encoding='utf-8')
+        return open(path, 'r', encoding='utf-8')
\ No newline at end of file
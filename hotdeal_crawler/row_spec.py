@@ -0,0 +1,289 @@
+"""
+핫딜 크롤러를 위한 선언적 행(row) 추출 명세 모듈.
+
+이 모듈은 사이트별 크롤러가 목록 페이지의 행과 필드를 CSS 선택자로 선언하는 명세와,
+명세를 한 번의 JavaScript 호출(Selenium) 또는 selectolax/lxml(HTTP 백엔드)로 실행하는 함수를 제공합니다.
+HTTP 백엔드에서는 명세의 선택자를 사이트마다 한 번만 컴파일해 두고, selectolax가 있으면
+lxml 트리를 만들지 않고 응답 바이트에서 바로 행을 추출합니다.
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from lxml.cssselect import CSSSelector
+
+from .fetchers import UTF8_ENCODINGS, URL_ATTRIBUTES, HtmlDocument, HtmlNode, absolute_url
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax가 없으면 미리 컴파일한 선택자로 lxml 트리에서 추출
+    LexborHTMLParser = None
+
+# selectolax에 넘기기 전에 문서의 인코딩을 알아낼 meta 태그 (문서 앞부분만 확인)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([A-Za-z0-9_-]+)', re.IGNORECASE)
+
+# 명세에 맞는 모든 행을 한 번의 execute_script 호출로 평범한 객체 목록으로 반환하는 스크립트
+EXTRACT_ROWS_SCRIPT = """
+const rowSelector = arguments[0];
+const fields = arguments[1];
+const urlAttributes = arguments[2];
+const normalize = (s) => (s == null ? null : s.replace(/\\s+/g, ' ').trim());
+return Array.from(document.querySelectorAll(rowSelector)).map((row) => {
+    const values = {};
+    for (const [name, selector, attribute] of fields) {
+        const el = selector ? row.querySelector(selector) : row;
+        if (!el) {
+            values[name] = null;
+        } else if (attribute === null) {
+            values[name] = normalize(el.innerText !== undefined ? el.innerText : el.textContent);
+        } else if (urlAttributes.includes(attribute) && el.getAttribute(attribute) !== null) {
+            values[name] = el[attribute];
+        } else {
+            values[name] = el.getAttribute(attribute);
+        }
+    }
+    return values;
+});
+"""
+
+
+class FieldSpec:
+    """행 안에서 값 하나를 추출하는 방법을 나타내는 클래스."""
+
+    def __init__(self, selector: Optional[str] = None, attribute: Optional[str] = None):
+        """
+        필드 명세를 초기화합니다.
+
+        Args:
+            selector: 행 기준 CSS 선택자 (None이면 행 요소 자체)
+            attribute: 추출할 속성 이름 (None이면 공백을 정리한 텍스트)
+        """
+        self.selector = selector
+        self.attribute = attribute
+
+
+class RowSpec:
+    """목록 페이지의 행과 각 행에서 추출할 필드를 나타내는 클래스."""
+
+    def __init__(self, row_selector: str, fields: Dict[str, FieldSpec]):
+        """
+        행 명세를 초기화합니다.
+
+        Args:
+            row_selector: 행 요소를 찾는 CSS 선택자
+            fields: 필드 이름과 필드 명세의 매핑
+        """
+        self.row_selector = row_selector
+        self.fields = fields
+        self._compiled: Optional[CompiledRowSpec] = None
+        self._lock = threading.Lock()
+
+    def script_arguments(self) -> list:
+        """EXTRACT_ROWS_SCRIPT에 전달할 인자 목록을 반환합니다."""
+        fields = [[name, field.selector, field.attribute] for name, field in self.fields.items()]
+        return [self.row_selector, fields, list(URL_ATTRIBUTES)]
+
+    def compiled(self) -> "CompiledRowSpec":
+        """
+        컴파일한 명세를 반환합니다. 처음 호출할 때 한 번만 컴파일합니다.
+
+        row_spec은 크롤러 클래스 속성이므로 사이트마다 한 번 컴파일됩니다.
+
+        Returns:
+            CompiledRowSpec: 컴파일한 명세
+        """
+        if self._compiled is None:
+            with self._lock:
+                if self._compiled is None:
+                    self._compiled = CompiledRowSpec(self)
+        return self._compiled
+
+
+class CompiledRowSpec:
+    """선택자를 미리 XPath로 컴파일하고 같은 선택자를 쓰는 필드를 묶어 둔 행 명세."""
+
+    def __init__(self, spec: RowSpec):
+        """
+        행 명세를 컴파일합니다.
+
+        Args:
+            spec: 컴파일할 행 명세
+        """
+        self.row_selector = spec.row_selector
+        self.row_xpath = CSSSelector(spec.row_selector, translator="html")
+        # 행마다 선택자 하나는 한 번만 실행하고 그 결과를 여러 필드가 나눠 씀
+        self.selectors: List[str] = []
+        self.selector_xpaths: List[CSSSelector] = []
+        self.fields: List[Tuple[str, int, Optional[str]]] = []
+        for name, field in spec.fields.items():
+            index = -1
+            if field.selector:
+                if field.selector not in self.selectors:
+                    self.selectors.append(field.selector)
+                    self.selector_xpaths.append(CSSSelector(field.selector, translator="html"))
+                index = self.selectors.index(field.selector)
+            self.fields.append((name, index, field.attribute))
+        # selectolax는 호출마다 선택자를 컴파일하므로 행마다 찾지 않고 문서 전체에서 필드별로 한 번에 찾음.
+        # 쉼표로 묶은 선택자는 행 선택자와 이어 붙일 수 없으므로 행마다 찾음
+        if ',' in spec.row_selector or any(',' in selector for selector in self.selectors):
+            self.scoped_selectors: Optional[List[str]] = None
+        else:
+            self.scoped_selectors = [f"{spec.row_selector} {selector}" for selector in self.selectors]
+
+
+def extract_rows_from_driver(driver, spec: RowSpec) -> List[Dict[str, Optional[str]]]:
+    """
+    Selenium WebDriver의 현재 페이지에서 한 번의 스크립트 실행으로 모든 행을 추출합니다.
+
+    Args:
+        driver: 페이지가 열려 있는 WebDriver
+        spec: 행 명세
+
+    Returns:
+        List[Dict[str, Optional[str]]]: 필드 이름과 값의 매핑 목록
+    """
+    return driver.execute_script(EXTRACT_ROWS_SCRIPT, *spec.script_arguments()) or []
+
+
+def extract_rows_from_node(root: HtmlNode, spec: RowSpec) -> List[Dict[str, Optional[str]]]:
+    """
+    HTTP 백엔드 문서에서 모든 행을 추출합니다.
+
+    아직 파싱하지 않은 문서는 selectolax가 있으면 응답 바이트에서 바로 추출하고,
+    그 외에는 컴파일한 선택자로 lxml 트리에서 추출합니다. 인코딩도 meta 태그도 없는 문서는
+    lxml과 같은 방식으로 읽도록 lxml 트리에서 추출합니다.
+
+    Args:
+        root: 문서의 루트 요소
+        spec: 행 명세
+
+    Returns:
+        List[Dict[str, Optional[str]]]: 필드 이름과 값의 매핑 목록
+    """
+    if (LexborHTMLParser is not None and isinstance(root, HtmlDocument) and not root.parsed
+            and (root.encoding or _META_CHARSET_RE.search(root.content, 0, 2048))):
+        return extract_rows_from_bytes(root.content, root.base_url, root.encoding, spec)
+    return extract_rows_from_lxml(root, spec)
+
+
+def extract_rows_from_lxml(root: HtmlNode, spec: RowSpec) -> List[Dict[str, Optional[str]]]:
+    """
+    컴파일한 선택자로 lxml 트리에서 모든 행을 추출합니다.
+
+    Args:
+        root: 문서의 루트 요소
+        spec: 행 명세
+
+    Returns:
+        List[Dict[str, Optional[str]]]: 필드 이름과 값의 매핑 목록
+    """
+    compiled = spec.compiled()
+    base_url = root.base_url
+    rows = []
+    for row in compiled.row_xpath(root.element):
+        matches = [xpath(row) for xpath in compiled.selector_xpaths]
+        values = {}
+        for name, index, attribute in compiled.fields:
+            if index < 0:
+                element = row
+            else:
+                element = matches[index][0] if matches[index] else None
+
+            if element is None:
+                values[name] = None
+            elif attribute is None:
+                values[name] = " ".join(element.text_content().split())
+            else:
+                value = element.get(attribute)
+                if value is not None and attribute in URL_ATTRIBUTES:
+                    value = absolute_url(base_url, value)
+                values[name] = value
+        rows.append(values)
+    return rows
+
+
+def _selectolax_input(content: bytes, encoding: Optional[str]):
+    """selectolax에 넘길 입력을 반환합니다. UTF-8 문서는 바이트를 그대로, 그 외에는 한 번 디코딩합니다."""
+    if not encoding:
+        match = _META_CHARSET_RE.search(content, 0, 2048)
+        encoding = match.group(1).decode('ascii') if match else "utf-8"
+    if encoding.lower() in UTF8_ENCODINGS:
+        return content
+    try:
+        return content.decode(encoding, errors="replace")
+    except LookupError:
+        return content
+
+
+def _match_fields_by_row(tree, row_nodes: list, scoped_selectors: List[str]) -> List[list]:
+    """
+    "행 선택자 필드 선택자" 형식의 선택자로 문서 전체를 한 번씩 찾은 뒤, 찾은 요소를
+    조상을 따라 올라가 속한 행에 배정합니다. 행마다 문서 순서로 처음 찾은 요소를 사용합니다.
+
+    Args:
+        tree: selectolax 문서
+        row_nodes: 행 요소 목록
+        scoped_selectors: 필드 선택자마다 행 선택자를 앞에 붙인 선택자 목록
+
+    Returns:
+        List[list]: 행마다 선택자별로 처음 찾은 요소 (없으면 None)
+    """
+    row_index = {row.mem_id: i for i, row in enumerate(row_nodes)}
+    matches = [[None] * len(scoped_selectors) for _ in row_nodes]
+    for column, selector in enumerate(scoped_selectors):
+        for element in tree.css(selector):
+            node = element.parent
+            while node is not None:
+                i = row_index.get(node.mem_id)
+                if i is not None:
+                    if matches[i][column] is None:
+                        matches[i][column] = element
+                    break
+                node = node.parent
+    return matches
+
+
+def extract_rows_from_bytes(content: bytes, base_url: str, encoding: Optional[str],
+                            spec: RowSpec) -> List[Dict[str, Optional[str]]]:
+    """
+    selectolax(lexbor)로 응답 바이트에서 모든 행을 추출합니다.
+
+    Args:
+        content: 응답 본문
+        base_url: 최종 응답 URL (상대 URL의 기준)
+        encoding: 문서 인코딩 (None이면 문서의 meta 태그, 없으면 UTF-8)
+        spec: 행 명세
+
+    Returns:
+        List[Dict[str, Optional[str]]]: 필드 이름과 값의 매핑 목록
+
+    Raises:
+        RuntimeError: selectolax가 설치되어 있지 않은 경우
+    """
+    if LexborHTMLParser is None:
+        raise RuntimeError("selectolax가 설치되어 있지 않습니다")
+    compiled = spec.compiled()
+    tree = LexborHTMLParser(_selectolax_input(content, encoding))
+    row_nodes = tree.css(compiled.row_selector)
+    if compiled.scoped_selectors is None:
+        row_matches = [[row.css_first(selector) for selector in compiled.selectors] for row in row_nodes]
+    else:
+        row_matches = _match_fields_by_row(tree, row_nodes, compiled.scoped_selectors)
+
+    rows = []
+    for row, matches in zip(row_nodes, row_matches):
+        values = {}
+        for name, index, attribute in compiled.fields:
+            element = row if index < 0 else matches[index]
+            if element is None:
+                values[name] = None
+            elif attribute is None:
+                values[name] = " ".join(element.text(deep=True).split())
+            else:
+                value = element.attributes.get(attribute)
+                if value is not None and attribute in URL_ATTRIBUTES:
+                    value = absolute_url(base_url, value)
+                values[name] = value
+        rows.append(values)
+    return rows
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""
+핫딜 크롤러를 위한 적응형 폴링 스케줄러 모듈.
+
+이 모듈은 사이트별로 새 게시글이 나오는 빈도에 맞춰 크롤링 간격을 조절하는 스케줄러를 제공합니다.
+"""
+
+import collections
+import random
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from .models import HotDealItem
+
+
+class SiteSchedule:
+    """사이트 하나의 폴링 간격과 실행 상태를 나타내는 클래스."""
+
+    def __init__(self, site_name: str, interval: float, min_interval: float,
+                 max_interval: float, seen_limit: int = 1000):
+        """
+        사이트 스케줄을 초기화합니다.
+
+        Args:
+            site_name: 사이트 이름
+            interval: 시작 폴링 간격(초)
+            min_interval: 최소 폴링 간격(초)
+            max_interval: 최대 폴링 간격(초)
+            seen_limit: 새 글 판별을 위해 기억할 최근 idx 수
+        """
+        self.site_name = site_name
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.next_run = 0.0
+        self.running = False
+        self.run_count = 0
+        self._seen_order = collections.deque(maxlen=seen_limit)
+        self._seen = set()
+
+    def filter_new(self, deals: Iterable[HotDealItem]) -> List[HotDealItem]:
+        """
+        처음 보는 (게시판, idx)를 가진 딜만 골라내고 기억합니다.
+
+        Args:
+            deals: 이번 실행에서 찾은 딜 목록
+
+        Returns:
+            List[HotDealItem]: 새 딜 목록
+        """
+        new_deals = []
+        for deal in deals:
+            if deal.key in self._seen:
+                continue
+            if len(self._seen_order) == self._seen_order.maxlen:
+                self._seen.discard(self._seen_order[0])
+            self._seen_order.append(deal.key)
+            self._seen.add(deal.key)
+            new_deals.append(deal)
+        return new_deals
+
+
+class AdaptiveScheduler:
+    """사이트별 새 글 빈도에 따라 폴링 간격을 조절하는 스케줄러."""
+
+    def __init__(self, initial_interval: float = 60, min_interval: float = 15,
+                 max_interval: float = 600, backoff: float = 1.5, speedup: float = 0.5,
+                 jitter: float = 0.1):
+        """
+        스케줄러를 초기화합니다.
+
+        Args:
+            initial_interval: 사이트별 시작 폴링 간격(초)
+            min_interval: 최소 폴링 간격(초)
+            max_interval: 최대 폴링 간격(초)
+            backoff: 새 글이 없을 때 간격에 곱할 값
+            speedup: 새 글이 있을 때 간격에 곱할 값
+            jitter: 간격에 더할 무작위 편차 비율 (0.1이면 ±10%)
+        """
+        self.initial_interval = initial_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.speedup = speedup
+        self.jitter = jitter
+        self.schedules: Dict[str, SiteSchedule] = {}
+        self.lock = threading.Lock()
+
+    def add_site(self, site_name: str):
+        """
+        스케줄에 사이트를 추가합니다. 추가된 사이트는 바로 실행 대상이 됩니다.
+
+        Args:
+            site_name: 사이트 이름
+        """
+        with self.lock:
+            self.schedules[site_name] = SiteSchedule(
+                site_name, self.initial_interval, self.min_interval, self.max_interval
+            )
+
+    def due_sites(self, now: Optional[float] = None) -> List[str]:
+        """
+        실행할 때가 되었고 실행 중이 아닌 사이트를 실행 중으로 표시하고 반환합니다.
+
+        같은 사이트의 실행이 겹치지 않도록 반환된 사이트는 finish()가 호출될 때까지
+        다시 반환되지 않습니다.
+
+        Args:
+            now: 기준 시각 (기본값: time.monotonic())
+
+        Returns:
+            List[str]: 실행할 사이트 이름 목록
+        """
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            due = [s for s in self.schedules.values() if not s.running and s.next_run <= now]
+            for schedule in due:
+                schedule.running = True
+            return [schedule.site_name for schedule in due]
+
+    def finish(self, site_name: str, deals: Iterable[HotDealItem],
+               now: Optional[float] = None) -> List[HotDealItem]:
+        """
+        사이트 실행 결과를 반영하여 다음 실행 시각을 정합니다.
+
+        새 글이 있으면 간격을 줄이고, 없으면 간격을 늘립니다.
+
+        Args:
+            site_name: 사이트 이름
+            deals: 이번 실행에서 찾은 딜 목록
+            now: 기준 시각 (기본값: time.monotonic())
+
+        Returns:
+            List[HotDealItem]: 이전 실행에서 보지 못한 새 딜 목록
+        """
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            schedule = self.schedules[site_name]
+            new_deals = schedule.filter_new(deals)
+
+            # 첫 실행은 모든 글이 새 글이므로 간격 조절에 사용하지 않음
+            if schedule.run_count > 0:
+                factor = self.speedup if new_deals else self.backoff
+                schedule.interval = min(schedule.max_interval,
+                                        max(schedule.min_interval, schedule.interval * factor))
+            schedule.run_count += 1
+
+            delay = schedule.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            schedule.next_run = now + delay
+            schedule.running = False
+            return new_deals
+
+    def seconds_until_next(self, now: Optional[float] = None) -> float:
+        """
+        실행 중이 아닌 사이트 중 가장 빠른 다음 실행까지 남은 시간을 반환합니다.
+
+        Args:
+            now: 기준 시각 (기본값: time.monotonic())
+
+        Returns:
+            float: 남은 시간(초), 기다릴 사이트가 없으면 min_interval
+        """
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            waiting = [s.next_run for s in self.schedules.values() if not s.running]
+        if not waiting:
+            return self.min_interval
+        return max(0.0, min(waiting) - now)
\ No newline at end of file
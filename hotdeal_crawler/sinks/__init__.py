@@ -0,0 +1,24 @@
+"""
+Result sink implementations.
+
+This package contains sinks that consume crawled deals as they are produced.
+"""
+
+from .base import BaseSink, SinkPipeline
+from .stdout_sink import StdoutSink
+from .json_lines_sink import JsonLinesSink
+from .result_store_sink import ResultStoreSink
+from .database_sink import DatabaseSink
+from .elasticsearch_sink import ElasticsearchSink
+from .alert_sink import AlertSink
+
+__all__ = [
+    'BaseSink',
+    'SinkPipeline',
+    'StdoutSink',
+    'JsonLinesSink',
+    'ResultStoreSink',
+    'DatabaseSink',
+    'ElasticsearchSink',
+    'AlertSink',
+]
\ No newline at end of file
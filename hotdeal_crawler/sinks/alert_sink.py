@@ -0,0 +1,42 @@
+"""
+키워드 구독 알림 싱크 구현.
+"""
+
+import logging
+from typing import Callable, List, Optional
+
+from .base import BaseSink
+from ..matcher import DealMatcher, Subscription
+from ..models import HotDealItem
+
+logger = logging.getLogger(__name__)
+
+
+class AlertSink(BaseSink):
+    """딜을 구독과 매칭하고, 매칭되면 알림 함수를 호출하는 싱크."""
+
+    def __init__(self, matcher: DealMatcher,
+                 on_match: Optional[Callable[[HotDealItem, List[Subscription]], None]] = None):
+        """
+        알림 싱크를 초기화합니다.
+        
+        Args:
+            matcher: 구독이 등록된 매처
+            on_match: 매칭된 딜과 구독 목록을 받는 함수 (기본값: 로그로 기록)
+        """
+        self.matcher = matcher
+        self.on_match = on_match or self._log_match
+        self.count = 0
+
+    @staticmethod
+    def _log_match(deal: HotDealItem, subscriptions: List[Subscription]):
+        """매칭 결과를 로그로 기록합니다."""
+        ids = ", ".join(subscription.id for subscription in subscriptions)
+        logger.info(f"구독 알림 [{ids}]: {deal.title} ({deal.url})")
+
+    def write(self, deal: HotDealItem):
+        """딜 하나를 구독과 매칭합니다."""
+        subscriptions = self.matcher.match(deal)
+        if subscriptions:
+            self.count += 1
+            self.on_match(deal, subscriptions)
\ No newline at end of file
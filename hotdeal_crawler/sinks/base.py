@@ -0,0 +1,189 @@
+"""
+핫딜 결과 싱크(sink)를 위한 기본 모듈.
+
+이 모듈은 모든 싱크의 추상 기본 클래스와, 여러 싱크가 딜을 동시에 소비하도록 하는 파이프라인을 제공합니다.
+"""
+
+import abc
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import AsyncIterable, Iterable, List, Optional
+
+from ..lifecycle import DealUpdate
+from ..metrics import MetricsRegistry, get_registry
+from ..models import HotDealItem
+
+logger = logging.getLogger(__name__)
+
+# 싱크 작업자에게 종료를 알리는 표시
+_STOP = object()
+
+
+class BaseSink(abc.ABC):
+    """크롤링한 딜을 받아 저장하거나 출력하는 싱크의 추상 기본 클래스."""
+
+    @abc.abstractmethod
+    def write(self, deal: HotDealItem):
+        """
+        딜 하나를 기록합니다.
+        
+        Args:
+            deal: 기록할 딜
+        """
+        pass
+
+    def write_update(self, update: DealUpdate):
+        """
+        다시 크롤링한 딜의 변경 하나를 기록합니다. 기본 구현은 아무것도 하지 않습니다.
+        
+        Args:
+            update: 기록할 변경
+        """
+        pass
+
+    def flush(self):
+        """버퍼에 남은 딜을 내보냅니다."""
+        pass
+
+    def close(self):
+        """버퍼를 비우고 싱크가 사용하는 자원을 정리합니다."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class SinkPipeline:
+    """여러 싱크가 각자의 스레드에서 딜을 동시에 소비하도록 하는 파이프라인."""
+
+    def __init__(self, sinks: List[BaseSink], queue_size: int = 1000,
+                 metrics: Optional[MetricsRegistry] = None):
+        """
+        파이프라인을 초기화하고 싱크별 작업자 스레드를 시작합니다.
+        
+        Args:
+            sinks: 딜을 받을 싱크 목록
+            queue_size: 싱크별 큐의 최대 크기 (가득 차면 put이 기다림)
+            metrics: 싱크별 기록 시간과 오류 수를 기록할 레지스트리 (기본값: 프로세스 공유 레지스트리)
+        """
+        self.sinks = sinks
+        self.count = 0
+        self.updates = 0
+        self.metrics = metrics or get_registry()
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in sinks]
+        self._threads = [
+            threading.Thread(target=self._run_sink, args=(sink, sink_queue),
+                             name=f"sink-{type(sink).__name__}", daemon=True)
+            for sink, sink_queue in zip(sinks, self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _run_sink(self, sink: BaseSink, sink_queue: queue.Queue):
+        """싱크 하나의 큐에서 딜과 변경을 꺼내 기록합니다."""
+        name = type(sink).__name__
+        try:
+            while True:
+                item = sink_queue.get()
+                if item is _STOP:
+                    break
+                # 버퍼가 차서 write 안에서 내보내는 싱크는 그 시간도 write에 포함됨
+                operation = "update" if isinstance(item, DealUpdate) else "write"
+                start = time.perf_counter()
+                try:
+                    if operation == "update":
+                        sink.write_update(item)
+                    else:
+                        sink.write(item)
+                except Exception as e:
+                    logger.error(f"{name} 싱크에서 오류 발생: {e}")
+                    self.metrics.sink_errors.inc(sink=name)
+                finally:
+                    self.metrics.sink_seconds.observe(time.perf_counter() - start, sink=name, operation=operation)
+        finally:
+            start = time.perf_counter()
+            try:
+                sink.close()
+            except Exception as e:
+                logger.error(f"{name} 싱크를 닫는 중 오류 발생: {e}")
+                self.metrics.sink_errors.inc(sink=name)
+            finally:
+                self.metrics.sink_seconds.observe(time.perf_counter() - start, sink=name, operation="flush")
+
+    def put(self, deal: HotDealItem):
+        """
+        모든 싱크에 딜을 전달합니다.
+        
+        Args:
+            deal: 전달할 딜
+        """
+        for sink_queue in self._queues:
+            sink_queue.put(deal)
+        self.count += 1
+
+    def put_update(self, update: DealUpdate):
+        """
+        모든 싱크에 다시 크롤링한 딜의 변경을 전달합니다.
+        
+        LifecycleStore.on_update로 등록하여 크롤러 작업자 스레드에서 호출할 수 있습니다.
+        
+        Args:
+            update: 전달할 변경
+        """
+        for sink_queue in self._queues:
+            sink_queue.put(update)
+        self.updates += 1
+
+    def consume(self, deals: Iterable[HotDealItem]) -> int:
+        """
+        딜 스트림을 끝까지 읽으며 모든 싱크에 전달합니다.
+        
+        Args:
+            deals: 딜 스트림 (예: HotDealCrawlerManager.iter_crawl())
+        
+        Returns:
+            int: 전달한 딜 수
+        """
+        count = 0
+        for deal in deals:
+            self.put(deal)
+            count += 1
+        return count
+
+    async def consume_async(self, deals: AsyncIterable[HotDealItem]) -> int:
+        """
+        비동기 딜 스트림을 끝까지 읽으며 모든 싱크에 전달합니다.
+        
+        싱크 큐가 가득 차 기다리는 동안 이벤트 루프가 멈추지 않도록 스레드 풀에서 넣습니다.
+        
+        Args:
+            deals: 딜 스트림 (예: AsyncCrawlEngine.iter_crawl())
+        
+        Returns:
+            int: 전달한 딜 수
+        """
+        loop = asyncio.get_running_loop()
+        count = 0
+        async for deal in deals:
+            await loop.run_in_executor(None, self.put, deal)
+            count += 1
+        return count
+
+    def close(self):
+        """남은 딜을 모두 기록할 때까지 기다린 뒤 싱크를 닫습니다."""
+        for sink_queue in self._queues:
+            sink_queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+데이터베이스 싱크 구현.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from .base import BaseSink
+from ..db import ADDED_COLUMNS, ConnectionPool, SqlDialect
+from ..lifecycle import DealUpdate
+from ..models import HotDealItem
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseSink(BaseSink):
+    """딜을 모아 (site, board, idx) 기준 다중 행 upsert로 데이터베이스에 쓰는 싱크."""
+
+    def __init__(self, pool: ConnectionPool, dialect: SqlDialect, table: str = "hot_deals",
+                 batch_size: int = 100, flush_interval: float = 5.0,
+                 max_retries: int = 3, retry_backoff: float = 0.5):
+        """
+        데이터베이스 싱크를 초기화하고 테이블이 없으면 만듭니다.
+        
+        Args:
+            pool: 데이터베이스 연결 풀
+            dialect: 데이터베이스 방언 (SqliteDialect 또는 MySqlDialect)
+            table: 딜을 저장할 테이블 이름
+            batch_size: 한 번에 쓸 최대 딜 수 (모이면 바로 씀)
+            flush_interval: 배치가 차지 않아도 모인 딜을 쓰는 간격(초)
+            max_retries: 쓰기에 실패했을 때 다시 시도할 횟수
+            retry_backoff: 첫 재시도 전 대기 시간(초), 재시도마다 두 배로 늘어남
+        """
+        self.pool = pool
+        self.dialect = dialect
+        self.table = table
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.written = 0
+        self.dropped = 0
+        # lock은 버퍼만 보호하고, _write_lock은 배치를 꺼낸 순서대로 쓰도록 쓰기를 직렬화함.
+        # 재시도 대기 중에도 다른 스레드가 버퍼에 딜을 추가할 수 있음
+        self.lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._buffer: Dict[Tuple[str, str, str], tuple] = {}
+        self._closed = threading.Event()
+
+        self._execute([(dialect.create_table_sql(table), ())])
+        self._add_missing_columns()
+
+        self._timer = threading.Thread(target=self._flush_periodically, name="database-sink-flush",
+                                       daemon=True)
+        self._timer.start()
+
+    def _add_missing_columns(self):
+        """이전 버전에서 만든 테이블에 나중에 추가된 컬럼(품절 여부, 인기 지표)을 추가합니다."""
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(f"SELECT * FROM {self.table} LIMIT 0")
+                existing = {description[0].lower() for description in cursor.description}
+            finally:
+                cursor.close()
+        missing = [column for column in ADDED_COLUMNS if column not in existing]
+        if missing:
+            logger.info(f"{self.table} 테이블에 컬럼을 추가합니다: {', '.join(missing)}")
+            self._execute([(self.dialect.add_column_sql(self.table, column), ()) for column in missing])
+
+    @staticmethod
+    def _to_row(deal: HotDealItem) -> tuple:
+        """딜을 DEAL_COLUMNS 순서의 값으로 변환합니다."""
+        return (
+            deal.site,
+            deal.board or "",
+            deal.idx,
+            deal.title,
+            deal.url,
+            deal.price,
+            deal.currency,
+            deal.shipping,
+            deal.store,
+            deal.discount,
+            deal.canonical_url,
+            deal.category,
+            deal.timestamp.isoformat(),
+            json.dumps(deal.alternate_urls, ensure_ascii=False),
+            int(deal.sold_out),
+            deal.recommendations,
+            deal.comments,
+            deal.views,
+        )
+
+    def write(self, deal: HotDealItem):
+        """딜 하나를 배치에 추가하고, 배치가 차면 씁니다."""
+        with self.lock:
+            # 같은 배치 안에서 같은 게시글은 마지막 값만 쓰면 됨
+            self._buffer[deal.key] = self._to_row(deal)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self.flush()
+
+    def write_update(self, update: DealUpdate):
+        """바뀐 딜(수정, 품절/재입고, 인기 지표, 추가된 URL)을 같은 배치 upsert로 덮어씁니다."""
+        self.write(update.deal)
+
+    def flush(self):
+        """모인 딜을 모두 씁니다."""
+        with self._write_lock:
+            with self.lock:
+                rows = list(self._buffer.values())
+                self._buffer.clear()
+            self._write_rows(rows)
+
+    def _flush_periodically(self):
+        """flush_interval마다 모인 딜을 씁니다."""
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"데이터베이스 주기적 쓰기 오류: {e}")
+
+    def _write_rows(self, rows: List[tuple]):
+        """꺼낸 딜을 방언의 최대 행 수 단위로 나눠 씁니다. _write_lock을 잡은 상태에서 호출해야 합니다."""
+        if not rows:
+            return
+
+        statements = []
+        for start in range(0, len(rows), self.dialect.max_rows):
+            chunk = rows[start:start + self.dialect.max_rows]
+            params = tuple(value for row in chunk for value in row)
+            statements.append((self.dialect.upsert_sql(self.table, len(chunk)), params))
+
+        if self._execute(statements):
+            self.written += len(rows)
+        else:
+            self.dropped += len(rows)
+            logger.error(f"딜 {len(rows)}개를 데이터베이스에 쓰지 못했습니다")
+
+    def _execute(self, statements: List[Tuple[str, tuple]]) -> bool:
+        """
+        SQL 문들을 한 트랜잭션으로 실행합니다. 실패하면 지수 백오프로 다시 시도합니다.
+        
+        Args:
+            statements: (SQL, 파라미터) 목록
+        
+        Returns:
+            bool: 성공하면 True, 모든 시도가 실패하면 False
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self.pool.connection() as conn:
+                    cursor = conn.cursor()
+                    try:
+                        for sql, params in statements:
+                            cursor.execute(sql, params)
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+                    finally:
+                        cursor.close()
+                return True
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error(f"데이터베이스 쓰기 실패 ({attempt + 1}회 시도): {e}")
+                    return False
+                delay = self.retry_backoff * (2 ** attempt)
+                logger.warning(f"데이터베이스 쓰기 실패, {delay:.1f}초 후 다시 시도합니다: {e}")
+                time.sleep(delay)
+        return False
+
+    def close(self):
+        """주기적 쓰기를 멈추고 남은 딜을 쓴 뒤 연결 풀을 닫습니다."""
+        self._closed.set()
+        self._timer.join()
+        self.flush()
+        self.pool.close()
\ No newline at end of file
@@ -0,0 +1,239 @@
+"""
+Elasticsearch 벌크 색인 싱크 구현.
+"""
+
+import concurrent.futures
+import json
+import logging
+import os
+import threading
+import time
+from typing import List, Optional
+
+import requests
+
+from .base import BaseSink
+from ..lifecycle import DealUpdate
+from ..models import HotDealItem
+
+logger = logging.getLogger(__name__)
+
+# 다시 보내면 성공할 수 있는 항목 상태 코드
+RETRYABLE_STATUSES = (429, 502, 503, 504)
+# 더 높은 버전의 문서가 이미 색인되어 있음 (늦게 도착한 이전 쓰기)
+VERSION_CONFLICT = 409
+
+
+def document_id(deal: HotDealItem) -> str:
+    """
+    딜의 결정적인 문서 ID를 반환합니다. 다시 크롤링한 딜은 같은 문서를 덮어씁니다.
+    
+    Args:
+        deal: 딜
+    
+    Returns:
+        str: 문서 ID
+    """
+    if deal.board:
+        return f"{deal.site.lower()}-{deal.board}-{deal.idx}"
+    return f"{deal.site.lower()}-{deal.idx}"
+
+
+class ElasticsearchSink(BaseSink):
+    """
+    딜을 모아 _bulk API로 병렬 색인하는 싱크.
+
+    벌크 요청이 여러 개 동시에 진행되거나 재시도되면 같은 문서의 쓰기가 순서를 바꿔 도착할 수 있으므로,
+    문서마다 write를 호출한 순서대로 커지는 외부 버전(version_type=external)을 붙여 보냅니다.
+    Elasticsearch는 저장된 버전보다 낮은 쓰기를 409로 거절하므로 마지막 쓰기가 항상 남습니다.
+    """
+
+    def __init__(self, base_url: str, index: str = "hot_deals", max_docs: int = 500,
+                 max_bytes: int = 5 * 1024 * 1024, max_in_flight: int = 2, timeout: float = 10,
+                 max_retries: int = 3, retry_backoff: float = 0.5):
+        """
+        Elasticsearch 싱크를 초기화합니다.
+        
+        Args:
+            base_url: Elasticsearch 주소 (예: http://localhost:9200)
+            index: 색인 이름
+            max_docs: 벌크 요청 하나에 담을 최대 문서 수
+            max_bytes: 벌크 요청 하나의 최대 본문 크기(바이트)
+            max_in_flight: 동시에 보낼 수 있는 최대 벌크 요청 수.
+                           모두 사용 중이면 write가 기다리므로 크롤링 파이프라인에 역압이 전달됨
+            timeout: 요청 타임아웃(초)
+            max_retries: 실패한 요청이나 항목을 다시 보낼 횟수
+            retry_backoff: 첫 재시도 전 대기 시간(초), 재시도마다 두 배로 늘어남
+        """
+        self.base_url = base_url.rstrip('/')
+        self.index = index
+        self.max_docs = max_docs
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_in_flight = max_in_flight
+        self.indexed = 0
+        self.failed = 0
+        self.lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._lines: List[bytes] = []
+        self._bytes = 0
+        self._version = 0
+        self._session = requests.Session()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight,
+                                                               thread_name_prefix="es-bulk")
+
+    @classmethod
+    def from_env(cls, **kwargs) -> Optional["ElasticsearchSink"]:
+        """
+        ELASTICSEARCH_HOST, ELASTICSEARCH_PORT 환경 변수로 싱크를 만듭니다.
+        
+        Args:
+            **kwargs: ElasticsearchSink 생성자에 전달할 추가 인자
+        
+        Returns:
+            싱크, ELASTICSEARCH_HOST가 설정되지 않았으면 None
+        """
+        host = os.environ.get("ELASTICSEARCH_HOST")
+        if not host:
+            return None
+        port = os.environ.get("ELASTICSEARCH_PORT") or "9200"
+        base_url = host if host.startswith(("http://", "https://")) else f"http://{host}"
+        return cls(f"{base_url}:{port}", **kwargs)
+
+    def _next_version_locked(self) -> int:
+        """
+        다음 외부 버전을 반환합니다. 잠금을 잡은 상태에서 호출해야 합니다.
+
+        나노초 단위 현재 시각을 쓰므로 다음 실행의 쓰기도 이전 실행보다 높은 버전을 받습니다.
+        """
+        self._version = max(self._version + 1, time.time_ns())
+        return self._version
+
+    def _action_lines(self, deal: HotDealItem, version: int) -> bytes:
+        """딜 하나의 벌크 액션 줄과 문서 줄을 만듭니다."""
+        action = {"index": {"_index": self.index, "_id": document_id(deal),
+                            "version": version, "version_type": "external"}}
+        return json.dumps(action).encode('utf-8') + b"\n" + deal.to_json() + b"\n"
+
+    def write(self, deal: HotDealItem):
+        """딜 하나를 배치에 추가하고, 문서 수나 크기 한도에 도달하면 보냅니다."""
+        batches = []
+        with self.lock:
+            lines = self._action_lines(deal, self._next_version_locked())
+            if self._lines and self._bytes + len(lines) > self.max_bytes:
+                batches.append(self._take_batch_locked())
+            self._lines.append(lines)
+            self._bytes += len(lines)
+            if len(self._lines) >= self.max_docs:
+                batches.append(self._take_batch_locked())
+        for batch in batches:
+            self._submit(batch)
+
+    def write_update(self, update: DealUpdate):
+        """바뀐 딜의 문서를 같은 ID로 다시 색인하여 덮어씁니다."""
+        self.write(update.deal)
+
+    def _take_batch_locked(self) -> List[bytes]:
+        """모인 배치를 꺼냅니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        lines, self._lines, self._bytes = self._lines, [], 0
+        return lines
+
+    def _submit(self, lines: List[bytes]):
+        """
+        배치를 벌크 요청으로 보냅니다.
+        
+        동시 요청 수가 한도에 도달하면 자리가 날 때까지 기다립니다.
+        
+        Args:
+            lines: 보낼 항목 목록
+        """
+        if not lines:
+            return
+        self._in_flight.acquire()
+        future = self._executor.submit(self._send, lines)
+        future.add_done_callback(lambda _: self._in_flight.release())
+
+    def _send(self, lines: List[bytes]):
+        """벌크 요청을 보내고, 실패한 요청이나 재시도할 수 있는 항목을 다시 보냅니다."""
+        for attempt in range(self.max_retries + 1):
+            retry_lines = lines
+            try:
+                response = self._session.post(
+                    f"{self.base_url}/_bulk",
+                    data=b"".join(lines),
+                    headers={"Content-Type": "application/x-ndjson"},
+                    timeout=self.timeout,
+                )
+                if response.status_code in RETRYABLE_STATUSES:
+                    raise requests.HTTPError(f"HTTP {response.status_code}")
+                response.raise_for_status()
+                retry_lines = self._handle_response(lines, response.json())
+                if not retry_lines:
+                    return
+            except (requests.RequestException, ValueError) as e:
+                logger.warning(f"벌크 요청 실패: {e}")
+
+            if attempt == self.max_retries:
+                break
+            lines = retry_lines
+            time.sleep(self.retry_backoff * (2 ** attempt))
+
+        with self._stats_lock:
+            self.failed += len(lines)
+        logger.error(f"문서 {len(lines)}개를 색인하지 못했습니다")
+
+    def _handle_response(self, lines: List[bytes], body: dict) -> List[bytes]:
+        """
+        벌크 응답을 확인하고 다시 보낼 항목을 반환합니다.
+        
+        Args:
+            lines: 보낸 항목 목록 (응답의 items와 순서가 같음)
+            body: 벌크 응답 본문
+        
+        Returns:
+            List[bytes]: 다시 보낼 항목 목록
+        """
+        if not body.get("errors"):
+            with self._stats_lock:
+                self.indexed += len(lines)
+            return []
+
+        retry_lines = []
+        succeeded = 0
+        for lines_for_item, item in zip(lines, body.get("items", [])):
+            result = next(iter(item.values()))
+            status = result.get("status", 500)
+            if status < 300:
+                succeeded += 1
+            elif status == VERSION_CONFLICT:
+                # 같은 문서의 더 나중 쓰기가 먼저 색인되었으므로 이 쓰기는 버려도 됨
+                succeeded += 1
+            elif status in RETRYABLE_STATUSES:
+                retry_lines.append(lines_for_item)
+            else:
+                logger.error(f"문서 {result.get('_id')} 색인 실패: {result.get('error')}")
+                with self._stats_lock:
+                    self.failed += 1
+        with self._stats_lock:
+            self.indexed += succeeded
+        return retry_lines
+
+    def flush(self):
+        """모인 배치를 보내고 보낸 요청이 모두 끝날 때까지 기다립니다."""
+        with self.lock:
+            lines = self._take_batch_locked()
+        self._submit(lines)
+        # 모든 자리를 한 번씩 잡아 진행 중인 요청이 끝났음을 확인
+        for _ in range(self.max_in_flight):
+            self._in_flight.acquire()
+        for _ in range(self.max_in_flight):
+            self._in_flight.release()
+
+    def close(self):
+        """남은 배치를 보내고 세션을 닫습니다."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self._session.close()
\ No newline at end of file
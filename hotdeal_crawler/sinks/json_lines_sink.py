@@ -0,0 +1,45 @@
+"""
+JSON Lines 파일 싱크 구현.
+"""
+
+import os
+import threading
+
+from .base import BaseSink
+from ..models import HotDealItem
+
+
+class JsonLinesSink(BaseSink):
+    """딜 하나를 JSON 한 줄로 파일에 이어 쓰는 싱크."""
+
+    def __init__(self, path: str):
+        """
+        JSON Lines 싱크를 초기화하고 파일을 추가 모드로 엽니다.
+        
+        Args:
+            path: 기록할 파일 경로
+        """
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self.lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, deal: HotDealItem):
+        """딜 하나를 JSON 한 줄로 기록합니다."""
+        line = deal.to_json().decode('utf-8')
+        with self.lock:
+            self._file.write(line + "\n")
+
+    def flush(self):
+        """파일 버퍼를 비웁니다."""
+        with self.lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self):
+        """파일을 닫습니다."""
+        with self.lock:
+            if not self._file.closed:
+                self._file.close()
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""
+결과 저장소 싱크 구현.
+"""
+
+from .base import BaseSink
+from ..models import HotDealItem
+from ..result_store import ResultStore
+
+
+class ResultStoreSink(BaseSink):
+    """딜을 ResultStore의 JSON Lines 세그먼트에 이어 쓰는 싱크."""
+
+    def __init__(self, store: ResultStore):
+        """
+        결과 저장소 싱크를 초기화합니다.
+        
+        Args:
+            store: 딜을 저장할 결과 저장소
+        """
+        self.store = store
+
+    def write(self, deal: HotDealItem):
+        """딜 하나를 저장소에 이어 씁니다."""
+        self.store.append(deal)
+
+    def flush(self):
+        """저장소 버퍼와 인덱스를 내보냅니다."""
+        self.store.flush()
+
+    def close(self):
+        """현재 세그먼트를 닫습니다."""
+        self.store.close()
\ No newline at end of file
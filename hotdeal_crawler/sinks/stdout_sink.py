@@ -0,0 +1,37 @@
+"""
+표준 출력 싱크 구현.
+"""
+
+import sys
+from typing import Optional, TextIO
+
+from .base import BaseSink
+from ..lifecycle import DealUpdate
+from ..models import HotDealItem
+
+
+class StdoutSink(BaseSink):
+    """딜을 찾는 대로 번호를 붙여 표준 출력에 쓰는 싱크."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """
+        표준 출력 싱크를 초기화합니다.
+        
+        Args:
+            stream: 출력할 스트림 (기본값: sys.stdout)
+        """
+        self.stream = stream or sys.stdout
+        self.count = 0
+
+    def write(self, deal: HotDealItem):
+        """딜 하나를 출력합니다."""
+        self.count += 1
+        print(f"{self.count}. {deal}", file=self.stream, flush=True)
+
+    def write_update(self, update: DealUpdate):
+        """변경 하나를 번호 없이 출력합니다."""
+        print(f"   갱신 {update}", file=self.stream, flush=True)
+
+    def flush(self):
+        """출력 스트림을 비웁니다."""
+        self.stream.flush()
\ No newline at end of file
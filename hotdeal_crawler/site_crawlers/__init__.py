@@ -2,11 +2,39 @@
 Site-specific crawler implementations.
 
 This package contains crawler implementations for specific community websites.
+Crawlers are imported on first access; look them up by site name through
+hotdeal_crawler.plugins.get_site_registry().
 """
 
-from .ruliweb_crawler import RuliwebCrawler
-from .coolenjoy_crawler import CoolenjoyCrawler
-from .ppomppu_crawler import PPomppuCrawler
+import importlib
+from typing import TYPE_CHECKING
+
+# Public crawler names and the modules that define them (imported on first access)
+_LAZY_ATTRIBUTES = {
+    'RuliwebCrawler': '.ruliweb_crawler',
+    'CoolenjoyCrawler': '.coolenjoy_crawler',
+    'PPomppuCrawler': '.ppomppu_crawler',
+}
+
+if TYPE_CHECKING:
+    from .ruliweb_crawler import RuliwebCrawler
+    from .coolenjoy_crawler import CoolenjoyCrawler
+    from .ppomppu_crawler import PPomppuCrawler
+
+
+def __getattr__(name: str):
+    """Import a crawler module on first access to one of its names (PEP 562)."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     'RuliwebCrawler',
@@ -3,85 +3,89 @@
 """
 
 import logging
-from typing import List
-
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
+from typing import Dict, Optional, Sequence
 
 from ..base_crawler import BaseCrawler
-from ..models import HotDealItem
+from ..models import HotDealItem, is_sold_out, parse_count
+from ..price_parser import parse_amount
+from ..row_spec import FieldSpec, RowSpec
 
 
 class CoolenjoyCrawler(BaseCrawler):
     """쿨엔조이 커뮤니티 사이트용 크롤러."""
+
+    requires_browser = False
+    ready_selector = '#bo_list'
+    default_boards = ("jirum",)
+    row_spec = RowSpec('#bo_list ul.na-table li.d-md-table-row', {
+        "class": FieldSpec(attribute='class'),
+        "title": FieldSpec('div:nth-child(2) .na-item a'),
+        "url": FieldSpec('div:nth-child(2) .na-item a', 'href'),
+        "category": FieldSpec('div:nth-child(1)'),
+        "price": FieldSpec('div:nth-child(3) font'),
+        "comments": FieldSpec('div:nth-child(2) .count-plus'),
+        "views": FieldSpec('div:nth-child(6)'),
+        "recommendations": FieldSpec('div:nth-child(7)'),
+    })
     
-    def __init__(self):
-        """쿨엔조이 크롤러를 초기화합니다."""
-        super().__init__("Coolenjoy", "https://coolenjoy.net")
-        self.hot_deal_url = f"{self.base_url}/bbs/jirum"
+    def __init__(self, fetch_backend: Optional[str] = None, boards: Optional[Sequence[str]] = None,
+                 pages: int = 1):
+        """
+        쿨엔조이 크롤러를 초기화합니다.
+
+        Args:
+            fetch_backend: 페이지 가져오기 백엔드 (None이면 HTTP 백엔드 사용)
+            boards: 게시판 이름 목록 (기본값: 지름 게시판 jirum)
+            pages: 게시판마다 항상 읽을 페이지 수
+        """
+        super().__init__("Coolenjoy", "https://coolenjoy.net", fetch_backend=fetch_backend,
+                         boards=boards, pages=pages)
+        self.hot_deal_url = self.board_url(self.boards[0])
         self.logger = logging.getLogger(f"{__name__}.{self.site_name}")
-    
-    def crawl(self) -> List[HotDealItem]:
+
+    def board_url(self, board: Optional[str]) -> str:
         """
-        쿨엔조이 사이트에서 핫딜 정보를 크롤링합니다.
-        
+        게시판 목록의 첫 페이지 URL을 반환합니다.
+
+        Args:
+            board: 게시판 이름
+
         Returns:
-            List[HotDealItem]: 핫딜 아이템 목록
+            str: 게시판 URL
+        """
+        return f"{self.base_url}/bbs/{board}"
+    
+    def parse_row(self, row: Dict[str, Optional[str]]) -> Optional[HotDealItem]:
         """
-        self.logger.info(f"{self.site_name}에서 핫딜 크롤링 중")
-        deals = []
+        쿨엔조이 목록의 행 하나를 핫딜 아이템으로 변환합니다.
         
-        # 핫딜 페이지로 이동
-        if not self.get_page(self.hot_deal_url):
-            self.logger.error(f"{self.hot_deal_url}로 이동하지 못했습니다")
-            return deals
+        Args:
+            row: row_spec으로 추출한 필드 값
         
-        try:
-            # 모든 딜 아이템 찾기
-            deal_elements = self.driver.find_elements(By.CSS_SELECTOR, '#bo_list ul.na-table li.d-md-table-row')
-            
-            for element in deal_elements:
-                try:
-                    # 상단 고정 게시글은 제외
-                    element_class = element.get_attribute('class')
-                    if 'bg-light' in element_class:
-                        continue
-
-                    # 제목 추출
-                    title_element = element.find_element(By.CSS_SELECTOR, 'div:nth-child(2) .na-item a')
-                    title = title_element.text.strip()
-
-                    # URL 추출
-                    url = title_element.get_attribute('href')
-
-                    # 카테고리 추출
-                    category_element = element.find_element(By.CSS_SELECTOR, 'div:nth-child(1)')
-                    category = category_element.text.strip() if category_element else None
+        Returns:
+            핫딜 아이템, 상단 고정 게시글이면 None
+        """
+        # 상단 고정 게시글은 제외
+        if 'bg-light' in (row["class"] or ''):
+            return None
 
-                    # 가격 추출
-                    price_element = element.find_element(By.CSS_SELECTOR, 'div:nth-child(3) font')
-                    price = price_element.text.strip() if price_element else "N/A"
+        if row["title"] is None or row["url"] is None:
+            raise ValueError("제목 또는 URL을 찾을 수 없습니다")
 
-                    # idx 추출
-                    idx = url.split('/')[-1].split('?')[0]  # URL에서 마지막 부분을 idx로 사용
+        url = row["url"]
+        # 가격 열이 비어 있으면 제목에서 추출한 가격을 사용
+        price, currency = parse_amount(row["price"] or "") or (None, "KRW")
 
-                    # 딜 아이템 생성 및 추가
-                    deals.append(HotDealItem(
-                        idx=idx,
-                        title=title,
-                        url=url,
-                        site=self.site_name,
-                        category=category,
-                        price=price.replace('원', '').replace(',', '').strip() if price != "N/A" else "0",
-                    ))
-                except Exception as e:
-                    self.logger.error(f"딜 아이템 파싱 오류: {e}")
-            
-        except Exception as e:
-            self.logger.error(f"{self.site_name} 크롤링 오류: {e}")
-        finally:
-            # WebDriver 종료
-            self._close_driver()
-        
-        self.logger.info(f"{self.site_name}에서 {len(deals)}개의 딜을 찾았습니다")
-        return deals
\ No newline at end of file
+        return HotDealItem(
+            idx=url.split('/')[-1].split('?')[0],  # URL에서 마지막 부분을 idx로 사용
+            title=row["title"],
+            url=url,
+            site=self.site_name,
+            category=row["category"],
+            price=price,
+            currency=currency,
+            recommendations=parse_count(row["recommendations"]),
+            comments=parse_count(row["comments"]),
+            views=parse_count(row["views"]),
+            sold_out=is_sold_out(row["title"]),
+        )
\ No newline at end of file
@@ -3,74 +3,83 @@
 """
 
 import logging
-from typing import List
-
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
+from typing import Dict, Optional, Sequence
 
 from ..base_crawler import BaseCrawler
-from ..models import HotDealItem
+from ..models import HotDealItem, is_sold_out, parse_count
+from ..row_spec import FieldSpec, RowSpec
 
 
 class PPomppuCrawler(BaseCrawler):
     """뽐뿌 커뮤니티 사이트용 크롤러."""
+
+    requires_browser = False
+    ready_selector = '#revolution_main_table'
+    default_boards = ("ppomppu",)
+    row_spec = RowSpec('#revolution_main_table tbody tr.baseList', {
+        "class": FieldSpec(attribute='class'),
+        "idx": FieldSpec('td:nth-child(1)'),
+        "title": FieldSpec('td:nth-child(2) a.baseList-title'),
+        "url": FieldSpec('td:nth-child(2) a.baseList-title', 'href'),
+        "comments": FieldSpec('td:nth-child(2) span.baseList-c'),
+        # 추천 열은 "추천 - 비추천" 형식
+        "recommendations": FieldSpec('td.baseList-rec'),
+        "views": FieldSpec('td.baseList-views'),
+    })
+    # 뽐뿌는 EUC-KR(CP949)로 인코딩된 페이지를 제공
+    encoding = "cp949"
     
-    def __init__(self):
-        """뽐뿌 크롤러를 초기화합니다."""
-        super().__init__("Ppomppu", "https://www.ppomppu.co.kr/")
-        self.hot_deal_url = f"{self.base_url}/zboard/zboard.php?id=ppomppu"
+    def __init__(self, fetch_backend: Optional[str] = None, boards: Optional[Sequence[str]] = None,
+                 pages: int = 1):
+        """
+        뽐뿌 크롤러를 초기화합니다.
+
+        Args:
+            fetch_backend: 페이지 가져오기 백엔드 (None이면 HTTP 백엔드 사용)
+            boards: 게시판 id 목록 (예: "ppomppu4" 해외뽐뿌, 기본값: 뽐뿌게시판)
+            pages: 게시판마다 항상 읽을 페이지 수
+        """
+        super().__init__("Ppomppu", "https://www.ppomppu.co.kr/", fetch_backend=fetch_backend,
+                         boards=boards, pages=pages)
+        self.hot_deal_url = self.board_url(self.boards[0])
         self.logger = logging.getLogger(f"{__name__}.{self.site_name}")
 
-    def crawl(self) -> List[HotDealItem]:
+    def board_url(self, board: Optional[str]) -> str:
         """
-        뽐뿌 사이트에서 핫딜 정보를 크롤링합니다.
-        
+        게시판 목록의 첫 페이지 URL을 반환합니다.
+
+        Args:
+            board: 게시판 id
+
         Returns:
-            List[HotDealItem]: 핫딜 아이템 목록
+            str: 게시판 URL
         """
-        self.logger.info(f"{self.site_name}에서 핫딜 크롤링 중")
-        deals = []
+        return f"{self.base_url}/zboard/zboard.php?id={board}"
+
+    def parse_row(self, row: Dict[str, Optional[str]]) -> Optional[HotDealItem]:
+        """
+        뽐뿌 목록의 행 하나를 핫딜 아이템으로 변환합니다.
         
-        if not self.get_page(self.hot_deal_url):
-            self.logger.error(f"{self.hot_deal_url}로 이동하지 못했습니다")
-            return deals
+        Args:
+            row: row_spec으로 추출한 필드 값
         
-        try:
-            deal_elements = self.driver.find_elements(By.CSS_SELECTOR, '#revolution_main_table tbody tr.baseList')
-            
-            for element in deal_elements:
-                try:
-                    # 상단 고정 게시글은 제외
-                    element_class = element.get_attribute('class')
-                    if 'hotpop_bg_color' in element_class:
-                        continue
-
-                    # idx 추출
-                    idx_element = element.find_element(By.CSS_SELECTOR, 'td:nth-child(1)')
-                    idx = idx_element.text.strip() if idx_element else ""
-
-                    # 제목 추출
-                    title_element = element.find_element(By.CSS_SELECTOR, 'td:nth-child(2) a.baseList-title')
-                    title = title_element.text.strip()
+        Returns:
+            핫딜 아이템, 상단 고정 게시글이면 None
+        """
+        # 상단 고정 게시글은 제외
+        if 'hotpop_bg_color' in (row["class"] or ''):
+            return None
 
-                    # URL 추출
-                    relative_url = title_element.get_attribute('href')
-                    url = relative_url if relative_url else ""
+        if row["title"] is None:
+            raise ValueError("제목을 찾을 수 없습니다")
 
-                    deals.append(HotDealItem(
-                        idx=idx,
-                        title=title,
-                        url=url,
-                        site=self.site_name
-                    ))
-                except Exception as e:
-                    self.logger.error(f"Error parsing deal item: {e}")
-            
-        except Exception as e:
-            self.logger.error(f"Error crawling {self.site_name}: {e}")
-        finally:
-            # Close the WebDriver
-            self._close_driver()
-        
-        self.logger.info(f"Found {len(deals)} deals from {self.site_name}")
-        return deals
\ No newline at end of file
+        return HotDealItem(
+            idx=row["idx"] or "",
+            title=row["title"],
+            url=row["url"] or "",
+            site=self.site_name,
+            recommendations=parse_count(row["recommendations"]),
+            comments=parse_count(row["comments"]),
+            views=parse_count(row["views"]),
+            sold_out=is_sold_out(row["title"])
+        )
\ No newline at end of file
@@ -4,84 +4,92 @@
 
 import logging
 import re
-from typing import List
-
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
+from typing import Dict, Optional, Sequence
 
 from ..base_crawler import BaseCrawler
-from ..models import HotDealItem
+from ..models import HotDealItem, is_sold_out, parse_count
+from ..row_spec import FieldSpec, RowSpec
+
+
+# 제목 끝의 댓글 수 (예: "제목 (12)")
+_COMMENT_COUNT_RE = re.compile(r'\s*\((\d+)\)$')
 
 
 class RuliwebCrawler(BaseCrawler):
     """루리웹 커뮤니티 사이트용 크롤러."""
+
+    requires_browser = False
+    ready_selector = 'tr.table_body'
+    default_boards = ("1020",)
+    row_spec = RowSpec('tr.table_body', {
+        "category": FieldSpec('td.divsn'),
+        "title": FieldSpec('a.deco'),
+        "url": FieldSpec('a.deco', 'href'),
+        "idx": FieldSpec('td.id'),
+        "recommendations": FieldSpec('td.recomd'),
+        "views": FieldSpec('td.hit'),
+    })
     
-    def __init__(self):
-        """루리웹 크롤러를 초기화합니다."""
-        super().__init__("Ruliweb", "https://bbs.ruliweb.com")
-        self.hot_deal_url = f"{self.base_url}/market/board/1020"
+    def __init__(self, fetch_backend: Optional[str] = None, boards: Optional[Sequence[str]] = None,
+                 pages: int = 1):
+        """
+        루리웹 크롤러를 초기화합니다.
+
+        Args:
+            fetch_backend: 페이지 가져오기 백엔드 (None이면 HTTP 백엔드 사용)
+            boards: 게시판 번호 목록 (기본값: 핫딜 게시판 1020)
+            pages: 게시판마다 항상 읽을 페이지 수
+        """
+        super().__init__("Ruliweb", "https://bbs.ruliweb.com", fetch_backend=fetch_backend,
+                         boards=boards, pages=pages)
+        self.hot_deal_url = self.board_url(self.boards[0])
         self.logger = logging.getLogger(f"{__name__}.{self.site_name}")
-    
-    def crawl(self) -> List[HotDealItem]:
+
+    def board_url(self, board: Optional[str]) -> str:
         """
-        루리웹 사이트에서 핫딜 정보를 크롤링합니다.
-        
+        게시판 목록의 첫 페이지 URL을 반환합니다.
+
+        Args:
+            board: 게시판 번호
+
         Returns:
-            List[HotDealItem]: 핫딜 아이템 목록
+            str: 게시판 URL
         """
-        self.logger.info(f"{self.site_name}에서 핫딜 크롤링 중")
-        deals = []
+        return f"{self.base_url}/market/board/{board}"
+    
+    def parse_row(self, row: Dict[str, Optional[str]]) -> Optional[HotDealItem]:
+        """
+        루리웹 목록의 행 하나를 핫딜 아이템으로 변환합니다.
         
-        # 핫딜 페이지로 이동
-        if not self.get_page(self.hot_deal_url):
-            self.logger.error(f"{self.hot_deal_url}로 이동하지 못했습니다")
-            return deals
+        Args:
+            row: row_spec으로 추출한 필드 값
         
-        try:
-            # 모든 딜 아이템 찾기
-            deal_elements = self.driver.find_elements(By.CSS_SELECTOR, 'tr.table_body')
-            
-            for element in deal_elements:
-                try:
-                    # 카테고리 추출
-                    try:
-                        category_element = element.find_element(By.CSS_SELECTOR, 'td.divsn')
-                        category = category_element.text.strip()
-                    except NoSuchElementException:
-                        category = None
-
-                    if category == "업체핫딜" or category == "BEST" or category == '공지':
-                        continue
-
-                    # 제목 추출
-                    title_element = element.find_element(By.CSS_SELECTOR, 'a.deco')
-                    title = title_element.text.strip()
-
-                    # 제목에 댓글 개수 제거
-                    # 예: "제목 (댓글수)" 형식에서 댓글 수를 제거
-                    title = re.sub(r'\s*\(\d+\)$', '', title)  # 댓글 수 제거
+        Returns:
+            핫딜 아이템, 업체핫딜/BEST/공지 행이면 None
+        """
+        category = row["category"]
+        if category == "업체핫딜" or category == "BEST" or category == '공지':
+            return None
 
-                    # URL 추출
-                    url = title_element.get_attribute('href')
+        if row["title"] is None or row["idx"] is None:
+            raise ValueError("제목 또는 idx를 찾을 수 없습니다")
 
-                    # idx 추출
-                    idx_element = element.find_element(By.CSS_SELECTOR, 'td.id')
-                    idx = idx_element.text.strip()
+        # 제목 끝의 "(댓글수)"는 제목에서 떼어 댓글 수로 사용
+        title = row["title"]
+        comments = None
+        match = _COMMENT_COUNT_RE.search(title)
+        if match:
+            title = title[:match.start()]
+            comments = int(match.group(1))
 
-                    deals.append(HotDealItem(
-                        idx=idx,
-                        title=title,
-                        url=url,
-                        category=category,
-                        site=self.site_name
-                    ))
-                except Exception as e:
-                    self.logger.error(f"딜 아이템 파싱 오류: {e}")
-            
-        except Exception as e:
-            self.logger.error(f"{self.site_name} 크롤링 오류: {e}")
-        finally:
-            self._close_driver()
-        
-        self.logger.info(f"{self.site_name}에서 {len(deals)}개의 딜을 찾았습니다")
-        return deals
\ No newline at end of file
+        return HotDealItem(
+            idx=row["idx"],
+            title=title,
+            url=row["url"],
+            category=category,
+            site=self.site_name,
+            recommendations=parse_count(row["recommendations"]),
+            comments=comments,
+            views=parse_count(row["views"]),
+            sold_out=is_sold_out(title)
+        )
\ No newline at end of file
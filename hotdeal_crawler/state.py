@@ -0,0 +1,96 @@
+"""
+핫딜 크롤러를 위한 크롤링 상태 저장소 모듈.
+
+이 모듈은 사이트별로 마지막으로 본 게시글 번호(idx)를 로컬 JSON 파일에 저장하는 저장소를 제공합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def idx_to_int(idx) -> Optional[int]:
+    """
+    게시글 번호를 정수로 변환합니다.
+
+    Args:
+        idx: 게시글 번호
+
+    Returns:
+        정수 게시글 번호, 숫자가 아니면 None
+    """
+    try:
+        return int(str(idx).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+class CrawlStateStore:
+    """사이트별 마지막으로 본 idx(high-water mark)를 저장하는 클래스."""
+
+    def __init__(self, path: str = os.path.join("result", "state.json")):
+        """
+        상태 저장소를 초기화하고 기존 상태를 읽어옵니다.
+
+        Args:
+            path: 상태를 저장할 JSON 파일 경로
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self._state = {}
+        self._load()
+
+    def _load(self):
+        """파일에서 상태를 읽어옵니다."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"상태 파일을 읽지 못했습니다 ({self.path}): {e}")
+            self._state = {}
+
+    def _save(self):
+        """상태를 임시 파일에 쓴 뒤 교체하여 원자적으로 저장합니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def get_last_idx(self, site_name: str) -> Optional[int]:
+        """
+        사이트에서 마지막으로 본 idx를 반환합니다.
+
+        Args:
+            site_name: 사이트 이름
+
+        Returns:
+            마지막으로 본 idx, 기록이 없으면 None
+        """
+        with self.lock:
+            return self._state.get(site_name, {}).get("last_idx")
+
+    def update_last_idx(self, site_name: str, idx: int):
+        """
+        사이트의 마지막으로 본 idx를 갱신합니다. 기존 값보다 클 때만 저장합니다.
+
+        Args:
+            site_name: 사이트 이름
+            idx: 새로 본 가장 큰 idx
+        """
+        with self.lock:
+            site_state = self._state.setdefault(site_name, {})
+            last_idx = site_state.get("last_idx")
+            if last_idx is not None and idx <= last_idx:
+                return
+            site_state["last_idx"] = idx
+            self._save()
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""
+pytest 공통 설정.
+
+저장소 루트를 import 경로에 추가하여 설치하지 않고도 hotdeal_crawler 패키지를 가져올 수 있게 합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
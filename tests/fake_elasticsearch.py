@@ -0,0 +1,155 @@
+"""
+테스트용 가짜 Elasticsearch 서버 구현.
+
+실제 Elasticsearch 없이 ElasticsearchSink를 확인할 수 있도록 _bulk API의 일부를 흉내 냅니다.
+index 액션의 외부 버전(version_type=external)과 항목별 실패 주입을 지원합니다.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+
+class _BulkHandler(BaseHTTPRequestHandler):
+    """POST /_bulk 요청을 처리하는 핸들러."""
+
+    server: "FakeElasticsearchServer"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if self.path.split('?')[0] != "/_bulk":
+            self._reply(404, {"error": "not found"})
+            return
+
+        status = self.server.next_failure()
+        if status is not None:
+            self._reply(status, {"error": "injected failure"})
+            return
+
+        self._reply(200, self.server.apply_bulk(body))
+
+    def _reply(self, status: int, payload: dict):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeElasticsearchServer(ThreadingHTTPServer):
+    """메모리에 문서를 저장하는 로컬 가짜 Elasticsearch 서버."""
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        가짜 서버를 초기화합니다. port가 0이면 빈 포트를 사용합니다.
+        
+        Args:
+            host: 바인딩할 주소
+            port: 바인딩할 포트
+        """
+        super().__init__((host, port), _BulkHandler)
+        self.documents: Dict[str, Dict[str, dict]] = {}
+        self.versions: Dict[str, Dict[str, int]] = {}
+        self.bulk_requests = 0
+        self.request_sizes: List[int] = []
+        self._failures: List[int] = []
+        self._item_failures: List[int] = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """서버 주소를 반환합니다."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def fail_next(self, count: int = 1, status: int = 429):
+        """
+        다음 벌크 요청들을 지정한 상태 코드로 실패시킵니다.
+        
+        Args:
+            count: 실패시킬 요청 수
+            status: 응답 상태 코드
+        """
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def fail_items(self, count: int = 1, status: int = 429):
+        """
+        다음 벌크 항목들을 적용하지 않고 지정한 상태 코드로 실패시킵니다. 요청 자체는 200으로 응답합니다.
+        
+        Args:
+            count: 실패시킬 항목 수
+            status: 항목 상태 코드
+        """
+        with self._lock:
+            self._item_failures.extend([status] * count)
+
+    def next_failure(self):
+        """주입된 실패가 있으면 상태 코드를 꺼내 반환합니다."""
+        with self._lock:
+            return self._failures.pop(0) if self._failures else None
+
+    def apply_bulk(self, body: bytes) -> dict:
+        """
+        벌크 본문의 index 액션을 적용하고 벌크 응답을 만듭니다.
+        
+        Args:
+            body: NDJSON 벌크 본문
+        
+        Returns:
+            dict: 벌크 응답
+        """
+        lines = [line for line in body.decode('utf-8').split("\n") if line]
+        items = []
+        errors = False
+        with self._lock:
+            self.bulk_requests += 1
+            self.request_sizes.append(len(body))
+            for action_line, source_line in zip(lines[0::2], lines[1::2]):
+                action = json.loads(action_line)["index"]
+                item = {"_index": action["_index"], "_id": action["_id"]}
+                items.append({"index": item})
+                index = self.documents.setdefault(action["_index"], {})
+                versions = self.versions.setdefault(action["_index"], {})
+                if self._item_failures:
+                    errors = True
+                    item.update(status=self._item_failures.pop(0), error={"type": "injected_failure"})
+                    continue
+                version = action.get("version")
+                if action.get("version_type") == "external" and action["_id"] in versions \
+                        and version <= versions[action["_id"]]:
+                    errors = True
+                    item.update(status=409, error={"type": "version_conflict_engine_exception"})
+                    continue
+                result = "updated" if action["_id"] in index else "created"
+                index[action["_id"]] = json.loads(source_line)
+                if version is not None:
+                    versions[action["_id"]] = version
+                item.update(status=201 if result == "created" else 200, result=result)
+        return {"took": 1, "errors": errors, "items": items}
+
+    def start(self) -> "FakeElasticsearchServer":
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버를 멈춥니다."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+asyncio 크롤링 엔진 테스트.
+"""
+
+import asyncio
+import os
+
+from hotdeal_crawler.async_engine import AsyncCrawlEngine
+from hotdeal_crawler.manager import HotDealCrawlerManager
+from hotdeal_crawler.plugins import get_site_registry
+from hotdeal_crawler.replay import AsyncReplayFetcher, ReplayFetcher
+from hotdeal_crawler.state import CrawlStateStore
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+# 픽스처 2페이지 중간의 idx (1페이지 20개와 2페이지 10개가 이보다 새 딜)
+OLD_LAST_IDX = 3299970
+
+
+def make_engine(tmp_path, **options):
+    """coolenjoy 픽스처 두 페이지를 재생하는 엔진을 만듭니다."""
+    manager = HotDealCrawlerManager(state_store=CrawlStateStore(str(tmp_path / "state.json")))
+    crawler = get_site_registry().create("coolenjoy", fetch_backend="http", pages=2)
+    crawler.latency_budget = float("inf")
+    manager.add_crawler(crawler)
+    crawler.update_last_idx(crawler.boards[0], OLD_LAST_IDX)
+    engine = AsyncCrawlEngine(manager, fetcher=AsyncReplayFetcher(ReplayFetcher(FIXTURES)), **options)
+    return engine, crawler
+
+
+def test_timed_out_page_keeps_last_idx(tmp_path):
+    engine, crawler = make_engine(tmp_path, target_timeout=0.2)
+    crawl_target_async = crawler.crawl_target_async
+
+    async def slow_page_2(target, last_idx, fetcher):
+        if target.page == 2:
+            await asyncio.sleep(5)
+        return await crawl_target_async(target, last_idx, fetcher)
+
+    crawler.crawl_target_async = slow_page_2
+    deals = asyncio.run(engine.crawl())
+
+    assert len(deals) == 20
+    assert crawler.get_last_idx(crawler.boards[0]) == OLD_LAST_IDX
+    assert engine.manager.health.site(crawler.site_name).breaker.failures == 1
+
+
+def test_failed_page_keeps_last_idx(tmp_path):
+    engine, crawler = make_engine(tmp_path)
+    crawl_target_async = crawler.crawl_target_async
+
+    async def broken_page_2(target, last_idx, fetcher):
+        if target.page == 2:
+            raise RuntimeError("목록을 읽지 못했습니다")
+        return await crawl_target_async(target, last_idx, fetcher)
+
+    crawler.crawl_target_async = broken_page_2
+    assert len(asyncio.run(engine.crawl())) == 20
+    assert crawler.get_last_idx(crawler.boards[0]) == OLD_LAST_IDX
+
+
+def test_finished_board_advances_last_idx(tmp_path):
+    engine, crawler = make_engine(tmp_path)
+    deals = asyncio.run(engine.crawl())
+
+    assert len(deals) == 30
+    assert crawler.get_last_idx(crawler.boards[0]) == 3300000
\ No newline at end of file
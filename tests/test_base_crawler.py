@@ -0,0 +1,46 @@
+"""
+기본 크롤러의 페이지 가져오기 테스트.
+"""
+
+from hotdeal_crawler.health import STATE_OPEN, HealthTracker
+from hotdeal_crawler.plugins import get_site_registry
+
+
+class FakeDriver:
+    """이동한 URL만 기록하는 WebDriver 대역."""
+
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url):
+        self.urls.append(url)
+
+    def quit(self):
+        pass
+
+
+def make_selenium_crawler(ready):
+    """준비 선택자 대기 결과가 ready인 Selenium 백엔드 크롤러를 만듭니다."""
+    crawler = get_site_registry().create("coolenjoy", fetch_backend="selenium")
+    crawler.driver = FakeDriver()
+    crawler.wait_for_element = lambda by, value, timeout=10: ready
+    return crawler
+
+
+def test_missing_ready_selector_fails_the_page():
+    crawler = make_selenium_crawler(ready=None)
+    assert crawler.get_page("https://coolenjoy.net/bbs/jirum") is False
+
+    crawler = make_selenium_crawler(ready=object())
+    assert crawler.get_page("https://coolenjoy.net/bbs/jirum") is True
+
+
+def test_missing_ready_selector_is_retried_and_opens_breaker():
+    tracker = HealthTracker(failure_threshold=2, max_attempts=2, retries_per_cycle=10, backoff_base=0)
+    crawler = make_selenium_crawler(ready=None)
+    crawler.health = tracker.site(crawler.site_name)
+
+    assert crawler._get_page_with_retries("https://coolenjoy.net/bbs/jirum") is False
+    assert len(crawler.driver.urls) == 2
+    assert crawler._get_page_with_retries("https://coolenjoy.net/bbs/jirum") is False
+    assert crawler.health.state == STATE_OPEN
\ No newline at end of file
@@ -0,0 +1,198 @@
+"""
+DatabaseSink 테스트.
+
+임시 SQLite 데이터베이스로 배치 upsert, 마지막 쓰기 우선, 재시도 중 잠금을 확인합니다.
+"""
+
+import contextlib
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from hotdeal_crawler.db import SqliteDialect, sqlite_pool
+from hotdeal_crawler.lifecycle import (
+    UPDATE_EDITED,
+    UPDATE_POPULARITY,
+    UPDATE_RESTOCKED,
+    UPDATE_SOLD_OUT,
+    DealUpdate,
+)
+from hotdeal_crawler.models import HotDealItem
+from hotdeal_crawler.sinks.database_sink import DatabaseSink
+
+
+class RecordingDialect(SqliteDialect):
+    """upsert 문마다 행 수를 기록하는 SQLite 방언."""
+
+    def __init__(self):
+        self.upserts = []
+
+    def upsert_sql(self, table: str, row_count: int) -> str:
+        self.upserts.append(row_count)
+        return super().upsert_sql(table, row_count)
+
+
+class FlakyPool:
+    """연결을 빌릴 때 정해진 횟수만큼 실패하는 연결 풀."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.failures = 0
+
+    @contextlib.contextmanager
+    def connection(self):
+        if self.failures:
+            self.failures -= 1
+            raise sqlite3.OperationalError("database is locked")
+        with self.pool.connection() as conn:
+            yield conn
+
+    def close(self):
+        self.pool.close()
+
+
+def make_deal(idx: int, title: str = "[쿠팡] 테스트 상품 (12,900원/무료)", board: str = "hot",
+              **fields) -> HotDealItem:
+    return HotDealItem(idx=str(idx), title=title, url=f"https://example.com/{idx}", price=12900,
+                       site="Example", board=board, **fields)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "deals.sqlite3")
+
+
+def read_rows(path: str):
+    conn = sqlite3.connect(path)
+    try:
+        return {(site, board, idx): title
+                for site, board, idx, title in conn.execute("SELECT site, board, idx, title FROM hot_deals")}
+    finally:
+        conn.close()
+
+
+def test_upserts_in_dialect_sized_chunks(db_path):
+    dialect = RecordingDialect()
+    sink = DatabaseSink(sqlite_pool(db_path), dialect, batch_size=1000, flush_interval=60)
+    count = dialect.max_rows * 2 + 5
+    for idx in range(count):
+        sink.write(make_deal(idx))
+    sink.close()
+
+    assert dialect.upserts == [dialect.max_rows, dialect.max_rows, 5]
+    assert sink.written == count
+    assert sink.dropped == 0
+    assert len(read_rows(db_path)) == count
+
+
+def test_flushes_when_batch_is_full(db_path):
+    dialect = RecordingDialect()
+    sink = DatabaseSink(sqlite_pool(db_path), dialect, batch_size=10, flush_interval=60)
+    for idx in range(25):
+        sink.write(make_deal(idx))
+    assert len(read_rows(db_path)) == 20
+    sink.close()
+
+    assert dialect.upserts == [10, 10, 5]
+    assert len(read_rows(db_path)) == 25
+
+
+def test_last_write_wins(db_path):
+    sink = DatabaseSink(sqlite_pool(db_path), SqliteDialect(), batch_size=1000, flush_interval=60)
+    # 같은 배치 안에서 덮어쓰기
+    sink.write(make_deal(1, "처음 제목"))
+    sink.write(make_deal(1, "수정된 제목"))
+    # 다른 배치에서 덮어쓰기
+    sink.write(make_deal(2, "처음 제목"))
+    sink.flush()
+    sink.write(make_deal(2, "수정된 제목"))
+    # 게시판이 다르면 다른 행
+    sink.write(make_deal(1, "다른 게시판", board="other"))
+    sink.close()
+
+    assert read_rows(db_path) == {
+        ("Example", "hot", "1"): "수정된 제목",
+        ("Example", "hot", "2"): "수정된 제목",
+        ("Example", "other", "1"): "다른 게시판",
+    }
+    # 두 번 나눠 쓴 게시글 2는 두 번 센다
+    assert sink.written == 4
+
+
+def read_columns(path: str, *columns):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(f"SELECT {', '.join(columns)} FROM hot_deals").fetchone()
+    finally:
+        conn.close()
+
+
+def test_write_update_stores_every_kind(db_path):
+    sink = DatabaseSink(sqlite_pool(db_path), SqliteDialect(), batch_size=1000, flush_interval=60)
+    sink.write(make_deal(1, "처음 제목", recommendations=1, comments=2, views=100))
+    sink.flush()
+
+    sink.write_update(DealUpdate(make_deal(1, "처음 제목", recommendations=5, comments=9, views=900),
+                                 [UPDATE_POPULARITY], {"recommendations": (1, 5)}))
+    sink.flush()
+    assert read_columns(db_path, "recommendations", "comments", "views") == (5, 9, 900)
+
+    sink.write_update(DealUpdate(make_deal(1, "[품절] 처음 제목", sold_out=True), [UPDATE_SOLD_OUT],
+                                 {"sold_out": (False, True)}))
+    sink.flush()
+    # 목록에 표시되지 않은 인기 지표는 기존 값을 유지
+    assert read_columns(db_path, "title", "sold_out", "views") == ("[품절] 처음 제목", 1, 900)
+
+    sink.write_update(DealUpdate(make_deal(1, "수정된 제목"), [UPDATE_EDITED, UPDATE_RESTOCKED], {}))
+    sink.close()
+    assert read_columns(db_path, "title", "sold_out", "recommendations") == ("수정된 제목", 0, 5)
+
+
+def test_adds_missing_columns_to_old_table(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE hot_deals (site VARCHAR(32) NOT NULL, board VARCHAR(32) NOT NULL DEFAULT '', "
+        "idx VARCHAR(64) NOT NULL, title TEXT NOT NULL, url TEXT NOT NULL, price BIGINT, "
+        "currency VARCHAR(8) NOT NULL DEFAULT 'KRW', shipping BIGINT, store VARCHAR(64), discount INTEGER, "
+        "canonical_url TEXT, category VARCHAR(64), timestamp VARCHAR(32) NOT NULL, alternate_urls TEXT, "
+        "PRIMARY KEY (site, board, idx))")
+    conn.execute("INSERT INTO hot_deals (site, board, idx, title, url, timestamp) "
+                 "VALUES ('Example', 'hot', '1', '이전 딜', 'https://example.com/1', '2024-01-01T00:00:00')")
+    conn.commit()
+    conn.close()
+
+    sink = DatabaseSink(sqlite_pool(db_path), SqliteDialect(), batch_size=1000, flush_interval=60)
+    sink.write(make_deal(2, views=10))
+    sink.close()
+
+    assert read_rows(db_path) == {("Example", "hot", "1"): "이전 딜",
+                                  ("Example", "hot", "2"): "[쿠팡] 테스트 상품 (12,900원/무료)"}
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT idx, sold_out, views FROM hot_deals ORDER BY idx").fetchall() == [
+            ("1", 0, None), ("2", 0, 10)]
+    finally:
+        conn.close()
+
+
+def test_write_does_not_wait_for_retry_backoff(db_path):
+    pool = FlakyPool(sqlite_pool(db_path))
+    sink = DatabaseSink(pool, SqliteDialect(), batch_size=1000, flush_interval=60, retry_backoff=0.5)
+    sink.write(make_deal(1))
+    pool.failures = 1
+    flusher = threading.Thread(target=sink.flush)
+    flusher.start()
+    time.sleep(0.1)
+
+    # 다른 스레드가 재시도를 기다리는 동안에도 버퍼에는 바로 추가됨
+    start = time.perf_counter()
+    sink.write(make_deal(2))
+    assert time.perf_counter() - start < 0.2
+    flusher.join()
+    sink.close()
+
+    assert sink.written == 2
+    assert sink.dropped == 0
+    assert set(read_rows(db_path)) == {("Example", "hot", "1"), ("Example", "hot", "2")}
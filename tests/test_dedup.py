@@ -0,0 +1,48 @@
+"""
+중복 제거 인덱스 테스트.
+"""
+
+from hotdeal_crawler.dedup import DedupIndex
+from hotdeal_crawler.models import HotDealItem
+
+
+def make_deal(site, idx, title):
+    return HotDealItem(idx=str(idx), title=title, url=f"https://{site}.example.com/{idx}", site=site, board="hot")
+
+
+def test_similar_deal_is_merged_into_canonical():
+    index = DedupIndex(ttl=10)
+    first = make_deal("a", 1, "[쿠팡] 맥심 모카골드 마일드 커피믹스 400T (52,800원/무료)")
+    second = make_deal("b", 7, "[G마켓] 맥심 모카골드 마일드 커피믹스 400T (52,800원/무료배송)")
+
+    assert index.dedupe([first, second], now=0) == [first]
+    assert first.alternate_urls == [second.url]
+    assert index.dedupe([second], now=1) == []
+
+
+def test_alias_expires_with_its_canonical():
+    index = DedupIndex(ttl=10)
+    first = make_deal("a", 1, "[쿠팡] 맥심 모카골드 마일드 커피믹스 400T (52,800원/무료)")
+    other = make_deal("a", 2, "[11번가] 삼다수 2L 12병 (9,900원/무료)")
+    alias = make_deal("b", 7, "[G마켓] 맥심 모카골드 마일드 커피믹스 400T (52,800원/무료배송)")
+
+    index.dedupe([first], now=0)
+    index.dedupe([other], now=5)
+    index.dedupe([alias], now=6)
+    assert len(index) == 3
+
+    # 대표 딜이 만료되면 대표 딜을 가리키던 키도 함께 잊음
+    assert index.dedupe([alias], now=11) == [alias]
+    assert set(index._entries) == {other.key, alias.key}
+
+
+def test_alias_is_dropped_when_canonical_is_evicted():
+    index = DedupIndex(ttl=100, max_entries=3)
+    first = make_deal("a", 1, "[쿠팡] 맥심 모카골드 마일드 커피믹스 400T (52,800원/무료)")
+    alias = make_deal("b", 7, "[G마켓] 맥심 모카골드 마일드 커피믹스 400T (52,800원/무료배송)")
+    index.dedupe([first, alias], now=0)
+    index.dedupe([make_deal("a", 2, "[11번가] 삼다수 2L 12병 (9,900원/무료)"),
+                  make_deal("a", 3, "[옥션] 풀무원 두부 300g x 8 (11,900원/3,500원)")], now=1)
+
+    assert alias.key not in index._entries
+    assert len(index) == 2
\ No newline at end of file
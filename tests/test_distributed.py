@@ -0,0 +1,165 @@
+"""
+분산 크롤링 작업 큐와 작업자 테스트.
+"""
+
+import threading
+import time
+
+import pytest
+
+from hotdeal_crawler import distributed
+from hotdeal_crawler.distributed import Lease, LeaseQueue, run_worker
+from hotdeal_crawler.models import CrawlTarget
+from hotdeal_crawler.plugins import get_site_registry
+
+
+@pytest.fixture
+def crawlers():
+    registry = get_site_registry()
+    return {name: registry.create(name, fetch_backend="http") for name in ("coolenjoy", "ppomppu")}
+
+
+def open_queues(tmp_path, **options):
+    """같은 파일을 쓰는 두 작업 큐 (서로 다른 프로세스의 작업자처럼 연결을 따로 가짐)."""
+    path = str(tmp_path / "queue.db")
+    options.setdefault("host_rate", 0)
+    return LeaseQueue(path, **options), LeaseQueue(path, **options)
+
+
+def put(queue, run_id, crawler, page=1):
+    return queue.put(run_id, crawler, CrawlTarget(crawler.site_name, crawler.boards[0], page), None)
+
+
+def test_expired_lease_is_leased_again(tmp_path, crawlers):
+    first, second = open_queues(tmp_path, lease_seconds=0.1)
+    run_id = first.start_run()
+    target_id = put(first, run_id, crawlers["coolenjoy"])
+
+    lease = first.lease("a", run_id)
+    assert lease.id == target_id
+    assert second.lease("b", run_id) is None
+
+    time.sleep(0.15)
+    taken = second.lease("b", run_id)
+    assert taken.id == target_id and taken.token != lease.token
+
+    # 리스를 잃은 작업자의 결과와 갱신은 버려짐
+    assert not first.renew(lease)
+    assert not first.complete(lease, [])
+    assert second.complete(taken, [])
+    assert [result.id for result in first.collect(run_id)] == [target_id]
+    first.close()
+    second.close()
+
+
+def test_target_fails_after_max_attempts(tmp_path, crawlers):
+    first, second = open_queues(tmp_path, lease_seconds=0.05, max_attempts=2)
+    run_id = first.start_run()
+    put(first, run_id, crawlers["coolenjoy"])
+
+    assert first.lease("a", run_id) is not None
+    time.sleep(0.1)
+    assert second.lease("b", run_id) is not None
+    time.sleep(0.1)
+    assert first.lease("a", run_id) is None
+
+    results = second.collect(run_id)
+    assert len(results) == 1
+    assert results[0].error == "리스가 만료되었습니다"
+    first.close()
+    second.close()
+
+
+def test_complete_requires_current_token(tmp_path, crawlers):
+    first, second = open_queues(tmp_path)
+    run_id = first.start_run()
+    put(first, run_id, crawlers["coolenjoy"])
+
+    lease = first.lease("a", run_id)
+    forged = Lease(lease.id, "other", lease.run_id, lease.crawler, lease.backend,
+                    lease.target, lease.last_idx)
+    assert not second.complete(forged, [])
+    assert not second.renew(forged)
+    assert second.complete(lease, [])
+    # 이미 끝난 리스는 다시 기록하지 않음
+    assert not first.complete(lease, [])
+    first.close()
+    second.close()
+
+
+def test_per_host_limit_spans_queues(tmp_path, crawlers):
+    first, second = open_queues(tmp_path, max_per_host=1)
+    run_id = first.start_run()
+    cool_1 = put(first, run_id, crawlers["coolenjoy"], 1)
+    cool_2 = put(first, run_id, crawlers["coolenjoy"], 2)
+    ppomppu = put(first, run_id, crawlers["ppomppu"], 1)
+
+    lease = first.lease("a", run_id)
+    assert lease.id == cool_1
+    # 같은 호스트는 다른 작업자도 한도를 넘겨 잡을 수 없음
+    assert second.lease("b", run_id).id == ppomppu
+    assert second.lease("b", run_id) is None
+
+    assert first.complete(lease, [])
+    assert second.lease("b", run_id).id == cool_2
+    first.close()
+    second.close()
+
+
+def test_host_rate_spaces_leases(tmp_path, crawlers):
+    first, second = open_queues(tmp_path, max_per_host=2, host_rate=10)
+    run_id = first.start_run()
+    put(first, run_id, crawlers["coolenjoy"], 1)
+    put(first, run_id, crawlers["coolenjoy"], 2)
+
+    assert first.lease("a", run_id) is not None
+    assert second.lease("b", run_id) is None
+    time.sleep(0.15)
+    assert second.lease("b", run_id) is not None
+    first.close()
+    second.close()
+
+
+class FakeCrawler:
+    """대상마다 빈 결과를 돌려주고 브라우저를 닫은 횟수를 세는 크롤러."""
+
+    site_name = "coolenjoy"
+
+    def __init__(self):
+        self.http_fetcher = None
+        self.health = None
+        self.targets = 0
+        self.closed = 0
+
+    def iter_target(self, target, last_idx=None):
+        self.targets += 1
+        return iter(())
+
+    def _close_driver(self):
+        self.closed += 1
+
+
+def test_worker_closes_browser_once(tmp_path, crawlers, monkeypatch):
+    fake = FakeCrawler()
+    monkeypatch.setattr(distributed, "load_crawler", lambda path, backend: fake)
+    queue = LeaseQueue(str(tmp_path / "queue.db"), host_rate=0)
+    run_id = queue.start_run()
+    for page in (1, 2, 3):
+        put(queue, run_id, crawlers["coolenjoy"], page)
+
+    def finish_when_done():
+        results = []
+        while len(results) < 3:
+            results += queue.collect(run_id)
+            time.sleep(0.01)
+        queue.finish_run(run_id)
+
+    finisher = threading.Thread(target=finish_when_done)
+    finisher.start()
+    count = run_worker(queue.path, run_id, "worker", host_rate=0, poll_interval=0.01)
+    finisher.join()
+    queue.close()
+
+    assert count == 3
+    assert fake.targets == 3
+    assert fake.closed == 1
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+ElasticsearchSink 테스트.
+
+로컬 가짜 Elasticsearch 서버로 벌크 색인, 재시도, 배치 분할, 외부 버전을 확인합니다.
+"""
+
+import time
+
+import pytest
+
+from fake_elasticsearch import FakeElasticsearchServer
+from hotdeal_crawler.models import HotDealItem
+from hotdeal_crawler.sinks.elasticsearch_sink import ElasticsearchSink, document_id
+
+
+def make_deal(idx: int, title: str = "[쿠팡] 테스트 상품 (12,900원/무료)") -> HotDealItem:
+    return HotDealItem(idx=str(idx), title=title, url=f"https://example.com/{idx}", price=12900,
+                       site="Example", board="hot")
+
+
+@pytest.fixture
+def server():
+    with FakeElasticsearchServer() as server:
+        yield server
+
+
+def make_sink(server: FakeElasticsearchServer, **kwargs) -> ElasticsearchSink:
+    kwargs.setdefault("retry_backoff", 0.01)
+    return ElasticsearchSink(server.url, index="deals", **kwargs)
+
+
+def test_indexes_all_deals(server):
+    sink = make_sink(server, max_docs=10)
+    for idx in range(25):
+        sink.write(make_deal(idx))
+    sink.close()
+
+    assert sink.indexed == 25
+    assert sink.failed == 0
+    assert server.bulk_requests == 3
+    assert set(server.documents["deals"]) == {document_id(make_deal(idx)) for idx in range(25)}
+
+
+def test_retries_rejected_request(server):
+    server.fail_next(2, status=429)
+    sink = make_sink(server)
+    for idx in range(5):
+        sink.write(make_deal(idx))
+    sink.close()
+
+    assert sink.indexed == 5
+    assert sink.failed == 0
+    assert len(server.documents["deals"]) == 5
+
+
+def test_retries_only_rejected_items(server):
+    server.fail_items(2, status=429)
+    sink = make_sink(server)
+    for idx in range(5):
+        sink.write(make_deal(idx))
+    sink.close()
+
+    assert sink.indexed == 5
+    assert sink.failed == 0
+    # 첫 요청에서 거절된 항목 2개만 두 번째 요청으로 다시 보냄
+    assert server.bulk_requests == 2
+    assert server.request_sizes[1] < server.request_sizes[0]
+    assert len(server.documents["deals"]) == 5
+
+
+def test_gives_up_on_permanent_item_errors(server):
+    server.fail_items(1, status=400)
+    sink = make_sink(server)
+    for idx in range(3):
+        sink.write(make_deal(idx))
+    sink.close()
+
+    assert sink.indexed == 2
+    assert sink.failed == 1
+    assert server.bulk_requests == 1
+
+
+def test_splits_batches_at_byte_limit(server):
+    deal_size = len(ElasticsearchSink(server.url)._action_lines(make_deal(0), time.time_ns()))
+    max_bytes = deal_size * 3 + deal_size // 2
+    sink = make_sink(server, max_bytes=max_bytes)
+    for idx in range(10):
+        sink.write(make_deal(idx))
+    sink.close()
+
+    assert sink.indexed == 10
+    assert server.bulk_requests == 4
+    assert all(size <= max_bytes for size in server.request_sizes)
+
+
+def test_late_stale_write_does_not_overwrite_newer(server):
+    sink = make_sink(server)
+    old = make_deal(1, "[쿠팡] 테스트 상품 (12,900원/무료)")
+    new = make_deal(1, "[쿠팡] 테스트 상품 (9,900원/무료) 가격 수정")
+    old_lines = sink._action_lines(old, sink._next_version_locked())
+    new_lines = sink._action_lines(new, sink._next_version_locked())
+
+    # 동시에 보낸 두 요청 중 나중 쓰기가 먼저 도착한 경우
+    sink._send([new_lines])
+    sink._send([old_lines])
+    sink.close()
+
+    assert server.documents["deals"][document_id(new)]["title"] == new.title
+    assert sink.indexed == 2
+    assert sink.failed == 0
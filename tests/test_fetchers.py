@@ -0,0 +1,78 @@
+"""
+URL 변환 테스트.
+"""
+
+import itertools
+import json
+import os
+from urllib.parse import urljoin
+
+import lxml.html
+import pytest
+
+from hotdeal_crawler.fetchers import absolute_url
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+
+BASE_URLS = [
+    "https://www.ppomppu.co.kr/zboard/zboard.php?id=ppomppu",
+    "https://bbs.ruliweb.com/market/board/1020?page=2",
+    "https://coolenjoy.net/bbs/jirum",
+    "https://example.com",
+    "https://example.com/",
+    "https://example.com/a/b;p?q=1#f",
+    "https://example.com/a/b;x=1/c",
+    "http://example.com/a/../b/",
+    "https://example.com/a//b",
+]
+
+EDGE_CASES = [
+    "", "/", "?", "#", "?page=2", "#top", "view.php?no=1", "/bbs/view?id=1&no=2",
+    "./view.php", "../view.php", "a/./b", "a/../b", ".", "..", "./", "../",
+    "view.php;jsessionid=1", "a;b/c", ";p", "/a;p?q", "..;..;", "b;",
+    "https://example.com/a;p", "https://example.com/a;#x", "https://example.com/a/../b",
+    "//cdn.example.com/img.png", "a//b", "a b", "https://example.com/a b",
+    "javascript:void(0)", "mailto:a@b.c", "http:view", "?#", "a?", "a#",
+]
+
+
+def fixture_links():
+    """픽스처 페이지의 href, src 값을 모읍니다."""
+    with open(os.path.join(FIXTURES, "index.json"), encoding="utf-8") as f:
+        index = json.load(f)
+    values = set()
+    for entry in index.values():
+        with open(os.path.join(FIXTURES, entry["file"]), "rb") as f:
+            document = lxml.html.fromstring(f.read())
+        for element in document.iter():
+            for attribute in ("href", "src"):
+                value = element.get(attribute)
+                if value is not None:
+                    values.add(value)
+    return sorted(values)
+
+
+def test_fixture_links_match_urljoin():
+    links = fixture_links()
+    assert links
+    for base_url in BASE_URLS:
+        for value in links:
+            assert absolute_url(base_url, value) == urljoin(base_url, value), (base_url, value)
+
+
+@pytest.mark.parametrize("base_url", BASE_URLS)
+def test_edge_cases_match_urljoin(base_url):
+    for value in EDGE_CASES:
+        assert absolute_url(base_url, value) == urljoin(base_url, value), value
+
+
+def test_generated_paths_match_urljoin():
+    parts = ["a", ".", "..", "/", ";", "?", "#", "=", "&", " ", ":", "//", "x;y", "%20"]
+    values = set()
+    for length in range(1, 4):
+        for combination in itertools.product(parts, repeat=length):
+            value = "".join(combination)
+            values.update((value, "/" + value, "https://example.com/" + value))
+    for base_url in BASE_URLS:
+        for value in values:
+            assert absolute_url(base_url, value) == urljoin(base_url, value), (base_url, value)
\ No newline at end of file
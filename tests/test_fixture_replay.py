@@ -0,0 +1,94 @@
+"""
+기록된 목록 페이지 픽스처 재생 테스트.
+
+benchmarks/fixtures를 네트워크 없이 재생하여 사이트별 딜 수가 benchmarks/baseline.json과 같고
+딜의 필드가 채워지는지 확인합니다. 픽스처를 다시 기록하면 crawl_bench.py --save-baseline으로
+기준 결과도 함께 갱신합니다.
+"""
+
+import asyncio
+import json
+import os
+from urllib.parse import urlparse
+
+import pytest
+
+from hotdeal_crawler.models import CrawlTarget
+from hotdeal_crawler.plugins import get_site_registry
+from hotdeal_crawler.replay import AsyncReplayFetcher, ReplayFetcher
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+FIXTURES = os.path.join(BENCHMARKS, "fixtures")
+BASELINE = os.path.join(BENCHMARKS, "baseline.json")
+
+
+@pytest.fixture(scope="module")
+def replay():
+    return ReplayFetcher(FIXTURES)
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    with open(BASELINE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def recorded_targets(crawler, replay):
+    """게시판의 페이지 중 기록된 것의 크롤링 대상을 반환합니다."""
+    board = crawler.boards[0]
+    targets = []
+    while replay.has(crawler.page_url(len(targets) + 1, board)):
+        targets.append(CrawlTarget(crawler.site_name, board, len(targets) + 1))
+    return targets
+
+
+def make_crawler(site, replay):
+    crawler = get_site_registry().create(site, fetch_backend="http")
+    crawler.http_fetcher = replay
+    crawler.latency_budget = float("inf")
+    return crawler
+
+
+@pytest.mark.parametrize("site", get_site_registry().names())
+def test_replay_matches_baseline(site, replay, baseline):
+    crawler = make_crawler(site, replay)
+    targets = recorded_targets(crawler, replay)
+    assert targets, "기록된 페이지가 없습니다"
+
+    deals = []
+    for target in targets:
+        page_deals = list(crawler.iter_target(target))
+        assert not target.failed
+        assert page_deals, f"{target}에서 딜이 나오지 않았습니다"
+        deals.extend(page_deals)
+
+    assert len(deals) == baseline[f"{site}/http"]["deals"]
+    assert len({deal.key for deal in deals}) == len(deals)
+    for deal in deals:
+        assert deal.site == crawler.site_name
+        assert deal.board == crawler.boards[0]
+        assert deal.idx.isdigit()
+        assert deal.title.strip() == deal.title and deal.title
+        assert urlparse(deal.url).scheme in ("http", "https") and urlparse(deal.url).netloc
+        assert deal.canonical_url
+        assert deal.timestamp is not None
+        assert deal.price is None or deal.price > 0
+        assert deal.shipping is None or deal.shipping >= 0
+    # 제목에 가격이 없는 딜도 있으므로 대부분의 딜에서만 가격을 찾으면 됨
+    assert sum(deal.price is not None for deal in deals) >= len(deals) // 2
+
+
+@pytest.mark.parametrize("site", get_site_registry().names())
+def test_async_replay_matches_thread_replay(site, replay):
+    crawler = make_crawler(site, replay)
+    fetcher = AsyncReplayFetcher(replay)
+
+    async def crawl(targets):
+        return [deal for target in targets for deal in await crawler.crawl_target_async(target, None, fetcher)]
+
+    expected = [deal.to_dict() for target in recorded_targets(crawler, replay)
+                for deal in crawler.iter_target(target)]
+    actual = [deal.to_dict() for deal in asyncio.run(crawl(recorded_targets(crawler, replay)))]
+    for deal in expected + actual:
+        deal.pop("timestamp")
+    assert actual == expected
@@ -0,0 +1,121 @@
+"""
+회로 차단기와 재시도 예산 테스트.
+"""
+
+from hotdeal_crawler.health import (STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, CircuitBreaker, HealthTracker,
+                                    RetryBudget)
+
+
+class FakeClock:
+    """테스트에서 직접 움직이는 시계."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_opens_after_threshold():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=60, clock=clock)
+
+    assert not breaker.record_failure()
+    assert not breaker.record_failure()
+    assert breaker.state == STATE_CLOSED and breaker.allow()
+    assert breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == 60
+
+
+def test_success_resets_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+    breaker.record_failure()
+    breaker.record_success()
+    assert not breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+
+
+def test_breaker_half_opens_after_cooldown_and_closes_on_success():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=60, clock=clock)
+    breaker.record_failure()
+
+    clock.now += 59
+    assert not breaker.allow()
+    clock.now += 1
+    # 냉각 시간이 지나면 시험 요청 하나만 허용
+    assert breaker.allow()
+    assert breaker.state == STATE_HALF_OPEN
+    assert not breaker.allow()
+
+    assert breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.failures == 0
+    assert breaker.allow() and breaker.allow()
+
+
+def test_failed_probe_doubles_cooldown():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=60, max_cooldown=100, clock=clock)
+    breaker.record_failure()
+
+    clock.now += 60
+    assert breaker.allow()
+    assert breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert breaker.cooldown == 100
+
+    clock.now += 100
+    assert breaker.allow()
+    breaker.record_success()
+    # 닫히면 냉각 시간도 처음 값으로 돌아감
+    assert breaker.cooldown == 60
+
+
+def test_cancelled_probe_is_released():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=60, clock=clock)
+    breaker.record_failure()
+    clock.now += 60
+    assert breaker.allow()
+    breaker.release_probe()
+    assert breaker.allow()
+
+
+def test_retry_budget_is_spent_and_reset():
+    budget = RetryBudget(retries_per_cycle=2)
+    assert budget.try_acquire() and budget.try_acquire()
+    assert not budget.try_acquire()
+    budget.reset()
+    assert budget.remaining == 2
+
+
+def test_begin_cycle_refills_retry_budget():
+    tracker = HealthTracker(retries_per_cycle=2, max_attempts=10, backoff_base=0)
+    health = tracker.site("PPomppu")
+    assert health.next_retry_delay(1) is not None
+    assert health.next_retry_delay(2) is not None
+    assert health.next_retry_delay(3) is None
+
+    # 다른 사이트만 새 실행을 시작하면 이 사이트의 예산은 그대로
+    tracker.begin_cycle("Ruliweb")
+    assert health.next_retry_delay(1) is None
+
+    tracker.begin_cycle()
+    assert health.budget.remaining == 2
+    assert health.next_retry_delay(1) is not None
+
+
+def test_no_retry_past_max_attempts_or_open_breaker():
+    tracker = HealthTracker(failure_threshold=1, retries_per_cycle=10, max_attempts=2, backoff_base=0)
+    health = tracker.site("PPomppu")
+    assert health.next_retry_delay(2) is None
+    # 시도 횟수 때문에 재시도하지 않을 때는 예산을 쓰지 않음
+    assert health.budget.remaining == 10
+
+    health.record_failure("연결 실패")
+    assert tracker.degraded_sites() == ["PPomppu"]
+    assert health.next_retry_delay(1) is None
+    assert health.report()["last_error"] == "연결 실패"
\ No newline at end of file
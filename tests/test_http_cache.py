@@ -0,0 +1,107 @@
+"""
+HTTP 응답 캐시 테스트.
+"""
+
+import os
+
+from hotdeal_crawler.http_cache import PageUnchanged, ResponseCache
+from hotdeal_crawler.manager import HotDealCrawlerManager
+from hotdeal_crawler.plugins import get_site_registry
+from hotdeal_crawler.replay import ReplayFetcher
+from hotdeal_crawler.state import CrawlStateStore
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+URL = "https://example.com/list"
+
+
+def test_response_is_pending_until_commit(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.json"))
+    assert not cache.record_response(URL, 200, b"page", etag='"v1"')
+    # 확정하기 전에는 조건부 요청을 보내지 않고 같은 본문도 바뀐 것으로 봄
+    assert cache.conditional_headers(URL) == {}
+    assert not cache.record_response(URL, 200, b"page", etag='"v1"')
+
+    cache.commit([URL])
+    assert cache.conditional_headers(URL) == {"If-None-Match": '"v1"'}
+    assert cache.record_response(URL, 200, b"page", etag='"v1"')
+    assert cache.record_response(URL, 304, b"")
+
+
+def test_discarded_response_keeps_committed_entry(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.json"))
+    cache.record_response(URL, 200, b"old", etag='"v1"')
+    cache.commit([URL])
+
+    assert not cache.record_response(URL, 200, b"new", etag='"v2"')
+    cache.discard([URL])
+    # 버린 응답은 다음 커밋에도 반영되지 않음
+    cache.commit([URL])
+    assert cache.conditional_headers(URL) == {"If-None-Match": '"v1"'}
+    assert not cache.record_response(URL, 200, b"new", etag='"v2"')
+
+
+def test_committed_entries_are_saved(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = ResponseCache(path, flush_interval=3600)
+    cache.record_response(URL, 200, b"page", last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+    cache.record_response(URL + "?page=2", 200, b"page 2")
+    cache.commit([URL])
+    cache.flush()
+
+    reloaded = ResponseCache(path)
+    assert reloaded.conditional_headers(URL) == {"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    assert reloaded.record_response(URL, 200, b"page")
+    assert not reloaded.record_response(URL + "?page=2", 200, b"page 2")
+
+
+class CachingReplayFetcher(ReplayFetcher):
+    """HttpFetcher처럼 응답을 캐시에 기록하고 바뀌지 않은 페이지는 PageUnchanged로 알리는 재생 fetcher."""
+
+    def __init__(self, directory, cache):
+        super().__init__(directory)
+        self.cache = cache
+
+    def fetch(self, url, encoding=None):
+        content = self.content(url)
+        if content is not None and self.cache.record_response(url, 200, content):
+            raise PageUnchanged(url)
+        return super().fetch(url, encoding)
+
+
+def crawl(tmp_path, cache, failed_page=None):
+    """coolenjoy 픽스처 두 페이지를 크롤링하고, failed_page는 딜을 읽은 뒤 실패로 처리합니다."""
+    manager = HotDealCrawlerManager(state_store=CrawlStateStore(str(tmp_path / "state.json")))
+    crawler = get_site_registry().create("coolenjoy", fetch_backend="http", pages=2)
+    crawler.http_fetcher = CachingReplayFetcher(FIXTURES, cache)
+    crawler.latency_budget = float("inf")
+    manager.add_crawler(crawler)
+    iter_target = crawler.iter_target
+
+    def fail_page(target, last_idx=None):
+        yield from iter_target(target, last_idx)
+        if target.page == failed_page:
+            target.failed = True
+
+    crawler.iter_target = fail_page
+    return manager.crawl_all(max_workers=2), crawler
+
+
+def test_failed_board_discards_pending_pages(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.json"))
+    deals, _ = crawl(tmp_path, cache, failed_page=2)
+
+    assert len(deals) == 40
+    # 1페이지는 성공했어도 게시판에 실패한 페이지가 있으면 모두 버려 다음 실행에서 다시 파싱함
+    assert not cache._entries and not cache._pending
+
+
+def test_finished_board_commits_pages(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.json"))
+    deals, crawler = crawl(tmp_path, cache)
+
+    assert len(deals) == 40
+    assert set(cache._entries) == {crawler.page_url(page, crawler.boards[0]) for page in (1, 2)}
+    assert not cache._pending
+    # 다음 실행에서는 두 페이지 모두 바뀌지 않은 것으로 건너뜀
+    assert crawl(tmp_path, cache)[0] == []
+    assert cache.stats()["unchanged"] == 2
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+딜 수명 주기 저장소 테스트.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from hotdeal_crawler import CrawlStateStore, HotDealCrawlerManager, get_site_registry
+from hotdeal_crawler.async_engine import AsyncCrawlEngine
+
+from hotdeal_crawler.lifecycle import (
+    UPDATE_EDITED,
+    UPDATE_POPULARITY,
+    UPDATE_RESTOCKED,
+    UPDATE_SOLD_OUT,
+    LifecycleStore,
+)
+from hotdeal_crawler.models import CrawlTarget, HotDealItem
+from hotdeal_crawler.replay import AsyncReplayFetcher, ReplayFetcher
+
+
+def make_deal(title: str = "[쿠팡] 테스트 상품 (12,900원/무료)", page: int = 1, **fields) -> HotDealItem:
+    url = f"https://www.ppomppu.co.kr/zboard/view.php?id=ppomppu&page={page}&divpage=90&no=100"
+    return HotDealItem(idx="100", title=title, url=url, price=12900, site="PPomppu", board="ppomppu",
+                       **fields)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LifecycleStore(str(tmp_path / "lifecycle.json"))
+    store.updates = []
+    store.on_update = store.updates.append
+    return store
+
+
+def test_new_deal_then_unchanged(store):
+    assert store.track(make_deal()) == (True, None)
+    assert store.track(make_deal()) == (False, None)
+    assert store.updates == []
+
+
+def test_page_params_are_not_an_edit(store):
+    store.track(make_deal(page=1))
+    is_new, update = store.track(make_deal(page=3))
+    assert (is_new, update) == (False, None)
+
+
+def test_title_edit(store):
+    store.track(make_deal())
+    _, update = store.track(make_deal("[쿠팡] 테스트 상품 (9,900원/무료)"))
+    assert update.kinds == [UPDATE_EDITED]
+
+
+def test_sold_out_and_back(store):
+    store.track(make_deal())
+    _, update = store.track(make_deal(sold_out=True))
+    assert update.kinds == [UPDATE_SOLD_OUT]
+    assert update.changes["sold_out"] == (False, True)
+
+    _, update = store.track(make_deal())
+    assert update.kinds == [UPDATE_RESTOCKED]
+    assert update.changes["sold_out"] == (True, False)
+    assert [u.kinds for u in store.updates] == [[UPDATE_SOLD_OUT], [UPDATE_RESTOCKED]]
+
+
+def test_small_view_changes_are_ignored(store):
+    store.track(make_deal(views=100, comments=1))
+    assert store.track(make_deal(views=150, comments=1)) == (False, None)
+    _, update = store.track(make_deal(views=250, comments=2))
+    assert update.kinds == [UPDATE_POPULARITY]
+    assert update.changes == {"comments": (1, 2), "views": (100, 250)}
+
+
+def test_seen_deal_is_not_new(store):
+    assert store.track(make_deal(), seen=True) == (False, None)
+
+
+def test_entries_survive_reload(store, tmp_path):
+    store.track(make_deal(sold_out=True))
+    store.close()
+    reloaded = LifecycleStore(str(tmp_path / "lifecycle.json"))
+    _, update = reloaded.track(make_deal())
+    assert update.kinds == [UPDATE_RESTOCKED]
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+
+
+def make_manager(tmp_path):
+    """coolenjoy 픽스처를 재생하는 상태 저장소와 수명 주기 저장소가 있는 관리자를 만듭니다."""
+    manager = HotDealCrawlerManager(state_store=CrawlStateStore(str(tmp_path / "state.json")),
+                                    lifecycle=LifecycleStore(str(tmp_path / "lifecycle.json")))
+    crawler = get_site_registry().create("coolenjoy", fetch_backend="http", pages=2)
+    crawler.http_fetcher = ReplayFetcher(FIXTURES)
+    crawler.latency_budget = float("inf")
+    manager.add_crawler(crawler)
+    return manager, crawler
+
+
+def test_failed_page_deals_are_not_remembered(tmp_path):
+    manager, crawler = make_manager(tmp_path)
+    iter_target = crawler.iter_target
+
+    def fail_page_2(target, last_idx=None):
+        # 2페이지는 딜을 읽은 뒤에 실패한 것으로 처리
+        yield from iter_target(target, last_idx)
+        if target.page == 2:
+            target.failed = True
+
+    crawler.iter_target = fail_page_2
+    assert len(list(manager.iter_crawl(max_workers=1))) == 40
+    assert crawler.get_last_idx(crawler.boards[0]) is None
+    manager.lifecycle.close()
+
+    manager, crawler = make_manager(tmp_path)
+    reader = get_site_registry().create("coolenjoy", fetch_backend="http")
+    reader.http_fetcher = crawler.http_fetcher
+    page_2 = {deal.idx for deal in reader.iter_target(CrawlTarget(reader.site_name, reader.boards[0], 2))}
+    second = list(manager.iter_crawl(max_workers=1))
+    # 1페이지의 딜은 전달되었으므로 다시 나오지 않고, 실패한 2페이지의 딜은 다시 나옴
+    assert {deal.idx for deal in second} == page_2
+    assert crawler.get_last_idx(crawler.boards[0]) is not None
+
+
+def test_timed_out_target_deals_are_not_remembered(tmp_path):
+    manager, crawler = make_manager(tmp_path)
+
+    async def slow_crawl_target(target, last_idx, fetcher):
+        # 스레드 풀의 Selenium 크롤링처럼 딜을 저장소와 비교한 뒤에 시간이 초과됨
+        deals = list(crawler.iter_target(target, last_idx))
+        await asyncio.sleep(5)
+        return deals
+
+    crawler.crawl_target_async = slow_crawl_target
+    engine = AsyncCrawlEngine(manager, fetcher=AsyncReplayFetcher(ReplayFetcher(FIXTURES)), target_timeout=0.2)
+    assert asyncio.run(engine.crawl()) == []
+    manager.lifecycle.close()
+
+    manager, crawler = make_manager(tmp_path)
+    engine = AsyncCrawlEngine(manager, fetcher=AsyncReplayFetcher(ReplayFetcher(FIXTURES)))
+    assert len(asyncio.run(engine.crawl())) == 40
@@ -0,0 +1,63 @@
+"""
+크롤러 관리자의 증분 크롤링 테스트.
+"""
+
+import os
+
+from hotdeal_crawler.manager import HotDealCrawlerManager
+from hotdeal_crawler.plugins import get_site_registry
+from hotdeal_crawler.replay import ReplayFetcher
+from hotdeal_crawler.state import CrawlStateStore
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+# 픽스처 2페이지 중간의 idx (1페이지 20개와 2페이지 10개가 이보다 새 딜)
+OLD_LAST_IDX = 3299970
+
+
+def make_manager(tmp_path, failed_page=None):
+    """coolenjoy 픽스처 두 페이지를 재생하고, failed_page는 딜을 읽은 뒤 실패로 처리하는 관리자를 만듭니다."""
+    manager = HotDealCrawlerManager(state_store=CrawlStateStore(str(tmp_path / "state.json")))
+    crawler = get_site_registry().create("coolenjoy", fetch_backend="http", pages=2)
+    crawler.http_fetcher = ReplayFetcher(FIXTURES)
+    crawler.latency_budget = float("inf")
+    manager.add_crawler(crawler)
+    if failed_page is not None:
+        iter_target = crawler.iter_target
+
+        def fail_page(target, last_idx=None):
+            yield from iter_target(target, last_idx)
+            if target.page == failed_page:
+                target.failed = True
+
+        crawler.iter_target = fail_page
+    return manager, crawler
+
+
+def test_failed_page_keeps_last_idx(tmp_path):
+    manager, crawler = make_manager(tmp_path, failed_page=2)
+    board = crawler.boards[0]
+    crawler.update_last_idx(board, OLD_LAST_IDX)
+
+    deals = manager.crawl_all(max_workers=2)
+    assert len(deals) == 30
+    assert crawler.get_last_idx(board) == OLD_LAST_IDX
+    # 저장된 상태도 그대로여서 다음 실행이 같은 경계부터 다시 읽음
+    assert CrawlStateStore(str(tmp_path / "state.json")).get_last_idx(crawler._state_key(board)) == OLD_LAST_IDX
+
+    manager, crawler = make_manager(tmp_path)
+    assert len(manager.crawl_all(max_workers=2)) == 30
+    assert crawler.get_last_idx(board) == 3300000
+
+
+def test_finished_board_advances_last_idx(tmp_path):
+    manager, crawler = make_manager(tmp_path)
+    board = crawler.boards[0]
+    crawler.update_last_idx(board, OLD_LAST_IDX)
+
+    deals = manager.crawl_all(max_workers=2)
+    assert len(deals) == 30
+    assert crawler.get_last_idx(board) == max(int(deal.idx) for deal in deals)
+
+    # 다음 실행에서는 경계 뒤의 딜이 없음
+    manager, crawler = make_manager(tmp_path)
+    assert manager.crawl_all(max_workers=2) == []
\ No newline at end of file
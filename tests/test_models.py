@@ -0,0 +1,41 @@
+"""
+핫딜 아이템 모델 테스트.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from hotdeal_crawler.models import HotDealItem, format_price
+
+
+@pytest.mark.parametrize("price, currency, text", [
+    (12900, "KRW", "12,900원"),
+    (1999, "USD", "19.99 USD"),
+    (123405, "EUR", "1,234.05 EUR"),
+    (5, "GBP", "0.05 GBP"),
+    (1980, "JPY", "1,980 JPY"),
+])
+def test_format_price(price, currency, text):
+    assert format_price(price, currency) == text
+
+
+def test_str_formats_minor_units():
+    deal = HotDealItem(idx="1", title="상품", url="https://example.com/1", price=1999, currency="USD", site="PPomppu")
+    assert str(deal) == "[PPomppu] 상품 - 19.99 USD (https://example.com/1)"
+
+
+def test_item_has_no_instance_dict():
+    deal = HotDealItem(idx="1", title="상품", url="https://example.com/1?page=2", price="12,900원")
+    assert not hasattr(deal, "__dict__")
+    assert deal.price == 12900
+    assert deal.alternate_urls == []
+    assert deal.canonical_url == "https://example.com/1"
+
+
+def test_dict_round_trip():
+    deal = HotDealItem(idx="1", title="상품", url="https://example.com/1", price=1999, currency="USD",
+                       timestamp=datetime(2024, 1, 2, 3, 4, 5), site="PPomppu", board="ppomppu",
+                       alternate_urls=["https://example.com/2"], sold_out=True, views=10)
+    restored = HotDealItem.from_json(deal.to_json())
+    assert restored.to_dict() == deal.to_dict()
\ No newline at end of file
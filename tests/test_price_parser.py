@@ -0,0 +1,76 @@
+"""
+가격 정보 추출 테스트.
+"""
+
+import pytest
+
+from hotdeal_crawler.models import HotDealItem
+from hotdeal_crawler.price_parser import apply_price_info, extract_price_info, parse_amount
+
+
+@pytest.mark.parametrize("title, price, currency, shipping", [
+    ("[쿠팡] 맥심 모카골드 400T (52,800원/무료)", 52800, "KRW", 0),
+    ("[옥션] 풀무원 두부 300g x 8 (11,900원/3,500원)", 11900, "KRW", 3500),
+    ("[G마켓] 상품 (1만2천원/무료)", 12000, "KRW", 0),
+    ("상품 1.5만원 특가", 15000, "KRW", None),
+    ("상품 12,900원 배송비 2,500원", 12900, "KRW", 2500),
+])
+def test_normal_titles(title, price, currency, shipping):
+    info = extract_price_info(title)
+    assert (info.price, info.currency, info.shipping) == (price, currency, shipping)
+
+
+@pytest.mark.parametrize("title", [
+    "가격 1,2345원",
+    "상품 (1,2345원/무료)",
+    "상품 12,34,567원",
+])
+def test_malformed_grouping_is_not_a_price(title):
+    assert extract_price_info(title).price is None
+
+
+@pytest.mark.parametrize("title", [
+    "상품 12,원",
+    "상품 50,원 특가",
+    "상품 (12,원/무료)",
+])
+def test_trailing_comma_is_not_a_price(title):
+    assert extract_price_info(title).price is None
+
+
+@pytest.mark.parametrize("title, price", [
+    ("상품 (12,900/무료)", 12900),
+    ("상품 (2개/무료)", None),
+    ("상품 (1+1/무료)", None),
+    ("상품(11/27까지) 9,900원", 9900),
+    ("상품 (500ml)", None),
+])
+def test_numbers_without_unit(title, price):
+    assert extract_price_info(title).price == price
+
+
+@pytest.mark.parametrize("title, price", [
+    ("[아마존] 상품 ($19.99/free)", 1999),
+    ("[아마존] 상품 ($1,299.99/무료)", 129999),
+    ("[아마존] 상품 $5", 500),
+    ("[아마존] 상품 (20달러/무료)", 2000),
+])
+def test_usd_prices_in_cents(title, price):
+    info = extract_price_info(title)
+    assert (info.price, info.currency) == (price, "USD")
+
+
+def test_parse_amount():
+    assert parse_amount("29,900원") == (29900, "KRW")
+    assert parse_amount("$12.5") == (1250, "USD")
+    assert parse_amount("3만원") == (30000, "KRW")
+    assert parse_amount("12", require_unit=True) is None
+    assert parse_amount("원") is None
+
+
+@pytest.mark.parametrize("title", [
+    "상품 12,원", "₩,원", "$.", "만원", "1.만원", ",,,원", "(/)", "((원/))", "$1,2,3", "9" * 40 + "원",
+])
+def test_never_raises(title):
+    deal = apply_price_info(HotDealItem(idx="1", title=title, url="https://example.com/1"))
+    assert deal.title == title